@@ -0,0 +1,136 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares augmenting ragged batches of images of distinct sizes with
+augmenting the dense batches of `keras_cv.datasets.bucket_by_aspect_ratio()`.
+"""
+
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+import tensorflow as tf
+
+from keras_cv.datasets import bucket_by_aspect_ratio
+from keras_cv.layers import Augmenter
+from keras_cv.layers import RandomFlip
+from keras_cv.layers import RandomHue
+from keras_cv.layers import Resizing
+
+BATCH_SIZE = 16
+
+
+def augmenter():
+    return Augmenter(
+        [
+            RandomFlip(bounding_box_format="xyxy"),
+            RandomHue(0.2, (0, 255)),
+        ]
+    )
+
+
+def ragged_batches(dataset):
+    return (
+        dataset.ragged_batch(BATCH_SIZE)
+        .map(augmenter(), num_parallel_calls=tf.data.AUTOTUNE)
+        .map(
+            Resizing(
+                256, 256, pad_to_aspect_ratio=True, bounding_box_format="xyxy"
+            ),
+            num_parallel_calls=tf.data.AUTOTUNE,
+        )
+    )
+
+
+def bucketed_batches(dataset):
+    return dataset.apply(
+        bucket_by_aspect_ratio(
+            bucket_sizes=[(256, 256), (192, 256), (256, 192)],
+            batch_size=BATCH_SIZE,
+            bounding_box_format="xyxy",
+        )
+    ).map(augmenter(), num_parallel_calls=tf.data.AUTOTUNE)
+
+
+def make_dataset(num_images):
+    rng = np.random.default_rng(1337)
+    sizes = rng.integers(128, 320, size=(num_images, 2))
+
+    def generator():
+        for height, width in sizes:
+            yield {
+                "images": rng.uniform(0, 255, (height, width, 3)).astype(
+                    "float32"
+                ),
+                "bounding_boxes": {
+                    "boxes": np.array(
+                        [[0, 0, width / 2, height / 2]], dtype="float32"
+                    ),
+                    "classes": np.ones((1,), dtype="float32"),
+                },
+            }
+
+    return tf.data.Dataset.from_generator(
+        generator,
+        output_signature={
+            "images": tf.TensorSpec((None, None, 3), tf.float32),
+            "bounding_boxes": {
+                "boxes": tf.TensorSpec((None, 4), tf.float32),
+                "classes": tf.TensorSpec((None,), tf.float32),
+            },
+        },
+    ).cache()
+
+
+class AspectRatioBucketingTest(tf.test.TestCase):
+    def test_bucketed_batches_are_dense(self):
+        for batch in bucketed_batches(make_dataset(8)):
+            self.assertIsInstance(batch["images"], tf.Tensor)
+
+
+if __name__ == "__main__":
+    # Run benchmark
+    num_images = [256, 512, 1024, 2048]
+    results = {}
+    pipeline_candidates = [ragged_batches, bucketed_batches]
+
+    for pipeline in pipeline_candidates:
+        c = pipeline.__name__
+        runtimes = []
+        print(f"Timing {c}")
+
+        for n_images in num_images:
+            dataset = pipeline(make_dataset(n_images))
+            # warmup
+            for _ in dataset:
+                pass
+
+            t0 = time.time()
+            for _ in dataset:
+                pass
+            t1 = time.time()
+            runtimes.append(t1 - t0)
+            print(f"Runtime for {c}, n_images={n_images}: {t1-t0}")
+        results[c] = runtimes
+
+    plt.figure()
+    for key in results:
+        plt.plot(num_images, results[key], label=key)
+        plt.xlabel("Number images")
+
+    plt.ylabel("Runtime (seconds)")
+    plt.legend()
+    plt.savefig("comparison.png")
+
+    # Run unit tests
+    tf.test.main()
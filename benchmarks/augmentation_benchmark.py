@@ -0,0 +1,516 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Throughput benchmark of every preprocessing layer in `keras_cv.layers`.
+
+Every layer is timed in eager mode, in a `tf.function`, in a `tf.data` map and
+in an XLA compiled `tf.function`, for every batch size and image size. The
+results are written to a JSON file, and compared to the results of a previous
+run, e.g. of the last release, if one is given. Other configurations of a
+layer, e.g. `RandAugment:vectorized`, are listed in `LAYER_ARGS` and timed as
+layers of their own.
+
+Usage:
+
+```
+python benchmarks/augmentation_benchmark.py \
+    --layers=RandomFlip,RandomHue \
+    --batch_sizes=32,128 \
+    --image_sizes=64,224 \
+    --output=results.json \
+    --baseline=baseline.json
+```
+"""
+
+import datetime
+import inspect
+import json
+import platform
+import sys
+import time
+
+import keras
+import tensorflow as tf
+from absl import app
+from absl import flags
+
+import keras_cv
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    BaseImageAugmentationLayer,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
+)
+
+MODES = ("eager", "tf_function", "tf_data", "jit")
+
+flags.DEFINE_list(
+    "layers", [], "Layers to benchmark, all the layers if not given."
+)
+flags.DEFINE_list("modes", list(MODES), "Modes to time the layers in.")
+flags.DEFINE_list("batch_sizes", ["32", "128"], "Batch sizes to benchmark.")
+flags.DEFINE_list("image_sizes", ["64", "224"], "Image sizes to benchmark.")
+flags.DEFINE_integer("iterations", 10, "Timed batches per case.")
+flags.DEFINE_string("output", None, "Path of the JSON file of the results.")
+flags.DEFINE_string(
+    "baseline", None, "Path of the JSON results of a previous run."
+)
+flags.DEFINE_float(
+    "max_regression",
+    0.1,
+    "Relative throughput drop from the baseline reported as a regression.",
+)
+flags.DEFINE_bool(
+    "fail_on_regression",
+    False,
+    "Exit with a non-zero status if any case regressed.",
+)
+
+FLAGS = flags.FLAGS
+
+# Constructor arguments of the layers with required arguments, as functions
+# of the image size. Keys of the form `"Layer:variant"` time another
+# configuration of `Layer`, e.g. an alternative code path, next to it.
+LAYER_ARGS = {
+    "AugMix": lambda size: {"value_range": (0, 255)},
+    # The sequential counterpart of `FusedAffineAugmentation`.
+    "Augmenter:affine": lambda size: {
+        "layers": [
+            keras_cv.layers.RandomRotation(0.1),
+            keras_cv.layers.RandomTranslation(0.1, 0.1),
+        ]
+    },
+    # The sequential counterpart of `RandomColorJitter`.
+    "Augmenter:color_jitter": lambda size: {
+        "layers": [
+            keras_cv.layers.RandomBrightness(0.2),
+            keras_cv.layers.RandomContrast((0, 255), 0.2),
+            keras_cv.layers.RandomSaturation((0.4, 0.6)),
+            keras_cv.layers.RandomHue(0.2, (0, 255)),
+        ]
+    },
+    "AutoContrast": lambda size: {"value_range": (0, 255)},
+    "Equalization": lambda size: {"value_range": (0, 255)},
+    "Equalization:preserve_uint8": lambda size: {
+        "value_range": (0, 255),
+        "preserve_uint8": True,
+    },
+    "FusedAffineAugmentation": lambda size: {
+        "layers": [
+            keras_cv.layers.RandomRotation(0.1),
+            keras_cv.layers.RandomTranslation(0.1, 0.1),
+        ]
+    },
+    "JitteredResize": lambda size: {
+        "target_size": (size, size),
+        "scale_factor": (0.8, 1.25),
+    },
+    "Posterization": lambda size: {"value_range": (0, 255), "bits": 4},
+    "Posterization:preserve_uint8": lambda size: {
+        "value_range": (0, 255),
+        "bits": 4,
+        "preserve_uint8": True,
+    },
+    "RandAugment": lambda size: {"value_range": (0, 255)},
+    "RandAugment:vectorized": lambda size: {
+        "value_range": (0, 255),
+        "vectorized": True,
+    },
+    "RandomApply": lambda size: {
+        "layer": keras_cv.layers.Grayscale(output_channels=3)
+    },
+    "RandomApply:vectorized": lambda size: {
+        "layer": keras_cv.layers.Grayscale(output_channels=3),
+        "vectorized": True,
+    },
+    "RandomAspectRatio": lambda size: {"factor": (0.9, 1.1)},
+    "RandomAugmentationPipeline": lambda size: {
+        "layers": [
+            keras_cv.layers.Grayscale(output_channels=3),
+            keras_cv.layers.RandomFlip(),
+        ],
+        "augmentations_per_image": 1,
+    },
+    "RandomAugmentationPipeline:vectorized": lambda size: {
+        "layers": [
+            keras_cv.layers.Grayscale(output_channels=3),
+            keras_cv.layers.RandomFlip(),
+        ],
+        "augmentations_per_image": 1,
+        "vectorized": True,
+    },
+    "RandomBrightness": lambda size: {"factor": 0.2},
+    "RandomBrightness:backend_native": lambda size: {
+        "factor": 0.2,
+        "backend_native": True,
+    },
+    "RandomChannelShift": lambda size: {
+        "value_range": (0, 255),
+        "factor": 0.2,
+    },
+    "RandomChoice": lambda size: {
+        "layers": [
+            keras_cv.layers.Grayscale(output_channels=3),
+            keras_cv.layers.RandomFlip(),
+        ]
+    },
+    "RandomChoice:vectorized": lambda size: {
+        "layers": [
+            keras_cv.layers.Grayscale(output_channels=3),
+            keras_cv.layers.RandomFlip(),
+        ],
+        "vectorized": True,
+    },
+    "RandomColorDegeneration": lambda size: {"factor": 0.5},
+    "RandomColorJitter": lambda size: {
+        "value_range": (0, 255),
+        "brightness_factor": 0.2,
+        "contrast_factor": 0.2,
+        "saturation_factor": (0.4, 0.6),
+        "hue_factor": 0.2,
+    },
+    "RandomContrast": lambda size: {"value_range": (0, 255), "factor": 0.2},
+    "RandomContrast:backend_native": lambda size: {
+        "value_range": (0, 255),
+        "factor": 0.2,
+        "backend_native": True,
+    },
+    "RandomCrop": lambda size: {"height": size // 2, "width": size // 2},
+    "RandomCrop:preserve_uint8": lambda size: {
+        "height": size // 2,
+        "width": size // 2,
+        "preserve_uint8": True,
+    },
+    "RandomCropAndResize": lambda size: {
+        "target_size": (size, size),
+        "crop_area_factor": (0.25, 1.0),
+        "aspect_ratio_factor": (3 / 4, 4 / 3),
+    },
+    "RandomCutout": lambda size: {
+        "height_factor": 0.3,
+        "width_factor": 0.3,
+    },
+    "RandomCutout:preserve_uint8": lambda size: {
+        "height_factor": 0.3,
+        "width_factor": 0.3,
+        "preserve_uint8": True,
+    },
+    "RandomFlip:backend_native": lambda size: {"backend_native": True},
+    "RandomFlip:preserve_uint8": lambda size: {"preserve_uint8": True},
+    "RandomGaussianBlur": lambda size: {"kernel_size": 3, "factor": 1.0},
+    "RandomHue": lambda size: {"factor": 0.2, "value_range": (0, 255)},
+    "RandomJpegQuality": lambda size: {"factor": (75, 100)},
+    "RandomRotation": lambda size: {"factor": 0.1},
+    "RandomSaturation": lambda size: {"factor": (0.4, 0.6)},
+    "RandomSharpness": lambda size: {"factor": 0.5, "value_range": (0, 255)},
+    "RandomShear": lambda size: {"x_factor": 0.2, "y_factor": 0.2},
+    "RandomTranslation": lambda size: {
+        "height_factor": 0.1,
+        "width_factor": 0.1,
+    },
+    "RandomZoom": lambda size: {"height_factor": 0.2},
+    "RepeatedAugmentation": lambda size: {
+        "augmenters": [
+            keras_cv.layers.RandomFlip(),
+            keras_cv.layers.Grayscale(output_channels=3),
+        ]
+    },
+    "Rescaling": lambda size: {"scale": 1 / 255},
+    "Resizing": lambda size: {"height": size // 2, "width": size // 2},
+    "Resizing:pad_to_aspect_ratio": lambda size: {
+        "height": size // 2,
+        "width": size // 3,
+        "pad_to_aspect_ratio": True,
+    },
+    "Solarization": lambda size: {"value_range": (0, 255)},
+    "Solarization:backend_native": lambda size: {
+        "value_range": (0, 255),
+        "backend_native": True,
+    },
+    "Solarization:preserve_uint8": lambda size: {
+        "value_range": (0, 255),
+        "preserve_uint8": True,
+    },
+}
+
+# Layers that expect labels along with the images.
+LABELED_LAYERS = {"CutMix", "FourierMix", "MixUp", "Mosaic", "ReservoirMosaic"}
+
+
+def discover_layers():
+    """Returns the names of the preprocessing layers in `keras_cv.layers`.
+
+    The variants of `LAYER_ARGS` follow the layer they configure.
+    """
+    base_classes = (
+        BaseImageAugmentationLayer,
+        VectorizedBaseImageAugmentationLayer,
+    )
+    names = []
+    for name in dir(keras_cv.layers):
+        cls = getattr(keras_cv.layers, name)
+        if (
+            inspect.isclass(cls)
+            and issubclass(cls, base_classes)
+            and cls not in base_classes
+        ):
+            names.append(name)
+    names += [name for name in LAYER_ARGS if ":" in name]
+    return sorted(names)
+
+
+def build_layer(name, image_size):
+    """Returns the layer `name`, or `None` if its arguments are unknown."""
+    cls = getattr(keras_cv.layers, name.split(":")[0])
+    if name in LAYER_ARGS:
+        return cls(**LAYER_ARGS[name](image_size))
+    parameters = inspect.signature(cls.__init__).parameters.values()
+    if any(
+        parameter.default is inspect.Parameter.empty
+        and parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+        and parameter.name != "self"
+        for parameter in parameters
+    ):
+        return None
+    return cls()
+
+
+def make_inputs(name, batch_size, image_size):
+    images = tf.random.uniform(
+        (batch_size, image_size, image_size, 3), 0, 255, seed=1
+    )
+    if name.endswith(":preserve_uint8"):
+        images = tf.cast(images, tf.uint8)
+    if name not in LABELED_LAYERS:
+        return images
+    labels = tf.one_hot(tf.range(batch_size) % 10, 10)
+    return {"images": images, "labels": labels}
+
+
+def time_layer(layer, inputs, mode, iterations):
+    """Returns the mean seconds per batch of `layer` in `mode`."""
+    if mode == "tf_data":
+        dataset = (
+            tf.data.Dataset.from_tensors(inputs)
+            .repeat(iterations)
+            .map(layer, num_parallel_calls=tf.data.AUTOTUNE)
+        )
+
+        def run():
+            for _ in dataset:
+                pass
+
+    else:
+        if mode == "eager":
+            augment = layer
+        else:
+            augment = tf.function(layer, jit_compile=mode == "jit")
+
+        def run():
+            for _ in range(iterations):
+                augment(inputs)
+
+    # The first run traces the functions, and is excluded from the timings.
+    run()
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) / iterations
+
+
+def run_case(name, mode, batch_size, image_size, iterations):
+    result = {
+        "layer": name,
+        "mode": mode,
+        "batch_size": batch_size,
+        "image_size": image_size,
+    }
+    layer = build_layer(name, image_size)
+    if layer is None:
+        result["error"] = "no benchmark arguments for the required arguments"
+        return result
+    inputs = make_inputs(name, batch_size, image_size)
+    try:
+        seconds = time_layer(layer, inputs, mode, iterations)
+    except Exception as e:
+        # e.g. layers that cannot be compiled by XLA
+        result["error"] = f"{type(e).__name__}: {str(e).splitlines()[0]}"
+        return result
+    result["seconds_per_batch"] = seconds
+    result["images_per_second"] = batch_size / seconds
+    return result
+
+
+def _case_key(result):
+    return (
+        result["layer"],
+        result["mode"],
+        result["batch_size"],
+        result["image_size"],
+    )
+
+
+def compare_to_baseline(results, baseline, max_regression):
+    """Compares the throughput of `results` to the one of `baseline`.
+
+    Args:
+        results: a list of results of `run_case()`.
+        baseline: a list of results of `run_case()` of a previous run.
+        max_regression: the relative throughput drop reported as a
+            regression.
+
+    Returns:
+        a list with one dictionary per case timed in both runs, with the keys
+        of the case, `"baseline_images_per_second"`, `"images_per_second"`,
+        `"change"`, the relative change of the throughput, and `"regression"`.
+    """
+    baseline = {
+        _case_key(result): result
+        for result in baseline
+        if "images_per_second" in result
+    }
+    comparisons = []
+    for result in results:
+        previous = baseline.get(_case_key(result))
+        if previous is None or "images_per_second" not in result:
+            continue
+        change = result["images_per_second"] / previous["images_per_second"] - 1
+        comparisons.append(
+            {
+                "layer": result["layer"],
+                "mode": result["mode"],
+                "batch_size": result["batch_size"],
+                "image_size": result["image_size"],
+                "baseline_images_per_second": previous["images_per_second"],
+                "images_per_second": result["images_per_second"],
+                "change": change,
+                "regression": change < -max_regression,
+            }
+        )
+    return comparisons
+
+
+def metadata():
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "keras_cv_version": keras_cv.__version__,
+        "keras_version": keras.__version__,
+        "tensorflow_version": tf.__version__,
+        "backend": keras.backend.backend(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def main(_):
+    for mode in FLAGS.modes:
+        if mode not in MODES:
+            raise ValueError(f"`modes` must be in {MODES}. Got {mode}.")
+    names = FLAGS.layers or discover_layers()
+    results = []
+    for name in names:
+        for mode in FLAGS.modes:
+            for batch_size in map(int, FLAGS.batch_sizes):
+                for image_size in map(int, FLAGS.image_sizes):
+                    result = run_case(
+                        name, mode, batch_size, image_size, FLAGS.iterations
+                    )
+                    results.append(result)
+                    if "error" in result:
+                        throughput = f"failed ({result['error']})"
+                    else:
+                        throughput = (
+                            f"{result['images_per_second']:10.1f} images/s"
+                        )
+                    print(
+                        f"{name:<28} {mode:<12} batch_size={batch_size:<4} "
+                        f"image_size={image_size:<4} {throughput}"
+                    )
+
+    report = {"metadata": metadata(), "results": results}
+    if FLAGS.baseline:
+        with open(FLAGS.baseline) as f:
+            baseline = json.load(f)["results"]
+        comparisons = compare_to_baseline(
+            results, baseline, FLAGS.max_regression
+        )
+        report["comparison"] = comparisons
+        print("\nChange from the baseline:")
+        for comparison in comparisons:
+            print(
+                f"{comparison['layer']:<28} {comparison['mode']:<12} "
+                f"batch_size={comparison['batch_size']:<4} "
+                f"image_size={comparison['image_size']:<4} "
+                f"{100 * comparison['change']:+7.1f}%"
+                + ("  REGRESSION" if comparison["regression"] else "")
+            )
+    if FLAGS.output:
+        with open(FLAGS.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if FLAGS.baseline and FLAGS.fail_on_regression:
+        if any(comparison["regression"] for comparison in comparisons):
+            sys.exit(1)
+
+
+class AugmentationBenchmarkTest(tf.test.TestCase):
+    def test_discovers_layers(self):
+        names = discover_layers()
+        self.assertIn("RandomFlip", names)
+        self.assertIn("RandAugment", names)
+        self.assertNotIn("BaseImageAugmentationLayer", names)
+
+    def test_discovers_variants(self):
+        names = discover_layers()
+        self.assertIn("RandAugment:vectorized", names)
+        self.assertEqual(
+            names.index("RandomFlip:backend_native"),
+            names.index("RandomFlip") + 1,
+        )
+
+    def test_every_layer_can_be_built(self):
+        for name in discover_layers():
+            self.assertIsNotNone(build_layer(name, 32), name)
+
+    def test_run_case(self):
+        result = run_case("RandomFlip", "tf_function", 2, 16, iterations=1)
+        self.assertNotIn("error", result)
+        self.assertGreater(result["images_per_second"], 0)
+
+    def test_run_variant(self):
+        result = run_case(
+            "RandomFlip:preserve_uint8", "tf_function", 2, 16, iterations=1
+        )
+        self.assertNotIn("error", result)
+        self.assertEqual(result["layer"], "RandomFlip:preserve_uint8")
+
+    def test_compare_to_baseline(self):
+        case = {"mode": "eager", "batch_size": 2, "image_size": 16}
+        baseline = [
+            {"layer": "A", "images_per_second": 100.0, **case},
+            {"layer": "B", "images_per_second": 100.0, **case},
+        ]
+        results = [
+            {"layer": "A", "images_per_second": 80.0, **case},
+            {"layer": "B", "images_per_second": 95.0, **case},
+            {"layer": "C", "images_per_second": 95.0, **case},
+        ]
+
+        comparisons = compare_to_baseline(results, baseline, 0.1)
+
+        self.assertEqual([c["layer"] for c in comparisons], ["A", "B"])
+        self.assertAllClose([c["change"] for c in comparisons], [-0.2, -0.05])
+        self.assertEqual([c["regression"] for c in comparisons], [True, False])
+
+
+if __name__ == "__main__":
+    app.run(main)
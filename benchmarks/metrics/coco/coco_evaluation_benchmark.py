@@ -0,0 +1,349 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Throughput and memory benchmark for the COCO evaluators.
+
+Every (evaluator, dataset size) case runs in a fresh subprocess, so that the
+reported peak RSS only covers that case. Synthetic batches are generated
+lazily from a fixed seed and their generation time is not measured.
+
+Usage:
+
+```
+python benchmarks/metrics/coco/coco_evaluation_benchmark.py \
+    --evaluators=box_coco_metrics,compute_pycoco_metrics \
+    --num_images=1000,10000,100000 \
+    --output=/tmp/coco_benchmark.json \
+    --baseline=/tmp/coco_benchmark_previous.json
+```
+
+The command exits with a non-zero status if any measurement regressed by
+more than `--tolerance` compared to `--baseline`.
+"""
+
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+flags.DEFINE_list(
+    "evaluators",
+    [
+        "box_coco_metrics",
+        "compute_pycoco_metrics",
+        "mask_coco_metrics",
+        "keypoint_coco_metrics",
+    ],
+    "The evaluators to benchmark.",
+)
+flags.DEFINE_list(
+    "num_images",
+    ["1000", "10000", "100000"],
+    "The synthetic dataset sizes to benchmark each evaluator on.",
+)
+flags.DEFINE_integer("batch_size", 32, "Images per `update_state()` call.")
+flags.DEFINE_integer("max_instances", 25, "Padded instances per image.")
+flags.DEFINE_integer("num_classes", 20, "Number of object classes.")
+flags.DEFINE_integer(
+    "image_size", 128, "Height and width of the synthetic mask images."
+)
+flags.DEFINE_integer("seed", 1337, "Seed of the synthetic datasets.")
+flags.DEFINE_string("output", None, "Where to write the JSON results.")
+flags.DEFINE_string(
+    "baseline", None, "A previous `--output` file to compare against."
+)
+flags.DEFINE_float(
+    "tolerance",
+    0.1,
+    "Relative increase over the baseline reported as a regression.",
+)
+flags.DEFINE_string(
+    "case",
+    None,
+    "Internal: `evaluator:num_images` case to run in this process.",
+)
+
+FLAGS = flags.FLAGS
+
+MEASUREMENTS = ["update_seconds", "result_seconds", "peak_rss_mb"]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is reported in bytes on macOS and in kilobytes elsewhere.
+    if sys.platform == "darwin":
+        return peak / 2**20
+    return peak / 2**10
+
+
+def synthetic_boxes(rng, batch_size):
+    """Generates padded `xyxy` ground truths and noisy predictions."""
+    size = FLAGS.image_size
+    num = FLAGS.max_instances
+    top_left = rng.uniform(0, size * 0.8, size=(batch_size, num, 2))
+    extent = rng.uniform(4, size * 0.5, size=(batch_size, num, 2))
+    boxes = np.concatenate([top_left, top_left + extent], axis=-1)
+    classes = rng.integers(0, FLAGS.num_classes, size=(batch_size, num))
+    num_valid = rng.integers(1, num + 1, size=(batch_size, 1))
+    padding = np.arange(num)[None, :] >= num_valid
+    classes = np.where(padding, -1, classes)
+    boxes = np.where(padding[..., None], -1, boxes)
+
+    noise = rng.normal(scale=2.0, size=boxes.shape)
+    pred_classes = np.where(
+        rng.uniform(size=classes.shape) < 0.8,
+        classes,
+        rng.integers(0, FLAGS.num_classes, size=classes.shape),
+    )
+    pred_classes = np.where(padding, -1, pred_classes)
+    confidence = np.where(padding, -1, rng.uniform(size=classes.shape))
+    y_true = {
+        "boxes": boxes.astype("float32"),
+        "classes": classes.astype("float32"),
+    }
+    y_pred = {
+        "boxes": np.where(padding[..., None], -1, boxes + noise).astype(
+            "float32"
+        ),
+        "classes": pred_classes.astype("float32"),
+        "confidence": confidence.astype("float32"),
+    }
+    return y_true, y_pred
+
+
+def boxes_to_masks(boxes):
+    """Rasterizes `xyxy` boxes into `[batch, instances, size, size]` masks."""
+    grid = np.arange(FLAGS.image_size)
+    x0, y0, x1, y1 = [boxes[..., i, None, None] for i in range(4)]
+    inside_x = (grid[None, None, None, :] >= x0) & (grid < x1)
+    inside_y = (grid[None, None, :, None] >= y0) & (grid[:, None] < y1)
+    return (inside_x & inside_y).astype("uint8")
+
+
+def boxes_to_keypoints(boxes, rng):
+    """Spreads 17 keypoints over each box."""
+    offsets = rng.uniform(size=boxes.shape[:2] + (17, 2))
+    top_left = boxes[..., None, :2]
+    extent = boxes[..., None, 2:] - top_left
+    return (top_left + offsets * extent).astype("float32")
+
+
+def synthetic_batches(evaluator_name, num_images):
+    rng = np.random.default_rng(FLAGS.seed)
+    for start in range(0, num_images, FLAGS.batch_size):
+        batch_size = min(FLAGS.batch_size, num_images - start)
+        y_true, y_pred = synthetic_boxes(rng, batch_size)
+        if evaluator_name == "mask_coco_metrics":
+            y_true = {
+                "masks": boxes_to_masks(y_true["boxes"]),
+                "classes": y_true["classes"],
+            }
+            y_pred = {
+                "masks": boxes_to_masks(y_pred["boxes"]),
+                "classes": y_pred["classes"],
+                "confidence": y_pred["confidence"],
+            }
+        elif evaluator_name == "keypoint_coco_metrics":
+            y_true = {
+                "keypoints": boxes_to_keypoints(y_true["boxes"], rng),
+                "classes": np.where(y_true["classes"] >= 0, 1, -1),
+                "boxes": y_true["boxes"],
+            }
+            y_pred = {
+                "keypoints": boxes_to_keypoints(y_pred["boxes"], rng),
+                "classes": np.where(y_pred["classes"] >= 0, 1, -1),
+                "confidence": y_pred["confidence"],
+            }
+        yield y_true, y_pred
+
+
+class PyCOCOMetricsEvaluator:
+    """Feeds batches straight into `compute_pycoco_metrics()`."""
+
+    def __init__(self):
+        self.reset_state()
+
+    def reset_state(self):
+        self.ground_truths = {
+            "source_id": [],
+            "num_detections": [],
+            "boxes": [],
+            "classes": [],
+        }
+        self.predictions = {
+            "source_id": [],
+            "num_detections": [],
+            "detection_boxes": [],
+            "detection_classes": [],
+            "detection_scores": [],
+        }
+        self.num_images = 0
+
+    def update_state(self, y_true, y_pred):
+        batch_size = y_true["boxes"].shape[0]
+        source_ids = np.char.mod(
+            "%d", np.arange(self.num_images, self.num_images + batch_size) + 1
+        )
+        self.num_images += batch_size
+        # `compute_pycoco_metrics()` expects `yxyx` boxes.
+        self.ground_truths["source_id"].append(source_ids)
+        self.ground_truths["num_detections"].append(
+            np.sum(y_true["classes"] >= 0, axis=-1)
+        )
+        self.ground_truths["boxes"].append(y_true["boxes"][..., [1, 0, 3, 2]])
+        self.ground_truths["classes"].append(y_true["classes"])
+        self.predictions["source_id"].append(source_ids)
+        self.predictions["num_detections"].append(
+            np.sum(y_pred["confidence"] > 0, axis=-1)
+        )
+        self.predictions["detection_boxes"].append(
+            y_pred["boxes"][..., [1, 0, 3, 2]]
+        )
+        self.predictions["detection_classes"].append(y_pred["classes"])
+        self.predictions["detection_scores"].append(y_pred["confidence"])
+
+    def result(self):
+        from keras_cv.src.metrics.coco import compute_pycoco_metrics
+
+        return compute_pycoco_metrics(self.ground_truths, self.predictions)
+
+
+def build_evaluator(evaluator_name):
+    import keras_cv
+
+    # `evaluate_freq` is set high enough to never trigger during updates, so
+    # that update and result latencies are measured separately.
+    never = 2**31
+    if evaluator_name == "box_coco_metrics":
+        return keras_cv.metrics.BoxCOCOMetrics("xyxy", evaluate_freq=never)
+    if evaluator_name == "mask_coco_metrics":
+        return keras_cv.metrics.MaskCOCOMetrics(evaluate_freq=never)
+    if evaluator_name == "keypoint_coco_metrics":
+        return keras_cv.metrics.KeypointCOCOMetrics(
+            "xy", evaluate_freq=never, bounding_box_format="xyxy"
+        )
+    if evaluator_name == "compute_pycoco_metrics":
+        return PyCOCOMetricsEvaluator()
+    raise ValueError(f"Unknown evaluator: {evaluator_name}")
+
+
+def run_case(evaluator_name, num_images):
+    evaluator = build_evaluator(evaluator_name)
+    rss_before_mb = peak_rss_mb()
+
+    update_seconds = 0.0
+    for y_true, y_pred in synthetic_batches(evaluator_name, num_images):
+        start = time.perf_counter()
+        evaluator.update_state(y_true, y_pred)
+        update_seconds += time.perf_counter() - start
+
+    start = time.perf_counter()
+    if isinstance(evaluator, PyCOCOMetricsEvaluator):
+        evaluator.result()
+    else:
+        evaluator.result(force=True)
+    result_seconds = time.perf_counter() - start
+
+    return {
+        "evaluator": evaluator_name,
+        "num_images": num_images,
+        "batch_size": FLAGS.batch_size,
+        "update_seconds": update_seconds,
+        "update_ms_per_image": 1000 * update_seconds / num_images,
+        "result_seconds": result_seconds,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_before_update_mb": rss_before_mb,
+    }
+
+
+def run_case_in_subprocess(evaluator_name, num_images):
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--case")]
+    command = [sys.executable, __file__, *args]
+    command.append(f"--case={evaluator_name}:{num_images}")
+    output = subprocess.run(
+        command, check=True, capture_output=True, text=True
+    ).stdout
+    # The result is always the last line printed by the subprocess.
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare_to_baseline(results, baseline):
+    baseline_results = {
+        (r["evaluator"], r["num_images"]): r for r in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        previous = baseline_results.get(
+            (result["evaluator"], result["num_images"])
+        )
+        if previous is None:
+            continue
+        for key in MEASUREMENTS:
+            change = result[key] / max(previous[key], 1e-9) - 1
+            result[f"{key}_change"] = change
+            if change > FLAGS.tolerance:
+                regressions.append(
+                    f"{result['evaluator']} @ {result['num_images']} images: "
+                    f"{key} {previous[key]:.3f} -> {result[key]:.3f} "
+                    f"({change:+.1%})"
+                )
+    return regressions
+
+
+def main(_):
+    if FLAGS.case:
+        evaluator_name, num_images = FLAGS.case.split(":")
+        print(json.dumps(run_case(evaluator_name, int(num_images))))
+        return
+
+    results = []
+    for evaluator_name in FLAGS.evaluators:
+        for num_images in FLAGS.num_images:
+            result = run_case_in_subprocess(evaluator_name, int(num_images))
+            print(
+                f"{evaluator_name:>24} {result['num_images']:>7} images: "
+                f"update {result['update_seconds']:8.2f}s "
+                f"result {result['result_seconds']:8.2f}s "
+                f"peak RSS {result['peak_rss_mb']:8.1f}MB"
+            )
+            results.append(result)
+
+    regressions = []
+    if FLAGS.baseline:
+        with open(FLAGS.baseline) as f:
+            regressions = compare_to_baseline(results, json.load(f))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+        "regressions": regressions,
+    }
+    if FLAGS.output:
+        with open(FLAGS.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    app.run(main)
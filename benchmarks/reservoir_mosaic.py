@@ -0,0 +1,126 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares `ReservoirMosaic` at a small batch size with `Mosaic` at small and
+large batch sizes.
+
+Besides the runtime, prints the number of distinct samples each sample is
+combined with over an epoch, the diversity `ReservoirMosaic` recovers at small
+batch sizes.
+"""
+
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+
+from keras_cv.layers import Mosaic
+from keras_cv.layers import ReservoirMosaic
+
+
+def mosaic_batch_64(dataset):
+    return dataset.batch(64).map(Mosaic(), num_parallel_calls=tf.data.AUTOTUNE)
+
+
+def mosaic_batch_8(dataset):
+    return dataset.batch(8).map(Mosaic(), num_parallel_calls=tf.data.AUTOTUNE)
+
+
+def reservoir_mosaic_batch_8(dataset):
+    # The reservoir is stateful, so batches are augmented one at a time.
+    return dataset.batch(8).map(ReservoirMosaic(reservoir_size=64))
+
+
+def partner_diversity(pipeline, num_images):
+    """The mean number of samples a sample is combined with in an epoch."""
+    labels = tf.one_hot(tf.range(num_images), num_images)
+    images = tf.zeros((num_images, 32, 32, 3))
+    dataset = pipeline(
+        tf.data.Dataset.from_tensor_slices({"images": images, "labels": labels})
+    )
+    partners = [
+        np.count_nonzero(outputs["labels"], axis=-1)
+        for outputs in dataset.as_numpy_iterator()
+    ]
+    return np.mean(np.concatenate(partners))
+
+
+class ReservoirMosaicTest(tf.test.TestCase):
+    def test_partners_from_previous_batches(self):
+        labels = tf.one_hot(tf.range(8), 8)
+        layer = ReservoirMosaic(offset=(0.5, 0.5), reservoir_size=8)
+        for i in range(0, 8, 2):
+            outputs = layer(
+                {
+                    "images": tf.zeros((2, 8, 8, 3)),
+                    "labels": labels[i : i + 2],
+                }
+            )
+
+        # The last batch also draws the samples of the previous batches.
+        self.assertGreater(
+            np.count_nonzero(np.sum(outputs["labels"][:, :6], axis=0)), 0
+        )
+
+
+if __name__ == "__main__":
+    # Run benchmark
+    (x_train, y_train), _ = keras.datasets.cifar10.load_data()
+    x_train = x_train.astype(np.float32)
+    y_train = tf.one_hot(np.squeeze(y_train), 10)
+
+    num_images = [1000, 2000, 5000, 10000]
+    results = {}
+    pipeline_candidates = [
+        reservoir_mosaic_batch_8,
+        mosaic_batch_8,
+        mosaic_batch_64,
+    ]
+
+    for pipeline in pipeline_candidates:
+        c = pipeline.__name__
+        runtimes = []
+        print(f"Timing {c}")
+        print(f"Partners per sample: {partner_diversity(pipeline, 512)}")
+
+        for n_images in num_images:
+            dataset = pipeline(
+                tf.data.Dataset.from_tensor_slices(
+                    {"images": x_train[:n_images], "labels": y_train[:n_images]}
+                )
+            )
+            # warmup
+            for _ in dataset:
+                pass
+
+            t0 = time.time()
+            for _ in dataset:
+                pass
+            t1 = time.time()
+            runtimes.append(t1 - t0)
+            print(f"Runtime for {c}, n_images={n_images}: {t1-t0}")
+        results[c] = runtimes
+
+    plt.figure()
+    for key in results:
+        plt.plot(num_images, results[key], label=key)
+        plt.xlabel("Number images")
+
+    plt.ylabel("Runtime (seconds)")
+    plt.legend()
+    plt.savefig("comparison.png")
+
+    # Run unit tests
+    tf.test.main()
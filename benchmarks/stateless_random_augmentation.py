@@ -0,0 +1,102 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+import tensorflow as tf
+from tensorflow import keras
+
+from keras_cv.layers import RandAugment
+from keras_cv.layers import StatelessRandomAugmentation
+
+
+def stateful_pipeline(dataset):
+    layer = RandAugment(value_range=(0, 255))
+    return dataset.batch(32).map(
+        lambda images: layer(images), num_parallel_calls=tf.data.AUTOTUNE
+    )
+
+
+def stateless_pipeline(dataset):
+    layer = StatelessRandomAugmentation(
+        RandAugment(value_range=(0, 255)), seed=1337
+    )
+    return (
+        dataset.enumerate()
+        .batch(32)
+        .map(
+            lambda indices, images: layer(images, sample_indices=indices),
+            num_parallel_calls=tf.data.AUTOTUNE,
+        )
+    )
+
+
+class StatelessRandomAugmentationTest(tf.test.TestCase):
+    def test_independent_of_batch_size(self):
+        images = np.random.uniform(0, 255, (8, 32, 32, 3)).astype("float32")
+        layer = StatelessRandomAugmentation(
+            RandAugment(value_range=(0, 255)), seed=1
+        )
+
+        batch = layer(images, sample_indices=tf.range(8))
+        halves = [
+            layer(images[:4], sample_indices=tf.range(4)),
+            layer(images[4:], sample_indices=tf.range(4, 8)),
+        ]
+
+        self.assertAllClose(batch, tf.concat(halves, axis=0), atol=1e-3)
+
+
+if __name__ == "__main__":
+    # Run benchmark
+    (x_train, _), _ = keras.datasets.cifar10.load_data()
+    x_train = x_train.astype(np.float32)
+
+    num_images = [100, 200, 500, 1000]
+    results = {}
+    pipeline_candidates = [stateless_pipeline, stateful_pipeline]
+
+    for pipeline in pipeline_candidates:
+        c = pipeline.__name__
+        runtimes = []
+        print(f"Timing {c}")
+
+        for n_images in num_images:
+            dataset = pipeline(
+                tf.data.Dataset.from_tensor_slices(x_train[:n_images])
+            )
+            # warmup
+            for _ in dataset:
+                pass
+
+            t0 = time.time()
+            for _ in dataset:
+                pass
+            t1 = time.time()
+            runtimes.append(t1 - t0)
+            print(f"Runtime for {c}, n_images={n_images}: {t1-t0}")
+        results[c] = runtimes
+
+    plt.figure()
+    for key in results:
+        plt.plot(num_images, results[key], label=key)
+        plt.xlabel("Number images")
+
+    plt.ylabel("Runtime (seconds)")
+    plt.legend()
+    plt.savefig("comparison.png")
+
+    # Run unit tests
+    tf.test.main()
@@ -0,0 +1,166 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Memory and latency benchmark for `YOLOV8LabelEncoder` GT chunking.
+
+Every (number of GT boxes, `gt_chunk_size`) case runs in a fresh subprocess,
+so that the reported peak RSS only covers that case.
+
+Usage:
+
+```
+python benchmarks/yolo_v8_label_encoder_memory.py \
+    --image_size=1280 \
+    --num_gt_boxes=50,200,500 \
+    --gt_chunk_sizes=none,64,16
+```
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+flags.DEFINE_integer("image_size", 1280, "Height and width of the inputs.")
+flags.DEFINE_integer("batch_size", 4, "Batch size of the encoded labels.")
+flags.DEFINE_integer("num_classes", 80, "Number of object classes.")
+flags.DEFINE_list(
+    "num_gt_boxes",
+    ["50", "200", "500"],
+    "Padded GT boxes per image to benchmark.",
+)
+flags.DEFINE_list(
+    "gt_chunk_sizes",
+    ["none", "64", "16"],
+    "Values of `gt_chunk_size` to benchmark, `none` disables chunking.",
+)
+flags.DEFINE_integer("iterations", 3, "Timed iterations per case.")
+flags.DEFINE_string(
+    "case",
+    None,
+    "Internal: `num_gt_boxes:gt_chunk_size` case to run in this process.",
+)
+
+FLAGS = flags.FLAGS
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is reported in bytes on macOS and in kilobytes elsewhere.
+    if sys.platform == "darwin":
+        return peak / 2**20
+    return peak / 2**10
+
+
+def synthetic_inputs(num_gt_boxes, anchors):
+    rng = np.random.default_rng(seed=1337)
+    size = FLAGS.image_size
+    batch_size = FLAGS.batch_size
+    num_anchors = anchors.shape[0]
+
+    top_left = rng.uniform(0, size * 0.9, size=(batch_size, num_gt_boxes, 2))
+    extent = rng.uniform(8, size * 0.25, size=(batch_size, num_gt_boxes, 2))
+    gt_bboxes = np.concatenate([top_left, top_left + extent], axis=-1)
+    gt_labels = rng.integers(
+        0, FLAGS.num_classes, size=(batch_size, num_gt_boxes)
+    )
+    gt_mask = np.ones((batch_size, num_gt_boxes, 1), dtype=bool)
+
+    offsets = rng.uniform(4, 64, size=(2, batch_size, num_anchors, 2))
+    decode_bboxes = np.concatenate(
+        [anchors - offsets[0], anchors + offsets[1]], axis=-1
+    )
+    scores = rng.uniform(size=(batch_size, num_anchors, FLAGS.num_classes))
+    return (
+        scores.astype("float32"),
+        decode_bboxes.astype("float32"),
+        anchors.astype("float32"),
+        gt_labels.astype("float32"),
+        gt_bboxes.astype("float32"),
+        gt_mask,
+    )
+
+
+def run_case(num_gt_boxes, gt_chunk_size):
+    from keras_cv.src.backend import ops
+    from keras_cv.src.models.object_detection.yolo_v8.yolo_v8_detector import (
+        get_anchors,
+    )
+    from keras_cv.src.models.object_detection.yolo_v8.yolo_v8_label_encoder import (  # noqa: E501
+        YOLOV8LabelEncoder,
+    )
+
+    image_shape = (FLAGS.image_size, FLAGS.image_size, 3)
+    anchor_points, strides = get_anchors(image_shape=image_shape)
+    anchors = ops.convert_to_numpy(anchor_points * strides[:, None])
+    inputs = synthetic_inputs(num_gt_boxes, anchors)
+    encoder = YOLOV8LabelEncoder(
+        num_classes=FLAGS.num_classes, gt_chunk_size=gt_chunk_size
+    )
+    rss_before_mb = peak_rss_mb()
+
+    # The first call is excluded from the timings.
+    encoder(*inputs)
+    start = time.perf_counter()
+    for _ in range(FLAGS.iterations):
+        outputs = encoder(*inputs)
+    ops.convert_to_numpy(outputs[1])
+    seconds = (time.perf_counter() - start) / FLAGS.iterations
+
+    return {
+        "num_anchors": int(anchors.shape[0]),
+        "num_gt_boxes": num_gt_boxes,
+        "gt_chunk_size": gt_chunk_size,
+        "seconds_per_batch": seconds,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_before_encoding_mb": rss_before_mb,
+    }
+
+
+def run_case_in_subprocess(num_gt_boxes, gt_chunk_size):
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--case")]
+    command = [sys.executable, __file__, *args]
+    command.append(f"--case={num_gt_boxes}:{gt_chunk_size}")
+    output = subprocess.run(
+        command, check=True, capture_output=True, text=True
+    ).stdout
+    # The result is always the last line printed by the subprocess.
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(_):
+    if FLAGS.case:
+        num_gt_boxes, gt_chunk_size = FLAGS.case.split(":")
+        gt_chunk_size = None if gt_chunk_size == "none" else int(gt_chunk_size)
+        print(json.dumps(run_case(int(num_gt_boxes), gt_chunk_size)))
+        return
+
+    for num_gt_boxes in FLAGS.num_gt_boxes:
+        for gt_chunk_size in FLAGS.gt_chunk_sizes:
+            result = run_case_in_subprocess(num_gt_boxes, gt_chunk_size)
+            print(
+                f"{result['num_anchors']:>6} anchors "
+                f"{result['num_gt_boxes']:>5} GT boxes "
+                f"gt_chunk_size={str(result['gt_chunk_size']):>5}: "
+                f"{1000 * result['seconds_per_batch']:9.1f}ms/batch "
+                f"peak RSS {result['peak_rss_mb']:8.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    app.run(main)
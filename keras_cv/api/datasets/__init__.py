@@ -7,3 +7,4 @@ since your modifications would be overwritten.
 from keras_cv.api.datasets import imagenet
 from keras_cv.api.datasets import pascal_voc
 from keras_cv.api.datasets import waymo
+from keras_cv.src.datasets.aspect_ratio_bucketing import bucket_by_aspect_ratio
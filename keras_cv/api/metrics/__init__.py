@@ -7,3 +7,9 @@ since your modifications would be overwritten.
 from keras_cv.src.metrics.object_detection.box_coco_metrics import (
     BoxCOCOMetrics,
 )
+from keras_cv.src.metrics.object_detection.keypoint_coco_metrics import (
+    KeypointCOCOMetrics,
+)
+from keras_cv.src.metrics.object_detection.mask_coco_metrics import (
+    MaskCOCOMetrics,
+)
@@ -0,0 +1,173 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+
+import tensorflow as tf
+
+from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.layers.preprocessing.resizing import Resizing
+
+BOUNDING_BOXES = "bounding_boxes"
+# The keys resized by `Resizing`, the other keys are passed through.
+RESIZED_KEYS = ("images", BOUNDING_BOXES, "segmentation_masks")
+
+
+@keras_cv_export("keras_cv.datasets.bucket_by_aspect_ratio")
+def bucket_by_aspect_ratio(
+    bucket_sizes,
+    batch_size,
+    bounding_box_format=None,
+    interpolation="bilinear",
+    drop_remainder=False,
+):
+    """Batches images of distinct sizes into dense batches of similar shape.
+
+    Batching images of distinct sizes requires ragged tensors, which force the
+    augmentation layers to augment one image at a time, or padding every image
+    to the largest size. Instead, this transformation assigns every sample to
+    the bucket with the closest aspect ratio, resizes it to the size of the
+    bucket with `keras_cv.layers.Resizing(pad_to_aspect_ratio=True)`, and
+    batches the samples of every bucket. Every batch is a dense batch of a
+    single bucket, so downstream augmentations stay vectorized, while the
+    padding is limited to the difference between the aspect ratios of the
+    images and the one of their bucket.
+
+    Bounding boxes are padded with -1 to the largest number of boxes of the
+    batch. The batches of the buckets are interleaved, so the shape of the
+    images varies between batches.
+
+    Usage:
+    ```python
+    dataset = dataset.apply(
+        keras_cv.datasets.bucket_by_aspect_ratio(
+            bucket_sizes=[(640, 640), (480, 640), (640, 480)],
+            batch_size=16,
+            bounding_box_format="xywh",
+        )
+    )
+    ```
+
+    Args:
+        bucket_sizes: a list of `(height, width)` tuples, the sizes of the
+            images of the buckets.
+        batch_size: the number of samples in a batch.
+        bounding_box_format: The format of bounding boxes of the samples, if
+            any. Refer to
+            https://keras.io/api/keras_cv/bounding_box/formats/ for more
+            details on supported bounding box formats.
+        interpolation: the interpolation used to resize the images, defaults
+            to `"bilinear"`.
+        drop_remainder: whether to drop the last batch of every bucket if it
+            has fewer than `batch_size` samples, defaults to False.
+
+    Returns:
+        A function of a `tf.data.Dataset` of unbatched samples, dictionaries
+        with an `"images"` key and optionally `"labels"`,
+        `"bounding_boxes"` and `"segmentation_masks"` keys, to pass to
+        `tf.data.Dataset.apply()`.
+    """
+    if not bucket_sizes:
+        raise ValueError(
+            "`bucket_by_aspect_ratio()` expects at least one bucket size. "
+            f"Got bucket_sizes={bucket_sizes}."
+        )
+    resizers = [
+        Resizing(
+            height,
+            width,
+            interpolation=interpolation,
+            pad_to_aspect_ratio=True,
+            bounding_box_format=bounding_box_format,
+        )
+        for height, width in bucket_sizes
+    ]
+    log_aspect_ratios = tf.constant(
+        [math.log(width / height) for height, width in bucket_sizes]
+    )
+
+    def assign_bucket(sample):
+        if not isinstance(sample, dict) or "images" not in sample:
+            raise ValueError(
+                "`bucket_by_aspect_ratio()` expects samples to be "
+                "dictionaries with an `images` key. Got "
+                f"sample={sample}."
+            )
+        shape = tf.cast(tf.shape(sample["images"]), tf.float32)
+        log_aspect_ratio = tf.math.log(shape[1] / shape[0])
+        bucket = tf.argmin(tf.abs(log_aspect_ratios - log_aspect_ratio))
+
+        def resize_fn(resizer):
+            def resize():
+                outputs = resizer(_copy_resized_keys(sample))
+                if BOUNDING_BOXES in outputs:
+                    outputs[BOUNDING_BOXES] = _to_dense(outputs[BOUNDING_BOXES])
+                return {**sample, **outputs}
+
+            return resize
+
+        resized = tf.switch_case(
+            tf.cast(bucket, tf.int32),
+            [resize_fn(resizer) for resizer in resizers],
+        )
+        return bucket, resized
+
+    def batch_bucket(bucket, window):
+        window = window.map(lambda bucket, sample: sample)
+        return window.padded_batch(
+            batch_size,
+            padding_values=_padding_values(window.element_spec),
+            drop_remainder=drop_remainder,
+        )
+
+    def apply(dataset):
+        return dataset.map(
+            assign_bucket, num_parallel_calls=tf.data.AUTOTUNE
+        ).group_by_window(
+            key_func=lambda bucket, sample: bucket,
+            reduce_func=batch_bucket,
+            window_size=batch_size,
+        )
+
+    return apply
+
+
+def _copy_resized_keys(sample):
+    # `Resizing` updates the dictionaries it is called on.
+    sample = {key: sample[key] for key in RESIZED_KEYS if key in sample}
+    if BOUNDING_BOXES in sample:
+        sample[BOUNDING_BOXES] = dict(sample[BOUNDING_BOXES])
+    return sample
+
+
+def _to_dense(bounding_boxes):
+    boxes = bounding_boxes["boxes"]
+    if isinstance(boxes, tf.RaggedTensor):
+        boxes = boxes.to_tensor(default_value=-1)
+    return {
+        **bounding_boxes,
+        "boxes": tf.reshape(boxes, (-1, 4)),
+        "classes": tf.reshape(bounding_boxes["classes"], (-1,)),
+    }
+
+
+def _padding_values(element_spec):
+    padding_values = tf.nest.map_structure(
+        lambda spec: tf.constant(0, spec.dtype), element_spec
+    )
+    if BOUNDING_BOXES in element_spec:
+        padding_values[BOUNDING_BOXES] = tf.nest.map_structure(
+            lambda spec: tf.constant(-1, spec.dtype),
+            element_spec[BOUNDING_BOXES],
+        )
+    return padding_values
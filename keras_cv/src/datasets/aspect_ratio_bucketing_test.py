@@ -0,0 +1,108 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import tensorflow as tf
+
+from keras_cv.src.datasets.aspect_ratio_bucketing import bucket_by_aspect_ratio
+from keras_cv.src.tests.test_case import TestCase
+
+
+def make_dataset(image_sizes, num_boxes=None):
+    def generator():
+        for i, (height, width) in enumerate(image_sizes):
+            sample = {
+                "images": tf.ones((height, width, 3)),
+                "labels": tf.one_hot(i % 2, 2),
+            }
+            if num_boxes is not None:
+                sample["bounding_boxes"] = {
+                    "boxes": tf.tile(
+                        [[0.0, 0.0, width / 2, height / 2]],
+                        (num_boxes[i], 1),
+                    ),
+                    "classes": tf.ones((num_boxes[i],)),
+                }
+            yield sample
+
+    output_signature = {
+        "images": tf.TensorSpec((None, None, 3), tf.float32),
+        "labels": tf.TensorSpec((2,), tf.float32),
+    }
+    if num_boxes is not None:
+        output_signature["bounding_boxes"] = {
+            "boxes": tf.TensorSpec((None, 4), tf.float32),
+            "classes": tf.TensorSpec((None,), tf.float32),
+        }
+    return tf.data.Dataset.from_generator(
+        generator, output_signature=output_signature
+    )
+
+
+@pytest.mark.tf_only
+class BucketByAspectRatioTest(TestCase):
+    def test_batches_have_the_size_of_their_bucket(self):
+        dataset = make_dataset(
+            [(40, 40), (30, 60), (50, 52), (32, 70), (64, 60), (20, 38)]
+        ).apply(
+            bucket_by_aspect_ratio(
+                bucket_sizes=[(32, 32), (16, 32)], batch_size=3
+            )
+        )
+
+        shapes = sorted(tuple(batch["images"].shape) for batch in dataset)
+
+        self.assertEqual(shapes, [(3, 16, 32, 3), (3, 32, 32, 3)])
+
+    def test_pads_to_aspect_ratio(self):
+        dataset = make_dataset([(10, 30)]).apply(
+            bucket_by_aspect_ratio(bucket_sizes=[(16, 32)], batch_size=1)
+        )
+
+        (batch,) = list(dataset)
+
+        # The image is resized to 32x10, and padded at the bottom.
+        self.assertAllClose(batch["images"][0, :10], tf.ones((10, 32, 3)))
+        self.assertAllClose(batch["images"][0, 11:], tf.zeros((5, 32, 3)))
+
+    def test_bounding_boxes_are_dense(self):
+        dataset = make_dataset([(20, 20), (40, 40)], num_boxes=[1, 3]).apply(
+            bucket_by_aspect_ratio(
+                bucket_sizes=[(10, 10)],
+                batch_size=2,
+                bounding_box_format="xyxy",
+            )
+        )
+
+        (batch,) = list(dataset)
+
+        boxes = batch["bounding_boxes"]["boxes"]
+        self.assertIsInstance(boxes, tf.Tensor)
+        self.assertEqual(boxes.shape, (2, 3, 4))
+        self.assertAllClose(boxes[0, 0], [0, 0, 5, 5])
+        self.assertAllClose(boxes[0, 1:], -tf.ones((2, 4)))
+        self.assertAllClose(batch["bounding_boxes"]["classes"][0], [1, -1, -1])
+        self.assertAllClose(batch["labels"], [[1, 0], [0, 1]])
+
+    def test_drop_remainder(self):
+        dataset = make_dataset([(40, 40), (30, 30), (20, 20)]).apply(
+            bucket_by_aspect_ratio(
+                bucket_sizes=[(8, 8)], batch_size=2, drop_remainder=True
+            )
+        )
+
+        self.assertEqual(len(list(dataset)), 1)
+
+    def test_no_bucket_sizes(self):
+        with self.assertRaisesRegexp(ValueError, "at least one bucket size"):
+            bucket_by_aspect_ratio(bucket_sizes=[], batch_size=2)
@@ -43,6 +43,9 @@ from keras_cv.src.layers.overlapping_patching_embedding import (
     OverlappingPatchingAndEmbedding,
 )
 from keras_cv.src.layers.preprocessing.aug_mix import AugMix
+from keras_cv.src.layers.preprocessing.augmentation_profiler import (
+    AugmentationProfiler,
+)
 from keras_cv.src.layers.preprocessing.auto_contrast import AutoContrast
 from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
     BaseImageAugmentationLayer,
@@ -51,6 +54,9 @@ from keras_cv.src.layers.preprocessing.channel_shuffle import ChannelShuffle
 from keras_cv.src.layers.preprocessing.cut_mix import CutMix
 from keras_cv.src.layers.preprocessing.equalization import Equalization
 from keras_cv.src.layers.preprocessing.fourier_mix import FourierMix
+from keras_cv.src.layers.preprocessing.fused_affine_augmentation import (
+    FusedAffineAugmentation,
+)
 from keras_cv.src.layers.preprocessing.grayscale import Grayscale
 from keras_cv.src.layers.preprocessing.grid_mask import GridMask
 from keras_cv.src.layers.preprocessing.jittered_resize import JitteredResize
@@ -102,8 +108,12 @@ from keras_cv.src.layers.preprocessing.repeated_augmentation import (
     RepeatedAugmentation,
 )
 from keras_cv.src.layers.preprocessing.rescaling import Rescaling
+from keras_cv.src.layers.preprocessing.reservoir_mosaic import ReservoirMosaic
 from keras_cv.src.layers.preprocessing.resizing import Resizing
 from keras_cv.src.layers.preprocessing.solarization import Solarization
+from keras_cv.src.layers.preprocessing.stateless_random_augmentation import (  # noqa: E501
+    StatelessRandomAugmentation,
+)
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
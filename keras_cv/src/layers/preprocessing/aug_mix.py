@@ -16,14 +16,33 @@ import tensorflow as tf
 
 from keras_cv.src import layers
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils import preprocessing
 
+# The augmentations sampled by the chains.
+AUTO_CONTRAST = 0
+EQUALIZE = 1
+POSTERIZE = 2
+ROTATE = 3
+SOLARIZE = 4
+SHEAR_X = 5
+SHEAR_Y = 6
+TRANSLATE_X = 7
+TRANSLATE_Y = 8
+NUM_AUGMENTATIONS = 9
+
+# The sub-batch of every augmentation, shifted by one so that the images whose
+# chain has ended, with an augmentation of -1, go to sub-batch 0. The
+# geometric augmentations share a sub-batch, as they are all applied with a
+# single projective transform.
+SUB_BATCHES = [0, 1, 2, 3, 5, 4, 5, 5, 5, 5]
+NUM_SUB_BATCHES = 6
+
 
 @keras_cv_export("keras_cv.layers.AugMix")
-class AugMix(BaseImageAugmentationLayer):
+class AugMix(VectorizedBaseImageAugmentationLayer):
     """Performs the AugMix data augmentation technique.
 
     AugMix aims to produce images with variety while preserving the image
@@ -35,6 +54,10 @@ class AugMix(BaseImageAugmentationLayer):
     together with the original image based on random samples from a Dirichlet
     distribution.
 
+    The chains of all the images of a batch are stacked into a single batch,
+    and every step of the chains applies each augmentation once, to the
+    sub-batch of images which sampled it.
+
     Args:
         value_range: the range of values the incoming images will have.
             Represented as a two number tuple written (low, high).
@@ -88,7 +111,6 @@ class AugMix(BaseImageAugmentationLayer):
 
         self.alpha = alpha
         self.seed = seed
-        self.auto_vectorize = False
         self.severity = severity
         self.severity_factor = preprocessing.parse_factor(
             self.severity,
@@ -101,283 +123,257 @@ class AugMix(BaseImageAugmentationLayer):
         # initialize layers
         self.auto_contrast = layers.AutoContrast(value_range=self.value_range)
         self.equalize = layers.Equalization(value_range=self.value_range)
+        self.built = True
 
     def _sample_from_dirichlet(self, alpha):
-        gamma_sample = tf.random.gamma(
-            shape=(),
+        gamma_sample = tf.random.stateless_gamma(
+            shape=tf.shape(alpha),
+            seed=self._random_generator.make_seeds()[:, 0],
             alpha=alpha,
         )
         return gamma_sample / tf.reduce_sum(
             gamma_sample, axis=-1, keepdims=True
         )
 
-    def _sample_from_beta(self, alpha, beta):
-        sample_alpha = tf.random.gamma(
-            (),
+    def _sample_from_beta(self, alpha, beta, shape):
+        seeds = self._random_generator.make_seeds(2)
+        sample_alpha = tf.random.stateless_gamma(
+            shape,
+            seed=seeds[:, 0],
             alpha=alpha,
         )
-        sample_beta = tf.random.gamma(
-            (),
+        sample_beta = tf.random.stateless_gamma(
+            shape,
+            seed=seeds[:, 1],
             alpha=beta,
         )
         return sample_alpha / (sample_alpha + sample_beta)
 
-    def _sample_depth(self):
-        return self._random_generator.uniform(
-            shape=(),
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        chains_shape = (batch_size, self.num_chains)
+        augmentations_shape = (batch_size, self.num_chains, self.chain_depth[1])
+
+        # Generate random values of chain_mixing_weights and weight_sample
+        chain_mixing_weights = self._sample_from_dirichlet(
+            tf.ones(chains_shape) * self.alpha
+        )
+        weight_sample = self._sample_from_beta(
+            self.alpha, self.alpha, (batch_size,)
+        )
+
+        # Generate the depth of every chain, and the augmentations of every
+        # step of the chains.
+        chain_depths = self._random_generator.uniform(
+            shape=chains_shape,
             minval=self.chain_depth[0],
             maxval=self.chain_depth[1] + 1,
             dtype=tf.int32,
         )
+        augmentations = self._random_generator.uniform(
+            shape=augmentations_shape,
+            minval=0,
+            maxval=NUM_AUGMENTATIONS,
+            dtype=tf.int32,
+        )
+        severities = self.severity_factor(shape=augmentations_shape)
+        inversions = tf.where(
+            self._random_generator.uniform(shape=augmentations_shape) > 0.5,
+            -1.0,
+            1.0,
+        )
+
+        return {
+            "chain_mixing_weights": chain_mixing_weights,
+            "weight_sample": weight_sample,
+            "chain_depths": chain_depths,
+            "augmentations": augmentations,
+            "severities": severities,
+            "inversions": inversions,
+        }
 
-    def _loop_on_depth(self, depth_level, image_aug):
-        op_index = self._random_generator.uniform(
-            shape=(), minval=0, maxval=8, dtype=tf.int32
+    def augment_images(self, images, transformations, **kwargs):
+        batch_size = tf.shape(images)[0]
+
+        # The chains are stacked as a batch of `num_chains * batch_size`
+        # images, chain after chain.
+        def stack_chains(x):
+            x = tf.transpose(x, [1, 0] + list(range(2, len(x.shape))))
+            return tf.reshape(x, tf.concat([[-1], tf.shape(x)[2:]], axis=0))
+
+        chains = tf.tile(images, [self.num_chains, 1, 1, 1])
+        chain_depths = stack_chains(transformations["chain_depths"])
+        augmentations = stack_chains(transformations["augmentations"])
+        severities = stack_chains(transformations["severities"])
+        inversions = stack_chains(transformations["inversions"])
+
+        for depth in range(self.chain_depth[1]):
+            chains = self._augment_step(
+                chains,
+                tf.where(depth < chain_depths, augmentations[:, depth], -1),
+                severities[:, depth],
+                inversions[:, depth],
+            )
+
+        chains = tf.reshape(
+            chains,
+            tf.concat(
+                [[self.num_chains, batch_size], tf.shape(images)[1:]], axis=0
+            ),
         )
-        image_aug = self._apply_op(image_aug, op_index)
-        depth_level += 1
-        return depth_level, image_aug
-
-    def _loop_on_width(self, image, chain_mixing_weights, curr_chain, result):
-        image_aug = tf.identity(image)
-        chain_depth = self._sample_depth()
-
-        depth_level = tf.constant([0], dtype=tf.int32)
-        depth_level, image_aug = tf.while_loop(
-            lambda depth_level, image_aug: tf.less(depth_level, chain_depth),
-            self._loop_on_depth,
-            [depth_level, image_aug],
+        chain_mixing_weights = tf.cast(
+            tf.transpose(transformations["chain_mixing_weights"]),
+            images.dtype,
+        )
+        result = tf.reduce_sum(
+            chain_mixing_weights[:, :, tf.newaxis, tf.newaxis, tf.newaxis]
+            * chains,
+            axis=0,
+        )
+        weight_sample = tf.cast(transformations["weight_sample"], images.dtype)[
+            :, tf.newaxis, tf.newaxis, tf.newaxis
+        ]
+        return weight_sample * images + (1 - weight_sample) * result
+
+    def _augment_step(self, images, augmentations, severities, inversions):
+        """Applies one augmentation to every image, -1 leaves it unchanged."""
+        shape = images.shape
+        sub_batches = tf.gather(SUB_BATCHES, augmentations + 1)
+        indices = tf.dynamic_partition(
+            tf.range(tf.shape(images)[0]), sub_batches, NUM_SUB_BATCHES
+        )
+        # Only the images of the augmented sub-batches are gathered.
+        sub_images, sub_augmentations, sub_severities, sub_inversions = (
+            [tf.gather(x, sub_batch) for sub_batch in indices[1:]]
+            for x in (images, augmentations, severities, inversions)
+        )
+        augmented = [
+            self._auto_contrast(sub_images[0]),
+            self._equalize(sub_images[1]),
+            self._posterize(sub_images[2], sub_severities[2]),
+            self._solarize(sub_images[3], sub_severities[3]),
+            self._transform(
+                sub_images[4],
+                sub_augmentations[4],
+                sub_severities[4],
+                sub_inversions[4],
+            ),
+        ]
+        # The augmented images override the images they are computed from.
+        augmented = tf.dynamic_stitch(
+            [tf.range(tf.shape(images)[0])] + indices[1:], [images] + augmented
         )
-        result += tf.gather(chain_mixing_weights, curr_chain) * image_aug
-        curr_chain += 1
-        return image, chain_mixing_weights, curr_chain, result
+        augmented.set_shape(shape)
+        return augmented
 
-    def _auto_contrast(self, image):
-        return self.auto_contrast(image)
+    def _auto_contrast(self, images):
+        return self.auto_contrast.augment_images(images)
 
-    def _equalize(self, image):
-        return self.equalize(image)
+    def _equalize(self, images):
+        return self.equalize.augment_images(images)
 
-    def _posterize(self, image):
-        image = preprocessing.transform_value_range(
-            images=image,
+    def _posterize(self, images, severities):
+        images = preprocessing.transform_value_range(
+            images=images,
             original_range=self.value_range,
             target_range=[0, 255],
+            dtype=self.compute_dtype,
         )
 
-        bits = tf.cast(self.severity_factor() * 3, tf.int32)
-        shift = tf.cast(4 - bits + 1, tf.uint8)
-        image = tf.cast(image, tf.uint8)
-        image = tf.bitwise.left_shift(
-            tf.bitwise.right_shift(image, shift), shift
+        bits = tf.cast(severities * 3, tf.int32)
+        shifts = tf.cast(4 - bits + 1, tf.uint8)
+        shifts = shifts[:, tf.newaxis, tf.newaxis, tf.newaxis]
+        images = tf.cast(images, tf.uint8)
+        images = tf.bitwise.left_shift(
+            tf.bitwise.right_shift(images, shifts), shifts
         )
-        image = tf.cast(image, self.compute_dtype)
+        images = tf.cast(images, self.compute_dtype)
         return preprocessing.transform_value_range(
-            images=image,
+            images=images,
             original_range=[0, 255],
             target_range=self.value_range,
+            dtype=self.compute_dtype,
         )
 
-    def _rotate(self, image):
-        angle = tf.expand_dims(
-            tf.cast(self.severity_factor() * 30, tf.float32), axis=0
+    def _solarize(self, images, severities):
+        thresholds = tf.cast(
+            tf.cast(severities * 255, tf.int32), self.compute_dtype
         )
-        shape = tf.cast(tf.shape(image), tf.float32)
-
-        return preprocessing.transform(
-            tf.expand_dims(image, 0),
-            preprocessing.get_rotation_matrix(angle, shape[0], shape[1]),
-        )[0]
+        thresholds = thresholds[:, tf.newaxis, tf.newaxis, tf.newaxis]
 
-    def _solarize(self, image):
-        threshold = tf.cast(
-            tf.cast(self.severity_factor() * 255, tf.int32), tf.float32
-        )
-
-        image = preprocessing.transform_value_range(
-            image, original_range=self.value_range, target_range=(0, 255)
+        images = preprocessing.transform_value_range(
+            images,
+            original_range=self.value_range,
+            target_range=(0, 255),
+            dtype=self.compute_dtype,
         )
-        result = tf.clip_by_value(image, 0, 255)
-        result = tf.where(result < threshold, result, 255 - result)
+        result = tf.clip_by_value(images, 0, 255)
+        result = tf.where(result < thresholds, result, 255 - result)
         return preprocessing.transform_value_range(
-            result, original_range=(0, 255), target_range=self.value_range
+            result,
+            original_range=(0, 255),
+            target_range=self.value_range,
+            dtype=self.compute_dtype,
         )
 
-    def _shear_x(self, image):
-        x = tf.cast(self.severity_factor() * 0.3, tf.float32)
-        x *= preprocessing.random_inversion(self._random_generator)
-        transform_x = layers.RandomShear._format_transform(
-            [1.0, x, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]
-        )
-        return preprocessing.transform(
-            images=tf.expand_dims(image, 0), transforms=transform_x
-        )[0]
-
-    def _shear_y(self, image):
-        y = tf.cast(self.severity_factor() * 0.3, tf.float32)
-        y *= preprocessing.random_inversion(self._random_generator)
-        transform_x = self._format_random_shear_transform(
-            [1.0, 0.0, 0.0, y, 1.0, 0.0, 0.0, 0.0]
-        )
-        return preprocessing.transform(
-            images=tf.expand_dims(image, 0), transforms=transform_x
-        )[0]
-
-    @staticmethod
-    def _format_random_shear_transform(transform):
-        transform = tf.convert_to_tensor(transform, dtype=tf.float32)
-        return transform[tf.newaxis]
-
-    def _translate_x(self, image):
-        shape = tf.cast(tf.shape(image), tf.float32)
-        x = tf.cast(self.severity_factor() * shape[1] / 3, tf.float32)
-        x = tf.expand_dims(tf.expand_dims(x, axis=0), axis=0)
-        x *= preprocessing.random_inversion(self._random_generator)
-        x = tf.cast(x, tf.int32)
-
-        translations = tf.cast(
-            tf.concat([x, tf.zeros_like(x)], axis=1), dtype=tf.float32
-        )
-        return preprocessing.transform(
-            tf.expand_dims(image, 0),
-            preprocessing.get_translation_matrix(translations),
-        )[0]
-
-    def _translate_y(self, image):
-        shape = tf.cast(tf.shape(image), tf.float32)
-        y = tf.cast(self.severity_factor() * shape[0] / 3, tf.float32)
-        y = tf.expand_dims(tf.expand_dims(y, axis=0), axis=0)
-        y *= preprocessing.random_inversion(self._random_generator)
-        y = tf.cast(y, tf.int32)
-
-        translations = tf.cast(
-            tf.concat([tf.zeros_like(y), y], axis=1), dtype=tf.float32
-        )
-        return preprocessing.transform(
-            tf.expand_dims(image, 0),
-            preprocessing.get_translation_matrix(translations),
-        )[0]
-
-    def _apply_op(self, image, op_index):
-        augmented = image
-        augmented = tf.cond(
-            op_index == tf.constant([0], dtype=tf.int32),
-            lambda: self._auto_contrast(augmented),
-            lambda: augmented,
-        )
-        augmented = tf.cond(
-            op_index == tf.constant([1], dtype=tf.int32),
-            lambda: self._equalize(augmented),
-            lambda: augmented,
-        )
-        augmented = tf.cond(
-            op_index == tf.constant([2], dtype=tf.int32),
-            lambda: self._posterize(augmented),
-            lambda: augmented,
+    def _transform(self, images, augmentations, severities, inversions):
+        """Rotates, shears or translates every image with its augmentation."""
+        shape = tf.cast(tf.shape(images), tf.float32)
+        height, width = shape[1], shape[2]
+        zeros = tf.zeros_like(severities)
+        ones = tf.ones_like(severities)
+
+        rotations = preprocessing.get_rotation_matrix(
+            severities * 30, height, width
         )
-        augmented = tf.cond(
-            op_index == tf.constant([3], dtype=tf.int32),
-            lambda: self._rotate(augmented),
-            lambda: augmented,
+        shears = severities * 0.3 * inversions
+        shears_x = tf.stack(
+            [ones, shears, zeros, zeros, ones, zeros, zeros, zeros], axis=-1
         )
-        augmented = tf.cond(
-            op_index == tf.constant([4], dtype=tf.int32),
-            lambda: self._solarize(augmented),
-            lambda: augmented,
+        shears_y = tf.stack(
+            [ones, zeros, zeros, shears, ones, zeros, zeros, zeros], axis=-1
         )
-        augmented = tf.cond(
-            op_index == tf.constant([5], dtype=tf.int32),
-            lambda: self._shear_x(augmented),
-            lambda: augmented,
+        translations_x = tf.cast(
+            tf.cast(severities * width / 3 * inversions, tf.int32), tf.float32
         )
-        augmented = tf.cond(
-            op_index == tf.constant([6], dtype=tf.int32),
-            lambda: self._shear_y(augmented),
-            lambda: augmented,
+        translations_y = tf.cast(
+            tf.cast(severities * height / 3 * inversions, tf.int32),
+            tf.float32,
         )
-        augmented = tf.cond(
-            op_index == tf.constant([7], dtype=tf.int32),
-            lambda: self._translate_x(augmented),
-            lambda: augmented,
+        translates_x = preprocessing.get_translation_matrix(
+            tf.stack([translations_x, zeros], axis=-1)
         )
-        augmented = tf.cond(
-            op_index == tf.constant([8], dtype=tf.int32),
-            lambda: self._translate_y(augmented),
-            lambda: augmented,
+        translates_y = preprocessing.get_translation_matrix(
+            tf.stack([zeros, translations_y], axis=-1)
         )
-        return augmented
-
-    def get_random_transformation(
-        self,
-        image=None,
-        label=None,
-        bounding_boxes=None,
-        keypoints=None,
-        segmentation_mask=None,
-    ):
-        # Generate random values of chain_mixing_weights and weight_sample
-        chain_mixing_weights = self._sample_from_dirichlet(
-            tf.ones([self.num_chains]) * self.alpha
-        )
-        weight_sample = self._sample_from_beta(self.alpha, self.alpha)
-
-        # Create a transformation config containing the random values
-        transformation = {
-            "chain_mixing_weights": chain_mixing_weights,
-            "weight_sample": weight_sample,
-        }
-
-        return transformation
 
-    def augment_image(self, image, transformation=None, **kwargs):
-        # Extract chain_mixing_weights and weight_sample from the provided transformation # noqa: E501
-        chain_mixing_weights = transformation["chain_mixing_weights"]
-        weight_sample = transformation["weight_sample"]
+        transforms = rotations
+        for augmentation, augmentation_transforms in (
+            (SHEAR_X, shears_x),
+            (SHEAR_Y, shears_y),
+            (TRANSLATE_X, translates_x),
+            (TRANSLATE_Y, translates_y),
+        ):
+            transforms = tf.where(
+                (augmentations == augmentation)[:, tf.newaxis],
+                augmentation_transforms,
+                transforms,
+            )
+        return preprocessing.transform(images, transforms)
 
-        result = tf.zeros_like(image)
-        curr_chain = tf.constant([0], dtype=tf.int32)
-
-        image, chain_mixing_weights, curr_chain, result = tf.while_loop(
-            lambda image, chain_mixing_weights, curr_chain, result: tf.less(
-                curr_chain, self.num_chains
-            ),
-            self._loop_on_width,
-            [image, chain_mixing_weights, curr_chain, result],
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        images = tf.expand_dims(image, axis=0)
+        transformations = tf.nest.map_structure(
+            lambda x: tf.expand_dims(x, axis=0), transformation
         )
-        result = weight_sample * image + (1 - weight_sample) * result
-        return result
+        return self.augment_images(images, transformations)[0]
 
-    def augment_label(self, label, transformation=None, **kwargs):
-        return label
+    def augment_labels(self, labels, transformations=None, **kwargs):
+        return labels
 
-    def augment_segmentation_mask(
-        self, segmentation_masks, transformation=None, **kwargs
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations=None, **kwargs
     ):
-        # Extract chain_mixing_weights and weight_sample from the provided transformation # noqa: E501
-        chain_mixing_weights = transformation["chain_mixing_weights"]
-        weight_sample = transformation["weight_sample"]
-
-        result = tf.zeros_like(segmentation_masks)
-        curr_chain = tf.constant([0], dtype=tf.int32)
-
-        (
-            segmentation_masks,
-            chain_mixing_weights,
-            curr_chain,
-            result,
-        ) = tf.while_loop(
-            lambda segmentation_masks, chain_mixing_weights, curr_chain, result: tf.less(  # noqa: E501
-                curr_chain, self.num_chains
-            ),
-            self._loop_on_width,
-            [segmentation_masks, chain_mixing_weights, curr_chain, result],
-        )
-
-        # Apply the mixing of segmentation_masks similar to images
-        result = (
-            weight_sample * segmentation_masks + (1 - weight_sample) * result
-        )
-        return result
+        return self.augment_images(segmentation_masks, transformations)
 
     def get_config(self):
         config = {
@@ -13,9 +13,40 @@
 # limitations under the License.
 
 import tensorflow as tf
+from absl.testing import parameterized
 
 from keras_cv.src.layers import preprocessing
 from keras_cv.src.tests.test_case import TestCase
+from keras_cv.src.utils import preprocessing as preprocessing_utils
+
+
+def _transform(images, transform):
+    return preprocessing_utils.transform(images, [transform] * len(images))
+
+
+# The augmentations of the per-image implementation, for a severity of 0.5
+# and an inversion of -1, on 16x20 images in the range [0, 255].
+AUGMENTATIONS = {
+    "auto_contrast": lambda x: preprocessing.AutoContrast((0, 255))(x),
+    "equalize": lambda x: preprocessing.Equalization((0, 255))(x),
+    # 4 - int(0.5 * 3) + 1 = 4 low bits are dropped.
+    "posterize": lambda x: tf.cast(
+        tf.bitwise.left_shift(
+            tf.bitwise.right_shift(tf.cast(x, tf.uint8), 4), 4
+        ),
+        tf.float32,
+    ),
+    "rotate": lambda x: _transform(
+        x, preprocessing_utils.get_rotation_matrix([15.0], 16.0, 20.0)[0]
+    ),
+    # The threshold is int(0.5 * 255).
+    "solarize": lambda x: tf.where(x < 127, x, 255 - x),
+    "shear_x": lambda x: _transform(x, [1, -0.15, 0, 0, 1, 0, 0, 0]),
+    "shear_y": lambda x: _transform(x, [1, 0, 0, -0.15, 1, 0, 0, 0]),
+    # Translations of int(-0.5 * 20 / 3) and int(-0.5 * 16 / 3) pixels.
+    "translate_x": lambda x: _transform(x, [1, 0, 3, 0, 1, 0, 0, 0]),
+    "translate_y": lambda x: _transform(x, [1, 0, 0, 0, 1, 2, 0, 0]),
+}
 
 
 class AugMixTest(TestCase):
@@ -128,3 +159,66 @@ class AugMixTest(TestCase):
         ys_segmentation_masks = layer(ys_segmentation_masks)
         self.assertEqual(xs.shape, (2, 512, 512, 1))
         self.assertEqual(ys_segmentation_masks.shape, (2, 512, 512, 1))
+
+    def test_chains_of_depth_zero_return_images(self):
+        layer = preprocessing.AugMix([0, 255], chain_depth=0)
+        xs = tf.random.uniform((4, 32, 32, 3), 0, 255)
+
+        self.assertAllClose(layer(xs), xs, atol=1e-3)
+
+    def test_augment_step_applies_the_augmentation_of_every_image(self):
+        layer = preprocessing.AugMix([0, 255], severity=(0.5, 0.5))
+        xs = tf.random.uniform((5, 16, 16, 3), 0, 255)
+        augmentations = tf.constant([-1, 0, 2, 3, 5])
+        severities = tf.fill((5,), 0.5)
+        inversions = tf.constant([1.0, 1.0, 1.0, 1.0, -1.0])
+
+        ys = layer._augment_step(xs, augmentations, severities, inversions)
+
+        self.assertAllClose(ys[0], xs[0])
+        for i in range(1, 5):
+            self.assertAllClose(
+                ys[i : i + 1],
+                layer._augment_step(
+                    xs[i : i + 1],
+                    augmentations[i : i + 1],
+                    severities[i : i + 1],
+                    inversions[i : i + 1],
+                ),
+            )
+
+    @parameterized.named_parameters(
+        (name, index, name) for index, name in enumerate(AUGMENTATIONS)
+    )
+    def test_augment_step_matches_per_image_augmentation(self, index, name):
+        layer = preprocessing.AugMix([0, 255])
+        xs = tf.random.uniform((2, 16, 20, 3), 0, 255)
+
+        ys = layer._augment_step(
+            xs, tf.fill((2,), index), tf.fill((2,), 0.5), -tf.ones((2,))
+        )
+
+        expected = tf.stack([AUGMENTATIONS[name](x[None])[0] for x in xs])
+        self.assertAllClose(ys, expected, atol=1e-3)
+
+    def test_in_tf_function(self):
+        layer = preprocessing.AugMix([0, 255])
+        xs = tf.random.uniform((2, 32, 32, 3), 0, 255)
+
+        ys = tf.function(layer)(xs)
+
+        self.assertEqual(ys.shape, (2, 32, 32, 3))
+
+    def test_ragged_images(self):
+        layer = preprocessing.AugMix([0, 255])
+        xs = tf.ragged.stack(
+            [
+                tf.random.uniform((16, 16, 3), 0, 255),
+                tf.random.uniform((8, 12, 3), 0, 255),
+            ]
+        )
+
+        ys = layer(xs)
+
+        self.assertEqual(ys[0].to_tensor().shape, (16, 16, 3))
+        self.assertEqual(ys[1].to_tensor().shape, (8, 12, 3))
@@ -0,0 +1,240 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-layer timing of augmentation layers."""
+
+import json
+import threading
+
+import tensorflow as tf
+
+from keras_cv.src.api_export import keras_cv_export
+
+
+class _TracingState(threading.local):
+    """The tracing state of a thread, so that threads tracing pipelines at
+    once do not instrument each other's layers."""
+
+    def __init__(self):
+        # The profilers whose scope is active, innermost last.
+        self.active_profilers = []
+        # The depth of the per-sample functions being traced, see
+        # `per_sample()`.
+        self.per_sample_depth = 0
+
+
+_TRACING_STATE = _TracingState()
+
+
+@keras_cv_export("keras_cv.layers.AugmentationProfiler")
+class AugmentationProfiler:
+    """Records the call counts and wall time of augmentation layers.
+
+    Augmentation layers called, or traced by `tf.data` or `tf.function`, by
+    the thread which entered the scope of a profiler are instrumented with
+    `tf.timestamp()` ops that accumulate the number of calls, the number of
+    samples and the wall time of every layer into variables. The
+    instrumentation is part of the traced graphs, so it keeps recording after
+    the scope is exited, whenever the graphs run. The profiler also records
+    the path taken by every layer: `"vectorized"` for vectorized layers,
+    `"vectorized_map"` or `"map_fn"` for layers augmenting one sample at a
+    time, and `"unbatched"` for single images.
+
+    The time of a layer includes the time of the layers it contains, e.g. the
+    time of `RandAugment` includes the time of its augmentations. Calls made
+    in parallel by `tf.data` overlap, so the times add up to more than the
+    wall time of the pipeline. Layers called on single samples inside the
+    `tf.map_fn()` or `tf.vectorized_map()` of another layer are not timed on
+    their own, as their instrumentation would stop `tf.vectorized_map()` from
+    vectorizing them.
+
+    Example:
+    ```python
+    profiler = keras_cv.layers.AugmentationProfiler()
+    with profiler:
+        dataset = dataset.map(augmenter, num_parallel_calls=tf.data.AUTOTUNE)
+    for _ in dataset:
+        pass
+    print(profiler.summary())
+    ```
+    """
+
+    def __init__(self):
+        self._records = {}
+
+    def __enter__(self):
+        _TRACING_STATE.active_profilers.append(self)
+        return self
+
+    def __exit__(self, *args):
+        _TRACING_STATE.active_profilers.remove(self)
+
+    def results(self):
+        """Returns the records of the layers, slowest first.
+
+        Returns:
+            a list with one dictionary per layer, with keys `"layer"`,
+            `"class"`, `"path"`, `"calls"`, `"samples"`, `"total_seconds"`
+            and `"mean_seconds"`.
+        """
+        results = []
+        for record in self._records.values():
+            calls = int(record.calls.numpy())
+            total_seconds = float(record.seconds.numpy())
+            results.append(
+                {
+                    "layer": record.name,
+                    "class": record.class_name,
+                    "path": ",".join(sorted(record.paths)) or "-",
+                    "calls": calls,
+                    "samples": int(record.samples.numpy()),
+                    "total_seconds": total_seconds,
+                    "mean_seconds": total_seconds / calls if calls else 0.0,
+                }
+            )
+        return sorted(results, key=lambda r: r["total_seconds"], reverse=True)
+
+    def summary(self):
+        """Returns the records of the layers as a text table."""
+        header = ("Layer", "Class", "Path", "Calls", "Samples", "Total (s)")
+        rows = [header + ("Mean (ms)",)]
+        for result in self.results():
+            rows.append(
+                (
+                    result["layer"],
+                    result["class"],
+                    result["path"],
+                    str(result["calls"]),
+                    str(result["samples"]),
+                    f"{result['total_seconds']:.4f}",
+                    f"{result['mean_seconds'] * 1000:.3f}",
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = []
+        for row in rows:
+            # text columns are left-aligned, numbers right-aligned
+            cells = [row[i].ljust(widths[i]) for i in range(3)]
+            cells += [row[i].rjust(widths[i]) for i in range(3, len(header))]
+            cells.append(row[-1].rjust(len(header[-1]) + 3))
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def to_json(self, **kwargs):
+        """Returns the records of the layers as a JSON string.
+
+        Args:
+            **kwargs: forwarded to `json.dumps()`, e.g. `indent=2`.
+        """
+        return json.dumps(self.results(), **kwargs)
+
+    def reset(self):
+        """Zeroes the call counts, samples and times of all layers."""
+        for record in self._records.values():
+            record.calls.assign(0)
+            record.samples.assign(0)
+            record.seconds.assign(0.0)
+
+    def _record(self, layer):
+        key = id(layer)
+        if key not in self._records:
+            self._records[key] = _LayerRecord(layer)
+        return self._records[key]
+
+
+class _LayerRecord:
+    def __init__(self, layer):
+        # Keeps the layer alive, so that its id is not reused by another
+        # layer while the record is keyed by it.
+        self.layer = layer
+        self.name = layer.name
+        self.class_name = type(layer).__name__
+        self.paths = set()
+        # The variables outlive the graphs the layer is traced in.
+        with tf.init_scope():
+            self.calls = tf.Variable(0, dtype=tf.int64, trainable=False)
+            self.samples = tf.Variable(0, dtype=tf.int64, trainable=False)
+            self.seconds = tf.Variable(0.0, dtype=tf.float64, trainable=False)
+
+    def update(self, samples, seconds):
+        return tf.group(
+            self.calls.assign_add(1),
+            self.samples.assign_add(tf.cast(samples, tf.int64)),
+            self.seconds.assign_add(seconds),
+        )
+
+
+def record_path(layer, path):
+    """Records that `layer` augments its inputs with `path`."""
+    if _TRACING_STATE.per_sample_depth:
+        return
+    for profiler in _TRACING_STATE.active_profilers:
+        profiler._record(layer).paths.add(path)
+
+
+def per_sample(func):
+    """Wraps `func`, mapped over samples, so that it is not instrumented."""
+
+    def wrapped(*args, **kwargs):
+        _TRACING_STATE.per_sample_depth += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _TRACING_STATE.per_sample_depth -= 1
+
+    return wrapped
+
+
+def profile_call(layer, call_fn, inputs):
+    """Calls `call_fn(inputs)`, timing it for the active profilers.
+
+    Args:
+        layer: the layer to record the call for.
+        call_fn: a function of a dictionary of formatted inputs.
+        inputs: a dictionary of formatted inputs, with an `"images"` key.
+    """
+    state = _TRACING_STATE
+    if not state.active_profilers or state.per_sample_depth:
+        return call_fn(inputs)
+    records = [profiler._record(layer) for profiler in state.active_profilers]
+
+    with tf.control_dependencies(_tensors(inputs)):
+        start = tf.timestamp()
+    with tf.control_dependencies([start]):
+        outputs = call_fn(inputs)
+    with tf.control_dependencies(_tensors(outputs)):
+        seconds = tf.timestamp() - start
+
+    images = inputs["images"]
+    if isinstance(images, tf.RaggedTensor):
+        samples = images.nrows(out_type=tf.int64)
+    elif images.shape.rank == 4:
+        samples = tf.shape(images, out_type=tf.int64)[0]
+    else:
+        samples = tf.constant(1, tf.int64)
+    updates = [record.update(samples, seconds) for record in records]
+    # The outputs depend on the updates, so that they run in graphs.
+    with tf.control_dependencies(updates):
+        return tf.nest.map_structure(
+            lambda x: x if x is None else tf.identity(x),
+            outputs,
+            expand_composites=True,
+        )
+
+
+def _tensors(structure):
+    return [
+        value
+        for value in tf.nest.flatten(structure, expand_composites=True)
+        if isinstance(value, tf.Tensor)
+    ]
@@ -0,0 +1,189 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import gc
+import json
+import threading
+
+import pytest
+import tensorflow as tf
+
+from keras_cv.src import layers
+from keras_cv.src.layers.preprocessing.augmentation_profiler import (
+    AugmentationProfiler,
+)
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    BaseImageAugmentationLayer,
+)
+from keras_cv.src.tests.test_case import TestCase
+
+
+class AddOneLayer(BaseImageAugmentationLayer):
+    def __init__(self, auto_vectorize=True, **kwargs):
+        super().__init__(**kwargs)
+        self.auto_vectorize = auto_vectorize
+
+    def augment_image(self, image, transformation, **kwargs):
+        return image + 1.0
+
+
+class AugmentationProfilerTest(TestCase):
+    def test_records_calls_and_samples(self):
+        layer = layers.RandomFlip(name="flip")
+        images = tf.random.uniform((4, 8, 8, 3))
+
+        with AugmentationProfiler() as profiler:
+            layer(images)
+            layer(images[:2])
+
+        (result,) = profiler.results()
+        self.assertEqual(result["layer"], "flip")
+        self.assertEqual(result["class"], "RandomFlip")
+        self.assertEqual(result["path"], "vectorized")
+        self.assertEqual(result["calls"], 2)
+        self.assertEqual(result["samples"], 6)
+        self.assertGreater(result["total_seconds"], 0.0)
+
+    def test_not_recorded_outside_of_scope(self):
+        layer = layers.RandomFlip()
+        profiler = AugmentationProfiler()
+
+        layer(tf.random.uniform((4, 8, 8, 3)))
+
+        self.assertEqual(profiler.results(), [])
+
+    def test_records_paths(self):
+        vectorized_map = AddOneLayer(auto_vectorize=True)
+        map_fn = AddOneLayer(auto_vectorize=False)
+        images = tf.random.uniform((2, 8, 8, 3))
+
+        with AugmentationProfiler() as profiler:
+            vectorized_map(images)
+            map_fn(images)
+            map_fn(images[0])
+
+        paths = {
+            result["layer"]: result["path"] for result in profiler.results()
+        }
+        self.assertEqual(paths[vectorized_map.name], "vectorized_map")
+        self.assertEqual(paths[map_fn.name], "map_fn,unbatched")
+
+    def test_ragged_images_are_mapped(self):
+        layer = layers.RandomFlip()
+        images = tf.ragged.stack(
+            [tf.ones((8, 8, 3)), tf.ones((4, 6, 3))]
+        ).with_row_splits_dtype(tf.int64)
+
+        with AugmentationProfiler() as profiler:
+            layer(images)
+
+        (result,) = profiler.results()
+        self.assertEqual(result["path"], "map_fn")
+        self.assertEqual(result["samples"], 2)
+
+    @pytest.mark.tf_only
+    def test_in_tf_data(self):
+        augmenter = layers.Augmenter(
+            [layers.RandomFlip(name="flip"), layers.Grayscale(name="gray")]
+        )
+        dataset = tf.data.Dataset.from_tensor_slices(
+            tf.random.uniform((8, 8, 8, 3))
+        ).batch(2)
+
+        with AugmentationProfiler() as profiler:
+            dataset = dataset.map(augmenter)
+        for _ in dataset:
+            pass
+
+        results = {result["layer"]: result for result in profiler.results()}
+        self.assertEqual(set(results), {"flip", "gray"})
+        self.assertEqual(results["flip"]["calls"], 4)
+        self.assertEqual(results["gray"]["samples"], 8)
+
+    def test_nested_layers_in_map_fn_are_not_timed(self):
+        layer = layers.RandomAugmentationPipeline(
+            [layers.RandomFlip(name="flip")],
+            augmentations_per_image=1,
+            name="pipeline",
+        )
+
+        with AugmentationProfiler() as profiler:
+            layer(tf.random.uniform((2, 8, 8, 3)))
+
+        results = {result["layer"]: result for result in profiler.results()}
+        self.assertEqual(results["pipeline"]["calls"], 1)
+        self.assertNotIn("flip", results)
+
+    def test_outputs_are_unchanged(self):
+        images = tf.random.uniform((2, 8, 8, 3))
+        labels = tf.one_hot([0, 1], 2)
+        layer = layers.RandomFlip(mode="horizontal", rate=1.0)
+
+        with AugmentationProfiler():
+            outputs = layer({"images": images, "labels": labels})
+
+        self.assertAllClose(outputs["images"], images[:, :, ::-1])
+        self.assertAllClose(outputs["labels"], labels)
+
+    def test_reset(self):
+        layer = layers.RandomFlip()
+        with AugmentationProfiler() as profiler:
+            layer(tf.random.uniform((2, 8, 8, 3)))
+
+        profiler.reset()
+
+        (result,) = profiler.results()
+        self.assertEqual(result["calls"], 0)
+        self.assertEqual(result["total_seconds"], 0.0)
+
+    def test_summary_and_json(self):
+        with AugmentationProfiler() as profiler:
+            layers.RandomFlip(name="flip")(tf.random.uniform((2, 8, 8, 3)))
+            layers.Grayscale(name="gray")(tf.random.uniform((2, 8, 8, 3)))
+
+        summary = profiler.summary().splitlines()
+        self.assertEqual(len(summary), 3)
+        self.assertTrue(summary[0].startswith("Layer"))
+        self.assertIn("RandomFlip", profiler.summary())
+        self.assertEqual(
+            [r["layer"] for r in json.loads(profiler.to_json())],
+            [r["layer"] for r in profiler.results()],
+        )
+
+    def test_scope_is_per_thread(self):
+        other_thread_layer = layers.RandomFlip(name="other_thread")
+
+        with AugmentationProfiler() as profiler:
+            thread = threading.Thread(
+                target=other_thread_layer,
+                args=(tf.random.uniform((2, 8, 8, 3)),),
+            )
+            thread.start()
+            thread.join()
+            layers.RandomFlip(name="flip")(tf.random.uniform((2, 8, 8, 3)))
+
+        self.assertEqual(
+            [result["layer"] for result in profiler.results()], ["flip"]
+        )
+
+    def test_layers_are_recorded_after_others_are_collected(self):
+        with AugmentationProfiler() as profiler:
+            for name in ("first", "second"):
+                layer = layers.RandomFlip(name=name)
+                layer(tf.random.uniform((2, 8, 8, 3)))
+                del layer
+                gc.collect()
+
+        results = {result["layer"]: result for result in profiler.results()}
+        self.assertEqual(results["first"]["calls"], 1)
+        self.assertEqual(results["second"]["calls"], 1)
@@ -93,3 +93,13 @@ class AutoContrastTest(TestCase):
 
         self.assertTrue(np.any(ops.convert_to_numpy(ys[0]) == 0.0))
         self.assertTrue(np.any(ops.convert_to_numpy(ys[0]) == 1.0))
+
+    def test_stretches_each_image_independently(self):
+        images = np.random.uniform(size=(16, 32, 32, 3)).astype(np.float32)
+
+        layer = preprocessing.AutoContrast(value_range=(0, 1))
+        ys = layer(images)
+
+        low = images.min(axis=(1, 2), keepdims=True)
+        high = images.max(axis=(1, 2), keepdims=True)
+        self.assertAllClose(ys, (images - low) / (high - low))
@@ -27,7 +27,9 @@ from keras_cv.src.backend import config
 from keras_cv.src.backend import keras
 from keras_cv.src.backend import ops
 from keras_cv.src.backend import scope
+from keras_cv.src.layers.preprocessing import augmentation_profiler
 from keras_cv.src.utils import preprocessing
+from keras_cv.src.utils import stateless_random
 
 # In order to support both unbatched and batched inputs, the horizontal
 # and vertical axis is reverse indexed
@@ -256,6 +258,12 @@ class BaseImageAugmentationLayer(keras.layers.Layer):
         if labels is not None:
             fn_output_signature[LABELS] = self._compute_target_signature(labels)
 
+        sample_indices = inputs.get(stateless_random.SAMPLE_INDICES, None)
+        if sample_indices is not None:
+            fn_output_signature[stateless_random.SAMPLE_INDICES] = (
+                tf.TensorSpec(sample_indices.shape[1:], sample_indices.dtype)
+            )
+
         return fn_output_signature
 
     @staticmethod
@@ -275,16 +283,34 @@ class BaseImageAugmentationLayer(keras.layers.Layer):
         Args:
             inputs: dictionary of inputs provided to map_fn.
         """
+        stateless = isinstance(
+            self._random_generator, stateless_random.StatelessRandomGenerator
+        )
+        if stateless:
+            func = self._with_sample_indices_scope(func)
+        func = augmentation_profiler.per_sample(func)
         if self._any_ragged(inputs) or self.force_output_ragged_images:
+            augmentation_profiler.record_path(self, "map_fn")
             return tf.map_fn(
                 func,
                 inputs,
                 fn_output_signature=self._compute_output_signature(inputs),
             )
         if self.auto_vectorize:
+            augmentation_profiler.record_path(self, "vectorized_map")
             return tf.vectorized_map(func, inputs)
+        augmentation_profiler.record_path(self, "map_fn")
         return tf.map_fn(func, inputs)
 
+    def _with_sample_indices_scope(self, func):
+        def augment_sample(inputs):
+            with stateless_random.sample_indices_scope(
+                self._random_generator, inputs
+            ):
+                return func(inputs)
+
+        return augment_sample
+
     def augment_image(self, image, transformation, **kwargs):
         """Augment a single image during training.
 
@@ -429,18 +455,26 @@ class BaseImageAugmentationLayer(keras.layers.Layer):
             inputs = self._ensure_inputs_are_compute_dtype(inputs)
             inputs, metadata = self._format_inputs(inputs)
             images = inputs[IMAGES]
-            if images.shape.rank == 3:
-                outputs = self._format_output(self._augment(inputs), metadata)
-            elif images.shape.rank == 4:
-                outputs = self._format_output(
-                    self._batch_augment(inputs), metadata
-                )
-            else:
-                raise ValueError(
-                    "Image augmentation layers are expecting inputs to be "
-                    "rank 3 (HWC) or 4D (NHWC) tensors. Got shape: "
-                    f"{images.shape}"
-                )
+            with stateless_random.sample_indices_scope(
+                self._random_generator, inputs
+            ):
+                if images.shape.rank == 3:
+                    augmentation_profiler.record_path(self, "unbatched")
+                    outputs = augmentation_profiler.profile_call(
+                        self, self._augment, inputs
+                    )
+                    outputs = self._format_output(outputs, metadata)
+                elif images.shape.rank == 4:
+                    outputs = augmentation_profiler.profile_call(
+                        self, self._batch_augment, inputs
+                    )
+                    outputs = self._format_output(outputs, metadata)
+                else:
+                    raise ValueError(
+                        "Image augmentation layers are expecting inputs to be "
+                        "rank 3 (HWC) or 4D (NHWC) tensors. Got shape: "
+                        f"{images.shape}"
+                    )
         # convert the outputs to backend native tensors if none of them
         # contain RaggedTensors. Note that if the user passed in Raggeds
         # but the outputs are dense, we still don't want to convert to
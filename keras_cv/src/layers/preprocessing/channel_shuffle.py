@@ -43,6 +43,8 @@ class ChannelShuffle(VectorizedBaseImageAugmentationLayer):
     ```
     """
 
+    _supports_uint8 = True
+
     def __init__(self, groups=3, seed=None, **kwargs):
         super().__init__(seed=seed, **kwargs)
         self.groups = groups
@@ -128,3 +128,19 @@ class ChannelShuffleTest(TestCase):
         layer = ChannelShuffle(groups=5)
         config = layer.get_config()
         self.assertEqual(config["groups"], 5)
+
+    def test_shuffles_whole_channel_groups(self):
+        # The shuffled groups are interleaved channel by channel.
+        images = np.random.uniform(size=(8, 16, 16, 4)).astype(np.float32)
+        layer = ChannelShuffle(groups=2, seed=2023)
+
+        ys = ops.convert_to_numpy(layer(images))
+
+        for image, y in zip(images, ys):
+            groups = [image[..., :2], image[..., 2:]]
+            self.assertTrue(
+                any(
+                    np.allclose(y, np.stack(order, axis=-1).reshape(y.shape))
+                    for order in (groups, groups[::-1])
+                )
+            )
@@ -14,15 +14,31 @@
 
 import tensorflow as tf
 
+from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    BATCHED,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    BOUNDING_BOXES,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    IMAGES,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    LABELS,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    SEGMENTATION_MASKS,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils import fill_utils
 
 
 @keras_cv_export("keras_cv.layers.CutMix")
-class CutMix(BaseImageAugmentationLayer):
+class CutMix(VectorizedBaseImageAugmentationLayer):
     """CutMix implements the CutMix data augmentation technique.
 
     Args:
@@ -30,6 +46,11 @@ class CutMix(BaseImageAugmentationLayer):
             distribution. This controls the shape of the distribution from which
             the smoothing values are sampled. Defaults to 1.0, which is a
             recommended value when training an imagenet1k classification model.
+        bounding_box_format: a case-insensitive string (for example, "xyxy") to
+            be passed if bounding boxes are being augmented by this layer.
+            Boxes of the pasted image are clipped to the pasted patch, and boxes
+            of the original image that are entirely covered by the patch are
+            removed. Defaults to None.
         seed: Integer. Used to create a random seed.
 
     References:
@@ -40,79 +61,38 @@ class CutMix(BaseImageAugmentationLayer):
     def __init__(
         self,
         alpha=1.0,
+        bounding_box_format=None,
         seed=None,
         **kwargs,
     ):
         super().__init__(seed=seed, **kwargs)
         self.alpha = alpha
+        self.bounding_box_format = bounding_box_format
         self.seed = seed
 
     def _sample_from_beta(self, alpha, beta, shape):
-        sample_alpha = tf.random.gamma(
+        seeds = self._random_generator.make_seeds(2)
+        sample_alpha = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 0],
             alpha=alpha,
         )
-        sample_beta = tf.random.gamma(
+        sample_beta = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 1],
             alpha=beta,
         )
         return sample_alpha / (sample_alpha + sample_beta)
 
-    def _batch_augment(self, inputs):
-        self._validate_inputs(inputs)
-        images = inputs.get("images", None)
-        labels = inputs.get("labels", None)
-        segmentation_masks = inputs.get("segmentation_masks", None)
-
-        (
-            images,
-            lambda_sample,
-            permutation_order,
-            random_center_height,
-            random_center_width,
-            cut_width,
-            cut_height,
-        ) = self._cutmix(images)
-
-        if labels is not None:
-            labels = self._update_labels(
-                labels, lambda_sample, permutation_order
-            )
-            inputs["labels"] = labels
-
-        if segmentation_masks is not None:
-            segmentation_masks = self._update_segmentation_masks(
-                segmentation_masks,
-                permutation_order,
-                random_center_height,
-                random_center_width,
-                cut_width,
-                cut_height,
-            )
-            inputs["segmentation_masks"] = segmentation_masks
-
-        inputs["images"] = images
-
-        return inputs
-
-    def _augment(self, inputs):
-        raise ValueError(
-            "CutMix received a single image to `call`. The layer relies on "
-            "combining multiple examples, and as such will not behave as "
-            "expected. Please call the layer with 2 or more samples."
-        )
-
-    def _cutmix(self, images):
-        """Apply cutmix."""
+    def get_random_transformation_batch(
+        self, batch_size, images=None, **kwargs
+    ):
         input_shape = tf.shape(images)
-        batch_size, image_height, image_width = (
-            input_shape[0],
-            input_shape[1],
-            input_shape[2],
-        )
+        image_height, image_width = input_shape[1], input_shape[2]
 
-        permutation_order = tf.random.shuffle(
-            tf.range(0, batch_size), seed=self.seed
+        permutation_order = tf.random.experimental.stateless_shuffle(
+            tf.range(0, batch_size),
+            seed=self._random_generator.make_seeds()[:, 0],
         )
         lambda_sample = self._sample_from_beta(
             self.alpha, self.alpha, (batch_size,)
@@ -127,10 +107,10 @@ class CutMix(BaseImageAugmentationLayer):
             ratio * tf.cast(image_width, dtype=tf.float32), dtype=tf.int32
         )
 
-        random_center_height = tf.random.uniform(
+        random_center_height = self._random_generator.uniform(
             shape=[batch_size], minval=0, maxval=image_height, dtype=tf.int32
         )
-        random_center_width = tf.random.uniform(
+        random_center_width = self._random_generator.uniform(
             shape=[batch_size], minval=0, maxval=image_width, dtype=tf.int32
         )
 
@@ -138,79 +118,173 @@ class CutMix(BaseImageAugmentationLayer):
         lambda_sample = 1.0 - bounding_box_area / (image_height * image_width)
         lambda_sample = tf.cast(lambda_sample, dtype=self.compute_dtype)
 
-        images = fill_utils.fill_rectangle(
-            images,
-            random_center_width,
-            random_center_height,
-            cut_width,
-            cut_height,
-            tf.gather(images, permutation_order),
+        return {
+            "permutation_order": permutation_order,
+            "lambda_sample": lambda_sample,
+            "center_x": random_center_width,
+            "center_y": random_center_height,
+            "cut_width": cut_width,
+            "cut_height": cut_height,
+        }
+
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        raise ValueError(
+            "CutMix received ragged images to `call`. The layer relies on "
+            "combining multiple examples with same size, and as such will not "
+            "behave as expected. Please call the layer with dense images with "
+            "same size."
         )
 
-        return (
+    def _fill_patches(self, images, transformations):
+        return fill_utils.fill_rectangle(
             images,
-            lambda_sample,
-            permutation_order,
-            random_center_height,
-            random_center_width,
-            cut_width,
-            cut_height,
+            transformations["center_x"],
+            transformations["center_y"],
+            transformations["cut_width"],
+            transformations["cut_height"],
+            tf.gather(images, transformations["permutation_order"]),
         )
 
-    def _update_labels(self, labels, lambda_sample, permutation_order):
-        cutout_labels = tf.gather(labels, permutation_order)
+    def augment_images(self, images, transformations, **kwargs):
+        return self._fill_patches(images, transformations)
 
-        lambda_sample = tf.reshape(lambda_sample, [-1, 1])
-        labels = lambda_sample * labels + (1.0 - lambda_sample) * cutout_labels
+    def augment_labels(self, labels, transformations, **kwargs):
+        cutout_labels = tf.gather(labels, transformations["permutation_order"])
+        lambda_sample = tf.reshape(transformations["lambda_sample"], [-1, 1])
+        return lambda_sample * labels + (1.0 - lambda_sample) * cutout_labels
 
-        return labels
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
+    ):
+        return self._fill_patches(segmentation_masks, transformations)
 
-    def _update_segmentation_masks(
-        self,
-        segmentation_masks,
-        permutation_order,
-        random_center_height,
-        random_center_width,
-        cut_width,
-        cut_height,
+    def augment_bounding_boxes(
+        self, bounding_boxes, transformations, images=None, **kwargs
     ):
-        cutout_segmentation_masks = tf.gather(
-            segmentation_masks, permutation_order
+        bounding_boxes = bounding_box.to_dense(bounding_boxes)
+        bounding_boxes = bounding_box.convert_format(
+            bounding_boxes,
+            source=self.bounding_box_format,
+            target="xyxy",
+            images=images,
+            dtype=self.compute_dtype,
+        )
+        boxes, classes = bounding_boxes["boxes"], bounding_boxes["classes"]
+
+        # The pixels covered by `fill_utils.fill_rectangle()` are the
+        # integers in `[center - size / 2, center + size / 2)`.
+        image_shape = tf.shape(images)
+        centers = tf.cast(
+            tf.stack(
+                [transformations["center_x"], transformations["center_y"]],
+                axis=-1,
+            ),
+            self.compute_dtype,
         )
+        sizes = tf.cast(
+            tf.stack(
+                [transformations["cut_width"], transformations["cut_height"]],
+                axis=-1,
+            ),
+            self.compute_dtype,
+        )
+        image_size = tf.cast(
+            tf.stack([image_shape[2], image_shape[1]]), self.compute_dtype
+        )
+        patch_min = tf.clip_by_value(
+            tf.math.ceil(centers - sizes / 2.0), 0.0, image_size
+        )
+        patch_max = tf.clip_by_value(
+            tf.math.ceil(centers + sizes / 2.0), 0.0, image_size
+        )
+        patch_min = patch_min[:, tf.newaxis, :]
+        patch_max = patch_max[:, tf.newaxis, :]
 
-        segmentation_masks = fill_utils.fill_rectangle(
-            segmentation_masks,
-            random_center_width,
-            random_center_height,
-            cut_width,
-            cut_height,
-            cutout_segmentation_masks,
+        # Boxes of the original images that the patch hides completely.
+        is_covered = tf.reduce_all(
+            (boxes[..., :2] >= patch_min) & (boxes[..., 2:] <= patch_max),
+            axis=-1,
+        )
+        classes = tf.where(is_covered, -1.0, classes)
+
+        # Boxes of the pasted images, clipped to the patch.
+        permutation_order = transformations["permutation_order"]
+        pasted_boxes = tf.gather(boxes, permutation_order)
+        pasted_classes = tf.gather(bounding_boxes["classes"], permutation_order)
+        pasted_boxes = tf.concat(
+            [
+                tf.maximum(pasted_boxes[..., :2], patch_min),
+                tf.minimum(pasted_boxes[..., 2:], patch_max),
+            ],
+            axis=-1,
+        )
+        is_visible = tf.reduce_all(
+            pasted_boxes[..., 2:] > pasted_boxes[..., :2], axis=-1
+        )
+        pasted_classes = tf.where(is_visible, pasted_classes, -1.0)
+
+        classes = tf.concat([classes, pasted_classes], axis=1)
+        boxes = tf.concat([boxes, pasted_boxes], axis=1)
+        boxes = tf.where(classes[..., tf.newaxis] == -1.0, -1.0, boxes)
+        bounding_boxes = {"boxes": boxes, "classes": classes}
+        return bounding_box.convert_format(
+            bounding_boxes,
+            source="xyxy",
+            target=self.bounding_box_format,
+            images=images,
+            dtype=self.compute_dtype,
         )
 
-        return segmentation_masks
+    def call(self, inputs):
+        # Labels are cast to the compute dtype by the base layer, so they are
+        # validated beforehand.
+        self._validate_inputs(inputs)
+        _, metadata = self._format_inputs(inputs)
+        if metadata[BATCHED] is not True:
+            raise ValueError(
+                "CutMix received a single image to `call`. The layer relies on "
+                "combining multiple examples, and as such will not behave as "
+                "expected. Please call the layer with 2 or more samples."
+            )
+        return super().call(inputs=inputs)
 
     def _validate_inputs(self, inputs):
-        images = inputs.get("images", None)
-        labels = inputs.get("labels", None)
-        segmentation_masks = inputs.get("segmentation_masks", None)
-
-        if images is None or (labels is None and segmentation_masks is None):
+        if not isinstance(inputs, dict):
+            inputs = {IMAGES: inputs}
+        images = inputs.get(IMAGES, None)
+        labels = inputs.get(LABELS, None)
+        bounding_boxes = inputs.get(BOUNDING_BOXES, None)
+        segmentation_masks = inputs.get(SEGMENTATION_MASKS, None)
+
+        if images is None or (
+            labels is None
+            and bounding_boxes is None
+            and segmentation_masks is None
+        ):
             raise ValueError(
                 "CutMix expects inputs in a dictionary with format "
                 '{"images": images, "labels": labels}. or'
+                '{"images": images, "bounding_boxes": bounding_boxes}. or'
                 '{"images": images, "segmentation_masks": segmentation_masks}. '
                 f"Got: inputs = {inputs}."
             )
 
-        if labels is not None and not labels.dtype.is_floating:
+        if labels is not None and not tf.as_dtype(labels.dtype).is_floating:
             raise ValueError(
                 f"CutMix received labels with type {labels.dtype}. "
                 "Labels must be of type float."
             )
 
+        if bounding_boxes is not None and self.bounding_box_format is None:
+            raise ValueError(
+                "CutMix received bounding boxes but no bounding_box_format. "
+                "Please pass a bounding_box_format from the supported list."
+            )
+
     def get_config(self):
         config = {
             "alpha": self.alpha,
+            "bounding_box_format": self.bounding_box_format,
             "seed": self.seed,
         }
         base_config = super().get_config()
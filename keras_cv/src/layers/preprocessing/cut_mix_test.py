@@ -15,6 +15,7 @@ import numpy as np
 import pytest
 import tensorflow as tf
 
+from keras_cv.src import bounding_box
 from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.cut_mix import CutMix
 from keras_cv.src.tests.test_case import TestCase
@@ -81,6 +82,33 @@ class CutMixTest(TestCase):
         self.assertNotAllClose(ys, 1.0)
         self.assertNotAllClose(ys, 0.0)
 
+    def test_label_weights_do_not_exceed_pixel_shares(self):
+        images = tf.ones((8, 32, 32, 3)) * tf.reshape(
+            tf.range(8, dtype=tf.float32), (8, 1, 1, 1)
+        )
+        labels = tf.one_hot(tf.range(8), 8)
+        layer = CutMix()
+
+        outputs = layer({"images": images, "labels": labels})
+
+        # Patches are clipped to the image while the label weights are
+        # computed from the unclipped patch area, so an image keeps at least
+        # the share of pixels given by its own label weight.
+        pixel_shares = tf.reduce_mean(
+            tf.cast(
+                outputs["images"][..., :1]
+                == tf.reshape(tf.range(8, dtype=tf.float32), (1, 1, 1, 8)),
+                tf.float32,
+            ),
+            axis=[1, 2],
+        )
+        self.assertAllClose(
+            tf.reduce_sum(outputs["labels"], axis=-1), tf.ones((8,))
+        )
+        self.assertAllGreaterEqual(
+            tf.linalg.diag_part(pixel_shares - outputs["labels"]), -1e-5
+        )
+
     def test_cut_mix_call_results_one_channel_with_labels(self):
         xs = tf.cast(
             tf.stack(
@@ -203,6 +231,43 @@ class CutMixTest(TestCase):
             )
         )
 
+    def test_cut_mix_call_results_with_bounding_boxes(self):
+        # Every image is filled with its own index + 1 and labeled with a
+        # box covering the whole image.
+        xs = tf.reshape(tf.range(1, 5, dtype=tf.float32), (4, 1, 1, 1))
+        xs = tf.tile(xs, [1, 32, 32, 1])
+        ys = {
+            "boxes": tf.tile(
+                tf.constant([[[0.0, 0.0, 32.0, 32.0]]]), [4, 1, 1]
+            ),
+            "classes": tf.constant([[0.0], [1.0], [2.0], [3.0]]),
+        }
+
+        layer = CutMix(bounding_box_format="xyxy", seed=1)
+        outputs = layer({"images": xs, "bounding_boxes": ys})
+        xs = ops.convert_to_numpy(outputs["images"])
+        ys = bounding_box.to_dense(outputs["bounding_boxes"])
+        boxes = ops.convert_to_numpy(ys["boxes"]).astype("int32")
+        classes = ops.convert_to_numpy(ys["classes"])
+
+        for i in range(4):
+            for box, class_id in zip(boxes[i], classes[i]):
+                if class_id == -1 or class_id == i:
+                    continue
+                # Pasted boxes cover exactly the pasted pixels.
+                x0, y0, x1, y1 = box
+                self.assertTrue(np.all(xs[i, y0:y1, x0:x1] == class_id + 1))
+                self.assertEqual(
+                    np.sum(xs[i] == class_id + 1), (x1 - x0) * (y1 - y0)
+                )
+
+    def test_bounding_boxes_require_bounding_box_format(self):
+        xs = tf.ones((2, 32, 32, 3))
+        ys = {"boxes": tf.ones((2, 1, 4)), "classes": tf.ones((2, 1))}
+        layer = CutMix()
+        with self.assertRaisesRegexp(ValueError, "bounding_box_format"):
+            _ = layer({"images": xs, "bounding_boxes": ys})
+
     @pytest.mark.tf_only
     def test_in_tf_function(self):
         xs = tf.cast(
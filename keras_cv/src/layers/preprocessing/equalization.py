@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from functools import partial
-
 import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
@@ -49,110 +47,107 @@ class Equalization(VectorizedBaseImageAugmentationLayer):
             of type float or int. Should be in NHWC format.
     """
 
+    _supports_uint8 = True
+
     def __init__(self, value_range, bins=256, **kwargs):
         super().__init__(**kwargs)
         self.bins = bins
         self.value_range = value_range
 
-    def equalize_channel(self, images, channel_index):
-        """equalize_channel performs histogram equalization on a single channel.
+    def equalize(self, images):
+        """equalize performs histogram equalization on all channels at once.
+
+        The histograms of all the channels of all the images are computed by
+        a single `tf.math.bincount()` of the bin of each pixel, offset by
+        `bins` for each channel of each image, and the lookup tables of all
+        the channels are then applied by a single `tf.gather()`.
 
         Args:
-            image: int Tensor with pixels in range [0, 255], RGB format,
+            images: int Tensor with pixels in range [0, 255], RGB format,
                 with channels last
-            channel_index: channel to equalize
         """
-        is_single_image = tf.rank(images) == 4 and tf.shape(images)[0] == 1
-
-        images = images[..., channel_index]
-        # Compute the histogram of the image channel.
-
-        # If the input is not a batch of images, directly using
-        # tf.histogram_fixed_width is much faster than using tf.vectorized_map
-        if is_single_image:
-            histogram = tf.histogram_fixed_width(
-                images, [0, 255], nbins=self.bins
-            )
-            histogram = tf.expand_dims(histogram, axis=0)
-        else:
-            partial_hist = partial(
-                tf.histogram_fixed_width, value_range=[0, 255], nbins=self.bins
-            )
-            histogram = tf.vectorized_map(
-                partial_hist, images, fallback_to_while_loop=True, warn=True
-            )
+        batch_size, num_channels = tf.shape(images)[0], tf.shape(images)[-1]
+        num_histograms = batch_size * num_channels
 
-        # For the purposes of computing the step, filter out the non-zeros.
-        # Zeroes are replaced by a big number while calculating min to keep
-        # shape constant across input sizes for compatibility with
-        # vectorized_map
+        # Bin the pixels like `tf.histogram_fixed_width()` on [0, 255].
+        bin_indices = tf.clip_by_value(
+            images * self.bins // 255, 0, self.bins - 1
+        )
+        offsets = tf.reshape(
+            tf.range(num_histograms) * self.bins,
+            (batch_size, 1, 1, num_channels),
+        )
+        bin_indices += offsets
+        histograms = tf.math.bincount(
+            tf.reshape(bin_indices, (-1,)),
+            minlength=num_histograms * self.bins,
+            maxlength=num_histograms * self.bins,
+        )
+        histograms = tf.reshape(
+            histograms, (batch_size, num_channels, self.bins)
+        )
 
+        # For the purposes of computing the step, filter out the non-zeros.
+        # Zeroes are replaced by a big number while calculating min.
         big_number = 1410065408
-        histogram_without_zeroes = tf.where(
-            tf.equal(histogram, 0),
+        histograms_without_zeroes = tf.where(
+            tf.equal(histograms, 0),
             big_number,
-            histogram,
+            histograms,
         )
 
         step = (
-            tf.reduce_sum(histogram, axis=-1)
-            - tf.reduce_min(histogram_without_zeroes, axis=-1)
+            tf.reduce_sum(histograms, axis=-1)
+            - tf.reduce_min(histograms_without_zeroes, axis=-1)
         ) // (self.bins - 1)
 
-        def build_mapping(histogram, step):
-            bacth_size = tf.shape(histogram)[0]
-
-            # Replace where step is 0 with 1 to avoid division by 0.
-            # This doesn't change the result, because where step==0 the
-            # original image is returned
-            _step = tf.where(
-                tf.equal(step, 0),
-                1,
-                step,
-            )
-            _step = tf.expand_dims(_step, -1)
-
-            # Compute the cumulative sum, shifting by step // 2
-            # and then normalization by step.
-            lookup_table = (
-                tf.cumsum(histogram, axis=-1) + (_step // 2)
-            ) // _step
-
-            # Shift lookup_table, prepending with 0.
-            lookup_table = tf.concat(
-                [tf.tile([[0]], [bacth_size, 1]), lookup_table[..., :-1]],
-                axis=1,
-            )
-
-            # Clip the counts to be in range. This is done
-            # in the C code for image.point.
-            return tf.clip_by_value(lookup_table, 0, 255)
-
-        # If step is zero, return the original image. Otherwise, build
-        # lookup table from the full histogram and step and then index from it.
-        # The lookup table is built for all images,
-        # regardless of the corresponding value of step.
-        result = tf.where(
-            tf.reshape(tf.equal(step, 0), (-1, 1, 1)),
+        # Replace where step is 0 with 1 to avoid division by 0.
+        # This doesn't change the result, because where step==0 the
+        # original image is returned
+        _step = tf.expand_dims(tf.where(tf.equal(step, 0), 1, step), -1)
+
+        # Compute the cumulative sum, shifting by step // 2
+        # and then normalization by step.
+        lookup_tables = (tf.cumsum(histograms, axis=-1) + (_step // 2)) // _step
+
+        # Shift lookup_tables, prepending with 0.
+        lookup_tables = tf.pad(
+            lookup_tables[..., :-1], [[0, 0], [0, 0], [1, 0]]
+        )
+
+        # Clip the counts to be in range. This is done
+        # in the C code for image.point.
+        lookup_tables = tf.clip_by_value(lookup_tables, 0, 255)
+
+        # If step is zero, return the original channel. Otherwise, index
+        # the lookup table of the channel with the bins of its pixels.
+        return tf.where(
+            tf.equal(step, 0)[:, tf.newaxis, tf.newaxis, :],
             images,
-            tf.gather(
-                build_mapping(histogram, step), images, batch_dims=1, axis=1
-            ),
+            tf.gather(tf.reshape(lookup_tables, (-1,)), bin_indices),
         )
 
-        return result
+    def equalize_channel(self, images, channel_index):
+        """equalize_channel performs histogram equalization on a single channel.
+
+        Args:
+            image: int Tensor with pixels in range [0, 255], RGB format,
+                with channels last
+            channel_index: channel to equalize
+        """
+        channel = images[..., channel_index : channel_index + 1]
+        return self.equalize(channel)[..., 0]
 
     def augment_images(self, images, transformations=None, **kwargs):
+        if images.dtype == tf.uint8 and tuple(self.value_range) == (0, 255):
+            images = self.equalize(tf.cast(images, tf.int32))
+            return tf.cast(images, tf.uint8)
         images = preprocessing.transform_value_range(
             images, self.value_range, (0, 255), dtype=self.compute_dtype
         )
         images = tf.cast(images, tf.int32)
 
-        images = tf.map_fn(
-            lambda channel: self.equalize_channel(images, channel),
-            tf.range(tf.shape(images)[-1]),
-        )
-        images = tf.transpose(images, [1, 2, 3, 0])
+        images = self.equalize(images)
 
         images = tf.cast(images, self.compute_dtype)
         images = preprocessing.transform_value_range(
@@ -72,3 +72,50 @@ class EqualizationTest(TestCase):
         layer = Equalization(value_range=(lower, upper))
         xs = ops.convert_to_numpy(layer(xs))
         self.assertAllInRange(xs, lower, upper)
+
+    def test_equalizes_channels_independently(self):
+        xs = np.random.randint(0, 64, size=(3, 16, 16, 3)).astype(np.float32)
+        # Constant channels are returned unchanged.
+        xs[1, ..., 2] = 7
+        layer = Equalization(value_range=(0, 255))
+
+        outputs = ops.convert_to_numpy(layer(xs))
+
+        for i in range(3):
+            for c in range(3):
+                channel = xs[i : i + 1, ..., c : c + 1]
+                self.assertAllClose(
+                    outputs[i, ..., c], layer(channel)[0, ..., 0]
+                )
+        self.assertAllClose(outputs[1, ..., 2], xs[1, ..., 2])
+
+    def test_matches_histogram_equalization(self):
+        xs = np.random.randint(0, 256, (8, 32, 32, 3)).astype(np.float32)
+        xs[0, ..., 0] = 7
+        layer = Equalization(value_range=(0, 255))
+
+        outputs = ops.convert_to_numpy(layer(xs))
+
+        for i in range(8):
+            for c in range(3):
+                channel = xs[i, ..., c].astype(np.int64)
+                histogram = np.bincount(channel.ravel(), minlength=256)
+                step = (histogram.sum() - histogram[histogram > 0].min()) // 255
+                if step == 0:
+                    expected = channel
+                else:
+                    lookup = (np.cumsum(histogram) + step // 2) // step
+                    lookup = np.clip(np.concatenate([[0], lookup[:-1]]), 0, 255)
+                    expected = lookup[channel]
+                self.assertAllClose(outputs[i, ..., c], expected)
+
+    def test_bins(self):
+        xs = np.random.uniform(size=(2, 16, 16, 3), low=0, high=255).astype(
+            np.float32
+        )
+        layer = Equalization(value_range=(0, 255), bins=16)
+
+        outputs = ops.convert_to_numpy(layer(xs))
+
+        self.assertLessEqual(len(np.unique(outputs[0, ..., 0])), 16)
+        self.assertAllInRange(outputs, 0, 255)
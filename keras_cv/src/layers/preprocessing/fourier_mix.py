@@ -15,13 +15,25 @@
 import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    BATCHED,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    IMAGES,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    LABELS,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    SEGMENTATION_MASKS,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 
 
 @keras_cv_export("keras_cv.layers.FourierMix")
-class FourierMix(BaseImageAugmentationLayer):
+class FourierMix(VectorizedBaseImageAugmentationLayer):
     """FourierMix implements the FMix data augmentation technique.
 
     Args:
@@ -53,12 +65,15 @@ class FourierMix(BaseImageAugmentationLayer):
         self.seed = seed
 
     def _sample_from_beta(self, alpha, beta, shape):
-        sample_alpha = tf.random.gamma(
+        seeds = self._random_generator.make_seeds(2)
+        sample_alpha = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 0],
             alpha=alpha,
         )
-        sample_beta = tf.random.gamma(
+        sample_beta = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 1],
             alpha=beta,
         )
         return sample_alpha / (sample_alpha + sample_beta)
@@ -88,7 +103,7 @@ class FourierMix(BaseImageAugmentationLayer):
 
         return tf.math.sqrt(fx * fx + fy * fy)
 
-    def _get_spectrum(self, freqs, decay_power, channel, h, w):
+    def _get_spectrum(self, freqs, decay_power, batch_size, channel, h, w):
         # Function to apply a low pass filter by decaying its high frequency
         # components.
         scale = tf.ones(1) / tf.cast(
@@ -100,119 +115,86 @@ class FourierMix(BaseImageAugmentationLayer):
         )
 
         param_size = tf.concat(
-            [tf.constant([channel]), tf.shape(freqs), tf.constant([2])], 0
+            [[batch_size, channel], tf.shape(freqs), tf.constant([2])], 0
         )
         param = self._random_generator.normal(param_size)
 
-        scale = tf.expand_dims(scale, -1)[None, :]
+        scale = tf.expand_dims(scale, -1)[None, None, :]
 
         return scale * param
 
-    def _sample_mask_from_transform(self, decay, shape, ch=1):
-        # Sampling low frequency map from fourier transform.
+    def _sample_masks_from_transform(self, decay, batch_size, shape, ch=1):
+        # Sampling low frequency maps from the fourier transform, one per
+        # sample of the batch.
         freqs = self._apply_fftfreq(shape[0], shape[1])
-        spectrum = self._get_spectrum(freqs, decay, ch, shape[0], shape[1])
-        spectrum = tf.complex(spectrum[:, 0], spectrum[:, 1])
+        spectrum = self._get_spectrum(
+            freqs, decay, batch_size, ch, shape[0], shape[1]
+        )
+        spectrum = tf.complex(spectrum[:, :, 0], spectrum[:, :, 1])
 
-        mask = tf.math.real(tf.signal.irfft2d(spectrum, shape))
-        mask = mask[:1, : shape[0], : shape[1]]
+        masks = tf.math.real(tf.signal.irfft2d(spectrum, shape))
+        masks = masks[:, 0, : shape[0], : shape[1]]
 
-        mask = mask - tf.reduce_min(mask)
-        mask = mask / tf.reduce_max(mask)
-        return mask
+        masks = masks - tf.reduce_min(masks, axis=[1, 2], keepdims=True)
+        masks = masks / tf.reduce_max(masks, axis=[1, 2], keepdims=True)
+        return masks
 
-    def _binarise_mask(self, mask, lam, in_shape):
-        # Create the final mask from the sampled values.
-        idx = tf.argsort(tf.reshape(mask, [-1]), direction="DESCENDING")
-        mask = tf.reshape(mask, [-1])
+    def _binarise_masks(self, masks, lambda_sample, shape):
+        # Create the final masks from the sampled values: the `lam * size`
+        # highest values of each mask are set to one.
+        batch_size = tf.shape(masks)[0]
+        masks = tf.reshape(masks, [batch_size, -1])
         num = tf.cast(
-            tf.math.round(lam * tf.cast(tf.size(mask), tf.float32)), tf.int32
-        )
-
-        updates = tf.concat(
-            [
-                tf.ones((num,), tf.float32),
-                tf.zeros((tf.size(mask) - num,), tf.float32),
-            ],
-            0,
-        )
-
-        mask = tf.scatter_nd(
-            tf.expand_dims(idx, -1), updates, tf.expand_dims(tf.size(mask), -1)
+            tf.math.round(
+                lambda_sample * tf.cast(tf.shape(masks)[1], tf.float32)
+            ),
+            tf.int32,
         )
 
-        mask = tf.reshape(mask, in_shape)
-        return mask
-
-    def _batch_augment(self, inputs):
-        images = inputs.get("images", None)
-        labels = inputs.get("labels", None)
-        segmentation_masks = inputs.get("segmentation_masks", None)
-        if images is None or (labels is None and segmentation_masks is None):
-            raise ValueError(
-                "FourierMix expects inputs in a dictionary with format "
-                '{"images": images, "labels": labels}.'
-                '{"images": images, "segmentation_masks": segmentation_masks}.'
-                f"Got: inputs = {inputs}"
-            )
-        images, masks, lambda_sample, permutation_order = self._fourier_mix(
-            images
-        )
-        if labels is not None:
-            labels = self._update_labels(
-                labels, lambda_sample, permutation_order
-            )
-            inputs["labels"] = labels
-        if segmentation_masks is not None:
-            segmentation_masks = self._update_segmentation_masks(
-                segmentation_masks, masks, permutation_order
-            )
-            inputs["segmentation_masks"] = segmentation_masks
-        inputs["images"] = images
-        return inputs
+        idx = tf.argsort(masks, axis=-1, direction="DESCENDING")
+        ranks = tf.argsort(idx, axis=-1)
+        masks = tf.cast(ranks < num[:, tf.newaxis], tf.float32)
 
-    def _augment(self, inputs):
-        raise ValueError(
-            "FourierMix received a single image to `call`. The layer relies on "
-            "combining multiple examples, and as such will not behave as "
-            "expected. Please call the layer with 2 or more samples."
-        )
+        return tf.reshape(masks, tf.concat([[batch_size], shape, [1]], 0))
 
-    def _fourier_mix(self, images):
-        shape = tf.shape(images)
-        permutation_order = tf.random.shuffle(
-            tf.range(0, shape[0]), seed=self.seed
+    def get_random_transformation_batch(
+        self, batch_size, images=None, **kwargs
+    ):
+        shape = tf.shape(images)[1:3]
+        permutation_order = tf.random.experimental.stateless_shuffle(
+            tf.range(0, batch_size),
+            seed=self._random_generator.make_seeds()[:, 0],
         )
-
         lambda_sample = self._sample_from_beta(
-            self.alpha, self.alpha, (shape[0],)
+            self.alpha, self.alpha, (batch_size,)
         )
-
-        # generate masks utilizing mapped calls
-        masks = tf.map_fn(
-            lambda x: self._sample_mask_from_transform(
-                self.decay_power, shape[1:-1]
-            ),
-            tf.range(shape[0], dtype=tf.float32),
+        masks = self._sample_masks_from_transform(
+            self.decay_power, batch_size, shape
         )
+        masks = self._binarise_masks(masks, lambda_sample, shape)
+        return {
+            "permutation_order": permutation_order,
+            "lambda_sample": tf.cast(lambda_sample, dtype=self.compute_dtype),
+            "masks": tf.cast(masks, dtype=self.compute_dtype),
+        }
 
-        # binarise masks utilizing mapped calls
-        masks = tf.map_fn(
-            lambda i: self._binarise_mask(
-                masks[i], lambda_sample[i], shape[1:-1]
-            ),
-            tf.range(shape[0], dtype=tf.int32),
-            fn_output_signature=tf.float32,
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        raise ValueError(
+            "FourierMix received ragged images to `call`. The layer relies on "
+            "combining multiple examples with same size, and as such will not "
+            "behave as expected. Please call the layer with dense images with "
+            "same size."
         )
-        masks = tf.expand_dims(masks, -1)
 
-        fmix_images = tf.gather(images, permutation_order)
-        images = masks * images + (1.0 - masks) * fmix_images
+    def augment_images(self, images, transformations, **kwargs):
+        masks = transformations["masks"]
+        fmix_images = tf.gather(images, transformations["permutation_order"])
+        return masks * images + (1.0 - masks) * fmix_images
 
-        return images, masks, lambda_sample, permutation_order
-
-    def _update_labels(self, labels, lambda_sample, permutation_order):
-        labels_for_fmix = tf.gather(labels, permutation_order)
+    def augment_labels(self, labels, transformations, **kwargs):
+        labels_for_fmix = tf.gather(
+            labels, transformations["permutation_order"]
+        )
 
         # for broadcasting
         batch_size = tf.expand_dims(tf.shape(labels)[0], -1)
@@ -220,24 +202,48 @@ class FourierMix(BaseImageAugmentationLayer):
         broadcast_shape = tf.concat(
             [batch_size, tf.ones(labels_rank - 1, tf.int32)], 0
         )
-        lambda_sample = tf.reshape(lambda_sample, broadcast_shape)
-
-        labels = (
-            lambda_sample * labels + (1.0 - lambda_sample) * labels_for_fmix
+        lambda_sample = tf.reshape(
+            transformations["lambda_sample"], broadcast_shape
         )
-        return labels
 
-    def _update_segmentation_masks(
-        self, segmentation_masks, masks, permutation_order
+        return lambda_sample * labels + (1.0 - lambda_sample) * labels_for_fmix
+
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
     ):
+        masks = transformations["masks"]
         fmix_segmentation_masks = tf.gather(
-            segmentation_masks, permutation_order
+            segmentation_masks, transformations["permutation_order"]
         )
-
-        segmentation_masks = (
+        return (
             masks * segmentation_masks + (1.0 - masks) * fmix_segmentation_masks
         )
-        return segmentation_masks
+
+    def call(self, inputs):
+        self._validate_inputs(inputs)
+        _, metadata = self._format_inputs(inputs)
+        if metadata[BATCHED] is not True:
+            raise ValueError(
+                "FourierMix received a single image to `call`. The layer "
+                "relies on combining multiple examples, and as such will not "
+                "behave as expected. Please call the layer with 2 or more "
+                "samples."
+            )
+        return super().call(inputs=inputs)
+
+    def _validate_inputs(self, inputs):
+        if not isinstance(inputs, dict):
+            inputs = {IMAGES: inputs}
+        images = inputs.get(IMAGES, None)
+        labels = inputs.get(LABELS, None)
+        segmentation_masks = inputs.get(SEGMENTATION_MASKS, None)
+        if images is None or (labels is None and segmentation_masks is None):
+            raise ValueError(
+                "FourierMix expects inputs in a dictionary with format "
+                '{"images": images, "labels": labels}.'
+                '{"images": images, "segmentation_masks": segmentation_masks}.'
+                f"Got: inputs = {inputs}"
+            )
 
     def get_config(self):
         config = {
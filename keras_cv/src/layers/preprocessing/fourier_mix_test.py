@@ -77,6 +77,31 @@ class FourierMixTest(TestCase):
         self.assertNotAllClose(ys, 1.0)
         self.assertNotAllClose(ys, 0.0)
 
+    def test_label_weights_match_pixel_shares(self):
+        images = tf.ones((8, 32, 32, 3)) * tf.reshape(
+            tf.range(8, dtype=tf.float32), (8, 1, 1, 1)
+        )
+        labels = tf.one_hot(tf.range(8), 8)
+        layer = FourierMix()
+
+        outputs = layer({"images": images, "labels": labels})
+
+        # Every pixel is copied from exactly one image, and the label weight
+        # of each source image is the share of pixels it contributes, up to
+        # the rounding of the mask to whole pixels.
+        pixel_shares = tf.reduce_mean(
+            tf.cast(
+                outputs["images"][..., :1]
+                == tf.reshape(tf.range(8, dtype=tf.float32), (1, 1, 1, 8)),
+                tf.float32,
+            ),
+            axis=[1, 2],
+        )
+        self.assertAllClose(tf.reduce_sum(pixel_shares, axis=-1), tf.ones((8,)))
+        self.assertAllClose(
+            outputs["labels"], pixel_shares, atol=1.0 / (32 * 32)
+        )
+
     def test_mix_up_call_results_with_masks(self):
         xs = tf.cast(
             tf.stack(
@@ -0,0 +1,390 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tensorflow as tf
+
+from keras_cv.src import bounding_box
+from keras_cv.src import keypoint
+from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.layers.preprocessing.random_flip import RandomFlip
+from keras_cv.src.layers.preprocessing.random_rotation import RandomRotation
+from keras_cv.src.layers.preprocessing.random_shear import RandomShear
+from keras_cv.src.layers.preprocessing.random_translation import (
+    RandomTranslation,
+)
+from keras_cv.src.layers.preprocessing.random_zoom import RandomZoom
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
+)
+from keras_cv.src.utils import preprocessing as preprocessing_utils
+
+# In order to support both unbatched and batched inputs, the horizontal
+# and vertical axis is reverse indexed
+H_AXIS = -3
+W_AXIS = -2
+
+SUPPORTED_LAYERS = (
+    RandomFlip,
+    RandomRotation,
+    RandomShear,
+    RandomTranslation,
+    RandomZoom,
+)
+
+
+@keras_cv_export("keras_cv.layers.FusedAffineAugmentation")
+class FusedAffineAugmentation(VectorizedBaseImageAugmentationLayer):
+    """Applies a sequence of geometric augmentations as a single warp.
+
+    Chaining `RandomRotation`, `RandomShear`, `RandomTranslation`,
+    `RandomZoom` and `RandomFlip` resamples the images once per layer, which
+    costs one interpolation, and one full pass over the images, per layer and
+    blurs the result a little more with every step. This layer samples the
+    random transformations of each wrapped layer, multiplies their per-sample
+    3x3 projective matrices, and warps the images and segmentation masks
+    exactly once. Bounding boxes and keypoints are mapped through the same
+    composed matrix.
+
+    The wrapped layers are only used to sample transformations: their
+    `fill_mode`, `fill_value` and `interpolation` arguments are ignored in
+    favor of the ones passed to this layer, and outside of the final warp no
+    intermediate fill happens at all.
+
+    Args:
+        layers: a list of `keras_cv.layers.RandomRotation`,
+            `keras_cv.layers.RandomShear`, `keras_cv.layers.RandomTranslation`,
+            `keras_cv.layers.RandomZoom` and `keras_cv.layers.RandomFlip`
+            layers, applied in order.
+        fill_mode: Points outside the boundaries of the input are filled
+            according to the given mode (one of `{"constant", "reflect",
+            "wrap", "nearest"}`). Defaults to `"reflect"`.
+        fill_value: a float represents the value to be filled outside the
+            boundaries when `fill_mode="constant"`. Defaults to `0.0`.
+        interpolation: Interpolation mode. Supported values: `"nearest"`,
+            `"bilinear"`. Defaults to `"bilinear"`.
+        bounding_box_format: The format of bounding boxes of input dataset.
+            Refer to
+            https://github.com/keras-team/keras-cv/blob/master/keras_cv/bounding_box/converters.py
+            for more details on supported bounding box formats.
+        keypoint_format: The format of keypoints of input dataset, one of
+            `"xy"` or `"rel_xy"`.
+        seed: Integer. Used to create a random seed.
+
+    Example:
+    ```python
+    augmenter = keras_cv.layers.FusedAffineAugmentation(
+        [
+            keras_cv.layers.RandomRotation(0.1),
+            keras_cv.layers.RandomShear(x_factor=0.2, y_factor=0.2),
+            keras_cv.layers.RandomTranslation(0.1, 0.1),
+            keras_cv.layers.RandomZoom(0.2),
+            keras_cv.layers.RandomFlip(),
+        ],
+        bounding_box_format="xyxy",
+    )
+    outputs = augmenter({"images": images, "bounding_boxes": boxes})
+    ```
+    """
+
+    def __init__(
+        self,
+        layers,
+        fill_mode="reflect",
+        fill_value=0.0,
+        interpolation="bilinear",
+        bounding_box_format=None,
+        keypoint_format=None,
+        seed=None,
+        **kwargs,
+    ):
+        super().__init__(seed=seed, **kwargs)
+        for layer in layers:
+            if not isinstance(layer, SUPPORTED_LAYERS):
+                raise ValueError(
+                    "FusedAffineAugmentation() only supports the layers "
+                    f"{[cls.__name__ for cls in SUPPORTED_LAYERS]}. "
+                    f"Received layer={layer}."
+                )
+        preprocessing_utils.check_fill_mode_and_interpolation(
+            fill_mode, interpolation
+        )
+        self.layers = list(layers)
+        self.fill_mode = fill_mode
+        self.fill_value = fill_value
+        self.interpolation = interpolation
+        self.bounding_box_format = bounding_box_format
+        self.keypoint_format = keypoint_format
+        self.seed = seed
+        self.built = True
+
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        transformations = []
+        for layer in self.layers:
+            transformation = layer.get_random_transformation_batch(batch_size)
+            if isinstance(layer, RandomShear):
+                # A disabled shear axis is sampled as `None`, which can not be
+                # unstacked for ragged inputs, so it is made an identity shear.
+                transformation = {
+                    key: tf.zeros((batch_size, 1)) if value is None else value
+                    for key, value in transformation.items()
+                }
+            transformations.append(transformation)
+        return transformations
+
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        images = tf.expand_dims(image, axis=0)
+        transformations = tf.nest.map_structure(
+            lambda x: tf.expand_dims(x, axis=0), transformation
+        )
+        images = self.augment_images(images, transformations)
+        return tf.squeeze(images, axis=0)
+
+    def augment_images(self, images, transformations, **kwargs):
+        return self._warp(images, transformations, self.interpolation)
+
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels
+
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
+    ):
+        return self._warp(segmentation_masks, transformations, "nearest")
+
+    def augment_bounding_boxes(
+        self, bounding_boxes, transformations, raw_images=None, **kwargs
+    ):
+        if self.bounding_box_format is None:
+            raise ValueError(
+                "`FusedAffineAugmentation()` was called with bounding boxes,"
+                "but no `bounding_box_format` was specified in the constructor."
+                "Please specify a bounding box format in the constructor. i.e."
+                "`FusedAffineAugmentation(layers, bounding_box_format='xyxy')`"
+            )
+        bounding_boxes = bounding_box.to_dense(bounding_boxes)
+        bounding_boxes = bounding_box.convert_format(
+            bounding_boxes,
+            source=self.bounding_box_format,
+            target="xyxy",
+            images=raw_images,
+        )
+        boxes = bounding_boxes["boxes"]
+        x1, y1, x2, y2 = tf.split(boxes, 4, axis=-1)
+        # [batch, num_boxes, 4 corners, 2]
+        corners = tf.stack(
+            [
+                tf.concat([x1, y1], axis=-1),
+                tf.concat([x2, y1], axis=-1),
+                tf.concat([x2, y2], axis=-1),
+                tf.concat([x1, y2], axis=-1),
+            ],
+            axis=2,
+        )
+        corners = self._transform_points(corners, transformations, raw_images)
+        boxes = tf.concat(
+            [
+                tf.reduce_min(corners, axis=2),
+                tf.reduce_max(corners, axis=2),
+            ],
+            axis=-1,
+        )
+
+        bounding_boxes = bounding_boxes.copy()
+        bounding_boxes["boxes"] = boxes
+        bounding_boxes = bounding_box.clip_to_image(
+            bounding_boxes,
+            bounding_box_format="xyxy",
+            images=raw_images,
+        )
+        bounding_boxes = bounding_box.convert_format(
+            bounding_boxes,
+            source="xyxy",
+            target=self.bounding_box_format,
+            dtype=self.compute_dtype,
+            images=raw_images,
+        )
+        return bounding_boxes
+
+    def augment_keypoints(
+        self, keypoints, transformations, raw_images=None, **kwargs
+    ):
+        if self.keypoint_format is None:
+            raise ValueError(
+                "`FusedAffineAugmentation()` was called with keypoints,"
+                "but no `keypoint_format` was specified in the constructor."
+                "Please specify a keypoint format in the constructor. i.e."
+                "`FusedAffineAugmentation(layers, keypoint_format='xy')`"
+            )
+        if isinstance(keypoints, tf.RaggedTensor):
+            keypoints = keypoints.to_tensor()
+        keypoints = keypoint.convert_format(
+            keypoints,
+            source=self.keypoint_format,
+            target="xy",
+            images=raw_images,
+        )
+        keypoints = self._transform_points(
+            keypoints, transformations, raw_images
+        )
+        return keypoint.convert_format(
+            keypoints,
+            source="xy",
+            target=self.keypoint_format,
+            images=raw_images,
+            dtype=self.compute_dtype,
+        )
+
+    def _warp(self, images, transformations, interpolation):
+        images = preprocessing_utils.ensure_tensor(images, self.compute_dtype)
+        original_shape = images.shape
+        matrices = self._get_matrices(transformations, images)
+        # The 8 projective parameters are the first 8 entries of the
+        # normalized matrix, the 9th entry being implicitly 1.
+        matrices = matrices / matrices[:, 2:, 2:]
+        transforms = tf.reshape(matrices, (-1, 9))[:, :8]
+        outputs = preprocessing_utils.transform(
+            images,
+            transforms,
+            fill_mode=self.fill_mode,
+            fill_value=self.fill_value,
+            interpolation=interpolation,
+        )
+        outputs.set_shape(original_shape)
+        return outputs
+
+    def _transform_points(self, points, transformations, images):
+        """Maps `[batch, ..., 2]` `xy` points from the input to the output.
+
+        Points are continuous coordinates, whereas the warp maps pixel
+        indices, so points are moved to pixel centers and back around the
+        inverse of the composed output-to-input matrix.
+        """
+        matrices = tf.linalg.inv(self._get_matrices(transformations, images))
+        batch_size = tf.shape(points)[0]
+        flat_points = tf.reshape(
+            tf.cast(points, tf.float32), (batch_size, -1, 2)
+        )
+        flat_points = tf.concat(
+            [flat_points - 0.5, tf.ones_like(flat_points[..., :1])], axis=-1
+        )
+        flat_points = tf.linalg.matmul(flat_points, matrices, transpose_b=True)
+        flat_points = flat_points[..., :2] / flat_points[..., 2:] + 0.5
+        return tf.reshape(flat_points, tf.shape(points))
+
+    def _get_matrices(self, transformations, images):
+        """Composes the output-to-input matrices of all layers.
+
+        Every layer maps its output pixels to its input pixels, so the output
+        of the last layer reaches the input of the first one through the
+        product of the matrices in layer order.
+        """
+        if isinstance(images, tf.RaggedTensor):
+            # Boxes and keypoints of ragged images are warped with the size of
+            # their own image, read from the first row of every image.
+            heights = images.row_lengths()
+            widths = tf.gather(images.values.row_lengths(), images.row_starts())
+        else:
+            image_shape = tf.shape(images)
+            heights = tf.fill(image_shape[:1], image_shape[H_AXIS])
+            widths = tf.fill(image_shape[:1], image_shape[W_AXIS])
+        height = tf.cast(heights, tf.float32)[:, tf.newaxis]
+        width = tf.cast(widths, tf.float32)[:, tf.newaxis]
+        matrices = None
+        for layer, transformation in zip(self.layers, transformations):
+            matrix = self._get_layer_matrix(
+                layer, transformation, height, width
+            )
+            matrices = (
+                matrix
+                if matrices is None
+                else tf.linalg.matmul(matrices, matrix)
+            )
+        if matrices is None:
+            return tf.eye(3, batch_shape=tf.shape(height)[:1])
+        return matrices
+
+    @staticmethod
+    def _get_layer_matrix(layer, transformation, height, width):
+        """Returns the `[batch, 3, 3]` output-to-input matrix of a layer.
+
+        `height` and `width` are `[batch, 1]` image sizes.
+        """
+        if isinstance(layer, RandomRotation):
+            transforms = preprocessing_utils.get_rotation_matrix(
+                transformation["angles"], height[:, 0], width[:, 0]
+            )
+        elif isinstance(layer, RandomShear):
+            shear_x = transformation["shear_x"]
+            shear_y = transformation["shear_y"]
+            return tf.linalg.matmul(
+                _to_matrix(layer._build_shear_x_transform_matrix(shear_x)),
+                _to_matrix(layer._build_shear_y_transform_matrix(shear_y)),
+            )
+        elif isinstance(layer, RandomTranslation):
+            translations = tf.concat(
+                [
+                    transformation["width_translations"] * width,
+                    transformation["height_translations"] * height,
+                ],
+                axis=1,
+            )
+            transforms = preprocessing_utils.get_translation_matrix(
+                translations
+            )
+        elif isinstance(layer, RandomZoom):
+            zooms = tf.concat(
+                [transformation["width_zooms"], transformation["height_zooms"]],
+                axis=1,
+            )
+            transforms = layer.get_zoom_matrix(zooms, height, width)
+        else:
+            threshold = 1.0 - layer.rate
+            flip_x = transformation["flip_horizontals"] > threshold
+            flip_y = transformation["flip_verticals"] > threshold
+            # A flip maps `x` to `(width - 1) - x`.
+            scale_x = tf.where(flip_x, -1.0, 1.0)
+            scale_y = tf.where(flip_y, -1.0, 1.0)
+            offset_x = tf.where(flip_x, width - 1.0, 0.0)
+            offset_y = tf.where(flip_y, height - 1.0, 0.0)
+            zeros = tf.zeros_like(scale_x)
+            transforms = tf.concat(
+                [scale_x, zeros, offset_x, zeros, scale_y, offset_y]
+                + [zeros, zeros],
+                axis=1,
+            )
+        return _to_matrix(transforms)
+
+    def compute_output_shape(self, input_shape):
+        return input_shape
+
+    def get_config(self):
+        config = super().get_config()
+        config.update(
+            {
+                "layers": self.layers,
+                "fill_mode": self.fill_mode,
+                "fill_value": self.fill_value,
+                "interpolation": self.interpolation,
+                "bounding_box_format": self.bounding_box_format,
+                "keypoint_format": self.keypoint_format,
+                "seed": self.seed,
+            }
+        )
+        return config
+
+
+def _to_matrix(transforms):
+    """Turns `[batch, 8]` projective transforms into `[batch, 3, 3]`."""
+    transforms = tf.cast(transforms, tf.float32)
+    ones = tf.ones_like(transforms[:, :1])
+    return tf.reshape(tf.concat([transforms, ones], axis=1), (-1, 3, 3))
@@ -0,0 +1,185 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import tensorflow as tf
+from absl.testing import parameterized
+
+from keras_cv.src import bounding_box
+from keras_cv.src.layers import preprocessing
+from keras_cv.src.tests.test_case import TestCase
+
+
+class FusedAffineAugmentationTest(TestCase):
+    @parameterized.named_parameters(
+        ("rotation", lambda: preprocessing.RandomRotation(0.2)),
+        ("shear", lambda: preprocessing.RandomShear(x_factor=0.3)),
+        ("translation", lambda: preprocessing.RandomTranslation(0.3, 0.3)),
+        ("zoom", lambda: preprocessing.RandomZoom(0.3, 0.2)),
+        ("flip", lambda: preprocessing.RandomFlip("horizontal_and_vertical")),
+    )
+    def test_single_layer_matches_layer(self, layer_fn):
+        layer = layer_fn()
+        fused = preprocessing.FusedAffineAugmentation([layer])
+        images = tf.random.uniform((4, 16, 12, 3))
+
+        transformations = fused.get_random_transformation_batch(4)
+        expected = layer.augment_images(images, transformations[0])
+        outputs = fused.augment_images(images, transformations)
+
+        self.assertAllClose(outputs, expected, atol=1e-4)
+
+    def test_matches_sequential_layers(self):
+        translation = preprocessing.RandomTranslation(
+            (0.25, 0.25), (-0.5, -0.5), fill_mode="constant"
+        )
+        flip = preprocessing.RandomFlip("horizontal_and_vertical", rate=1.0)
+        fused = preprocessing.FusedAffineAugmentation(
+            [translation, flip], fill_mode="constant"
+        )
+        images = np.random.uniform(size=(2, 8, 8, 3)).astype("float32")
+
+        outputs = fused(images)
+
+        self.assertAllClose(outputs, flip(translation(images)))
+
+    def test_composes_in_layer_order(self):
+        zoom = preprocessing.RandomZoom((-0.5, -0.5), fill_mode="constant")
+        translation = preprocessing.RandomTranslation(
+            (0.0, 0.0), (0.25, 0.25), fill_mode="constant"
+        )
+        fused = preprocessing.FusedAffineAugmentation(
+            [translation, zoom], fill_mode="constant"
+        )
+        images = np.random.uniform(size=(1, 16, 16, 1)).astype("float32")
+
+        outputs = fused(images)
+
+        self.assertAllClose(outputs, zoom(translation(images)))
+        self.assertNotAllClose(outputs, translation(zoom(images)))
+
+    def test_augments_bounding_boxes(self):
+        translation = preprocessing.RandomTranslation(
+            (0.25, 0.25), (0.0, 0.0), bounding_box_format="xyxy"
+        )
+        flip = preprocessing.RandomFlip(
+            "horizontal", rate=1.0, bounding_box_format="xyxy"
+        )
+        fused = preprocessing.FusedAffineAugmentation(
+            [translation, flip], bounding_box_format="xyxy"
+        )
+        inputs = {
+            "images": tf.ones((2, 8, 8, 3)),
+            "bounding_boxes": {
+                "boxes": tf.constant(
+                    [
+                        [[0, 0, 2, 2], [4, 2, 8, 4]],
+                        [[1, 1, 3, 3], [0, 0, 0, 0]],
+                    ],
+                    tf.float32,
+                ),
+                "classes": tf.constant([[0, 1], [0, -1]], tf.float32),
+            },
+        }
+
+        outputs = fused(inputs)
+        expected = flip(translation(inputs))
+
+        outputs = bounding_box.to_dense(outputs["bounding_boxes"])
+        expected = bounding_box.to_dense(expected["bounding_boxes"])
+        self.assertAllClose(outputs["boxes"], expected["boxes"], atol=1e-4)
+        self.assertAllClose(
+            outputs["boxes"][0], [[6, 2, 8, 4], [0, 4, 4, 6]], atol=1e-4
+        )
+
+    def test_rotated_bounding_boxes_enclose_corners(self):
+        rotation = preprocessing.RandomRotation((0.25, 0.25))
+        fused = preprocessing.FusedAffineAugmentation(
+            [rotation], bounding_box_format="xyxy"
+        )
+        inputs = {
+            "images": tf.ones((1, 10, 10, 3)),
+            "bounding_boxes": {
+                "boxes": tf.constant([[[0, 0, 4, 2]]], tf.float32),
+                "classes": tf.constant([[0]], tf.float32),
+            },
+        }
+
+        outputs = fused(inputs)
+
+        # A counter-clockwise quarter turn about the center (5, 5) maps
+        # (x, y) to (y, 10 - x) in continuous coordinates.
+        boxes = bounding_box.to_dense(outputs["bounding_boxes"])["boxes"]
+        self.assertAllClose(boxes, [[[0, 6, 2, 10]]], atol=1e-4)
+
+    def test_augments_keypoints(self):
+        flip = preprocessing.RandomFlip("vertical", rate=1.0)
+        fused = preprocessing.FusedAffineAugmentation(
+            [flip], keypoint_format="rel_xy"
+        )
+        inputs = {
+            "images": tf.ones((1, 8, 4, 3)),
+            "keypoints": tf.constant([[[0.25, 0.25], [0.5, 1.0]]]),
+        }
+
+        outputs = fused(inputs)
+
+        self.assertAllClose(
+            outputs["keypoints"], [[[0.25, 0.75], [0.5, 0.0]]], atol=1e-5
+        )
+
+    def test_augments_segmentation_masks_with_nearest(self):
+        fused = preprocessing.FusedAffineAugmentation(
+            [preprocessing.RandomRotation(0.1), preprocessing.RandomZoom(0.2)]
+        )
+        masks = tf.cast(
+            tf.random.uniform((2, 16, 16, 1), maxval=3, dtype=tf.int32),
+            tf.float32,
+        )
+
+        outputs = fused(
+            {"images": tf.ones((2, 16, 16, 3)), "segmentation_masks": masks}
+        )
+
+        values = outputs["segmentation_masks"]
+        self.assertAllEqual(values, tf.round(values))
+
+    def test_ragged_images(self):
+        fused = preprocessing.FusedAffineAugmentation(
+            [preprocessing.RandomRotation(0.1), preprocessing.RandomShear(0.2)]
+        )
+        images = tf.ragged.stack(
+            [tf.ones((8, 8, 3)), tf.ones((4, 6, 3)), tf.ones((6, 4, 3))]
+        )
+
+        outputs = fused(images)
+
+        self.assertIsInstance(outputs, tf.RaggedTensor)
+        self.assertAllEqual(outputs.row_lengths(), [8, 4, 6])
+
+    def test_raises_on_unsupported_layer(self):
+        with self.assertRaisesRegex(ValueError, "only supports the layers"):
+            preprocessing.FusedAffineAugmentation(
+                [preprocessing.RandomBrightness(0.2)]
+            )
+
+    def test_config(self):
+        layers = [preprocessing.RandomRotation(0.1)]
+        fused = preprocessing.FusedAffineAugmentation(
+            layers, fill_mode="constant", bounding_box_format="xyxy"
+        )
+        config = fused.get_config()
+        self.assertEqual(config["layers"], layers)
+        self.assertEqual(config["fill_mode"], "constant")
+        self.assertEqual(config["bounding_box_format"], "xyxy")
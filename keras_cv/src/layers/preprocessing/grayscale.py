@@ -15,6 +15,7 @@
 import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
@@ -49,6 +50,9 @@ class Grayscale(VectorizedBaseImageAugmentationLayer):
     ```
     """
 
+    _supports_backend_native = True
+    _supports_uint8 = True
+
     def __init__(self, output_channels=1, **kwargs):
         super().__init__(**kwargs)
         self.output_channels = output_channels
@@ -76,11 +80,13 @@ class Grayscale(VectorizedBaseImageAugmentationLayer):
         )
 
     def augment_images(self, images, transformations=None, **kwargs):
-        grayscale = tf.image.rgb_to_grayscale(images)
+        grayscale = ops.image.rgb_to_grayscale(
+            images, data_format="channels_last"
+        )
         if self.output_channels == 1:
             return grayscale
         elif self.output_channels == 3:
-            return tf.image.grayscale_to_rgb(grayscale)
+            return ops.repeat(grayscale, 3, axis=-1)
         else:
             raise ValueError("Unsupported value for `output_channels`.")
 
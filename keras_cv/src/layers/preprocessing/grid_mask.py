@@ -12,30 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import tensorflow as tf
 
 from keras_cv.src import core
-from keras_cv.src import layers as cv_layers
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
-from keras_cv.src.utils import fill_utils
 from keras_cv.src.utils import preprocessing
 
 
-def _center_crop(mask, width, height):
-    masks_shape = tf.shape(mask)
-    h_diff = masks_shape[0] - height
-    w_diff = masks_shape[1] - width
-
-    h_start = tf.cast(h_diff / 2, tf.int32)
-    w_start = tf.cast(w_diff / 2, tf.int32)
-    return tf.image.crop_to_bounding_box(mask, h_start, w_start, height, width)
-
-
 @keras_cv_export("keras_cv.layers.GridMask")
-class GridMask(BaseImageAugmentationLayer):
+class GridMask(VectorizedBaseImageAugmentationLayer):
     """GridMask class for grid-mask augmentation.
 
 
@@ -93,6 +82,8 @@ class GridMask(BaseImageAugmentationLayer):
         - [GridMask paper](https://arxiv.org/abs/2001.04086)
     """
 
+    _supports_uint8 = True
+
     def __init__(
         self,
         ratio_factor=(0, 0.5),
@@ -118,13 +109,12 @@ class GridMask(BaseImageAugmentationLayer):
         self.fill_mode = fill_mode
         self.fill_value = fill_value
         self.rotation_factor = rotation_factor
-        self.random_rotate = cv_layers.RandomRotation(
-            factor=rotation_factor,
-            fill_mode="constant",
-            fill_value=0.0,
-            seed=seed,
-        )
-        self.auto_vectorize = False
+        if isinstance(rotation_factor, (tuple, list)):
+            self.rotation_lower = rotation_factor[0]
+            self.rotation_upper = rotation_factor[1]
+        else:
+            self.rotation_lower = -rotation_factor
+            self.rotation_upper = rotation_factor
         self._check_parameter_values()
         self.seed = seed
 
@@ -142,114 +132,141 @@ class GridMask(BaseImageAugmentationLayer):
                 f'"gaussian_noise", or "random". Got `fill_mode`={fill_mode}'
             )
 
-    def get_random_transformation(
-        self, image=None, label=None, bounding_boxes=None, **kwargs
-    ):
-        ratio = self.ratio_factor()
-
-        # compute grid mask
-        input_shape = tf.shape(image)
-        mask = self._compute_grid_mask(input_shape, ratio=ratio)
-
-        # convert mask to single-channel image
-        mask = tf.cast(mask, tf.float32)
-        mask = tf.expand_dims(mask, axis=-1)
-
-        # randomly rotate mask
-        mask = self.random_rotate(mask)
-
-        # compute fill
-        if self.fill_mode == "constant":
-            fill_value = tf.fill(input_shape, self.fill_value)
-            fill_value = tf.cast(fill_value, dtype=self.compute_dtype)
-        else:
-            # gaussian noise
-            fill_value = self._random_generator.random_normal(
-                shape=input_shape, dtype=self.compute_dtype
-            )
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        # Unit sizes and offsets are sampled as fractions of their range, and
+        # only scaled to the image size in `_get_grid_parameters()`, so that
+        # they also apply to ragged batches.
+        fractions = self._random_generator.uniform(
+            shape=(batch_size, 3), minval=0.0, maxval=1.0, dtype=tf.float32
+        )
+        ratios = tf.cast(self.ratio_factor(shape=(batch_size,)), tf.float32)
+        angles = self._random_generator.uniform(
+            shape=(batch_size,),
+            minval=self.rotation_lower * 2.0 * np.pi,
+            maxval=self.rotation_upper * 2.0 * np.pi,
+            dtype=tf.float32,
+        )
+        return {
+            "unit_size_fractions": fractions[:, 0],
+            "offset_fractions": fractions[:, 1:],
+            "ratios": ratios,
+            "angles": angles,
+        }
 
-        return mask, fill_value
+    def _get_grid_parameters(self, input_shape, transformations):
+        height = tf.cast(input_shape[1], tf.float32)
+        width = tf.cast(input_shape[2], tf.float32)
 
-    def _compute_grid_mask(self, input_shape, ratio):
-        height = tf.cast(input_shape[0], tf.float32)
-        width = tf.cast(input_shape[1], tf.float32)
+        # grid unit size
+        min_unit_size = tf.math.minimum(height * 0.5, width * 0.3)
+        max_unit_size = tf.math.maximum(height * 0.5, width * 0.3) + 1
+        unit_sizes = min_unit_size + transformations["unit_size_fractions"] * (
+            max_unit_size - min_unit_size
+        )
+        rectangle_side_lens = transformations["ratios"] * unit_sizes
+
+        # x and y offset for grid units between 0 and unit_size
+        offsets = transformations["offset_fractions"] * unit_sizes[:, None]
+        return unit_sizes, rectangle_side_lens, offsets[:, 0], offsets[:, 1]
+
+    def _compute_grid_masks(self, input_shape, transformations):
+        """Computes the rotated grid masks of a batch at once.
+
+        The grid is defined on a square with the side length of the image
+        diagonal, rotated around its center and center cropped to the image.
+        Instead of materializing each of these steps, the pixels of the
+        cropped masks are rotated back onto the square, and tested against the
+        periodic grid directly.
+        """
+        height = input_shape[1]
+        width = input_shape[2]
+        float_height = tf.cast(height, tf.float32)
+        float_width = tf.cast(width, tf.float32)
 
         # mask side length
-        input_diagonal_len = tf.sqrt(tf.square(width) + tf.square(height))
+        input_diagonal_len = tf.sqrt(
+            tf.square(float_width) + tf.square(float_height)
+        )
         mask_side_len = tf.math.ceil(input_diagonal_len)
 
-        # grid unit size
-        unit_size = self._random_generator.uniform(
-            shape=(),
-            minval=tf.math.minimum(height * 0.5, width * 0.3),
-            maxval=tf.math.maximum(height * 0.5, width * 0.3) + 1,
-            dtype=tf.float32,
-        )
-        rectangle_side_len = tf.cast((ratio) * unit_size, tf.float32)
+        # offset of the center crop, and rotation center of the mask
+        int_side_len = tf.cast(mask_side_len, tf.int32)
+        h_start = tf.cast((int_side_len - height) // 2, tf.float32)
+        w_start = tf.cast((int_side_len - width) // 2, tf.float32)
+        center = (mask_side_len - 1.0) / 2.0
 
-        # sample x and y offset for grid units randomly between 0 and unit_size
-        delta_x = self._random_generator.uniform(
-            shape=(), minval=0.0, maxval=unit_size, dtype=tf.float32
-        )
-        delta_y = self._random_generator.uniform(
-            shape=(), minval=0.0, maxval=unit_size, dtype=tf.float32
-        )
+        ys = tf.range(float_height) + h_start - center
+        xs = tf.range(float_width) + w_start - center
+        ys = ys[tf.newaxis, :, tf.newaxis]
+        xs = xs[tf.newaxis, tf.newaxis, :]
 
-        # grid size (number of diagonal units in grid)
-        grid_size = mask_side_len // unit_size + 1
-        grid_size_range = tf.range(1, grid_size + 1)
-
-        # diagonal corner coordinates
-        unit_size_range = grid_size_range * unit_size
-        x1 = unit_size_range - delta_x
-        x0 = x1 - rectangle_side_len
-        y1 = unit_size_range - delta_y
-        y0 = y1 - rectangle_side_len
-
-        # compute grid coordinates
-        x0, y0 = tf.meshgrid(x0, y0)
-        x1, y1 = tf.meshgrid(x1, y1)
-
-        # flatten mesh grid
-        x0 = tf.reshape(x0, [-1])
-        y0 = tf.reshape(y0, [-1])
-        x1 = tf.reshape(x1, [-1])
-        y1 = tf.reshape(y1, [-1])
-
-        # convert coordinates to mask
-        corners = tf.stack([x0, y0, x1, y1], axis=-1)
-        mask_side_len = tf.cast(mask_side_len, tf.int32)
-        rectangle_masks = fill_utils.corners_to_mask(
-            corners, mask_shape=(mask_side_len, mask_side_len)
+        unit_sizes, rectangle_side_lens, delta_x, delta_y = (
+            self._get_grid_parameters(input_shape, transformations)
         )
-        grid_mask = tf.reduce_any(rectangle_masks, axis=0)
+        unit_sizes = unit_sizes[:, tf.newaxis, tf.newaxis]
+        rectangle_side_lens = rectangle_side_lens[:, tf.newaxis, tf.newaxis]
+
+        angles = transformations["angles"][:, tf.newaxis, tf.newaxis]
+        cos = tf.cos(angles)
+        sin = tf.sin(angles)
+        # Pixel coordinates on the unrotated mask, sampled with nearest
+        # neighbor interpolation.
+        mask_xs = tf.round(cos * xs - sin * ys + center)
+        mask_ys = tf.round(sin * xs + cos * ys + center)
+
+        def grid_axis_mask(coordinates, deltas):
+            # Rectangles span `[k * unit_size - delta - rectangle_side_len,
+            # k * unit_size - delta)` for integers `k >= 1`.
+            phase = tf.math.floormod(
+                coordinates + deltas[:, tf.newaxis, tf.newaxis], unit_sizes
+            )
+            in_square = (coordinates >= 0) & (coordinates < mask_side_len)
+            return in_square & (phase >= unit_sizes - rectangle_side_lens)
 
-        return grid_mask
+        masks = grid_axis_mask(mask_xs, delta_x) & grid_axis_mask(
+            mask_ys, delta_y
+        )
+        return masks[..., tf.newaxis]
 
-    def augment_image(self, image, transformation=None, **kwargs):
-        mask, fill_value = transformation
-        input_shape = tf.shape(image)
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        image = tf.expand_dims(image, axis=0)
+        transformation = {
+            key: tf.expand_dims(value, axis=0)
+            for key, value in transformation.items()
+        }
+        image = self.augment_images(
+            images=image, transformations=transformation, **kwargs
+        )
+        return tf.squeeze(image, axis=0)
 
-        # center crop mask
-        input_height = input_shape[0]
-        input_width = input_shape[1]
-        mask = _center_crop(mask, input_width, input_height)
+    def augment_images(self, images, transformations, **kwargs):
+        input_shape = tf.shape(images)
+        masks = self._compute_grid_masks(input_shape, transformations)
 
-        # convert back to boolean mask
-        mask = tf.cast(mask, tf.bool)
+        # compute fill
+        if self.fill_mode == "constant":
+            fill_values = tf.cast(self.fill_value, dtype=self.compute_dtype)
+        else:
+            # gaussian noise
+            fill_values = self._random_generator.normal(
+                shape=input_shape, dtype=self.compute_dtype
+            )
 
-        return tf.where(mask, fill_value, image)
+        return tf.where(masks, tf.cast(fill_values, images.dtype), images)
 
-    def augment_bounding_boxes(self, bounding_boxes, **kwargs):
+    def augment_bounding_boxes(self, bounding_boxes, transformations, **kwargs):
         return bounding_boxes
 
-    def augment_label(self, label, transformation=None, **kwargs):
-        return label
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels
+
+    def augment_keypoints(self, keypoints, transformations, **kwargs):
+        return keypoints
 
-    def augment_segmentation_mask(
-        self, segmentation_mask, transformation, **kwargs
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
     ):
-        return segmentation_mask
+        return segmentation_masks
 
     def get_config(self):
         config = {
@@ -87,6 +87,15 @@ class GridMaskTest(TestCase):
         )
         self.assertTrue(np.any(ops.convert_to_numpy(xs[1]) == 1.0))
 
+    def test_ratio_sets_share_of_masked_pixels(self):
+        images = tf.ones((64, 64, 48, 3))
+        layer = GridMask(ratio_factor=(0.5, 0.5), fill_value=0)
+
+        outputs = layer(images)
+
+        # Half of each grid unit is masked along both axes.
+        self.assertAllClose(tf.reduce_mean(outputs), 0.75, atol=0.05)
+
     @pytest.mark.tf_only
     def test_in_tf_function(self):
         xs = tf.cast(
@@ -132,3 +141,31 @@ class GridMaskTest(TestCase):
         xs = layer(xs, training=True)
         self.assertTrue(np.any(ops.convert_to_numpy(xs) == 0.0))
         self.assertTrue(np.any(ops.convert_to_numpy(xs) == 1.0))
+
+    def test_unrotated_masks_match_grid_of_rectangles(self):
+        images = tf.ones((4, 30, 50, 1))
+        layer = GridMask(ratio_factor=(0.2, 0.6), rotation_factor=0.0)
+        transformations = layer.get_random_transformation_batch(
+            4, images=images
+        )
+        outputs = layer.augment_images(images, transformations)
+        unit_sizes, side_lens, deltas_x, deltas_y = layer._get_grid_parameters(
+            tf.shape(images), transformations
+        )
+
+        # Offsets of the center crop of the `59x59` mask.
+        ys = np.arange(30)[:, None] + 14
+        xs = np.arange(50)[None, :] + 4
+        for i in range(4):
+            unit_size = float(unit_sizes[i])
+            side_len = float(side_lens[i])
+            delta_x = float(deltas_x[i])
+            delta_y = float(deltas_y[i])
+            k = np.arange(1, 60 // unit_size + 2)[:, None, None]
+            x_ends = k * unit_size - delta_x
+            y_ends = k * unit_size - delta_y
+            in_x = np.any((xs >= x_ends - side_len) & (xs < x_ends), axis=0)
+            in_y = np.any((ys >= y_ends - side_len) & (ys < y_ends), axis=0)
+            self.assertAllEqual(
+                ops.convert_to_numpy(outputs[i, ..., 0]) == 0.0, in_x & in_y
+            )
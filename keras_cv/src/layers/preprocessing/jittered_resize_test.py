@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import unittest
+
 import numpy as np
 import tensorflow as tf
 
@@ -205,6 +207,23 @@ class JitteredResizeTest(TestCase):
         self.assertNotAllClose(output["images"], input_image_resized)
         self.assertNotAllClose(output["segmentation_masks"], input_mask_resized)
 
+    def test_matches_per_image_resize_and_crop(self):
+        images = tf.random.uniform(shape=(2, 64, 64, 3)) * 255.0
+        layer = layers.JitteredResize(
+            target_size=(32, 32), scale_factor=(3 / 4, 3 / 4)
+        )
+
+        with unittest.mock.patch.object(
+            layer._random_generator,
+            "uniform",
+            return_value=tf.fill((2, 2), 0.5),
+        ):
+            output = layer(images)
+
+        # Images are scaled to 48x48 and cropped at offset (48 - 32) * 0.5.
+        expected = tf.image.resize(images, (48, 48))[:, 8:40, 8:40]
+        self.assertAllClose(output, expected)
+
     def test_config_with_custom_name(self):
         layer = layers.JitteredResize(
             target_size=self.target_size,
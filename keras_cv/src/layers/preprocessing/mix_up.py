@@ -16,13 +16,28 @@ import tensorflow as tf
 
 from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    BATCHED,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    BOUNDING_BOXES,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    IMAGES,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    LABELS,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    SEGMENTATION_MASKS,
+)
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 
 
 @keras_cv_export("keras_cv.layers.MixUp")
-class MixUp(BaseImageAugmentationLayer):
+class MixUp(VectorizedBaseImageAugmentationLayer):
     """MixUp implements the MixUp data augmentation technique.
 
     Args:
@@ -56,83 +71,56 @@ class MixUp(BaseImageAugmentationLayer):
         self.seed = seed
 
     def _sample_from_beta(self, alpha, beta, shape):
-        sample_alpha = tf.random.gamma(
+        seeds = self._random_generator.make_seeds(2)
+        sample_alpha = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 0],
             alpha=alpha,
         )
-        sample_beta = tf.random.gamma(
+        sample_beta = tf.random.stateless_gamma(
             shape,
+            seed=seeds[:, 1],
             alpha=beta,
         )
         return sample_alpha / (sample_alpha + sample_beta)
 
-    def _batch_augment(self, inputs):
-        self._validate_inputs(inputs)
-        images = inputs.get("images", None)
-        labels = inputs.get("labels", None)
-        bounding_boxes = inputs.get("bounding_boxes", None)
-        segmentation_masks = inputs.get("segmentation_masks", None)
-        images, lambda_sample, permutation_order = self._mixup(images)
-        if labels is not None:
-            labels = self._update_labels(
-                tf.cast(labels, dtype=self.compute_dtype),
-                lambda_sample,
-                permutation_order,
-            )
-            inputs["labels"] = labels
-        if bounding_boxes is not None:
-            bounding_boxes = self._update_bounding_boxes(
-                bounding_boxes, permutation_order
-            )
-            inputs["bounding_boxes"] = bounding_boxes
-        inputs["images"] = images
-        if segmentation_masks is not None:
-            segmentation_masks = self._update_segmentation_masks(
-                segmentation_masks, lambda_sample, permutation_order
-            )
-            inputs["segmentation_masks"] = segmentation_masks
-        return inputs
-
-    def _augment(self, inputs):
-        raise ValueError(
-            "MixUp received a single image to `call`. The layer relies on "
-            "combining multiple examples, and as such will not behave as "
-            "expected. Please call the layer with 2 or more samples."
-        )
-
-    def _mixup(self, images):
-        batch_size = tf.shape(images)[0]
-        permutation_order = tf.random.shuffle(
-            tf.range(0, batch_size), seed=self.seed
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        permutation_order = tf.random.experimental.stateless_shuffle(
+            tf.range(0, batch_size),
+            seed=self._random_generator.make_seeds()[:, 0],
         )
-
         lambda_sample = self._sample_from_beta(
             self.alpha, self.alpha, (batch_size,)
         )
-        lambda_sample = tf.cast(
-            tf.reshape(lambda_sample, [-1, 1, 1, 1]), dtype=self.compute_dtype
-        )
+        return {
+            "permutation_order": permutation_order,
+            "lambda_sample": tf.cast(lambda_sample, dtype=self.compute_dtype),
+        }
 
-        mixup_images = tf.cast(
-            tf.gather(images, permutation_order), dtype=self.compute_dtype
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        raise ValueError(
+            "MixUp received ragged images to `call`. The layer relies on "
+            "combining multiple examples with same size, and as such will not "
+            "behave as expected. Please call the layer with dense images with "
+            "same size."
         )
 
-        images = lambda_sample * images + (1.0 - lambda_sample) * mixup_images
-
-        return images, tf.squeeze(lambda_sample), permutation_order
-
-    def _update_labels(self, labels, lambda_sample, permutation_order):
-        labels_for_mixup = tf.gather(labels, permutation_order)
-
-        lambda_sample = tf.reshape(lambda_sample, [-1, 1])
-
-        labels = (
-            lambda_sample * labels + (1.0 - lambda_sample) * labels_for_mixup
+    def augment_images(self, images, transformations, **kwargs):
+        lambda_sample = tf.reshape(
+            transformations["lambda_sample"], [-1, 1, 1, 1]
         )
+        mixup_images = tf.gather(images, transformations["permutation_order"])
+        return lambda_sample * images + (1.0 - lambda_sample) * mixup_images
 
-        return labels
+    def augment_labels(self, labels, transformations, **kwargs):
+        labels_for_mixup = tf.gather(
+            labels, transformations["permutation_order"]
+        )
+        lambda_sample = tf.reshape(transformations["lambda_sample"], [-1, 1])
+        return lambda_sample * labels + (1.0 - lambda_sample) * labels_for_mixup
 
-    def _update_bounding_boxes(self, bounding_boxes, permutation_order):
+    def augment_bounding_boxes(self, bounding_boxes, transformations, **kwargs):
+        permutation_order = transformations["permutation_order"]
         boxes, classes = bounding_boxes["boxes"], bounding_boxes["classes"]
         boxes_for_mixup = tf.gather(boxes, permutation_order)
         classes_for_mixup = tf.gather(classes, permutation_order)
@@ -140,27 +128,48 @@ class MixUp(BaseImageAugmentationLayer):
         classes = tf.concat([classes, classes_for_mixup], axis=1)
         return {"boxes": boxes, "classes": classes}
 
-    def _update_segmentation_masks(
-        self, segmentation_masks, lambda_sample, permutation_order
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
     ):
-        lambda_sample = tf.reshape(lambda_sample, [-1, 1, 1, 1])
-
+        lambda_sample = tf.reshape(
+            transformations["lambda_sample"], [-1, 1, 1, 1]
+        )
         segmentation_masks_for_mixup = tf.gather(
-            segmentation_masks, permutation_order
+            segmentation_masks, transformations["permutation_order"]
         )
-
-        segmentation_masks = (
+        return (
             lambda_sample * segmentation_masks
             + (1.0 - lambda_sample) * segmentation_masks_for_mixup
         )
 
-        return segmentation_masks
+    def call(self, inputs):
+        # Labels are cast to the compute dtype by the base layer, so they are
+        # validated beforehand.
+        self._validate_inputs(inputs)
+        _, metadata = self._format_inputs(inputs)
+        if metadata[BATCHED] is not True:
+            raise ValueError(
+                "MixUp received a single image to `call`. The layer relies on "
+                "combining multiple examples, and as such will not behave as "
+                "expected. Please call the layer with 2 or more samples."
+            )
+        outputs = super().call(inputs=inputs)
+        # The base layer returns ragged bounding boxes, keep dense inputs
+        # dense.
+        if isinstance(inputs, dict) and BOUNDING_BOXES in inputs:
+            if not isinstance(inputs[BOUNDING_BOXES]["boxes"], tf.RaggedTensor):
+                outputs[BOUNDING_BOXES] = bounding_box.to_dense(
+                    outputs[BOUNDING_BOXES]
+                )
+        return outputs
 
     def _validate_inputs(self, inputs):
-        images = inputs.get("images", None)
-        labels = inputs.get("labels", None)
-        bounding_boxes = inputs.get("bounding_boxes", None)
-        segmentation_masks = inputs.get("segmentation_masks", None)
+        if not isinstance(inputs, dict):
+            inputs = {IMAGES: inputs}
+        images = inputs.get(IMAGES, None)
+        labels = inputs.get(LABELS, None)
+        bounding_boxes = inputs.get(BOUNDING_BOXES, None)
+        segmentation_masks = inputs.get(SEGMENTATION_MASKS, None)
 
         if images is None or (
             labels is None
@@ -175,7 +184,7 @@ class MixUp(BaseImageAugmentationLayer):
                 f"Got: inputs = {inputs}."
             )
 
-        if labels is not None and not labels.dtype.is_floating:
+        if labels is not None and not tf.as_dtype(labels.dtype).is_floating:
             raise ValueError(
                 f"MixUp received labels with type {labels.dtype}. "
                 "Labels must be of type float."
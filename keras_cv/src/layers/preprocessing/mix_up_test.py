@@ -67,6 +67,34 @@ class MixUpTest(TestCase):
         self.assertEqual(ys_bounding_boxes["classes"].shape, (2, 6))
         self.assertEqual(ys_segmentation_masks.shape, (2, 512, 512, 3))
 
+    def test_ragged_bounding_boxes_stay_ragged(self):
+        xs = tf.ones((2, 32, 32, 3))
+        ys_labels = tf.one_hot([0, 1], num_classes)
+        ys_bounding_boxes = {
+            "boxes": tf.ragged.constant(
+                [[[0, 0, 1, 1], [0, 0, 2, 2]], [[0, 0, 3, 3]]],
+                ragged_rank=1,
+                dtype=tf.float32,
+            ),
+            "classes": tf.ragged.constant([[1, 2], [3]], dtype=tf.float32),
+        }
+
+        layer = MixUp()
+        outputs = layer(
+            {
+                "images": xs,
+                "labels": ys_labels,
+                "bounding_boxes": ys_bounding_boxes,
+            }
+        )
+        ys_bounding_boxes = outputs["bounding_boxes"]
+
+        self.assertIsInstance(ys_bounding_boxes["boxes"], tf.RaggedTensor)
+        self.assertIsInstance(ys_bounding_boxes["classes"], tf.RaggedTensor)
+        # Each image keeps its own boxes and gains those of its mixing partner.
+        self.assertEqual(ys_bounding_boxes["classes"].nrows(), 2)
+        self.assertEqual(tf.size(ys_bounding_boxes["classes"].flat_values), 6)
+
     def test_mix_up_call_results_with_labels(self):
         xs = tf.cast(
             tf.stack(
@@ -89,6 +117,18 @@ class MixUpTest(TestCase):
         self.assertNotAllClose(ys, 1.0)
         self.assertNotAllClose(ys, 0.0)
 
+    def test_identical_images_keep_their_values(self):
+        images = tf.ones((8, 32, 32, 3)) * tf.random.uniform((1, 1, 1, 3))
+        labels = tf.one_hot(tf.range(8) % 4, 4)
+        layer = MixUp()
+
+        outputs = layer({"images": images, "labels": labels})
+
+        self.assertAllClose(outputs["images"], images)
+        self.assertAllClose(
+            tf.reduce_sum(outputs["labels"], axis=-1), tf.ones((8,))
+        )
+
     def test_mix_up_call_results_with_masks(self):
         xs = tf.cast(
             tf.stack(
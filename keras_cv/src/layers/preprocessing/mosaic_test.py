@@ -113,3 +113,21 @@ class MosaicTest(TestCase):
             ValueError, "Mosaic expects inputs in a dictionary with format"
         ):
             _ = layer(xs)
+
+    def test_crops_the_mosaic_around_the_center(self):
+        images = tf.random.uniform((1, 32, 32, 3))
+        labels = tf.one_hot(tf.zeros((1,), tf.int32), num_classes)
+        layer = Mosaic(offset=(0.5, 0.5), seed=2023)
+
+        outputs = layer({"images": images, "labels": labels})
+
+        # A single image is tiled four times and the crop is centered at
+        # (16, 16) in each tile's own coordinates.
+        tiles = tf.concat([images, images], axis=1)
+        tiles = tf.concat([tiles, tiles], axis=2)
+        start, end = 16 / 63, 48 / 63
+        expected = tf.image.crop_and_resize(
+            tiles, [[start, start, end, end]], [0], (32, 32)
+        )
+        self.assertAllClose(outputs["images"], expected, atol=1e-5)
+        self.assertAllClose(outputs["labels"], labels)
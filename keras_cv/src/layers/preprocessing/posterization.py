@@ -15,14 +15,14 @@
 import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils.preprocessing import transform_value_range
 
 
 @keras_cv_export("keras_cv.layers.Posterization")
-class Posterization(BaseImageAugmentationLayer):
+class Posterization(VectorizedBaseImageAugmentationLayer):
     """Reduces the number of bits for each color channel.
 
     References:
@@ -58,6 +58,8 @@ class Posterization(BaseImageAugmentationLayer):
             2. A dict of tensors where the images are under `"images"` key.
     """  # noqa: E501
 
+    _supports_uint8 = True
+
     def __init__(self, value_range, bits, **kwargs):
         super().__init__(**kwargs)
 
@@ -75,45 +77,48 @@ class Posterization(BaseImageAugmentationLayer):
         self._shift = 8 - bits
         self._value_range = value_range
 
-    def augment_image(self, image, **kwargs):
-        image = transform_value_range(
-            images=image,
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        return self.augment_images(image, transformations=transformation)
+
+    def augment_images(self, images, transformations=None, **kwargs):
+        if images.dtype == tf.uint8 and tuple(self._value_range) == (0, 255):
+            return self._posterize(images)
+        images = transform_value_range(
+            images=images,
             original_range=self._value_range,
             target_range=[0, 255],
         )
-        image = tf.cast(image, tf.uint8)
+        images = tf.cast(images, tf.uint8)
 
-        image = self._posterize(image)
+        images = self._posterize(images)
 
-        image = tf.cast(image, self.compute_dtype)
+        images = tf.cast(images, self.compute_dtype)
         return transform_value_range(
-            images=image,
+            images=images,
             original_range=[0, 255],
             target_range=self._value_range,
             dtype=self.compute_dtype,
         )
 
-    def augment_bounding_boxes(self, bounding_boxes, **kwargs):
+    def augment_bounding_boxes(self, bounding_boxes, transformations, **kwargs):
         return bounding_boxes
 
-    def augment_segmentation_mask(
-        self, segmentation_mask, transformation, **kwargs
-    ):
-        return segmentation_mask
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels
 
-    def _batch_augment(self, inputs):
-        # Skip the use of vectorized_map or map_fn as the implementation is
-        # already vectorized
-        return self._augment(inputs)
+    def augment_keypoints(self, keypoints, transformations, **kwargs):
+        return keypoints
+
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
+    ):
+        return segmentation_masks
 
     def _posterize(self, image):
         return tf.bitwise.left_shift(
             tf.bitwise.right_shift(image, self._shift), self._shift
         )
 
-    def augment_label(self, label, transformation=None, **kwargs):
-        return label
-
     def get_config(self):
         config = {"bits": 8 - self._shift, "value_range": self._value_range}
         base_config = super().get_config()
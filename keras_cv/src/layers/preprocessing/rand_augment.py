@@ -67,6 +67,9 @@ class RandAugment(RandomAugmentationPipeline):
         geometric: whether to include geometric augmentations. This
             should be set to False when performing object detection. Defaults to
             True.
+        vectorized: whether to augment whole batches at once rather than one
+            sample at a time. See `keras_cv.layers.RandomAugmentationPipeline`
+            for details. Defaults to `False`.
     Example:
     ```python
     (x_test, y_test), _ = keras.datasets.cifar10.load_data()
@@ -85,6 +88,7 @@ class RandAugment(RandomAugmentationPipeline):
         magnitude_stddev=0.15,
         rate=10 / 11,
         geometric=True,
+        vectorized=False,
         seed=None,
         **kwargs,
     ):
@@ -111,6 +115,7 @@ class RandAugment(RandomAugmentationPipeline):
             ),
             augmentations_per_image=augmentations_per_image,
             rate=rate,
+            vectorized=vectorized,
             **kwargs,
             seed=seed,
         )
@@ -120,6 +125,20 @@ class RandAugment(RandomAugmentationPipeline):
         self.geometric = geometric
         self.magnitude_stddev = float(magnitude_stddev)
 
+    def _batch_augment(self, inputs):
+        if not self.vectorized:
+            # Samples are converted one at a time in `_augment()`.
+            return super()._batch_augment(inputs)
+        inputs = dict(inputs)
+        inputs["images"] = preprocessing_utils.transform_value_range(
+            inputs["images"], self.value_range, (0, 255)
+        )
+        result = super()._batch_augment(inputs)
+        result["images"] = preprocessing_utils.transform_value_range(
+            result["images"], (0, 255), self.value_range
+        )
+        return result
+
     def _augment(self, sample):
         sample["images"] = preprocessing_utils.transform_value_range(
             sample["images"], self.value_range, (0, 255)
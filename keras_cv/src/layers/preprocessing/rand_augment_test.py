@@ -21,10 +21,12 @@ from keras_cv.src.tests.test_case import TestCase
 
 
 class RandAugmentTest(TestCase):
-    def test_zero_rate_pass_through(self):
+    @parameterized.named_parameters(("vectorized", True), ("per_sample", False))
+    def test_zero_rate_pass_through(self, vectorized):
         rand_augment = layers.RandAugment(
             value_range=(0, 255),
             rate=0.0,
+            vectorized=vectorized,
         )
         xs = np.ones((2, 512, 512, 3))
         ys = rand_augment(xs)
@@ -120,3 +122,35 @@ class RandAugmentTest(TestCase):
                 [isinstance(x, layers.RandomShear) for x in rand_augment.layers]
             )
         )
+
+    @parameterized.named_parameters(("vectorized", True), ("per_sample", False))
+    def test_runs_in_graph_mode(self, vectorized):
+        rand_augment = layers.RandAugment(
+            value_range=(0, 1), rate=1.0, vectorized=vectorized
+        )
+
+        @tf.function()
+        def augment(xs):
+            return rand_augment(xs)
+
+        xs = tf.random.uniform((8, 32, 32, 3), 0, 1, dtype=tf.float32)
+        ys = ops.convert_to_numpy(augment(xs))
+        self.assertEqual(ys.shape, (8, 32, 32, 3))
+        self.assertTrue(np.all(np.logical_and(ys >= 0, ys <= 1)))
+
+    def test_vectorized_with_bounding_boxes(self):
+        rand_augment = layers.RandAugment(
+            value_range=(0, 255), geometric=False, vectorized=True
+        )
+        inputs = {
+            "images": tf.random.uniform((4, 32, 32, 3), 0, 255),
+            "bounding_boxes": {
+                "boxes": tf.constant([[[0, 0, 8, 8]]] * 4, tf.float32),
+                "classes": tf.constant([[1]] * 4, tf.float32),
+            },
+        }
+        outputs = rand_augment(inputs)
+        self.assertAllClose(
+            outputs["bounding_boxes"]["boxes"].to_tensor(),
+            inputs["bounding_boxes"]["boxes"],
+        )
@@ -12,10 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import tensorflow as tf
+
+from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    BOUNDING_BOXES,
+)
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    IMAGES,
+)
 from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
     BaseImageAugmentationLayer,
 )
+from keras_cv.src.utils import preprocessing as preprocessing_utils
 
 
 @keras_cv_export("keras_cv.layers.RandomApply")
@@ -37,6 +47,12 @@ class RandomApply(BaseImageAugmentationLayer):
         auto_vectorize: bool, whether to use tf.vectorized_map or tf.map_fn for
             batched input. Setting this to True might give better performance
             but currently doesn't work with XLA. Defaults to False.
+        vectorized: bool, whether to augment batches without a per-sample
+            loop. Each sample is still selected independently, but the
+            selected samples are passed to `layer` as a single sub-batch, so
+            a `VectorizedBaseImageAugmentationLayer` keeps its batched
+            implementation. Bounding boxes are returned as ragged tensors in
+            this mode. Ignored when `batchwise=True`. Defaults to False.
         seed: integer, controls random behaviour.
 
     Example:
@@ -94,6 +110,7 @@ class RandomApply(BaseImageAugmentationLayer):
         rate=0.5,
         batchwise=False,
         auto_vectorize=False,
+        vectorized=False,
         seed=None,
         **kwargs,
     ):
@@ -108,6 +125,7 @@ class RandomApply(BaseImageAugmentationLayer):
         self._rate = rate
         self.auto_vectorize = auto_vectorize
         self.batchwise = batchwise
+        self.vectorized = vectorized
         self.seed = seed
         self.built = True
 
@@ -121,14 +139,38 @@ class RandomApply(BaseImageAugmentationLayer):
                 return self._layer(inputs)
             else:
                 return inputs
+        if self.vectorized:
+            return self._vectorized_augment(inputs)
         # non-batchwise augmentations
         return super()._batch_augment(inputs)
 
-    def _augment(self, inputs):
-        if self._should_augment():
-            return self._layer(inputs)
+    def _vectorized_augment(self, inputs):
+        inputs = dict(inputs)
+        images = inputs[IMAGES]
+        if isinstance(images, tf.RaggedTensor):
+            batch_size = images.nrows(out_type=tf.int32)
         else:
-            return inputs
+            batch_size = tf.shape(images)[0]
+        if BOUNDING_BOXES in inputs:
+            # Vectorized layers return ragged boxes, so the samples left
+            # untouched must hold ragged boxes too to be merged with them.
+            inputs[BOUNDING_BOXES] = bounding_box.to_ragged(
+                inputs[BOUNDING_BOXES], dtype=self.compute_dtype
+            )
+        should_augment = (
+            self._random_generator.uniform(shape=(batch_size,))
+            > 1.0 - self._rate
+        )
+        # Group 0 goes through the layer, group 1 is left unchanged.
+        groups = tf.cast(tf.logical_not(should_augment), tf.int32)
+        return preprocessing_utils.augment_by_group(
+            inputs, [self._layer, None], groups
+        )
+
+    def _augment(self, inputs):
+        return tf.cond(
+            self._should_augment(), lambda: self._layer(inputs), lambda: inputs
+        )
 
     def get_config(self):
         config = super().get_config()
@@ -139,6 +181,7 @@ class RandomApply(BaseImageAugmentationLayer):
                 "seed": self.seed,
                 "batchwise": self.batchwise,
                 "auto_vectorize": self.auto_vectorize,
+                "vectorized": self.vectorized,
             }
         )
         return config
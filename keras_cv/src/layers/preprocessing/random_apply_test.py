@@ -119,3 +119,41 @@ class RandomApplyTest(TestCase):
             return layer(x)
 
         apply(dummy_inputs)
+
+    def test_vectorized_rate_equal_to_zero_leaves_inputs_unchanged(self):
+        dummy_inputs = self.rng.uniform(shape=(8, 16, 16, 3))
+        layer = RandomApply(rate=0.0, layer=ZeroOut(), vectorized=True)
+
+        outputs = layer(dummy_inputs)
+
+        self.assertAllClose(outputs, dummy_inputs)
+
+    def test_vectorized_applies_layer_per_sample(self):
+        dummy_inputs = tf.ones((64, 4, 4, 3))
+        dummy_labels = tf.range(64, dtype=tf.float32)[:, None]
+        layer = RandomApply(
+            rate=0.5, layer=layers.RandomBrightness((1.0, 1.0)), vectorized=True
+        )
+
+        outputs = layer({"images": dummy_inputs, "labels": dummy_labels})
+
+        changed = tf.reduce_all(outputs["images"] == 255.0, axis=[1, 2, 3])
+        unchanged = tf.reduce_all(outputs["images"] == 1.0, axis=[1, 2, 3])
+        self.assertAllEqual(tf.logical_or(changed, unchanged), [True] * 64)
+        self.assertTrue(tf.reduce_any(changed))
+        self.assertTrue(tf.reduce_any(unchanged))
+        self.assertAllEqual(outputs["labels"], dummy_labels)
+
+    def test_vectorized_works_in_graph_mode(self):
+        dummy_inputs = self.rng.uniform(shape=(8, 16, 16, 3))
+        layer = RandomApply(
+            rate=1.0, layer=layers.RandomBrightness(0.2), vectorized=True
+        )
+
+        @tf.function
+        def apply(x):
+            return layer(x)
+
+        outputs = apply(dummy_inputs)
+
+        self.assertEqual(outputs.shape, dummy_inputs.shape)
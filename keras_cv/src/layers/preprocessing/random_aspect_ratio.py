@@ -16,15 +16,19 @@ import tensorflow as tf
 
 from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils import get_interpolation
 from keras_cv.src.utils import parse_factor
 
+# The interpolations supported by `tf.image.crop_and_resize()`, the other
+# interpolations resize the images of dense batches one at a time.
+CROP_AND_RESIZE_INTERPOLATIONS = ("bilinear", "nearest")
+
 
 @keras_cv_export("keras_cv.layers.RandomAspectRatio")
-class RandomAspectRatio(BaseImageAugmentationLayer):
+class RandomAspectRatio(VectorizedBaseImageAugmentationLayer):
     """RandomAspectRatio randomly distorts the aspect ratio of the provided
     image.
 
@@ -47,7 +51,7 @@ class RandomAspectRatio(BaseImageAugmentationLayer):
         seed=None,
         **kwargs
     ):
-        super().__init__(**kwargs)
+        super().__init__(seed=seed, **kwargs)
         self.interpolation = get_interpolation(interpolation)
         self.factor = parse_factor(
             factor,
@@ -58,70 +62,128 @@ class RandomAspectRatio(BaseImageAugmentationLayer):
         )
         self.bounding_box_format = bounding_box_format
         self.seed = seed
-        self.auto_vectorize = False
-        self.force_output_ragged_images = True
 
-    def get_random_transformation(self, **kwargs):
-        return self.factor(dtype=self.compute_dtype)
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        return self.factor(shape=(batch_size,), dtype=self.compute_dtype)
 
-    def compute_image_signature(self, images):
+    def compute_ragged_image_signature(self, images):
         return tf.RaggedTensorSpec(
             shape=(None, None, images.shape[-1]),
             ragged_rank=1,
             dtype=self.compute_dtype,
         )
 
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        img_shape = tf.cast(tf.shape(image), self.compute_dtype)
+        height, width = img_shape[0], img_shape[1]
+        height = height / transformation
+        width = width * transformation
+
+        target_size = tf.cast(tf.stack([height, width]), tf.int32)
+        result = tf.image.resize(
+            image, size=target_size, method=self.interpolation
+        )
+        return tf.cast(result, self.compute_dtype)
+
+    def augment_images(self, images, transformations, **kwargs):
+        """Resizes a dense batch with a single `crop_and_resize` call.
+
+        Every image is resampled onto a canvas that fits the largest output
+        image, and the outputs are then sliced from the canvas as a ragged
+        batch. The crop boxes are chosen so that the sampled pixels match
+        those of `tf.image.resize()`, with a one pixel border of replicated
+        edges standing in for its clamping at the image borders.
+        """
+        if self.interpolation not in CROP_AND_RESIZE_INTERPOLATIONS:
+            return tf.map_fn(
+                lambda x: tf.RaggedTensor.from_tensor(
+                    self.augment_ragged_image(x[0], x[1])
+                ),
+                (images, transformations),
+                fn_output_signature=self.compute_ragged_image_signature(images),
+            )
+
+        batch_size = tf.shape(images)[0]
+        img_shape = tf.cast(tf.shape(images), self.compute_dtype)
+        height, width = img_shape[1], img_shape[2]
+        heights = tf.cast(height / transformations, tf.int32)
+        widths = tf.cast(width * transformations, tf.int32)
+        max_height = tf.reduce_max(heights)
+        max_width = tf.reduce_max(widths)
+
+        def half_pixel_boxes(input_size, output_sizes, canvas_size):
+            # The output pixel `i` samples the input at
+            # `(i + 0.5) * input_size / output_size - 0.5`, shifted by one
+            # for the padded border.
+            input_size = tf.cast(input_size, tf.float32)
+            output_sizes = tf.cast(output_sizes, tf.float32)
+            canvas_size = tf.cast(canvas_size, tf.float32)
+            scales = input_size / output_sizes
+            starts = (0.5 * scales + 0.5) / (input_size + 1.0)
+            ends = starts + scales * tf.maximum(canvas_size - 1.0, 1.0) / (
+                input_size + 1.0
+            )
+            return starts, ends
+
+        y1, y2 = half_pixel_boxes(height, heights, max_height)
+        x1, x2 = half_pixel_boxes(width, widths, max_width)
+        padded_images = tf.pad(
+            tf.cast(images, tf.float32),
+            [[0, 0], [1, 1], [1, 1], [0, 0]],
+            mode="SYMMETRIC",
+        )
+        canvas = tf.image.crop_and_resize(
+            padded_images,
+            tf.stack([y1, x1, y2, x2], axis=-1),
+            tf.range(batch_size),
+            tf.stack([max_height, max_width]),
+            method=self.interpolation,
+        )
+        canvas = tf.cast(canvas, self.compute_dtype)
+
+        # Slice every image out of the canvas, first along the height and
+        # then along the width of each of its rows.
+        row_widths = tf.repeat(widths, heights)
+        return tf.RaggedTensor.from_tensor(
+            canvas, lengths=(heights, row_widths)
+        )
+
     def augment_bounding_boxes(
-        self, bounding_boxes, transformation, image, **kwargs
+        self,
+        bounding_boxes,
+        transformations,
+        images=None,
+        raw_images=None,
+        **kwargs
     ):
         if self.bounding_box_format is None:
             raise ValueError(
                 "Please provide a `bounding_box_format` when augmenting "
                 "bounding boxes with `RandomAspectRatio()`."
             )
-        bounding_boxes = bounding_boxes.copy()
-        img_shape = tf.shape(image)
-        img_shape = tf.cast(img_shape, self.compute_dtype)
-        height, width = img_shape[0], img_shape[1]
-        height = height / transformation
-        width = width * transformation
-
+        if isinstance(bounding_boxes["boxes"], tf.RaggedTensor):
+            bounding_boxes = bounding_box.to_dense(bounding_boxes)
+        # Boxes are stretched along with the images, so their coordinates
+        # relative to the image size are left unchanged.
         bounding_boxes = bounding_box.convert_format(
             bounding_boxes,
             source=self.bounding_box_format,
-            target="xyxy",
-            image_shape=img_shape,
+            target="rel_xyxy",
+            images=raw_images,
         )
-        x, y, x2, y2 = tf.split(bounding_boxes["boxes"], [1, 1, 1, 1], axis=-1)
-        x = x * transformation
-        x2 = x2 * transformation
-        y = y / transformation
-        y2 = y2 / transformation
-        boxes = tf.concat([x, y, x2, y2], axis=-1)
-        boxes = bounding_box.convert_format(
-            boxes,
-            source="xyxy",
+        bounding_boxes = bounding_box.convert_format(
+            bounding_boxes,
+            source="rel_xyxy",
             target=self.bounding_box_format,
-            image_shape=tf.stack([height, width, 3], axis=0),
+            images=images,
         )
-        bounding_boxes["boxes"] = boxes
         return bounding_boxes
 
-    def augment_image(self, image, transformation, **kwargs):
-        # images....transformation
-        img_shape = tf.cast(tf.shape(image), self.compute_dtype)
-        height, width = img_shape[0], img_shape[1]
-        height = height / transformation
-        width = width * transformation
-
-        target_size = tf.cast(tf.stack([height, width]), tf.int32)
-        result = tf.image.resize(
-            image, size=target_size, method=self.interpolation
-        )
-        return tf.cast(result, self.compute_dtype)
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels
 
-    def augment_label(self, label, transformation, **kwargs):
-        return label
+    def augment_keypoints(self, keypoints, transformations, **kwargs):
+        return keypoints
 
     def get_config(self):
         config = {
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import tensorflow as tf
+from absl.testing import parameterized
 
 from keras_cv.src import bounding_box
 from keras_cv.src import layers
@@ -37,6 +38,32 @@ class RandomAspectRatioTest(TestCase):
         output = layer(image, training=True)
         self.assertEqual(output.shape[-1], 1)
 
+    @parameterized.named_parameters(
+        ("bilinear", "bilinear"),
+        ("nearest", "nearest"),
+        ("bicubic", "bicubic"),
+        ("area", "area"),
+        ("lanczos3", "lanczos3"),
+        ("lanczos5", "lanczos5"),
+        ("gaussian", "gaussian"),
+        ("mitchellcubic", "mitchellcubic"),
+    )
+    def test_batched_resize_matches_single_image_resize(self, interpolation):
+        images = tf.random.uniform(shape=(3, 37, 53, 3))
+        layer = layers.RandomAspectRatio(
+            factor=(0.5, 2.0), interpolation=interpolation
+        )
+        transformations = layer.get_random_transformation_batch(3)
+        output = layer.augment_images(images, transformations)
+
+        for i in range(3):
+            height = int(37 / float(transformations[i]))
+            width = int(53 * float(transformations[i]))
+            expected = tf.image.resize(
+                images[i], (height, width), method=interpolation
+            )
+            self.assertAllClose(output[i].to_tensor(), expected, atol=2e-3)
+
     def test_augment_boxes_ragged(self):
         image = tf.zeros([2, 20, 20, 3])
         bounding_boxes = {
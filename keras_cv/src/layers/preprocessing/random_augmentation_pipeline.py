@@ -14,12 +14,20 @@
 
 import tensorflow as tf
 
+from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import keras
 from keras_cv.src.layers import preprocessing
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    BOUNDING_BOXES,
+)
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    IMAGES,
+)
 from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
     BaseImageAugmentationLayer,
 )
+from keras_cv.src.utils import preprocessing as preprocessing_utils
 
 
 @keras_cv_export("keras_cv.layers.RandomAugmentationPipeline")
@@ -69,6 +77,15 @@ class RandomAugmentationPipeline(BaseImageAugmentationLayer):
             apply the augmentations. This offers a significant performance
             boost, but can only be used if all the layers provided to the
             `layers` argument support auto vectorization.
+        vectorized: whether to augment batches without a per-sample loop.
+            Every sample of the batch draws its own layer, the samples that
+            drew the same layer are gathered into a sub-batch that the layer
+            augments in a single call, and the results are scattered back in
+            place. This is much faster when `layers` are
+            `VectorizedBaseImageAugmentationLayer`s, but layers combining
+            several samples, like `MixUp()`, then only mix samples of their
+            sub-batch. Bounding boxes are returned as ragged tensors in this
+            mode. Defaults to `False`.
         seed: Integer. Used to create a random seed.
     """
 
@@ -78,6 +95,7 @@ class RandomAugmentationPipeline(BaseImageAugmentationLayer):
         augmentations_per_image,
         rate=1.0,
         auto_vectorize=False,
+        vectorized=False,
         seed=None,
         **kwargs,
     ):
@@ -86,6 +104,7 @@ class RandomAugmentationPipeline(BaseImageAugmentationLayer):
         self.rate = rate
         self.layers = list(layers)
         self.auto_vectorize = auto_vectorize
+        self.vectorized = vectorized
         self.seed = seed
 
         self._random_choice = preprocessing.RandomChoice(
@@ -108,6 +127,44 @@ class RandomAugmentationPipeline(BaseImageAugmentationLayer):
             )
         return result
 
+    def _batch_augment(self, inputs):
+        if not self.vectorized:
+            return super()._batch_augment(inputs)
+        if self.layers == []:
+            return inputs
+
+        result = dict(inputs)
+        if BOUNDING_BOXES in result:
+            # Vectorized layers return ragged boxes, so the samples left
+            # untouched must hold ragged boxes too to be merged with them.
+            result[BOUNDING_BOXES] = bounding_box.to_ragged(
+                result[BOUNDING_BOXES], dtype=self.compute_dtype
+            )
+        for _ in range(self.augmentations_per_image):
+            result = self._augment_grouped_by_layer(result)
+        return result
+
+    def _augment_grouped_by_layer(self, inputs):
+        images = inputs[IMAGES]
+        if isinstance(images, tf.RaggedTensor):
+            batch_size = images.nrows(out_type=tf.int32)
+        else:
+            batch_size = tf.shape(images)[0]
+        num_layers = len(self.layers)
+        skip_augment = self._random_generator.uniform(
+            shape=(batch_size,), minval=0.0, maxval=1.0, dtype=tf.float32
+        )
+        selected_layers = self._random_generator.uniform(
+            (batch_size,), minval=0, maxval=num_layers, dtype=tf.int32
+        )
+        # Skipped samples are assigned to an extra, identity, group.
+        selected_layers = tf.where(
+            skip_augment > self.rate, num_layers, selected_layers
+        )
+        return preprocessing_utils.augment_by_group(
+            inputs, self.layers + [None], selected_layers
+        )
+
     def get_config(self):
         config = super().get_config()
 
@@ -115,6 +172,7 @@ class RandomAugmentationPipeline(BaseImageAugmentationLayer):
             {
                 "augmentations_per_image": self.augmentations_per_image,
                 "auto_vectorize": self.auto_vectorize,
+                "vectorized": self.vectorized,
                 "rate": self.rate,
                 "layers": self.layers,
                 "seed": self.seed,
@@ -101,3 +101,63 @@ class RandomAugmentationPipelineTest(TestCase):
         os = pipeline(xs)
 
         self.assertAllClose(xs, os)
+
+    def test_vectorized_applies_one_layer_per_sample(self):
+        pipeline = layers.RandomAugmentationPipeline(
+            layers=[AddOneToInputs(), layers.Rescaling(scale=-1.0)],
+            augmentations_per_image=1,
+            rate=1.0,
+            vectorized=True,
+        )
+        xs = tf.random.uniform((16, 5, 5, 3), 1, 100, dtype=tf.float32)
+        os = pipeline(xs)
+
+        added = tf.reduce_all(tf.equal(os, xs + 1), axis=(1, 2, 3))
+        negated = tf.reduce_all(tf.equal(os, -xs), axis=(1, 2, 3))
+        self.assertAllEqual(tf.math.logical_xor(added, negated), [True] * 16)
+
+    @parameterized.named_parameters(("1", 1), ("3", 3))
+    def test_vectorized_calls_layers_augmentations_per_image_times(
+        self, augmentations_per_image
+    ):
+        pipeline = layers.RandomAugmentationPipeline(
+            layers=[AddOneToInputs()],
+            augmentations_per_image=augmentations_per_image,
+            rate=1.0,
+            vectorized=True,
+        )
+        xs = tf.random.uniform((4, 5, 5, 3), 0, 100, dtype=tf.float32)
+
+        @tf.function()
+        def call_pipeline(xs):
+            return pipeline(xs)
+
+        self.assertAllClose(xs + augmentations_per_image, call_pipeline(xs))
+
+    def test_vectorized_respects_rate(self):
+        pipeline = layers.RandomAugmentationPipeline(
+            layers=[AddOneToInputs()],
+            augmentations_per_image=3,
+            rate=0.0,
+            vectorized=True,
+        )
+        xs = tf.random.uniform((4, 5, 5, 3), 0, 100, dtype=tf.float32)
+        os = pipeline(xs)
+
+        self.assertAllClose(xs, os)
+
+    def test_vectorized_keeps_labels_aligned(self):
+        pipeline = layers.RandomAugmentationPipeline(
+            layers=[layers.Rescaling(1.0, offset=1.0), layers.Rescaling(2.0)],
+            augmentations_per_image=2,
+            rate=0.5,
+            vectorized=True,
+        )
+        xs = tf.ones((8, 5, 5, 3)) * tf.reshape(tf.range(8.0), (8, 1, 1, 1))
+        labels = tf.range(8.0)[:, None]
+        outputs = pipeline({"images": xs, "labels": labels})
+
+        self.assertAllClose(outputs["labels"], labels)
+        self.assertAllGreaterEqual(
+            outputs["images"][:, 0, 0, 0] - labels[:, 0], 0.0
+        )
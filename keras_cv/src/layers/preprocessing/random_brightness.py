@@ -16,6 +16,7 @@ import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import keras
+from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
@@ -61,6 +62,8 @@ class RandomBrightness(VectorizedBaseImageAugmentationLayer):
     ```
     """
 
+    _supports_backend_native = True
+
     def __init__(self, factor, value_range=(0, 255), seed=None, **kwargs):
         super().__init__(seed=seed, **kwargs)
         if isinstance(factor, float) or isinstance(factor, int):
@@ -88,17 +91,15 @@ class RandomBrightness(VectorizedBaseImageAugmentationLayer):
         return tf.squeeze(image, axis=0)
 
     def augment_images(self, images, transformations, **kwargs):
-        rank = images.shape.rank
+        rank = len(images.shape)
         if rank != 4:
             raise ValueError(
                 "Expected the input image to be rank 4. Got "
                 f"inputs.shape = {images.shape}"
             )
-        rgb_deltas = tf.cast(transformations, images.dtype)
+        rgb_deltas = ops.cast(transformations, images.dtype)
         images += rgb_deltas
-        return tf.clip_by_value(
-            images, self.value_range[0], self.value_range[1]
-        )
+        return ops.clip(images, self.value_range[0], self.value_range[1])
 
     def augment_labels(self, labels, transformations, **kwargs):
         return labels
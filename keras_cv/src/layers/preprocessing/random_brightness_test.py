@@ -62,6 +62,17 @@ class RandomBrightnessTest(TestCase):
             output, tf.fill((4, 8, 8, 3), 1), atol=1e-5, rtol=1e-5
         )
 
+    def test_partial_brightness_is_clipped(self):
+        image_shape = (16, 32, 32, 3)
+        image = tf.random.uniform(shape=image_shape) * 255.0
+
+        layer = preprocessing.RandomBrightness(factor=(0.8, 0.8))
+        output = layer(image)
+
+        self.assertAllClose(
+            output, tf.clip_by_value(image + 0.8 * 255.0, 0.0, 255.0)
+        )
+
     def test_zero_brightness(self):
         image_shape = (4, 8, 8, 3)
         image = tf.random.uniform(shape=image_shape) * 255.0
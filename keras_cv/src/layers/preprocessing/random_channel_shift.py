@@ -12,17 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import tensorflow as tf
-
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.backend import ops
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils import preprocessing
 
 
 @keras_cv_export("keras_cv.layers.RandomChannelShift")
-class RandomChannelShift(BaseImageAugmentationLayer):
+class RandomChannelShift(VectorizedBaseImageAugmentationLayer):
     """Randomly shift values for each channel of the input image(s).
 
     The input images should have values in the `[0-255]` or `[0-1]` range.
@@ -58,6 +57,8 @@ class RandomChannelShift(BaseImageAugmentationLayer):
     ```
     """
 
+    _supports_backend_native = True
+
     def __init__(self, value_range, factor, channels=3, seed=None, **kwargs):
         super().__init__(**kwargs, seed=seed)
         self.seed = seed
@@ -65,48 +66,47 @@ class RandomChannelShift(BaseImageAugmentationLayer):
         self.channels = channels
         self.factor = preprocessing.parse_factor(factor, seed=self.seed)
 
-    def get_random_transformation(
-        self, image=None, label=None, bounding_boxes=None, **kwargs
-    ):
-        shifts = []
-        for _ in range(self.channels):
-            shifts.append(self._get_shift())
-        return shifts
-
-    def _get_shift(self):
-        invert = preprocessing.random_inversion(self._random_generator)
-        return tf.cast(invert * self.factor() * 0.5, dtype=self.compute_dtype)
-
-    def augment_image(self, image, transformation=None, **kwargs):
-        image = preprocessing.transform_value_range(
-            image, self.value_range, (0, 1), dtype=self.compute_dtype
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        invert = self._random_generator.uniform(
+            (batch_size, self.channels), 0, 1, dtype="float32"
         )
-        unstack_rgb = tf.unstack(image, axis=-1)
+        invert = ops.where(invert > 0.5, -1.0, 1.0)
+        shifts = invert * self.factor(shape=(batch_size, self.channels)) * 0.5
+        return ops.cast(shifts, dtype=self.compute_dtype)
 
-        result = []
-        for c_i in range(self.channels):
-            result.append(unstack_rgb[c_i] + transformation[c_i])
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        return self.augment_images(
+            image, transformations=transformation, **kwargs
+        )
 
-        result = tf.stack(
-            result,
-            axis=-1,
+    def augment_images(self, images, transformations, **kwargs):
+        images = preprocessing.transform_value_range(
+            images, self.value_range, (0, 1), dtype=self.compute_dtype
         )
-        result = tf.clip_by_value(result, 0.0, 1.0)
-        image = preprocessing.transform_value_range(
+        # `transformations` has a shape of `[batch_size, channels]`, or
+        # `[channels]` for a single ragged image.
+        shifts = ops.expand_dims(ops.expand_dims(transformations, -2), -2)
+
+        result = images[..., : self.channels] + shifts
+        result = ops.clip(result, 0.0, 1.0)
+        images = preprocessing.transform_value_range(
             result, (0, 1), self.value_range, dtype=self.compute_dtype
         )
-        return image
+        return images
 
-    def augment_bounding_boxes(self, bounding_boxes, **kwargs):
+    def augment_bounding_boxes(self, bounding_boxes, transformations, **kwargs):
         return bounding_boxes
 
-    def augment_label(self, label, transformation=None, **kwargs):
-        return label
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels
+
+    def augment_keypoints(self, keypoints, transformations, **kwargs):
+        return keypoints
 
-    def augment_segmentation_mask(
-        self, segmentation_mask, transformation, **kwargs
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
     ):
-        return segmentation_mask
+        return segmentation_masks
 
     def get_config(self):
         config = super().get_config()
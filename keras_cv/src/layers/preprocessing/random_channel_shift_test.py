@@ -100,6 +100,20 @@ class RandomChannelShiftTest(TestCase):
         xs = layer(xs, training=True)
         self.assertFalse(np.any(ops.convert_to_numpy(xs) == 1.0))
 
+    def test_shifts_every_channel_by_half_the_factor(self):
+        images = np.random.uniform(100, 150, size=(16, 32, 32, 3))
+        images = images.astype(np.float32)
+        layer = preprocessing.RandomChannelShift(
+            value_range=(0, 255), factor=(0.2, 0.2)
+        )
+
+        outputs = ops.convert_to_numpy(layer(images))
+
+        # Each channel is shifted up or down by half the factor, 0.1 * 255.
+        self.assertAllClose(
+            np.abs(outputs - images), np.full(images.shape, 25.5), atol=1e-3
+        )
+
     def test_config(self):
         layer = preprocessing.RandomChannelShift(
             factor=[0.1, 0.5], value_range=(0, 255), seed=101
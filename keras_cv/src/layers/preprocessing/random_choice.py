@@ -14,10 +14,18 @@
 
 import tensorflow as tf
 
+from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    BOUNDING_BOXES,
+)
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    IMAGES,
+)
 from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
     BaseImageAugmentationLayer,
 )
+from keras_cv.src.utils import preprocessing as preprocessing_utils
 
 
 @keras_cv_export("keras_cv.layers.RandomChoice")
@@ -57,6 +65,12 @@ class RandomChoice(BaseImageAugmentationLayer):
             single layer, instead of each sample to an independent layer. This
             is useful when using `MixUp()`, `CutMix()`, `Mosaic()`, etc.
             Defaults to `False`.
+        vectorized: Boolean, whether to augment batches without a per-sample
+            loop. Each sample still draws its own layer, but the samples that
+            drew the same layer are passed to it as a single sub-batch, so
+            `VectorizedBaseImageAugmentationLayer`s keep their batched
+            implementation. Bounding boxes are returned as ragged tensors in
+            this mode. Ignored when `batchwise=True`. Defaults to `False`.
         seed: Integer. Used to create a random seed.
     """
 
@@ -65,6 +79,7 @@ class RandomChoice(BaseImageAugmentationLayer):
         layers,
         auto_vectorize=False,
         batchwise=False,
+        vectorized=False,
         seed=None,
         **kwargs,
     ):
@@ -72,6 +87,7 @@ class RandomChoice(BaseImageAugmentationLayer):
         self.layers = layers
         self.auto_vectorize = auto_vectorize
         self.batchwise = batchwise
+        self.vectorized = vectorized
         self.seed = seed
 
     def _curry_call_layer(self, inputs, layer):
@@ -83,9 +99,31 @@ class RandomChoice(BaseImageAugmentationLayer):
     def _batch_augment(self, inputs):
         if self.batchwise:
             return self._augment(inputs)
+        elif self.vectorized:
+            return self._vectorized_augment(inputs)
         else:
             return super()._batch_augment(inputs)
 
+    def _vectorized_augment(self, inputs):
+        inputs = dict(inputs)
+        images = inputs[IMAGES]
+        if isinstance(images, tf.RaggedTensor):
+            batch_size = images.nrows(out_type=tf.int32)
+        else:
+            batch_size = tf.shape(images)[0]
+        if BOUNDING_BOXES in inputs:
+            # Vectorized layers return ragged boxes, so all groups must hold
+            # ragged boxes to be merged.
+            inputs[BOUNDING_BOXES] = bounding_box.to_ragged(
+                inputs[BOUNDING_BOXES], dtype=self.compute_dtype
+            )
+        selected_layers = self._random_generator.uniform(
+            (batch_size,), minval=0, maxval=len(self.layers), dtype=tf.int32
+        )
+        return preprocessing_utils.augment_by_group(
+            inputs, self.layers, selected_layers
+        )
+
     def _augment(self, inputs, *args, **kwargs):
         selected_op = self._random_generator.uniform(
             (), minval=0, maxval=len(self.layers), dtype=tf.int32
@@ -118,6 +156,7 @@ class RandomChoice(BaseImageAugmentationLayer):
                 "auto_vectorize": self.auto_vectorize,
                 "seed": self.seed,
                 "batchwise": self.batchwise,
+                "vectorized": self.vectorized,
             }
         )
         return config
@@ -99,3 +99,59 @@ class RandomChoiceTest(TestCase):
             pipeline.layers[0].call_counter + pipeline.layers[1].call_counter
         )
         self.assertEqual(total_calls, batch_size)
+
+    def test_vectorized_chooses_one_layer_per_sample(self):
+        batch_size = 64
+        pipeline = layers.RandomChoice(
+            layers=[
+                layers.RandomBrightness((1.0, 1.0)),
+                layers.RandomBrightness((-1.0, -1.0)),
+            ],
+            vectorized=True,
+        )
+        xs = tf.fill((batch_size, 4, 4, 3), 100.0)
+        ys = tf.range(batch_size, dtype=tf.float32)[:, None]
+
+        os = pipeline({"images": xs, "labels": ys})
+
+        brightened = tf.reduce_all(os["images"] == 255.0, axis=[1, 2, 3])
+        darkened = tf.reduce_all(os["images"] == 0.0, axis=[1, 2, 3])
+        self.assertAllEqual(
+            tf.math.logical_xor(brightened, darkened), [True] * batch_size
+        )
+        self.assertTrue(tf.reduce_any(brightened))
+        self.assertTrue(tf.reduce_any(darkened))
+        self.assertAllEqual(os["labels"], ys)
+
+    def test_vectorized_matches_per_sample_path(self):
+        xs = tf.random.uniform((8, 32, 32, 3), 0, 255)
+        choices = [layers.RandomBrightness((0.1, 0.1))]
+
+        os = layers.RandomChoice(choices, vectorized=True)(xs)
+
+        self.assertAllClose(os, layers.RandomChoice(choices)(xs))
+
+    def test_vectorized_with_bounding_boxes(self):
+        pipeline = layers.RandomChoice(
+            layers=[
+                layers.RandomFlip(rate=1.0, bounding_box_format="xyxy"),
+                layers.RandomBrightness(0.1),
+            ],
+            vectorized=True,
+        )
+        xs = {
+            "images": tf.ones((4, 8, 8, 3)),
+            "bounding_boxes": {
+                "boxes": tf.tile(
+                    tf.constant([[[0.0, 0.0, 4.0, 4.0]]]), [4, 2, 1]
+                ),
+                "classes": tf.ones((4, 2)),
+            },
+        }
+
+        os = pipeline(xs)
+
+        self.assertIsInstance(os["bounding_boxes"]["boxes"], tf.RaggedTensor)
+        self.assertAllEqual(
+            os["bounding_boxes"]["boxes"].row_lengths(), [2] * 4
+        )
@@ -12,10 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import tensorflow as tf
-
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import keras
+from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
@@ -45,6 +44,8 @@ class RandomColorDegeneration(VectorizedBaseImageAugmentationLayer):
         seed: Integer. Used to create a random seed.
     """
 
+    _supports_backend_native = True
+
     def __init__(
         self,
         factor,
@@ -63,8 +64,10 @@ class RandomColorDegeneration(VectorizedBaseImageAugmentationLayer):
         )
 
     def augment_images(self, images, transformations=None, **kwargs):
-        degenerates = tf.image.grayscale_to_rgb(
-            tf.image.rgb_to_grayscale(images)
+        degenerates = ops.repeat(
+            ops.image.rgb_to_grayscale(images, data_format="channels_last"),
+            3,
+            axis=-1,
         )
         result = preprocessing.blend(images, degenerates, transformations)
         return result
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.layers import preprocessing
@@ -111,23 +112,66 @@ class RandomColorJitter(VectorizedBaseImageAugmentationLayer):
         self.random_hue = preprocessing.RandomHue(
             factor=self.hue_factor, value_range=(0, 255), seed=self.seed
         )
+        self.built = True
+
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        layers = {
+            "brightness": self.random_brightness,
+            "contrast": self.random_contrast,
+            "saturation": self.random_saturation,
+            "hue": self.random_hue,
+        }
+        return {
+            name: layer.get_random_transformation_batch(batch_size)
+            for name, layer in layers.items()
+        }
 
     def augment_ragged_image(self, image, transformation, **kwargs):
-        return self.augment_images(
-            images=image, transformations=transformation, **kwargs
+        images = tf.expand_dims(image, axis=0)
+        transformations = tf.nest.map_structure(
+            lambda x: tf.expand_dims(x, axis=0), transformation
+        )
+        images = self.augment_images(
+            images=images, transformations=transformations, **kwargs
         )
+        return tf.squeeze(images, axis=0)
 
-    def augment_images(self, images, transformations=None, **kwargs):
+    def augment_images(self, images, transformations, **kwargs):
+        """Applies all four adjustments in a single pass.
+
+        This matches running `RandomBrightness`, `RandomContrast`,
+        `RandomSaturation` and `RandomHue` one after the other, but converts
+        the value range, and RGB to HSV, only once.
+        """
         images = preprocessing_utils.transform_value_range(
             images,
             original_range=self.value_range,
             target_range=(0, 255),
             dtype=self.compute_dtype,
         )
-        images = self.random_brightness(images)
-        images = self.random_contrast(images)
-        images = self.random_saturation(images)
-        images = self.random_hue(images)
+        brightness = tf.cast(transformations["brightness"], images.dtype)
+        images = tf.clip_by_value(images + brightness, 0, 255)
+
+        contrast = tf.cast(transformations["contrast"], images.dtype)
+        means = tf.reduce_mean(images, axis=(1, 2), keepdims=True)
+        images = tf.clip_by_value((images - means) * contrast + means, 0, 255)
+
+        # Hue and saturation do not depend on the value range, so both are
+        # adjusted in the same HSV image. See `RandomSaturation` for the
+        # mapping of the saturation factor to `[0, +inf]`.
+        saturation = tf.convert_to_tensor(transformations["saturation"])
+        saturation = tf.cast(saturation / (1 - saturation), images.dtype)
+        hue = tf.cast(transformations["hue"], images.dtype)
+        images = tf.image.rgb_to_hsv(images)
+        h_channel = images[..., 0] + hue[:, tf.newaxis, tf.newaxis]
+        h_channel = tf.where(h_channel > 1.0, h_channel - 1.0, h_channel)
+        h_channel = tf.where(h_channel < 0.0, h_channel + 1.0, h_channel)
+        s_channel = tf.clip_by_value(
+            images[..., 1] * saturation[:, tf.newaxis, tf.newaxis], 0.0, 1.0
+        )
+        images = tf.stack([h_channel, s_channel, images[..., 2]], axis=-1)
+        images = tf.clip_by_value(tf.image.hsv_to_rgb(images), 0, 255)
+
         images = preprocessing_utils.transform_value_range(
             images,
             original_range=(0, 255),
@@ -106,3 +106,40 @@ class RandomColorJitterTest(TestCase):
             reconstructed_layer.saturation_factor, layer.saturation_factor
         )
         self.assertEqual(reconstructed_layer.hue_factor, layer.hue_factor)
+
+    # Test 5: Check that the fused pass matches the individual layers.
+    def test_matches_sequential_layers(self):
+        layer = preprocessing.RandomColorJitter(
+            value_range=(0, 1),
+            brightness_factor=0.2,
+            contrast_factor=(0.5, 0.9),
+            saturation_factor=(0.2, 0.8),
+            hue_factor=0.5,
+        )
+        images = tf.random.uniform((4, 16, 16, 3))
+        transformations = layer.get_random_transformation_batch(4)
+
+        outputs = layer.augment_images(images, transformations)
+
+        expected = images * 255.0
+        for name in ["brightness", "contrast", "saturation", "hue"]:
+            sublayer = getattr(layer, f"random_{name}")
+            expected = sublayer.augment_images(expected, transformations[name])
+        self.assertAllClose(outputs, expected / 255.0, atol=1e-5)
+
+    def test_ragged_images(self):
+        layer = preprocessing.RandomColorJitter(
+            value_range=(0, 255),
+            brightness_factor=0.2,
+            contrast_factor=0.5,
+            saturation_factor=(0.2, 0.8),
+            hue_factor=0.5,
+        )
+        images = tf.ragged.stack(
+            [tf.ones((8, 8, 3)) * 100.0, tf.ones((4, 6, 3)) * 50.0]
+        )
+
+        outputs = layer(images)
+
+        self.assertIsInstance(outputs, tf.RaggedTensor)
+        self.assertAllEqual(outputs.row_lengths(), [8, 4])
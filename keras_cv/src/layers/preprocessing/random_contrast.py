@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import tensorflow as tf
-
 from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
@@ -66,6 +65,8 @@ class RandomContrast(VectorizedBaseImageAugmentationLayer):
     ```
     """
 
+    _supports_backend_native = True
+
     def __init__(self, value_range, factor, seed=None, **kwargs):
         super().__init__(seed=seed, **kwargs)
         if isinstance(factor, (tuple, list)):
@@ -90,13 +91,11 @@ class RandomContrast(VectorizedBaseImageAugmentationLayer):
         )
 
     def augment_images(self, images, transformations, **kwargs):
-        contrast_factors = tf.cast(transformations, dtype=images.dtype)
-        means = tf.reduce_mean(images, axis=(1, 2), keepdims=True)
+        contrast_factors = ops.cast(transformations, dtype=images.dtype)
+        means = ops.mean(images, axis=(1, 2), keepdims=True)
 
         images = (images - means) * contrast_factors + means
-        images = tf.clip_by_value(
-            images, self.value_range[0], self.value_range[1]
-        )
+        images = ops.clip(images, self.value_range[0], self.value_range[1])
         return images
 
     def augment_labels(self, labels, transformations, **kwargs):
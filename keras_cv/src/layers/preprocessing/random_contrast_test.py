@@ -55,6 +55,21 @@ class RandomContrastTest(TestCase):
         output = layer(image)
         self.assertNotAllClose(image, output)
 
+    def test_matches_adjust_contrast(self):
+        image_shape = (16, 32, 32, 3)
+        image = tf.random.uniform(shape=image_shape) * 255.0
+
+        # Makes the lower and upper contrast factors both 0.7.
+        layer = preprocessing.RandomContrast(
+            value_range=(0, 255), factor=(0.3, -0.3)
+        )
+        output = layer(image)
+
+        expected = tf.clip_by_value(
+            tf.image.adjust_contrast(image, 0.7), 0, 255
+        )
+        self.assertAllClose(expected, output, atol=1e-5, rtol=1e-5)
+
     def test_config(self):
         layer = preprocessing.RandomContrast(
             value_range=(0, 255), factor=(0.3, 0.8)
@@ -56,6 +56,8 @@ class RandomCrop(VectorizedBaseImageAugmentationLayer):
         seed: Integer. Used to create a random seed.
     """
 
+    _supports_uint8 = True
+
     def __init__(
         self, height, width, seed=None, bounding_box_format=None, **kwargs
     ):
@@ -18,14 +18,14 @@ from keras_cv.src import bounding_box
 from keras_cv.src import core
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import keras
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils import preprocessing
 
 
 @keras_cv_export("keras_cv.layers.RandomCropAndResize")
-class RandomCropAndResize(BaseImageAugmentationLayer):
+class RandomCropAndResize(VectorizedBaseImageAugmentationLayer):
     """Randomly crops a part of an image and resizes it to provided size.
 
     This implementation takes an intuitive approach, where we crop the images to
@@ -96,11 +96,9 @@ class RandomCropAndResize(BaseImageAugmentationLayer):
         self.bounding_box_format = bounding_box_format
         self.force_output_dense_images = True
 
-    def get_random_transformation(
-        self, image=None, label=None, bounding_box=None, **kwargs
-    ):
-        crop_area_factor = self.crop_area_factor()
-        aspect_ratio = self.aspect_ratio_factor()
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        crop_area_factor = self.crop_area_factor(shape=(batch_size, 1))
+        aspect_ratio = self.aspect_ratio_factor(shape=(batch_size, 1))
 
         new_height = tf.clip_by_value(
             tf.sqrt(crop_area_factor / aspect_ratio), 0.0, 1.0
@@ -110,14 +108,14 @@ class RandomCropAndResize(BaseImageAugmentationLayer):
         )
 
         height_offset = self._random_generator.uniform(
-            (),
+            (batch_size, 1),
             minval=tf.minimum(0.0, 1.0 - new_height),
             maxval=tf.maximum(0.0, 1.0 - new_height),
             dtype=tf.float32,
         )
 
         width_offset = self._random_generator.uniform(
-            (),
+            (batch_size, 1),
             minval=tf.minimum(0.0, 1.0 - new_width),
             maxval=tf.maximum(0.0, 1.0 - new_width),
             dtype=tf.float32,
@@ -128,42 +126,37 @@ class RandomCropAndResize(BaseImageAugmentationLayer):
         x1 = width_offset
         x2 = width_offset + new_width
 
-        return [[y1, x1, y2, x2]]
+        return {"crop_boxes": tf.concat([y1, x1, y2, x2], axis=-1)}
 
-    def compute_image_signature(self, images):
-        return tf.TensorSpec(
+    def compute_ragged_image_signature(self, images):
+        ragged_spec = tf.RaggedTensorSpec(
             shape=(self.target_size[0], self.target_size[1], images.shape[-1]),
+            ragged_rank=1,
             dtype=self.compute_dtype,
         )
+        return ragged_spec
 
-    def augment_image(self, image, transformation, **kwargs):
-        return self._crop_and_resize(image, transformation)
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        image = tf.expand_dims(image, axis=0)
+        transformation = {
+            "crop_boxes": tf.expand_dims(transformation["crop_boxes"], axis=0)
+        }
+        image = self.augment_images(
+            images=image, transformations=transformation, **kwargs
+        )
+        return tf.squeeze(image, axis=0)
 
-    def augment_target(self, target, **kwargs):
-        return target
+    def augment_images(self, images, transformations, **kwargs):
+        return self._crop_and_resize(images, transformations)
 
-    def _transform_bounding_boxes(bounding_boxes, transformation):
-        bounding_boxes = bounding_boxes.copy()
-        t_y1, t_x1, t_y2, t_x2 = transformation[0]
-        t_dx = t_x2 - t_x1
-        t_dy = t_y2 - t_y1
-        x1, y1, x2, y2 = tf.split(
-            bounding_boxes["boxes"], [1, 1, 1, 1], axis=-1
-        )
-        output = tf.concat(
-            [
-                (x1 - t_x1) / t_dx,
-                (y1 - t_y1) / t_dy,
-                (x2 - t_x1) / t_dx,
-                (y2 - t_y1) / t_dy,
-            ],
-            axis=-1,
-        )
-        bounding_boxes["boxes"] = output
-        return bounding_boxes
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels
+
+    def augment_keypoints(self, keypoints, transformations, **kwargs):
+        return keypoints
 
     def augment_bounding_boxes(
-        self, bounding_boxes, transformation=None, image=None, **kwargs
+        self, bounding_boxes, transformations, raw_images=None, **kwargs
     ):
         if self.bounding_box_format is None:
             raise ValueError(
@@ -172,29 +165,49 @@ class RandomCropAndResize(BaseImageAugmentationLayer):
                 "Please specify a bounding box format in the constructor. i.e."
                 "`RandomCropAndResize(bounding_box_format='xyxy')`"
             )
+        if isinstance(bounding_boxes["boxes"], tf.RaggedTensor):
+            bounding_boxes = bounding_box.to_dense(bounding_boxes)
 
         bounding_boxes = bounding_box.convert_format(
             bounding_boxes,
             source=self.bounding_box_format,
             target="rel_xyxy",
-            images=image,
+            images=raw_images,
         )
 
-        bounding_boxes = RandomCropAndResize._transform_bounding_boxes(
-            bounding_boxes, transformation
+        bounding_boxes = bounding_boxes.copy()
+        crop_boxes = tf.cast(
+            transformations["crop_boxes"][:, tf.newaxis, :],
+            bounding_boxes["boxes"].dtype,
+        )
+        t_y1, t_x1, t_y2, t_x2 = tf.split(crop_boxes, [1, 1, 1, 1], axis=-1)
+        t_dx = t_x2 - t_x1
+        t_dy = t_y2 - t_y1
+        x1, y1, x2, y2 = tf.split(
+            bounding_boxes["boxes"], [1, 1, 1, 1], axis=-1
+        )
+        bounding_boxes["boxes"] = tf.concat(
+            [
+                (x1 - t_x1) / t_dx,
+                (y1 - t_y1) / t_dy,
+                (x2 - t_x1) / t_dx,
+                (y2 - t_y1) / t_dy,
+            ],
+            axis=-1,
         )
 
+        image_shape = tuple(self.target_size) + (None,)
         bounding_boxes = bounding_box.clip_to_image(
             bounding_boxes,
             bounding_box_format="rel_xyxy",
-            images=image,
+            image_shape=image_shape,
         )
         bounding_boxes = bounding_box.convert_format(
             bounding_boxes,
             source="rel_xyxy",
             target=self.bounding_box_format,
             dtype=self.compute_dtype,
-            images=image,
+            image_shape=image_shape,
         )
         return bounding_boxes
 
@@ -244,11 +257,11 @@ class RandomCropAndResize(BaseImageAugmentationLayer):
                 f"aspect_ratio_factor={aspect_ratio_factor}"
             )
 
-    def augment_segmentation_mask(
-        self, segmentation_mask, transformation, **kwargs
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
     ):
         return self._crop_and_resize(
-            segmentation_mask, transformation, method="nearest"
+            segmentation_masks, transformations, method="nearest"
         )
 
     def get_config(self):
@@ -279,19 +292,42 @@ class RandomCropAndResize(BaseImageAugmentationLayer):
             )
         return cls(**config)
 
-    def _crop_and_resize(self, image, transformation, method=None):
-        image = tf.expand_dims(image, axis=0)
-        boxes = transformation
-
-        # See bit.ly/tf_crop_resize for more details
-        augmented_image = tf.image.crop_and_resize(
-            image,  # image shape: [B, H, W, C]
-            boxes,  # boxes: (1, 4) in this case; represents area
-            # to be cropped from the original image
-            [0],  # box_indices: maps boxes to images along batch axis
-            # [0] since there is only one image
+    def _crop_and_resize(self, images, transformations, method=None):
+        if isinstance(images, tf.RaggedTensor):
+            # Ragged segmentation masks are cropped one at a time, ragged
+            # images go through `augment_ragged_image()` instead.
+            def crop_and_resize_single(inputs):
+                image, crop_box = inputs
+                if isinstance(image, tf.RaggedTensor):
+                    image = image.to_tensor()
+                transformation = {"crop_boxes": crop_box[tf.newaxis]}
+                image = self._crop_and_resize(
+                    image[tf.newaxis], transformation, method=method
+                )
+                return tf.squeeze(image, axis=0)
+
+            return tf.map_fn(
+                crop_and_resize_single,
+                (images, transformations["crop_boxes"]),
+                fn_output_signature=tf.TensorSpec(
+                    (
+                        self.target_size[0],
+                        self.target_size[1],
+                        images.shape[-1],
+                    ),
+                    self.compute_dtype,
+                ),
+            )
+
+        # A single `crop_and_resize` call over the whole batch, box `i` is
+        # cropped from image `i`. See bit.ly/tf_crop_resize for more details.
+        boxes = transformations["crop_boxes"]
+        augmented_images = tf.image.crop_and_resize(
+            images,  # image shape: [B, H, W, C]
+            boxes,  # boxes: [B, 4], the area to be cropped from each image
+            tf.range(tf.shape(boxes)[0]),  # box_indices: maps boxes to images
             self.target_size,  # output size
             method=method or self.interpolation,
         )
-
-        return tf.squeeze(augmented_image, axis=0)
+        # crop_and_resize always outputs float32, so we need to re-cast.
+        return tf.cast(augmented_images, self.compute_dtype)
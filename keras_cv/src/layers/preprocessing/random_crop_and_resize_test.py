@@ -115,6 +115,25 @@ class RandomCropAndResizeTest(TestCase):
                 crop_area_factor=crop_area_factor,
             )
 
+    def test_crops_each_image_with_its_own_box(self):
+        images = tf.random.uniform(shape=(self.batch_size, 40, 60, 3))
+        layer = preprocessing.RandomCropAndResize(
+            target_size=(16, 16),
+            crop_area_factor=(0.08, 1.0),
+            aspect_ratio_factor=(3 / 4, 4 / 3),
+        )
+        transformations = layer.get_random_transformation_batch(self.batch_size)
+        output = layer.augment_images(images, transformations)
+
+        for i in range(self.batch_size):
+            expected = tf.image.crop_and_resize(
+                images[i : i + 1],
+                transformations["crop_boxes"][i : i + 1],
+                [0],
+                (16, 16),
+            )
+            self.assertAllClose(output[i], expected[0])
+
     def test_augment_sparse_segmentation_mask(self):
         num_classes = 8
 
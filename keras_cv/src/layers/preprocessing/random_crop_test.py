@@ -185,6 +185,34 @@ class RandomCropTest(TestCase):
             [[200.0, 200.0, 400.0, 400.0]],
         )
         self.assertAllClose(expected_output, output["bounding_boxes"]["boxes"])
+        self.assertAllClose(
+            tf.image.resize(input_image, (512, 512)), output["images"]
+        )
+
+    def test_crop_matches_slice_of_image(self):
+        input_image = np.random.random((256, 256, 3)).astype(np.float32)
+        bboxes = {
+            "boxes": np.array([[100, 100, 200, 200]]),
+            "classes": np.array([1]),
+        }
+        input = {"images": input_image, "bounding_boxes": bboxes}
+        # for top = 20 and left = 30
+        transformations = {
+            "tops": np.ones((1, 1)) * (20 / (256 - 128)),
+            "lefts": np.ones((1, 1)) * (30 / (256 - 128)),
+        }
+        layer = RandomCrop(height=128, width=128, bounding_box_format="xyxy")
+        with unittest.mock.patch.object(
+            layer,
+            "get_random_transformation_batch",
+            return_value=transformations,
+        ):
+            output = layer(input)
+
+        self.assertAllClose(input_image[20:148, 30:158], output["images"])
+        self.assertAllClose(
+            [[70.0, 80.0, 128.0, 128.0]], output["bounding_boxes"]["boxes"]
+        )
 
     @pytest.mark.tf_only
     def test_in_tf_function(self):
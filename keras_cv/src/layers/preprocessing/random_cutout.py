@@ -66,6 +66,8 @@ class RandomCutout(VectorizedBaseImageAugmentationLayer):
     ```
     """
 
+    _supports_uint8 = True
+
     def __init__(
         self,
         height_factor,
@@ -224,18 +226,21 @@ class RandomCutout(VectorizedBaseImageAugmentationLayer):
         input_shape = tf.shape(inputs)
         if self.fill_mode == "constant":
             fill_value = tf.fill(input_shape, self.fill_value)
-            fill_value = tf.cast(fill_value, dtype=self.compute_dtype)
+            fill_value = tf.cast(fill_value, dtype=inputs.dtype)
         else:
             # gaussian noise
-            fill_value = tf.random.normal(input_shape, dtype=self.compute_dtype)
+            fill_value = self._random_generator.normal(
+                input_shape, dtype=self.compute_dtype
+            )
             # rescale the random noise to the original image range
-            image_max = tf.reduce_max(inputs)
-            image_min = tf.reduce_min(inputs)
+            image_max = tf.cast(tf.reduce_max(inputs), self.compute_dtype)
+            image_min = tf.cast(tf.reduce_min(inputs), self.compute_dtype)
             fill_max = tf.reduce_max(fill_value)
             fill_min = tf.reduce_min(fill_value)
             fill_value = (image_max - image_min) * (fill_value - fill_min) / (
                 fill_max - fill_min
             ) + image_min
+            fill_value = tf.cast(fill_value, inputs.dtype)
         return fill_value
 
     def get_config(self):
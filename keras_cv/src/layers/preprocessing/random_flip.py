@@ -16,6 +16,7 @@ import tensorflow as tf
 
 from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
@@ -61,6 +62,9 @@ class RandomFlip(VectorizedBaseImageAugmentationLayer):
             for more details on supported bounding box formats.
     """  # noqa: E501
 
+    _supports_backend_native = True
+    _supports_uint8 = True
+
     def __init__(
         self,
         mode=HORIZONTAL,
@@ -94,8 +98,8 @@ class RandomFlip(VectorizedBaseImageAugmentationLayer):
         self.rate = rate
 
     def get_random_transformation_batch(self, batch_size, **kwargs):
-        flip_horizontals = tf.zeros(shape=(batch_size, 1))
-        flip_verticals = tf.zeros(shape=(batch_size, 1))
+        flip_horizontals = ops.zeros(shape=(batch_size, 1))
+        flip_verticals = ops.zeros(shape=(batch_size, 1))
 
         if self.horizontal:
             flip_horizontals = self._random_generator.uniform(
@@ -197,33 +201,20 @@ class RandomFlip(VectorizedBaseImageAugmentationLayer):
         return self._flip_images(segmentation_masks, transformations)
 
     def _flip_images(self, images, transformations):
-        batch_size = tf.shape(images)[0]
-        height, width = tf.shape(images)[1], tf.shape(images)[2]
-        channel = tf.shape(images)[3]
-        flip_horizontals = transformations["flip_horizontals"]
-        flip_verticals = transformations["flip_verticals"]
-
         # broadcast
-        flip_horizontals = (
-            tf.ones(shape=(batch_size, height, width, channel))
-            * flip_horizontals[:, tf.newaxis, tf.newaxis, :]
-        )
-        flip_verticals = (
-            tf.ones(shape=(batch_size, height, width, channel))
-            * flip_verticals[:, tf.newaxis, tf.newaxis, :]
-        )
+        flip_horizontals = transformations["flip_horizontals"][:, None, None, :]
+        flip_verticals = transformations["flip_verticals"][:, None, None, :]
 
-        flipped_outputs = tf.where(
+        flipped_outputs = ops.where(
             flip_horizontals > (1.0 - self.rate),
-            tf.image.flip_left_right(images),
+            ops.flip(images, axis=2),
             images,
         )
-        flipped_outputs = tf.where(
+        flipped_outputs = ops.where(
             flip_verticals > (1.0 - self.rate),
-            tf.image.flip_up_down(flipped_outputs),
+            ops.flip(flipped_outputs, axis=1),
             flipped_outputs,
         )
-        flipped_outputs.set_shape(images.shape)
         return flipped_outputs
 
     def _flip_boxes_horizontal(self, boxes):
@@ -16,16 +16,20 @@ import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import keras
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils import preprocessing
 
 
 @keras_cv_export("keras_cv.layers.RandomGaussianBlur")
-class RandomGaussianBlur(BaseImageAugmentationLayer):
+class RandomGaussianBlur(VectorizedBaseImageAugmentationLayer):
     """Applies a Gaussian Blur with random strength to an image.
 
+    The blur is applied as two separable 1D convolutions. A kernel is
+    generated for every image of the batch, and all images are blurred at
+    once by a depthwise convolution grouped over images and channels.
+
     Args:
         kernel_size: int, 2 element tuple or 2 element list. x and y dimensions
             for the kernel used. If tuple or list, first element is used for the
@@ -38,16 +42,18 @@ class RandomGaussianBlur(BaseImageAugmentationLayer):
             no-op operation, and high values make the blur stronger. In order to
             ensure the value is always the same, please pass a tuple with two
             identical floats: `(0.5, 0.5)`.
+        seed: Integer. Used to create a random seed.
     """
 
-    def __init__(self, kernel_size, factor, **kwargs):
-        super().__init__(**kwargs)
+    def __init__(self, kernel_size, factor, seed=None, **kwargs):
+        super().__init__(seed=seed, **kwargs)
 
         self.factor = preprocessing.parse_factor(
             factor, min_value=0.0, max_value=None, param_name="factor"
         )
 
         self.kernel_size = kernel_size
+        self.seed = seed
 
         if isinstance(kernel_size, (tuple, list)):
             self.x = kernel_size[0]
@@ -61,49 +67,80 @@ class RandomGaussianBlur(BaseImageAugmentationLayer):
                     ", got {} ".format(type(self.kernel_size))
                 )
 
-    def get_random_transformation(self, **kwargs):
+    def get_random_transformation_batch(self, batch_size, **kwargs):
         # `factor` must not become too small otherwise numerical issues occur.
         # keras.backend.epsilon() behaves like 0 without causing `nan`s
-        factor = tf.math.maximum(self.factor(), keras.backend.epsilon())
+        factor = tf.math.maximum(
+            self.factor(shape=(batch_size,)), keras.backend.epsilon()
+        )
         blur_v = RandomGaussianBlur.get_kernel(factor, self.y)
         blur_h = RandomGaussianBlur.get_kernel(factor, self.x)
-        blur_v = tf.reshape(blur_v, [self.y, 1, 1, 1])
-        blur_h = tf.reshape(blur_h, [1, self.x, 1, 1])
-        return (blur_v, blur_h)
-
-    def augment_image(self, image, transformation=None, **kwargs):
-        image = tf.expand_dims(image, axis=0)
-
-        num_channels = tf.shape(image)[-1]
-        blur_v, blur_h = transformation
-        blur_h = tf.cast(
-            tf.tile(blur_h, [1, 1, num_channels, 1]), dtype=self.compute_dtype
+        return {"blur_v": blur_v, "blur_h": blur_h}
+
+    def augment_images(self, images, transformations, **kwargs):
+        images_shape = tf.shape(images)
+        batch_size, height, width, num_channels = tf.unstack(images_shape)
+        num_groups = num_channels * batch_size
+
+        # Fold the batch into the channels, so that a single depthwise
+        # convolution applies the kernel of every image to all its channels.
+        # Channels are ordered channel-major (`channel * batch_size + image`),
+        # which is faster than image-major on CPU for all but tiny images.
+        # Shape: (1, height, width, num_channels * batch_size)
+        images = tf.transpose(images, [1, 2, 3, 0])
+        images = tf.reshape(images, [1, height, width, num_groups])
+
+        def to_depthwise_kernel(kernel, kernel_shape):
+            # (batch_size, size) -> (size, num_channels * batch_size)
+            kernel = tf.tile(tf.transpose(kernel), [1, num_channels])
+            kernel = tf.reshape(kernel, kernel_shape)
+            return tf.cast(kernel, dtype=self.compute_dtype)
+
+        blur_h = to_depthwise_kernel(
+            transformations["blur_h"], [1, self.x, num_groups, 1]
         )
-        blur_v = tf.cast(
-            tf.tile(blur_v, [1, 1, num_channels, 1]), dtype=self.compute_dtype
+        blur_v = to_depthwise_kernel(
+            transformations["blur_v"], [self.y, 1, num_groups, 1]
         )
         blurred = tf.nn.depthwise_conv2d(
-            image, blur_h, strides=[1, 1, 1, 1], padding="SAME"
+            images, blur_h, strides=[1, 1, 1, 1], padding="SAME"
         )
         blurred = tf.nn.depthwise_conv2d(
             blurred, blur_v, strides=[1, 1, 1, 1], padding="SAME"
         )
 
-        return tf.squeeze(blurred, axis=0)
+        blurred = tf.reshape(blurred, [height, width, num_channels, batch_size])
+        return tf.transpose(blurred, [3, 0, 1, 2])
+
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        images = tf.expand_dims(image, axis=0)
+        transformations = tf.nest.map_structure(
+            lambda x: tf.expand_dims(x, axis=0), transformation
+        )
+        output = self.augment_images(images, transformations)
+        return tf.squeeze(output, axis=0)
 
-    def augment_bounding_boxes(self, bounding_boxes, **kwargs):
+    def augment_bounding_boxes(self, bounding_boxes, transformations, **kwargs):
         return bounding_boxes
 
-    def augment_label(self, label, transformation=None, **kwargs):
-        return label
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels
 
-    def augment_segmentation_mask(
-        self, segmentation_mask, transformation, **kwargs
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
     ):
-        return segmentation_mask
+        return segmentation_masks
+
+    def augment_keypoints(self, keypoints, transformations, **kwargs):
+        return keypoints
 
     @staticmethod
     def get_kernel(factor, filter_size):
+        """Returns normalized 1D Gaussian kernels of size `filter_size`.
+
+        `factor` may be a scalar or a batch of sigmas, in which case one
+        kernel is returned per sigma, with shape `factor.shape + [filter_size]`.
+        """
         # We are running this in float32, regardless of layer's
         # self.compute_dtype. Calculating blur_filter in lower precision will
         # corrupt the final results.
@@ -111,14 +148,18 @@ class RandomGaussianBlur(BaseImageAugmentationLayer):
             tf.range(-filter_size // 2 + 1, filter_size // 2 + 1),
             dtype=tf.float32,
         )
-        blur_filter = tf.exp(
-            -tf.pow(x, 2.0)
-            / (2.0 * tf.pow(tf.cast(factor, dtype=tf.float32), 2.0))
-        )
-        blur_filter /= tf.reduce_sum(blur_filter)
+        factor = tf.cast(factor, dtype=tf.float32)[..., tf.newaxis]
+        blur_filter = tf.exp(-tf.pow(x, 2.0) / (2.0 * tf.pow(factor, 2.0)))
+        blur_filter /= tf.reduce_sum(blur_filter, axis=-1, keepdims=True)
         return blur_filter
 
     def get_config(self):
         config = super().get_config()
-        config.update({"factor": self.factor, "kernel_size": self.kernel_size})
+        config.update(
+            {
+                "factor": self.factor,
+                "kernel_size": self.kernel_size,
+                "seed": self.seed,
+            }
+        )
         return config
@@ -114,3 +114,50 @@ class RandomGaussianBlurTest(TestCase):
         xs = layer(xs)
 
         self.assertAllClose(xs, result)
+
+    def test_per_sample_kernels_match_single_image_blur(self):
+        layer = preprocessing.RandomGaussianBlur(
+            kernel_size=(3, 5), factor=(0.5, 3.0)
+        )
+        images = np.random.uniform(size=(4, 16, 24, 3)).astype("float32")
+
+        transformations = layer.get_random_transformation_batch(4)
+        blurred = layer.augment_images(images, transformations)
+
+        for i in range(4):
+            # A 2D convolution with the outer product of the 1D kernels.
+            kernel = tf.tensordot(
+                transformations["blur_v"][i],
+                transformations["blur_h"][i],
+                axes=0,
+            )
+            kernel = tf.tile(kernel[:, :, None, None], [1, 1, 3, 1])
+            expected = tf.nn.depthwise_conv2d(
+                images[i : i + 1], kernel, [1, 1, 1, 1], padding="SAME"
+            )
+            self.assertAllClose(blurred[i : i + 1], expected)
+        # Every image is blurred with its own kernel.
+        self.assertNotAllClose(
+            transformations["blur_h"][0], transformations["blur_h"][1]
+        )
+
+    def test_fixed_factor_matches_separable_gaussian_blur(self):
+        layer = preprocessing.RandomGaussianBlur(
+            kernel_size=(3, 7), factor=(1.5, 1.5)
+        )
+        images = np.random.uniform(0, 255, size=(4, 64, 48, 3))
+        images = images.astype("float32")
+
+        blurred = layer(images)
+
+        def gaussian(size):
+            x = np.arange(size) - size // 2
+            kernel = np.exp(-(x**2) / (2 * 1.5**2))
+            return kernel / kernel.sum()
+
+        kernel = np.outer(gaussian(7), gaussian(3)).astype("float32")
+        kernel = np.tile(kernel[:, :, None, None], [1, 1, 3, 1])
+        expected = tf.nn.depthwise_conv2d(
+            images, kernel, [1, 1, 1, 1], padding="SAME"
+        )
+        self.assertAllClose(blurred, expected, atol=1e-3)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import numpy as np
+import tensorflow as tf
 from absl.testing import parameterized
 
 from keras_cv.src import core
@@ -102,6 +103,28 @@ class RandomHueTest(TestCase):
         output = layer(image)
         self.assertNotAllClose(image, output)
 
+    def test_matches_adjust_hue(self):
+        image_shape = (16, 32, 32, 3)
+        image = np.random.uniform(size=image_shape).astype(np.float32)
+
+        layer = preprocessing.RandomHue(
+            factor=(0.8, 0.8), value_range=(0, 1), seed=2023
+        )
+        output = ops.convert_to_numpy(layer(image))
+
+        # The hue is rotated by half the factor in a random direction.
+        for x, y in zip(image, output):
+            self.assertTrue(
+                any(
+                    np.allclose(
+                        y,
+                        np.clip(tf.image.adjust_hue(x, delta), 0, 1),
+                        atol=1e-5,
+                    )
+                    for delta in (-0.4, 0.4)
+                )
+            )
+
     def test_config(self):
         layer = preprocessing.RandomHue(factor=(0.3, 0.8), value_range=(0, 255))
         config = layer.get_config()
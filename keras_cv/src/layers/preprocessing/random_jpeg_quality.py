@@ -12,28 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import tensorflow as tf
 
 from keras_cv.src.api_export import keras_cv_export
-from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
-    BaseImageAugmentationLayer,
+from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
+    VectorizedBaseImageAugmentationLayer,
 )
 from keras_cv.src.utils import preprocessing
 
 
 @keras_cv_export("keras_cv.layers.RandomJpegQuality")
-class RandomJpegQuality(BaseImageAugmentationLayer):
+class RandomJpegQuality(VectorizedBaseImageAugmentationLayer):
     """Applies Random Jpeg compression artifacts to an image.
 
     Performs the jpeg compression algorithm on the image. This layer can be used
     in order to ensure your model is robust to artifacts introduced by JPEG
     compression.
 
+    JPEG encoding has no batched kernel, so every image of a batch is encoded
+    and decoded with its own quality. Within a `tf.function` or a `tf.data`
+    pipeline, up to `num_parallel_calls` images are encoded concurrently on the
+    inter-op thread pool of TensorFlow.
+
     Args:
         factor: 2 element tuple or 2 element list. During augmentation, a random
         number is drawn from the factor distribution. This value is passed to
         `tf.image.adjust_jpeg_quality()`.
         seed: Integer. Used to create a random seed.
+        num_parallel_calls: the number of images of a batch to encode
+            concurrently, defaults to the number of CPUs.
 
     Example:
     ```python
@@ -43,15 +52,22 @@ class RandomJpegQuality(BaseImageAugmentationLayer):
     ```
     """
 
-    def __init__(self, factor, seed=None, **kwargs):
-        super().__init__(**kwargs)
+    def __init__(self, factor, seed=None, num_parallel_calls=None, **kwargs):
+        super().__init__(seed=seed, **kwargs)
         if isinstance(factor, (float, int)):
             raise ValueError(
                 "RandomJpegQuality() expects factor to be a 2 element "
                 "tuple, list or a `keras_cv.FactorSampler`. "
                 "RandomJpegQuality() received `factor={factor}`."
             )
+        if num_parallel_calls is not None and num_parallel_calls < 1:
+            raise ValueError(
+                "RandomJpegQuality() expects `num_parallel_calls` to be a "
+                "positive integer. RandomJpegQuality() received "
+                f"`num_parallel_calls={num_parallel_calls}`."
+            )
         self.seed = seed
+        self.num_parallel_calls = num_parallel_calls
         self.factor = preprocessing.parse_factor(
             factor,
             min_value=0,
@@ -59,26 +75,51 @@ class RandomJpegQuality(BaseImageAugmentationLayer):
             param_name="factor",
             seed=self.seed,
         )
+        self._traced_adjust_jpeg_quality = tf.function(
+            self._adjust_jpeg_quality, reduce_retracing=True
+        )
 
-    def get_random_transformation(self, **kwargs):
-        return self.factor(dtype=tf.int32)
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        return self.factor(shape=(batch_size,), dtype=tf.int32)
 
-    def augment_image(self, image, transformation=None, **kwargs):
-        jpeg_quality = transformation
-        return tf.image.adjust_jpeg_quality(image, jpeg_quality)
+    def augment_images(self, images, transformations, **kwargs):
+        if tf.executing_eagerly():
+            # An eager `tf.map_fn` encodes the images one after another.
+            return self._traced_adjust_jpeg_quality(images, transformations)
+        return self._adjust_jpeg_quality(images, transformations)
+
+    def _adjust_jpeg_quality(self, images, qualities):
+        return tf.map_fn(
+            lambda x: tf.image.adjust_jpeg_quality(x[0], x[1]),
+            (images, qualities),
+            fn_output_signature=tf.TensorSpec(images.shape[1:], images.dtype),
+            parallel_iterations=self.num_parallel_calls or os.cpu_count() or 1,
+        )
+
+    def augment_ragged_image(self, image, transformation, **kwargs):
+        return tf.image.adjust_jpeg_quality(image, transformation)
 
     def augment_bounding_boxes(self, bounding_boxes, **kwargs):
         return bounding_boxes
 
-    def augment_label(self, label, transformation=None, **kwargs):
-        return label
+    def augment_labels(self, labels, transformations=None, **kwargs):
+        return labels
 
-    def augment_segmentation_mask(
-        self, segmentation_mask, transformation, **kwargs
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
     ):
-        return segmentation_mask
+        return segmentation_masks
+
+    def augment_keypoints(self, keypoints, transformations, **kwargs):
+        return keypoints
 
     def get_config(self):
         config = super().get_config()
-        config.update({"factor": self.factor, "seed": self.seed})
+        config.update(
+            {
+                "factor": self.factor,
+                "seed": self.seed,
+                "num_parallel_calls": self.num_parallel_calls,
+            }
+        )
         return config
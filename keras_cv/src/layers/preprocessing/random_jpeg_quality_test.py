@@ -66,3 +66,51 @@ class RandomJpegQualityTest(TestCase):
         xs = np.ones((2, 256, 512, 1))
         xs = layer(xs)
         self.assertEqual(xs.shape, (2, 256, 512, 1))
+
+    def test_batch_uses_per_sample_qualities(self):
+        layer = preprocessing.RandomJpegQuality(
+            factor=[0, 100], num_parallel_calls=2
+        )
+        images = tf.random.uniform((3, 16, 16, 3))
+        qualities = tf.constant([10, 50, 95])
+
+        outputs = layer.augment_images(images, qualities)
+
+        for image, quality, output in zip(images, qualities, outputs):
+            self.assertAllClose(
+                output, tf.image.adjust_jpeg_quality(image, quality)
+            )
+
+    def test_fixed_quality_matches_adjust_jpeg_quality(self):
+        layer = preprocessing.RandomJpegQuality(factor=(80, 81))
+        images = tf.random.uniform((4, 32, 32, 3))
+
+        outputs = layer(images)
+
+        for image, output in zip(images, outputs):
+            self.assertAllClose(output, tf.image.adjust_jpeg_quality(image, 80))
+
+    def test_batch_in_tf_function(self):
+        layer = preprocessing.RandomJpegQuality(factor=[50, 51])
+        images = tf.random.uniform((4, 16, 16, 3))
+
+        outputs = tf.function(layer)(images)
+
+        self.assertAllClose(
+            outputs, layer.augment_images(images, tf.fill((4,), 50))
+        )
+
+    def test_invalid_num_parallel_calls(self):
+        with self.assertRaisesRegexp(ValueError, "num_parallel_calls"):
+            preprocessing.RandomJpegQuality(
+                factor=[0, 100], num_parallel_calls=0
+            )
+
+    def test_config(self):
+        layer = preprocessing.RandomJpegQuality(
+            factor=[0, 100], num_parallel_calls=4
+        )
+
+        config = layer.get_config()
+
+        self.assertEqual(config["num_parallel_calls"], 4)
@@ -81,6 +81,28 @@ class RandomRotationTest(TestCase):
         }
         self.assertAllClose(expected_bounding_boxes, output["bounding_boxes"])
 
+    def test_augment_batched_images_and_bounding_boxes(self):
+        input_images = tf.random.uniform((2, 20, 20, 3))
+        bounding_boxes = {
+            "boxes": tf.ragged.constant(
+                [[[2, 2, 4, 4], [1, 1, 3, 3]], [[2, 2, 4, 4]]],
+                dtype=tf.float32,
+            ),
+            "classes": tf.ragged.constant([[0, 1], [0]], dtype=tf.float32),
+        }
+        input = {"images": input_images, "bounding_boxes": bounding_boxes}
+        # 180 rotation.
+        layer = RandomRotation(factor=(0.5, 0.5), bounding_box_format="xyxy")
+        output = layer(input)
+
+        self.assertAllClose(
+            tf.reverse(input_images, axis=(1, 2)), output["images"], atol=1e-5
+        )
+        self.assertAllClose(
+            [[[16, 16, 18, 18], [17, 17, 19, 19]], [[16, 16, 18, 18], [0] * 4]],
+            output["bounding_boxes"]["boxes"].to_tensor(),
+        )
+
     def test_output_dtypes(self):
         inputs = np.array([[[1], [2]], [[3], [4]]], dtype="float64")
         layer = RandomRotation(0.5)
@@ -80,3 +80,26 @@ class RandomSharpnessTest(TestCase):
         results = layer(batched_images)
 
         self.assertNotAllClose(results[0], results[1])
+
+    def test_random_sharpness_blends_with_smoothed_interior(self):
+        images = tf.random.uniform((2, 64, 64, 3), minval=0, maxval=255)
+        layer = preprocessing.RandomSharpness(
+            value_range=(0, 255), factor=(0.5, 0.5)
+        )
+
+        ys = layer(images)
+
+        kernel = tf.constant(
+            [[1, 1, 1], [1, 5, 1], [1, 1, 1]], tf.float32, shape=(3, 3, 1, 1)
+        )
+        smoothed = tf.nn.depthwise_conv2d(
+            images, tf.tile(kernel / 13.0, (1, 1, 3, 1)), [1] * 4, "VALID"
+        )
+        # Border pixels keep their original values.
+        smoothed = tf.concat(
+            [images[:, :1, 1:-1], smoothed, images[:, -1:, 1:-1]], axis=1
+        )
+        smoothed = tf.concat(
+            [images[:, :, :1], smoothed, images[:, :, -1:]], axis=2
+        )
+        self.assertAllClose(ys, (images + smoothed) / 2, atol=1e-4)
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import unittest
+
 import numpy as np
 import pytest
 import tensorflow as tf
@@ -19,6 +21,7 @@ from keras_cv.src import bounding_box
 from keras_cv.src.backend import ops
 from keras_cv.src.layers import preprocessing
 from keras_cv.src.tests.test_case import TestCase
+from keras_cv.src.utils import preprocessing as preprocessing_utils
 
 num_classes = 10
 
@@ -221,6 +224,60 @@ class RandomShearTest(TestCase):
         self.assertAllEqual(xs, output_xs)
         self.assertAllEqual(ys["boxes"], output_ys["boxes"])
 
+    def test_matches_sequential_shear_transforms(self):
+        images = tf.random.uniform(shape=(2, 64, 64, 3))
+        shear_x = tf.constant([[0.2], [-0.3]])
+        shear_y = tf.constant([[0.1], [0.4]])
+        layer = preprocessing.RandomShear(x_factor=0.5, y_factor=0.5)
+
+        with unittest.mock.patch.object(
+            layer,
+            "get_random_transformation_batch",
+            return_value={"shear_x": shear_x, "shear_y": shear_y},
+        ):
+            outputs = layer(images)
+
+        zeros = tf.zeros((2, 1))
+        ones = tf.ones((2, 1))
+        expected = preprocessing_utils.transform(
+            images,
+            tf.concat(
+                [ones, shear_x, zeros, zeros, ones, zeros, zeros, zeros], 1
+            ),
+            fill_mode="reflect",
+        )
+        expected = preprocessing_utils.transform(
+            expected,
+            tf.concat(
+                [ones, zeros, zeros, shear_y, ones, zeros, zeros, zeros], 1
+            ),
+            fill_mode="reflect",
+        )
+        self.assertAllClose(expected, outputs)
+
+    def test_shears_bounding_box_corners(self):
+        xs = tf.zeros((1, 100, 100, 3))
+        ys = {
+            "boxes": tf.constant([[[10.0, 20.0, 40.0, 50.0]]]),
+            "classes": tf.constant([[0.0]]),
+        }
+        layer = preprocessing.RandomShear(
+            x_factor=0.1, y_factor=None, bounding_box_format="xyxy"
+        )
+
+        with unittest.mock.patch.object(
+            layer,
+            "get_random_transformation_batch",
+            return_value={"shear_x": tf.constant([[0.1]]), "shear_y": None},
+        ):
+            outputs = layer({"images": xs, "bounding_boxes": ys})
+
+        # Each corner moves left by 0.1 times its y coordinate.
+        self.assertAllClose(
+            [[[5.0, 20.0, 38.0, 50.0]]],
+            bounding_box.to_dense(outputs["bounding_boxes"])["boxes"],
+        )
+
     # TODO re-enable when bounding box augmentation is fixed.
     def DISABLED_test_output_values(self):
         """test to verify augmented bounding box output coordinate"""
@@ -18,6 +18,7 @@ import tensorflow as tf
 from keras_cv.src.backend import ops
 from keras_cv.src.layers import preprocessing
 from keras_cv.src.tests.test_case import TestCase
+from keras_cv.src.utils import preprocessing as preprocessing_utils
 
 
 class RandomTranslationTest(TestCase):
@@ -186,6 +187,20 @@ class RandomTranslationTest(TestCase):
             expected_output = np.reshape(expected_output, (1, 5, 5, 1))
             self.assertAllEqual(expected_output, output_image)
 
+    def test_matches_translation_transform(self):
+        images = tf.random.uniform(shape=(16, 32, 32, 3)) * 255.0
+        layer = preprocessing.RandomTranslation((0.5, 0.5), (0.5, 0.5))
+
+        output = layer(images)
+
+        # Shifting by .5 * 32 = 16 pixels along both axes.
+        expected = preprocessing_utils.transform(
+            images,
+            preprocessing_utils.get_translation_matrix(tf.fill((16, 2), 16.0)),
+            fill_mode="reflect",
+        )
+        self.assertAllClose(expected, output)
+
     def test_random_translation_on_batched_images_independently(self):
         image = tf.random.uniform(shape=(100, 100, 3))
         input_images = tf.stack([image, image], axis=0)
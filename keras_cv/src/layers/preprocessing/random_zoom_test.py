@@ -19,6 +19,7 @@ from absl.testing import parameterized
 from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.random_zoom import RandomZoom
 from keras_cv.src.tests.test_case import TestCase
+from keras_cv.src.utils import preprocessing as preprocessing_utils
 
 
 class RandomZoomTest(TestCase):
@@ -128,6 +129,27 @@ class RandomZoomTest(TestCase):
             expected_output = np.reshape(expected_output, (1, 5, 5, 1))
             self.assertAllEqual(expected_output, output_image)
 
+    @parameterized.named_parameters(
+        ("random_zoom_in", (-0.5, -0.5), (-0.5, -0.5), [0.5, 0.5]),
+        ("random_zoom_out", (0.5, 0.5), (0.8, 0.8), [1.8, 1.5]),
+    )
+    def test_matches_zoom_transform(self, height_factor, width_factor, zooms):
+        images = tf.random.uniform(shape=(16, 32, 32, 3)) * 255.0
+        layer = RandomZoom(height_factor, width_factor, interpolation="nearest")
+
+        output = layer(images)
+
+        # Zooms about the image center, (15.5, 15.5).
+        zoom_x, zoom_y = zooms
+        offset_x, offset_y = 15.5 * (1 - zoom_x), 15.5 * (1 - zoom_y)
+        expected = preprocessing_utils.transform(
+            images,
+            [[zoom_x, 0, offset_x, 0, zoom_y, offset_y, 0, 0]] * 16,
+            fill_mode="reflect",
+            interpolation="nearest",
+        )
+        self.assertAllClose(expected, output)
+
     def test_random_zoom_on_batched_images_independently(self):
         image = tf.random.uniform(shape=(100, 100, 3))
         input_images = tf.stack([image, image], axis=0)
@@ -14,8 +14,15 @@
 
 import tensorflow as tf
 
+from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import keras
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    BOUNDING_BOXES,
+)
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    IMAGES,
+)
 from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
     BaseImageAugmentationLayer,
 )
@@ -34,11 +41,16 @@ class RepeatedAugmentation(BaseImageAugmentationLayer):
     within a batch creating correlated samples.
 
     This layer increases your batch size by a factor of `len(augmenters)`.
+    The outputs of the augmenters are written directly to their rows of the
+    output batch, without intermediate copies. Bounding boxes are padded to
+    the largest number of boxes output by an augmenter.
 
     Args:
         augmenters: the augmenters to use to augment the image
         shuffle: whether to shuffle the result. Essential when using an
             asynchronous distribution strategy such as ParameterServerStrategy.
+            If False, the augmentations of every image are adjacent in the
+            output, in the order of `augmenters`.
 
     Example:
 
@@ -82,32 +94,33 @@ class RepeatedAugmentation(BaseImageAugmentationLayer):
         self.shuffle = shuffle
 
     def _batch_augment(self, inputs):
-        if "bounding_boxes" in inputs:
-            raise ValueError(
-                "RepeatedAugmentation() does not yet support bounding box "
-                "labels."
-            )
-
         augmenter_outputs = [augmenter(inputs) for augmenter in self.augmenters]
+        slots = self._output_slots(tf.shape(inputs[IMAGES])[0])
 
         outputs = {}
         for k in inputs.keys():
-            outputs[k] = tf.concat(
-                [output[k] for output in augmenter_outputs], axis=0
+            values = [output[k] for output in augmenter_outputs]
+            if k == BOUNDING_BOXES:
+                outputs[k] = _stitch_bounding_boxes(slots, values, self.shuffle)
+            else:
+                outputs[k] = _stitch(slots, values, self.shuffle)
+        return outputs
+
+    def _output_slots(self, batch_size):
+        """The output rows of the augmentations of every augmenter.
+
+        The augmentations of a sample are interleaved, unless the output is
+        shuffled, in which case the rows are permuted instead of gathering
+        the outputs once more.
+        """
+        num_repeats = len(self.augmenters)
+        slots = tf.range(batch_size * num_repeats)
+        if self.shuffle:
+            slots = tf.random.experimental.stateless_shuffle(
+                slots, seed=self._random_generator.make_seeds()[:, 0]
             )
-
-        if not self.shuffle:
-            return outputs
-        return self.shuffle_outputs(outputs)
-
-    def shuffle_outputs(self, result):
-        indices = tf.range(
-            start=0, limit=tf.shape(result["images"])[0], dtype=tf.int32
-        )
-        indices = tf.random.shuffle(indices)
-        for key in result:
-            result[key] = tf.gather(result[key], indices)
-        return result
+        slots = tf.transpose(tf.reshape(slots, (batch_size, num_repeats)))
+        return tf.unstack(slots, num=num_repeats)
 
     def _augment(self, inputs):
         raise ValueError(
@@ -128,3 +141,42 @@ class RepeatedAugmentation(BaseImageAugmentationLayer):
                 config["augmenters"]
             )
         return cls(**config)
+
+
+def _stitch(slots, values, shuffled):
+    """Writes the rows of every tensor of `values` to its `slots`."""
+    if any(isinstance(value, tf.RaggedTensor) for value in values):
+        order = tf.math.invert_permutation(tf.concat(slots, axis=0))
+        return tf.gather(tf.concat(values, axis=0), order)
+    if not shuffled:
+        # interleaving is a plain stack, cheaper than scattering the rows
+        values = tf.stack(values, axis=1)
+        outputs = tf.reshape(
+            values, tf.concat([[-1], tf.shape(values)[2:]], axis=0)
+        )
+        outputs.set_shape([None] + values.shape[2:].as_list())
+        return outputs
+    return tf.dynamic_stitch(slots, values)
+
+
+def _stitch_bounding_boxes(slots, bounding_boxes, shuffled):
+    ragged = isinstance(bounding_boxes[0]["boxes"], tf.RaggedTensor)
+    bounding_boxes = [bounding_box.to_dense(boxes) for boxes in bounding_boxes]
+    # the augmenters may output different numbers of boxes
+    max_boxes = tf.reduce_max(
+        [tf.shape(boxes["boxes"])[1] for boxes in bounding_boxes]
+    )
+    result = {}
+    for key in bounding_boxes[0]:
+        values = []
+        for boxes in bounding_boxes:
+            value = boxes[key]
+            padding = [[0, 0], [0, max_boxes - tf.shape(value)[1]]]
+            padding += [[0, 0]] * (value.shape.rank - 2)
+            values.append(tf.pad(value, padding, constant_values=-1))
+        result[key] = _stitch(slots, values, shuffled)
+    if ragged:
+        result = bounding_box.to_ragged(
+            result, dtype=bounding_boxes[0]["boxes"].dtype
+        )
+    return result
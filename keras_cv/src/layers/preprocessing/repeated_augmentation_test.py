@@ -53,3 +53,65 @@ class RepeatedAugmentationTest(TestCase):
 
         self.assertEqual(outputs["images"].shape, (16, 512, 512, 3))
         self.assertEqual(outputs["labels"].shape, (16, 10))
+
+    def test_interleaves_outputs_without_shuffle(self):
+        repeated_augment = cv_layers.RepeatedAugmentation(
+            augmenters=[
+                cv_layers.RandomBrightness((0.1, 0.1), value_range=(0, 1)),
+                cv_layers.RandomBrightness((0.2, 0.2), value_range=(0, 1)),
+            ],
+            shuffle=False,
+        )
+        inputs = {
+            "images": tf.zeros((3, 4, 4, 3)),
+            "labels": tf.constant([0.0, 1.0, 2.0]),
+        }
+        outputs = repeated_augment(inputs)
+
+        self.assertAllClose(outputs["labels"], [0, 0, 1, 1, 2, 2])
+        self.assertAllClose(
+            outputs["images"][:, 0, 0, 0], [0.1, 0.2, 0.1, 0.2, 0.1, 0.2]
+        )
+
+    def test_shuffle_keeps_inputs_aligned(self):
+        repeated_augment = cv_layers.RepeatedAugmentation(
+            augmenters=[cv_layers.RandomFlip()] * 3, seed=1
+        )
+        labels = tf.range(4, dtype=tf.float32)
+        inputs = {
+            "images": labels[:, None, None, None] * tf.ones((4, 4, 4, 3)),
+            "labels": labels,
+        }
+        outputs = repeated_augment(inputs)
+
+        self.assertAllClose(outputs["images"][:, 0, 0, 0], outputs["labels"])
+        self.assertAllClose(
+            tf.sort(outputs["labels"]), tf.repeat(labels, 3, axis=0)
+        )
+
+    def test_bounding_boxes(self):
+        repeated_augment = cv_layers.RepeatedAugmentation(
+            augmenters=[
+                cv_layers.RandomFlip(bounding_box_format="xyxy"),
+                cv_layers.RandomFlip(bounding_box_format="xyxy"),
+            ],
+            shuffle=False,
+        )
+        inputs = {
+            "images": tf.ones((2, 4, 4, 3)),
+            "bounding_boxes": {
+                "boxes": tf.ragged.constant(
+                    [[[0, 0, 1, 1]], [[0, 0, 2, 2], [1, 1, 2, 2]]],
+                    ragged_rank=1,
+                    dtype=tf.float32,
+                ),
+                "classes": tf.ragged.constant([[1.0], [2.0, 3.0]]),
+            },
+        }
+        outputs = repeated_augment(inputs)
+
+        self.assertAllClose(
+            outputs["bounding_boxes"]["classes"].to_tensor(-1),
+            [[1, -1], [1, -1], [2, 3], [2, 3]],
+        )
+        self.assertEqual(outputs["bounding_boxes"]["boxes"].shape, [4, None, 4])
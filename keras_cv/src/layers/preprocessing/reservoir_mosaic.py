@@ -0,0 +1,385 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tensorflow as tf
+
+from keras_cv.src import bounding_box
+from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.layers.preprocessing.mosaic import Mosaic
+
+TILES = "tiles"
+
+
+@keras_cv_export("keras_cv.layers.ReservoirMosaic")
+class ReservoirMosaic(Mosaic):
+    """Mosaic augmentation drawing its tiles from a cross-batch reservoir.
+
+    `Mosaic` combines every image with 3 other images of the same batch, so
+    small batches yield little diversity. `ReservoirMosaic` instead keeps a
+    bounded reservoir of the tiles of the samples seen in previous batches,
+    and draws the 3 partner tiles of every mosaic from both the current batch
+    and the reservoir. The tiles of a batch are written to the reservoir
+    after the batch is augmented, replacing the oldest tiles once the
+    reservoir is full.
+
+    Every image is resized once to a tile of half its height and width, with
+    its labels, bounding boxes and segmentation masks. The 4 tiles of a
+    mosaic are placed around the mosaic center, as in the YOLOv5
+    implementation, and the parts of the output not covered by a tile are
+    filled with `fill_value`. Labels are in the same ratio as the area of
+    their tiles in the output image.
+
+    The reservoir is created on the first call, so the inputs must have the
+    same keys and, apart from the batch size, the same shapes on every call.
+    It is not saved with the layer.
+
+    Args:
+        offset: A tuple of two floats, a single float or
+            `keras_cv.FactorSampler`. `offset` is used to determine the offset
+            of the mosaic center from the top-left corner of the output. If a
+            tuple is used, the x and y coordinates of the mosaic center are
+            sampled between the two values for every image augmented. If a
+            single float is used, a value between `0.0` and the passed float is
+            sampled. Defaults to (0.25, 0.75).
+        reservoir_size: integer, the number of tiles kept in the reservoir.
+            Defaults to 64.
+        max_boxes: integer, the number of bounding boxes kept per tile. Extra
+            boxes are dropped. Defaults to 100.
+        fill_value: a float, the value of the pixels not covered by a tile.
+            Defaults to 0.0.
+        bounding_box_format: a case-insensitive string (for example, "xyxy") to
+            be passed if bounding boxes are being augmented by this layer.
+            For detailed information on the supported formats, see the
+            [KerasCV bounding box documentation](https://keras.io/api/keras_cv/bounding_box/formats/).
+            Defaults to None.
+        seed: integer, used to create a random seed.
+
+    Example:
+    ```python
+    mosaic = keras_cv.layers.ReservoirMosaic(
+        reservoir_size=64, bounding_box_format="xywh"
+    )
+    dataset = dataset.batch(8).map(mosaic)
+    ```
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        offset=(0.25, 0.75),
+        reservoir_size=64,
+        max_boxes=100,
+        fill_value=0.0,
+        bounding_box_format=None,
+        seed=None,
+        **kwargs,
+    ):
+        super().__init__(
+            offset=offset,
+            bounding_box_format=bounding_box_format,
+            seed=seed,
+            **kwargs,
+        )
+        if reservoir_size < 1:
+            raise ValueError(
+                "ReservoirMosaic expects `reservoir_size` to be a positive "
+                f"integer. Got: reservoir_size={reservoir_size}"
+            )
+        self.reservoir_size = reservoir_size
+        self.max_boxes = max_boxes
+        self.fill_value = fill_value
+        self._reservoir = None
+        self._reservoir_count = None
+
+    def get_random_transformation_batch(
+        self,
+        batch_size,
+        images=None,
+        labels=None,
+        bounding_boxes=None,
+        segmentation_masks=None,
+        **kwargs,
+    ):
+        tiles = self._make_tiles(
+            images, labels, bounding_boxes, segmentation_masks
+        )
+        self._build_reservoir(tiles)
+
+        # Partners are drawn from the current batch, indices below
+        # `batch_size`, and from the filled part of the reservoir.
+        num_filled = tf.cast(
+            tf.minimum(self._reservoir_count, self.reservoir_size), tf.int32
+        )
+        partners = self._random_generator.uniform(
+            (batch_size, 3),
+            minval=0,
+            maxval=batch_size + num_filled,
+            dtype=tf.int32,
+        )
+        from_batch = partners < batch_size
+        batch_indices = tf.minimum(partners, batch_size - 1)
+        reservoir_indices = tf.maximum(partners - batch_size, 0)
+
+        mosaic_tiles = {}
+        for key, batch_tiles in tiles.items():
+            partner_tiles = _select(
+                from_batch,
+                tf.gather(batch_tiles, batch_indices),
+                tf.gather(self._reservoir[key], reservoir_indices),
+            )
+            mosaic_tiles[key] = tf.concat(
+                [batch_tiles[:, tf.newaxis], partner_tiles], axis=1
+            )
+
+        # The reads above happen before the writes, as stateful ops run in
+        # program order.
+        self._update_reservoir(tiles, batch_size)
+
+        mosaic_centers_x = self.center_sampler(
+            shape=(batch_size,), dtype=self.compute_dtype
+        )
+        mosaic_centers_y = self.center_sampler(
+            shape=(batch_size,), dtype=self.compute_dtype
+        )
+        mosaic_centers = tf.stack((mosaic_centers_x, mosaic_centers_y), axis=-1)
+
+        return {TILES: mosaic_tiles, "mosaic_centers": mosaic_centers}
+
+    def augment_images(self, images, transformations, **kwargs):
+        return self._compose(
+            transformations[TILES]["images"],
+            transformations["mosaic_centers"],
+            images.shape[1:3],
+            self.fill_value,
+        )
+
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
+    ):
+        return self._compose(
+            transformations[TILES]["segmentation_masks"],
+            transformations["mosaic_centers"],
+            segmentation_masks.shape[1:3],
+            0,
+        )
+
+    def augment_labels(self, labels, transformations, images=None, **kwargs):
+        height, width = images.shape[1:3]
+        centers_x, centers_y = self._integer_centers(
+            transformations["mosaic_centers"], height, width
+        )
+        tile_height, tile_width = height // 2, width // 2
+        # the visible extent of the 4 tiles, ordered as their quadrants
+        top = tf.minimum(centers_y, tile_height)
+        bottom = tf.minimum(height - centers_y, tile_height)
+        left = tf.minimum(centers_x, tile_width)
+        right = tf.minimum(width - centers_x, tile_width)
+        areas = tf.cast(
+            tf.stack(
+                [top * left, top * right, bottom * left, bottom * right],
+                axis=-1,
+            ),
+            labels.dtype,
+        )
+        ratios = areas / tf.reduce_sum(areas, axis=-1, keepdims=True)
+        return tf.einsum("bk,bkc->bc", ratios, transformations[TILES]["labels"])
+
+    def augment_bounding_boxes(
+        self, bounding_boxes, transformations, images=None, **kwargs
+    ):
+        batch_size = tf.shape(images)[0]
+        height, width = images.shape[1:3]
+        centers_x, centers_y = self._integer_centers(
+            transformations["mosaic_centers"], height, width
+        )
+        tile_height, tile_width = height // 2, width // 2
+        # values to translate the tile boxes by in the mosaic image
+        left = centers_x - tile_width
+        top = centers_y - tile_height
+        translate_x = tf.stack([left, centers_x, left, centers_x], axis=-1)
+        translate_y = tf.stack([top, top, centers_y, centers_y], axis=-1)
+        translate_values = tf.stack(
+            [translate_x, translate_y, translate_x, translate_y], axis=-1
+        )
+        translate_values = tf.cast(translate_values, self.compute_dtype)
+
+        tiles = transformations[TILES]
+        boxes = tiles["boxes"] + translate_values[:, :, tf.newaxis]
+        boxes_for_mosaic = {
+            "boxes": tf.reshape(boxes, [batch_size, -1, 4]),
+            "classes": tf.reshape(tiles["classes"], [batch_size, -1]),
+        }
+        boxes_for_mosaic = bounding_box.clip_to_image(
+            boxes_for_mosaic,
+            bounding_box_format="xyxy",
+            images=images,
+        )
+        return bounding_box.convert_format(
+            boxes_for_mosaic,
+            source="xyxy",
+            target=self.bounding_box_format,
+            images=images,
+            dtype=self.compute_dtype,
+        )
+
+    def _make_tiles(self, images, labels, bounding_boxes, segmentation_masks):
+        """Resizes the samples of a batch to tiles of half their size."""
+        height, width = images.shape[1:3]
+        if height is None or width is None:
+            raise ValueError(
+                "ReservoirMosaic expects images with a static height and "
+                f"width. Got: images.shape={images.shape}"
+            )
+        tile_size = (height // 2, width // 2)
+        tiles = {
+            "images": tf.cast(
+                tf.image.resize(images, tile_size), self.compute_dtype
+            )
+        }
+        if labels is not None:
+            tiles["labels"] = labels
+        if bounding_boxes is not None:
+            bounding_boxes = bounding_box.to_dense(bounding_boxes)
+            bounding_boxes = bounding_box.convert_format(
+                bounding_boxes,
+                source=self.bounding_box_format,
+                target="xyxy",
+                images=images,
+                dtype=self.compute_dtype,
+            )
+            scale = tf.constant(
+                [
+                    tile_size[1] / width,
+                    tile_size[0] / height,
+                    tile_size[1] / width,
+                    tile_size[0] / height,
+                ],
+                self.compute_dtype,
+            )
+            tiles["boxes"] = _pad_boxes(
+                bounding_boxes["boxes"] * scale, self.max_boxes
+            )
+            tiles["classes"] = _pad_boxes(
+                tf.cast(bounding_boxes["classes"], self.compute_dtype),
+                self.max_boxes,
+            )
+        if segmentation_masks is not None:
+            tiles["segmentation_masks"] = tf.image.resize(
+                segmentation_masks, tile_size, method="nearest"
+            )
+        return tiles
+
+    def _build_reservoir(self, tiles):
+        if self._reservoir is not None:
+            return
+        # The reservoir outlives the graphs the layer may be traced in.
+        with tf.init_scope():
+            self._reservoir = {
+                key: tf.Variable(
+                    tf.zeros(
+                        (self.reservoir_size,) + tuple(value.shape[1:]),
+                        value.dtype,
+                    ),
+                    trainable=False,
+                )
+                for key, value in tiles.items()
+            }
+            self._reservoir_count = tf.Variable(
+                0, dtype=tf.int64, trainable=False
+            )
+
+    def _update_reservoir(self, tiles, batch_size):
+        # Only the last `reservoir_size` samples of a larger batch are kept,
+        # so that no slot is written twice.
+        start = tf.maximum(batch_size - self.reservoir_size, 0)
+        slots = (
+            self._reservoir_count
+            + tf.cast(tf.range(start, batch_size), tf.int64)
+        ) % self.reservoir_size
+        for key, value in tiles.items():
+            self._reservoir[key].scatter_nd_update(
+                slots[:, tf.newaxis], value[start:]
+            )
+        self._reservoir_count.assign_add(tf.cast(batch_size, tf.int64))
+
+    def _integer_centers(self, mosaic_centers, height, width):
+        centers_x = tf.cast(tf.round(mosaic_centers[..., 0] * width), tf.int32)
+        centers_y = tf.cast(tf.round(mosaic_centers[..., 1] * height), tf.int32)
+        return centers_x, centers_y
+
+    def _compose(self, tiles, mosaic_centers, output_size, fill_value):
+        """Places the `[batch_size, 4, ...]` tiles around the centers."""
+        height, width = output_size
+        tile_height, tile_width = tiles.shape[2:4]
+        centers_x, centers_y = self._integer_centers(
+            mosaic_centers, height, width
+        )
+        # the 4 tiles form a grid, which is translated to the mosaic center
+        tops = tf.concat([tiles[:, 0], tiles[:, 1]], axis=2)
+        bottoms = tf.concat([tiles[:, 2], tiles[:, 3]], axis=2)
+        grids = tf.concat([tops, bottoms], axis=1)
+
+        rows = tf.range(height)[tf.newaxis] - centers_y[:, tf.newaxis]
+        rows += tile_height
+        cols = tf.range(width)[tf.newaxis] - centers_x[:, tf.newaxis]
+        cols += tile_width
+        outputs = tf.gather(
+            grids,
+            tf.clip_by_value(rows, 0, 2 * tile_height - 1),
+            axis=1,
+            batch_dims=1,
+        )
+        outputs = tf.gather(
+            outputs,
+            tf.clip_by_value(cols, 0, 2 * tile_width - 1),
+            axis=2,
+            batch_dims=1,
+        )
+        inside = ((rows >= 0) & (rows < 2 * tile_height))[:, :, tf.newaxis] & (
+            (cols >= 0) & (cols < 2 * tile_width)
+        )[:, tf.newaxis]
+        return tf.where(
+            inside[..., tf.newaxis],
+            outputs,
+            tf.cast(fill_value, outputs.dtype),
+        )
+
+    def get_config(self):
+        config = super().get_config()
+        config.update(
+            {
+                "reservoir_size": self.reservoir_size,
+                "max_boxes": self.max_boxes,
+                "fill_value": self.fill_value,
+            }
+        )
+        return config
+
+
+def _select(condition, x, y):
+    """Selects along the leading `[batch_size, 3]` dimensions of `x`, `y`."""
+    condition = tf.reshape(
+        condition, tf.concat([tf.shape(condition), [1] * (x.shape.rank - 2)], 0)
+    )
+    return tf.where(condition, x, y)
+
+
+def _pad_boxes(values, max_boxes):
+    """Pads or truncates the boxes dimension of `values` to `max_boxes`."""
+    values = values[:, :max_boxes]
+    padding = [[0, 0], [0, max_boxes - tf.shape(values)[1]]]
+    padding += [[0, 0]] * (values.shape.rank - 2)
+    values = tf.pad(values, padding, constant_values=-1)
+    return tf.ensure_shape(
+        values, [None, max_boxes] + values.shape[2:].as_list()
+    )
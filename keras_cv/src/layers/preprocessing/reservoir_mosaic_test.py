@@ -0,0 +1,138 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from keras_cv.src.layers.preprocessing.reservoir_mosaic import ReservoirMosaic
+from keras_cv.src.tests.test_case import TestCase
+
+num_classes = 10
+
+
+class ReservoirMosaicTest(TestCase):
+    def test_return_shapes(self):
+        input_shape = (2, 64, 64, 3)
+        xs = tf.ones(input_shape)
+        ys_labels = tf.one_hot([0, 1], num_classes)
+        ys_bounding_boxes = {
+            "boxes": tf.random.uniform((2, 3, 4), 0, 1),
+            "classes": tf.random.uniform((2, 3), 0, 1),
+        }
+        ys_segmentation_masks = tf.cast(
+            2 * tf.random.uniform(input_shape), tf.int32
+        )
+        layer = ReservoirMosaic(bounding_box_format="xywh")
+
+        for _ in range(2):
+            outputs = layer(
+                {
+                    "images": xs,
+                    "labels": ys_labels,
+                    "bounding_boxes": ys_bounding_boxes,
+                    "segmentation_masks": ys_segmentation_masks,
+                }
+            )
+
+        self.assertEqual(outputs["images"].shape, input_shape)
+        self.assertEqual(outputs["labels"].shape, [2, 10])
+        self.assertEqual(outputs["bounding_boxes"]["boxes"].shape, [2, None, 4])
+        self.assertEqual(outputs["bounding_boxes"]["classes"].shape, [2, None])
+        self.assertEqual(outputs["segmentation_masks"].shape, input_shape)
+
+    def test_draws_partners_from_previous_batches(self):
+        images = tf.ones((2, 8, 8, 1))
+        labels = tf.one_hot([0, 0], 2)
+        layer = ReservoirMosaic(offset=(0.5, 0.5), reservoir_size=4, seed=1)
+        layer({"images": 2 * images, "labels": tf.one_hot([1, 1], 2)})
+
+        outputs = layer({"images": images, "labels": labels})
+
+        # The top-left tile comes from the current batch, and the partners
+        # are drawn from both batches.
+        self.assertAllClose(outputs["images"][:, :4, :4], images[:, :4, :4])
+        self.assertAllGreater(outputs["labels"][:, 0], 0.0)
+        self.assertAllGreater(tf.reduce_max(outputs["labels"][:, 1]), 0.0)
+        self.assertAllClose(tf.reduce_sum(outputs["labels"], axis=-1), [1, 1])
+
+    def test_reservoir_keeps_last_samples(self):
+        layer = ReservoirMosaic(reservoir_size=3)
+        images = tf.reshape(tf.range(5, dtype=tf.float32), (5, 1, 1, 1))
+        images = tf.tile(images, (1, 4, 4, 1))
+
+        layer({"images": images, "labels": tf.one_hot(tf.range(5), 5)})
+
+        self.assertEqual(int(layer._reservoir_count), 5)
+        self.assertAllClose(
+            np.sort(layer._reservoir["images"].numpy()[:, 0, 0, 0]), [2, 3, 4]
+        )
+
+    def test_tiles_are_placed_around_center(self):
+        images = tf.reshape(tf.range(64, dtype=tf.float32), (1, 8, 8, 1))
+        layer = ReservoirMosaic(offset=(0.75, 0.75), fill_value=-1.0)
+
+        outputs = layer({"images": images, "labels": tf.ones((1, 1))})
+
+        # The output is a single image, so every tile is the same.
+        tile = tf.image.resize(images, (4, 4))[0]
+        outputs = outputs["images"][0]
+        self.assertAllClose(outputs[2:6, 2:6], tile)
+        self.assertAllClose(outputs[6:, 6:], tile[:2, :2])
+        self.assertAllClose(outputs[:2], -tf.ones((2, 8, 1)))
+
+    def test_translates_bounding_boxes(self):
+        images = tf.zeros((1, 8, 8, 3))
+        bounding_boxes = {
+            "boxes": tf.constant([[[0.0, 0.0, 4.0, 4.0]]]),
+            "classes": tf.constant([[1.0]]),
+        }
+        layer = ReservoirMosaic(offset=(0.5, 0.5), bounding_box_format="xyxy")
+
+        outputs = layer({"images": images, "bounding_boxes": bounding_boxes})
+
+        self.assertAllClose(
+            outputs["bounding_boxes"]["boxes"].to_tensor(),
+            [[[0, 0, 2, 2], [4, 0, 6, 2], [0, 4, 2, 6], [4, 4, 6, 6]]],
+        )
+
+    @pytest.mark.tf_only
+    def test_in_tf_data(self):
+        images = tf.random.uniform((8, 16, 16, 3))
+        labels = tf.one_hot(tf.range(8) % 2, 2)
+        layer = ReservoirMosaic(reservoir_size=8)
+        dataset = (
+            tf.data.Dataset.from_tensor_slices(
+                {"images": images, "labels": labels}
+            )
+            .batch(2)
+            .map(layer)
+        )
+
+        for outputs in dataset:
+            self.assertEqual(outputs["images"].shape, (2, 16, 16, 3))
+        self.assertEqual(int(layer._reservoir_count), 8)
+
+    def test_image_input_only(self):
+        layer = ReservoirMosaic()
+        with self.assertRaisesRegexp(
+            ValueError, "expects inputs in a dictionary"
+        ):
+            layer(tf.ones((2, 8, 8, 3)))
+
+    def test_config(self):
+        layer = ReservoirMosaic(reservoir_size=16, max_boxes=10)
+        config = layer.get_config()
+        self.assertEqual(config["reservoir_size"], 16)
+        self.assertEqual(config["max_boxes"], 10)
+        self.assertEqual(ReservoirMosaic.from_config(config).max_boxes, 10)
@@ -146,12 +146,12 @@ class Resizing(BaseImageAugmentationLayer):
             inputs["images"] = images
 
         if bounding_boxes is not None:
-            outputs["bounding_boxes"]["classes"] = tf.squeeze(
-                outputs["bounding_boxes"]["classes"], axis=0
-            )
-            outputs["bounding_boxes"]["boxes"] = tf.squeeze(
-                outputs["bounding_boxes"]["boxes"], axis=0
-            )
+            outputs["bounding_boxes"]["classes"] = outputs["bounding_boxes"][
+                "classes"
+            ][0]
+            outputs["bounding_boxes"]["boxes"] = outputs["bounding_boxes"][
+                "boxes"
+            ][0]
             inputs["bounding_boxes"] = outputs["bounding_boxes"]
 
         if segmentation_masks is not None:
@@ -183,106 +183,115 @@ class Resizing(BaseImageAugmentationLayer):
         return inputs
 
     def _resize_with_pad(self, inputs):
-        def resize_single_with_pad_to_aspect(x):
-            image = x.get("images", None)
-            bounding_boxes = x.get("bounding_boxes", None)
-            segmentation_masks = x.get("segmentation_masks", None)
-
-            # images must be dense-able at this point.
-            if isinstance(image, tf.RaggedTensor):
-                image = image.to_tensor()
-
-            img_size = tf.shape(image)
-            img_height = tf.cast(img_size[H_AXIS], self.compute_dtype)
-            img_width = tf.cast(img_size[W_AXIS], self.compute_dtype)
-            if bounding_boxes is not None:
-                bounding_boxes = bounding_box.to_dense(bounding_boxes)
-                bounding_boxes = bounding_box.convert_format(
-                    bounding_boxes,
-                    image_shape=img_size,
-                    source=self.bounding_box_format,
-                    target="rel_xyxy",
-                )
-
-            # how much we scale height by to hit target height
-            height_scale = self.height / img_height
-            width_scale = self.width / img_width
+        images = inputs.get("images", None)
+        bounding_boxes = inputs.get("bounding_boxes", None)
+        segmentation_masks = inputs.get("segmentation_masks", None)
 
-            resize_scale = tf.math.minimum(height_scale, width_scale)
-            target_height = img_height * resize_scale
-            target_width = img_width * resize_scale
+        image_heights, image_widths = self._image_sizes(images)
+        # how much we scale height by to hit target height
+        height_scales = self.height / tf.cast(image_heights, self.compute_dtype)
+        width_scales = self.width / tf.cast(image_widths, self.compute_dtype)
+        resize_scales = tf.math.minimum(height_scales, width_scales)
+        target_heights = tf.cast(
+            tf.cast(image_heights, self.compute_dtype) * resize_scales,
+            tf.int32,
+        )
+        target_widths = tf.cast(
+            tf.cast(image_widths, self.compute_dtype) * resize_scales,
+            tf.int32,
+        )
 
-            image = tf.image.resize(
-                image,
-                size=(target_height, target_width),
+        if isinstance(images, tf.RaggedTensor):
+            resized_images = self._map_resize_with_pad(
+                images,
+                target_heights,
+                target_widths,
+                self._interpolation_method,
+            )
+        else:
+            # The images of a dense batch share their size, so the batch is
+            # resized at once.
+            resized_images = tf.image.resize(
+                images,
+                size=(target_heights[0], target_widths[0]),
                 method=self._interpolation_method,
             )
-            if bounding_boxes is not None:
-                bounding_boxes = bounding_box.convert_format(
-                    bounding_boxes,
-                    images=image,
-                    source="rel_xyxy",
-                    target="xyxy",
-                )
-            image = tf.image.pad_to_bounding_box(
-                image, 0, 0, self.height, self.width
+            resized_images = tf.image.pad_to_bounding_box(
+                resized_images, 0, 0, self.height, self.width
             )
-            if bounding_boxes is not None:
-                bounding_boxes = bounding_box.clip_to_image(
-                    bounding_boxes, images=image, bounding_box_format="xyxy"
-                )
-                bounding_boxes = bounding_box.convert_format(
-                    bounding_boxes,
-                    images=image,
-                    source="xyxy",
-                    target=self.bounding_box_format,
-                )
-            inputs["images"] = image
+        outputs = {"images": tf.cast(resized_images, self.compute_dtype)}
 
-            if bounding_boxes is not None:
-                inputs["bounding_boxes"] = bounding_box.to_ragged(
-                    bounding_boxes
-                )
+        if bounding_boxes is not None:
+            bounding_boxes = bounding_box.to_dense(bounding_boxes)
+            bounding_boxes = bounding_box.convert_format(
+                bounding_boxes,
+                images=images,
+                source=self.bounding_box_format,
+                target="rel_xyxy",
+            )
+            scales = tf.cast(
+                tf.stack([target_widths, target_heights] * 2, axis=-1),
+                bounding_boxes["boxes"].dtype,
+            )
+            bounding_boxes["boxes"] = (
+                bounding_boxes["boxes"] * scales[:, tf.newaxis, :]
+            )
+            bounding_boxes = bounding_box.clip_to_image(
+                bounding_boxes,
+                images=outputs["images"],
+                bounding_box_format="xyxy",
+            )
+            bounding_boxes = bounding_box.convert_format(
+                bounding_boxes,
+                images=outputs["images"],
+                source="xyxy",
+                target=self.bounding_box_format,
+            )
+            outputs["bounding_boxes"] = bounding_box.to_ragged(bounding_boxes)
 
-            if segmentation_masks is not None:
+        if segmentation_masks is not None:
+            segmentation_masks = tf.cast(segmentation_masks, "float32")
+            if isinstance(segmentation_masks, tf.RaggedTensor):
+                segmentation_masks = self._map_resize_with_pad(
+                    segmentation_masks, target_heights, target_widths, "nearest"
+                )
+            else:
                 segmentation_masks = tf.image.resize(
                     segmentation_masks,
-                    size=(target_height, target_width),
+                    size=(target_heights[0], target_widths[0]),
                     method="nearest",
                 )
                 segmentation_masks = tf.image.pad_to_bounding_box(
-                    tf.cast(segmentation_masks, dtype="float32"),
-                    0,
-                    0,
-                    self.height,
-                    self.width,
+                    segmentation_masks, 0, 0, self.height, self.width
                 )
-                inputs["segmentation_masks"] = segmentation_masks
-
-            return inputs
-
-        size_as_shape = tf.TensorShape((self.height, self.width))
-        shape = size_as_shape + inputs["images"].shape[-1:]
-        img_spec = tf.TensorSpec(shape, self.compute_dtype)
-        fn_output_signature = {"images": img_spec}
+            outputs["segmentation_masks"] = tf.cast(
+                segmentation_masks, self.compute_dtype
+            )
 
-        bounding_boxes = inputs.get("bounding_boxes", None)
-        if bounding_boxes is not None:
-            boxes_spec = self._compute_bounding_box_signature(bounding_boxes)
-            fn_output_signature["bounding_boxes"] = boxes_spec
+        return {**inputs, **outputs}
 
-        segmentation_masks = inputs.get("segmentation_masks", None)
-        if segmentation_masks is not None:
-            seg_map_shape = (
-                size_as_shape + inputs["segmentation_masks"].shape[-1:]
+    def _map_resize_with_pad(
+        self, images, target_heights, target_widths, interpolation_method
+    ):
+        # Ragged images have distinct sizes, so they are resized one at a time.
+        def resize_single_with_pad_to_aspect(x):
+            image, target_height, target_width = x
+            image = tf.image.resize(
+                image.to_tensor(),
+                size=(target_height, target_width),
+                method=interpolation_method,
+            )
+            return tf.image.pad_to_bounding_box(
+                image, 0, 0, self.height, self.width
             )
-            seg_map_spec = tf.TensorSpec(seg_map_shape, self.compute_dtype)
-            fn_output_signature["segmentation_masks"] = seg_map_spec
 
         return tf.map_fn(
             resize_single_with_pad_to_aspect,
-            inputs,
-            fn_output_signature=fn_output_signature,
+            (images, target_heights, target_widths),
+            fn_output_signature=tf.TensorSpec(
+                (self.height, self.width) + tuple(images.shape[-1:]),
+                tf.float32,
+            ),
         )
 
     def _resize_with_crop(self, inputs):
@@ -356,6 +365,23 @@ class Resizing(BaseImageAugmentationLayer):
 
         return inputs
 
+    def _image_sizes(self, images):
+        """Returns the heights and widths of a batch of images."""
+        if not isinstance(images, tf.RaggedTensor):
+            shape = tf.shape(images)
+            batch_size = shape[0:1]
+            return tf.fill(batch_size, shape[H_AXIS]), tf.fill(
+                batch_size, shape[W_AXIS]
+            )
+        heights = tf.cast(images.row_lengths(), tf.int32)
+        if isinstance(images.values, tf.RaggedTensor):
+            # the width of an image is the length of its first row
+            widths = tf.gather(images.values.row_lengths(), images.row_starts())
+            widths = tf.where(heights > 0, tf.cast(widths, tf.int32), 0)
+        else:
+            widths = tf.fill(tf.shape(heights), tf.shape(images.values)[1])
+        return heights, widths
+
     def _check_inputs(self, inputs):
         for key in inputs:
             if key not in supported_keys:
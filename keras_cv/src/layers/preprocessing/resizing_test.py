@@ -341,3 +341,98 @@ class ResizingTest(TestCase):
         self.assertAllEqual(
             expected_output_seg_masks, outputs["segmentation_masks"]
         )
+
+    def test_pad_to_aspect_ratio_batch(self):
+        images = tf.random.uniform((2, 8, 4, 3))
+        labels = tf.one_hot([0, 1], 2)
+        bounding_boxes = {
+            "boxes": tf.constant([[[0, 0, 2, 4]], [[2, 4, 4, 8]]], "float32"),
+            "classes": tf.constant([[0], [1]], "float32"),
+        }
+        layer = cv_layers.Resizing(
+            4, 4, pad_to_aspect_ratio=True, bounding_box_format="xyxy"
+        )
+
+        outputs = layer(
+            {
+                "images": images,
+                "labels": labels,
+                "bounding_boxes": bounding_boxes,
+            }
+        )
+
+        self.assertAllClose(
+            outputs["images"][:, :, :2], tf.image.resize(images, (4, 2))
+        )
+        self.assertAllClose(outputs["images"][:, :, 2:], tf.zeros((2, 4, 2, 3)))
+        self.assertAllClose(outputs["labels"], labels)
+        self.assertAllClose(
+            outputs["bounding_boxes"]["boxes"].to_tensor(),
+            [[[0, 0, 1, 2]], [[1, 2, 2, 4]]],
+        )
+
+    def test_pad_to_aspect_ratio_batch_upsample(self):
+        images = tf.random.uniform((4, 24, 32, 3))
+        bounding_boxes = {
+            "boxes": tf.tile(
+                tf.constant([[[2.0, 2.0, 20.0, 16.0]]]), (4, 4, 1)
+            ),
+            "classes": tf.zeros((4, 4)),
+        }
+        layer = cv_layers.Resizing(
+            40, 40, pad_to_aspect_ratio=True, bounding_box_format="xyxy"
+        )
+
+        outputs = layer({"images": images, "bounding_boxes": bounding_boxes})
+
+        # Images are scaled by 40 / 32 = 1.25 and padded at the bottom.
+        self.assertAllClose(
+            outputs["images"][:, :30], tf.image.resize(images, (30, 40))
+        )
+        self.assertAllClose(outputs["images"][:, 30:], tf.zeros((4, 10, 40, 3)))
+        self.assertAllClose(
+            outputs["bounding_boxes"]["boxes"].to_tensor(),
+            tf.tile(tf.constant([[[2.5, 2.5, 25.0, 20.0]]]), (4, 4, 1)),
+        )
+
+    @parameterized.named_parameters(
+        ("pad_bilinear", "bilinear", False),
+        ("pad_nearest", "nearest", False),
+        ("pad_bicubic", "bicubic", False),
+        ("crop_bilinear", "bilinear", True),
+        ("crop_nearest", "nearest", True),
+    )
+    @pytest.mark.tf_only
+    def test_ragged_images_match_resizing_every_image(
+        self, interpolation, crop_to_aspect_ratio
+    ):
+        images = [
+            tf.random.uniform((h, w, 3)) for h, w in [(17, 23), (40, 9), (8, 8)]
+        ]
+        masks = [
+            tf.cast(tf.random.uniform(image.shape[:2] + (1,)) * 3, "float32")
+            for image in images
+        ]
+        layer = cv_layers.Resizing(
+            12,
+            16,
+            interpolation=interpolation,
+            crop_to_aspect_ratio=crop_to_aspect_ratio,
+            pad_to_aspect_ratio=not crop_to_aspect_ratio,
+        )
+
+        outputs = layer(
+            {
+                "images": tf.ragged.stack(images),
+                "segmentation_masks": tf.ragged.stack(masks),
+            }
+        )
+
+        for i, (image, mask) in enumerate(zip(images, masks)):
+            self.assertAllClose(outputs["images"][i], layer(image), atol=1e-5)
+            self.assertAllClose(
+                outputs["segmentation_masks"][i],
+                layer({"images": image, "segmentation_masks": mask})[
+                    "segmentation_masks"
+                ],
+            )
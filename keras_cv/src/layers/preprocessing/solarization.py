@@ -12,10 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import tensorflow as tf
-
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import keras
+from keras_cv.src.backend import ops
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
@@ -73,6 +72,9 @@ class Solarization(VectorizedBaseImageAugmentationLayer):
             or [height, width, channels].
     """
 
+    _supports_backend_native = True
+    _supports_uint8 = True
+
     def __init__(
         self,
         value_range,
@@ -113,6 +115,7 @@ class Solarization(VectorizedBaseImageAugmentationLayer):
     def augment_images(self, images, transformations, **kwargs):
         thresholds = transformations["thresholds"]
         additions = transformations["additions"]
+        images = ops.cast(images, self.compute_dtype)
         images = preprocessing.transform_value_range(
             images,
             original_range=self.value_range,
@@ -120,8 +123,8 @@ class Solarization(VectorizedBaseImageAugmentationLayer):
             dtype=self.compute_dtype,
         )
         results = images + additions
-        results = tf.clip_by_value(results, 0, 255)
-        results = tf.where(results < thresholds, results, 255 - results)
+        results = ops.clip(results, 0, 255)
+        results = ops.where(results < thresholds, results, 255 - results)
         results = preprocessing.transform_value_range(
             results,
             original_range=(0, 255),
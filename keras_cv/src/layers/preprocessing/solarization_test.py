@@ -98,3 +98,17 @@ class SolarizationTest(TestCase):
         outputs = layer(images)
 
         self.assertNotAllEqual(outputs[0], outputs[1])
+
+    def test_rescaled_value_range(self):
+        images = tf.random.uniform((16, 32, 32, 3))
+        layer = Solarization(
+            value_range=(0, 1),
+            threshold_factor=(200, 200),
+            addition_factor=(100, 100),
+        )
+
+        outputs = layer(images)
+
+        expected = tf.clip_by_value(images * 255 + 100, 0, 255)
+        expected = tf.where(expected < 200, expected, 255 - expected) / 255
+        self.assertAllClose(outputs, expected)
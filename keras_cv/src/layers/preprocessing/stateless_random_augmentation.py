@@ -0,0 +1,139 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+
+import tensorflow as tf
+
+from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.backend import keras
+from keras_cv.src.layers.preprocessing.base_image_augmentation_layer import (
+    IMAGES,
+)
+from keras_cv.src.utils import preprocessing
+from keras_cv.src.utils import stateless_random
+from keras_cv.src.utils.stateless_random import SAMPLE_INDICES
+
+
+@keras_cv_export("keras_cv.layers.StatelessRandomAugmentation")
+class StatelessRandomAugmentation(keras.layers.Layer):
+    """Derives the randomness of an augmentation layer from sample indices.
+
+    Augmentation layers draw their random numbers from a stateful
+    `tf.random.Generator`, so their output depends on the order in which they
+    are called, and parallel calls from a `tf.data` pipeline contend for the
+    generator. `StatelessRandomAugmentation` instead keys every random draw
+    of the wrapped layer, and of all the layers it contains, by
+    `(seed, epoch, sample index)` with a counter-based generator. The
+    augmentation of a sample is then reproducible regardless of batching,
+    interleaving or `num_parallel_calls`, and an interrupted training can be
+    resumed with the exact same augmentations.
+
+    The draws of layers that sample from a whole batch, such as the
+    permutation of `MixUp`, are keyed by the index of the first sample of the
+    batch.
+
+    Args:
+        layer: the augmentation layer to wrap. It may be a container of other
+            augmentation layers, e.g. `keras_cv.layers.RandAugment`.
+        seed: integer, the seed of the random draws.
+
+    Call arguments:
+        inputs: the inputs of `layer`.
+        sample_indices: integer scalar for a single sample, or integer tensor
+            of shape `[batch_size]` for a batch, the indices of the samples
+            within the dataset.
+        epoch: integer scalar, the current epoch. Defaults to 0.
+
+    Example:
+    ```python
+    augmenter = keras_cv.layers.StatelessRandomAugmentation(
+        keras_cv.layers.RandAugment(value_range=(0, 255)), seed=1337
+    )
+
+    def augment(sample_index, inputs):
+        return augmenter(inputs, sample_indices=sample_index, epoch=epoch)
+
+    dataset = dataset.enumerate().map(
+        augment, num_parallel_calls=tf.data.AUTOTUNE
+    )
+    ```
+    """
+
+    def __init__(self, layer, seed=0, **kwargs):
+        super().__init__(**kwargs)
+        self.layer = layer
+        self.seed = seed
+        self._convert_input_args = False
+        self._allow_non_tensor_positional_args = True
+        self.built = True
+        # The draws are keyed by their order, which must not depend on the
+        # branches taken by `tf.cond()`, so the layer always runs as a graph.
+        self._eager_stateless_call = tf.function(self._stateless_call)
+
+    def call(self, inputs, sample_indices, epoch=0):
+        is_dict = isinstance(inputs, dict)
+        inputs = dict(inputs) if is_dict else {IMAGES: inputs}
+        inputs[SAMPLE_INDICES] = tf.cast(sample_indices, tf.int64)
+        if tf.executing_eagerly():
+            stateless_call = self._eager_stateless_call
+        else:
+            stateless_call = self._stateless_call
+        outputs = stateless_call(inputs, tf.cast(epoch, tf.int64))
+        return outputs if is_dict else outputs[IMAGES]
+
+    def _stateless_call(self, inputs, epoch):
+        state = stateless_random.StatelessRandomState(
+            self.seed, epoch, inputs[SAMPLE_INDICES]
+        )
+        with self._stateless_layers(state):
+            outputs = dict(self.layer(inputs))
+        outputs.pop(SAMPLE_INDICES, None)
+        return outputs
+
+    @contextlib.contextmanager
+    def _stateless_layers(self, state):
+        """Swaps the random generators of the wrapped layers for the scope.
+
+        Every layer gets its own `StatelessRandomGenerator`, which also backs
+        the random factor samplers of the layer.
+        """
+        replaced = []
+        for salt, layer in enumerate(self.layer._flatten_layers()):
+            if not hasattr(layer, "_random_generator"):
+                continue
+            random_generator = stateless_random.StatelessRandomGenerator(
+                state, salt
+            )
+            stateless_attributes = {"_random_generator": random_generator}
+            for name, value in vars(layer).items():
+                if stateless_random.is_random_factor_sampler(value):
+                    stateless_attributes[name] = (
+                        preprocessing.GeneratorFactorSampler(
+                            value, random_generator
+                        )
+                    )
+            for name, value in stateless_attributes.items():
+                replaced.append((layer, name, getattr(layer, name)))
+                setattr(layer, name, value)
+        try:
+            yield
+        finally:
+            for layer, name, value in reversed(replaced):
+                setattr(layer, name, value)
+
+    def get_config(self):
+        config = super().get_config()
+        config.update({"layer": self.layer, "seed": self.seed})
+        return config
@@ -0,0 +1,150 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import tensorflow as tf
+from absl.testing import parameterized
+
+from keras_cv.src.layers import preprocessing
+from keras_cv.src.tests.test_case import TestCase
+
+
+class StatelessRandomAugmentationTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.images = np.random.uniform(0, 255, (4, 16, 16, 3)).astype(
+            "float32"
+        )
+
+    @parameterized.named_parameters(
+        ("vectorized", lambda: preprocessing.RandomRotation(0.2)),
+        ("factor_sampler", lambda: preprocessing.RandomBrightness(0.3)),
+        (
+            "per_sample",
+            lambda: preprocessing.RandomChoice(
+                [preprocessing.RandomFlip(), preprocessing.RandomZoom(0.2)]
+            ),
+        ),
+        (
+            "rand_augment",
+            lambda: preprocessing.RandAugment(
+                value_range=(0, 255), vectorized=False
+            ),
+        ),
+    )
+    def test_independent_of_batching(self, layer_fn):
+        augmenter = preprocessing.StatelessRandomAugmentation(
+            layer_fn(), seed=7
+        )
+
+        batch = augmenter(self.images, sample_indices=tf.range(4))
+        samples = [
+            augmenter(self.images[i], sample_indices=i) for i in range(4)
+        ]
+
+        self.assertAllClose(batch, tf.stack(samples), atol=1e-3)
+        self.assertNotAllClose(batch, self.images)
+
+    def test_reproducible_per_seed_and_epoch(self):
+        layer = preprocessing.RandomTranslation(0.3, 0.3)
+        augmenter = preprocessing.StatelessRandomAugmentation(layer, seed=7)
+        indices = tf.range(4)
+
+        outputs = augmenter(self.images, sample_indices=indices, epoch=3)
+
+        self.assertAllClose(
+            outputs, augmenter(self.images, sample_indices=indices, epoch=3)
+        )
+        self.assertNotAllClose(
+            outputs, augmenter(self.images, sample_indices=indices, epoch=4)
+        )
+        other_seed = preprocessing.StatelessRandomAugmentation(layer, seed=8)
+        self.assertNotAllClose(
+            outputs, other_seed(self.images, sample_indices=indices, epoch=3)
+        )
+
+    def test_graph_mode_matches_eager(self):
+        augmenter = preprocessing.StatelessRandomAugmentation(
+            preprocessing.RandAugment(value_range=(0, 255)), seed=7
+        )
+
+        @tf.function
+        def augment(images, sample_indices):
+            return augmenter(images, sample_indices=sample_indices)
+
+        self.assertAllClose(
+            augment(self.images, tf.range(4)),
+            augmenter(self.images, sample_indices=tf.range(4)),
+        )
+
+    def test_independent_of_parallel_interleaving(self):
+        augmenter = preprocessing.StatelessRandomAugmentation(
+            preprocessing.RandomCropAndResize(
+                target_size=(8, 8),
+                crop_area_factor=(0.5, 1.0),
+                aspect_ratio_factor=(0.75, 1.25),
+            ),
+            seed=7,
+        )
+        dataset = tf.data.Dataset.from_tensor_slices(
+            np.random.uniform(size=(16, 16, 16, 3)).astype("float32")
+        ).enumerate()
+
+        sequential = dataset.map(lambda i, x: augmenter(x, sample_indices=i))
+        parallel = dataset.shuffle(16).map(
+            lambda i, x: augmenter(x, sample_indices=i),
+            num_parallel_calls=tf.data.AUTOTUNE,
+            deterministic=False,
+        )
+
+        self.assertEqual(
+            sorted(x.tobytes() for x in sequential.as_numpy_iterator()),
+            sorted(x.tobytes() for x in parallel.as_numpy_iterator()),
+        )
+
+    def test_dict_inputs(self):
+        augmenter = preprocessing.StatelessRandomAugmentation(
+            preprocessing.MixUp(), seed=7
+        )
+        inputs = {
+            "images": self.images,
+            "labels": np.eye(4, dtype="float32"),
+        }
+
+        outputs = augmenter(inputs, sample_indices=tf.range(4))
+
+        self.assertEqual(set(outputs.keys()), {"images", "labels"})
+        self.assertAllClose(
+            outputs["images"],
+            augmenter(inputs, sample_indices=tf.range(4))["images"],
+        )
+
+    def test_restores_random_generators(self):
+        layer = preprocessing.RandomContrast(value_range=(0, 255), factor=0.5)
+        random_generator, factor = layer._random_generator, layer.factor
+        augmenter = preprocessing.StatelessRandomAugmentation(layer, seed=7)
+
+        augmenter(self.images, sample_indices=tf.range(4))
+
+        self.assertIs(layer._random_generator, random_generator)
+        self.assertIs(layer.factor, factor)
+
+    def test_config(self):
+        layer = preprocessing.RandomFlip()
+        augmenter = preprocessing.StatelessRandomAugmentation(layer, seed=7)
+
+        config = augmenter.get_config()
+
+        self.assertEqual(config["layer"], layer)
+        self.assertEqual(config["seed"], 7)
@@ -12,16 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+
 import tensorflow as tf
 import tree
 
 from keras_cv.src import bounding_box
+from keras_cv.src import core
 from keras_cv.src.api_export import keras_cv_export
 from keras_cv.src.backend import config
 from keras_cv.src.backend import keras
 from keras_cv.src.backend import ops
+from keras_cv.src.backend import random
 from keras_cv.src.backend import scope
+from keras_cv.src.layers.preprocessing import augmentation_profiler
 from keras_cv.src.utils import preprocessing
+from keras_cv.src.utils import stateless_random
 
 H_AXIS = -3
 W_AXIS = -2
@@ -95,11 +101,59 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
     also includes a keras_backend.RandomGenerator, which can be used to
     produce the random numbers. The random number generator is stored in the
     `self._random_generator` attribute.
+
+    By default, the layer runs TensorFlow ops whatever the Keras backend, so
+    that it can be used in a `tf.data` pipeline. Layers that set
+    `_supports_backend_native = True` can instead be created with
+    `backend_native=True` to run with `keras.ops` and `keras.random` only,
+    e.g. within a jitted JAX train step or a torch `DataLoader` worker. Such
+    layers must implement `get_random_transformation_batch()` and the
+    `augment_*()` methods with `keras.ops`, and draw their random numbers
+    from `self._random_generator`. In this mode the layer supports dense
+    images, labels and segmentation masks, and draws from a
+    `keras.random.SeedGenerator` whose state is a non-trainable variable of
+    the layer: within a jitted JAX function, call the layer with
+    `layer.stateless_call()`.
+
+    Images are cast to the compute dtype of the layer, usually `float32`.
+    Layers whose augmentation is exact, or nearly so, on `uint8` pixels, such
+    as flips, crops and cutouts, set `_supports_uint8 = True` and can be
+    created with `preserve_uint8=True`. `uint8` images then stay `uint8`
+    through the layer, with intermediate results rounded back to `uint8`, so
+    a stack of such layers reads and writes a quarter of the bytes of
+    `float32` images. Layers that compute in floats, such as `Solarization`,
+    still cast internally, so the mode pays off most for layers that only
+    move or replace pixels. The first layer without the option casts the
+    images to floats. Images of other dtypes are cast as usual.
     """
 
-    def __init__(self, seed=None, **kwargs):
+    _supports_backend_native = False
+    _supports_uint8 = False
+
+    def __init__(
+        self, seed=None, backend_native=False, preserve_uint8=False, **kwargs
+    ):
         super().__init__(**kwargs)
-        if seed:
+        if preserve_uint8 and not self._supports_uint8:
+            raise ValueError(
+                f"`{type(self).__name__}` does not support "
+                "`preserve_uint8=True`."
+            )
+        self.preserve_uint8 = preserve_uint8
+        self.backend_native = backend_native
+        if backend_native:
+            if not self._supports_backend_native:
+                raise ValueError(
+                    f"`{type(self).__name__}` does not support "
+                    "`backend_native=True`."
+                )
+            if not config.keras_3():
+                raise ValueError("`backend_native=True` requires Keras 3.")
+            self._seed_generator = random.SeedGenerator(seed)
+            self._random_generator = preprocessing.BackendRandomGenerator(
+                self._seed_generator
+            )
+        elif seed:
             self._random_generator = tf.random.Generator.from_seed(seed=seed)
         else:
             self._random_generator = tf.random.get_global_generator()
@@ -315,6 +369,9 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
             segmentation_mask=segmentation_masks,
             transformation=transformation,
         )
+        # `uint8` images are rounded back to `uint8` after the `map_fn`, whose
+        # signature has the compute dtype.
+        images = tf.cast(images, self.compute_dtype)
         return tf.RaggedTensor.from_tensor(images)
 
     def _batch_augment(self, inputs):
@@ -325,7 +382,10 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
         keypoints = inputs.get(KEYPOINTS, None)
         segmentation_masks = inputs.get(SEGMENTATION_MASKS, None)
 
-        batch_size = tf.shape(images)[0]
+        if self.backend_native:
+            batch_size = ops.shape(images)[0]
+        else:
+            batch_size = tf.shape(images)[0]
 
         transformations = self.get_random_transformation_batch(
             batch_size,
@@ -337,13 +397,17 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
         )
 
         if isinstance(images, tf.RaggedTensor):
+            augmentation_profiler.record_path(self, "map_fn")
             inputs_for_raggeds = {"transformations": transformations, **inputs}
             images = tf.map_fn(
-                self._unwrap_ragged_image_call,
+                augmentation_profiler.per_sample(
+                    self._unwrap_ragged_image_call
+                ),
                 inputs_for_raggeds,
                 fn_output_signature=self.compute_ragged_image_signature(images),
             )
         else:
+            augmentation_profiler.record_path(self, "vectorized")
             images = self.augment_images(
                 images,
                 transformations=transformations,
@@ -375,7 +439,8 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
                 images=images,
                 raw_images=raw_images,
             )
-            bounding_boxes = bounding_box.to_ragged(bounding_boxes)
+            if not self.backend_native:
+                bounding_boxes = bounding_box.to_ragged(bounding_boxes)
             result[BOUNDING_BOXES] = bounding_boxes
 
         if keypoints is not None:
@@ -411,6 +476,17 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
         return result
 
     def call(self, inputs):
+        if self.backend_native:
+            if isinstance(inputs, dict) and (
+                BOUNDING_BOXES in inputs or KEYPOINTS in inputs
+            ):
+                raise ValueError(
+                    "`backend_native=True` does not support bounding boxes "
+                    f"and keypoints. Got inputs with keys {list(inputs)}."
+                )
+            with self._backend_native_factor_samplers():
+                return self._augment_inputs(inputs)
+
         # try to convert a given backend native tensor to TensorFlow tensor
         # before passing it over to TFDataScope
         is_tf_backend = config.backend() == "tensorflow"
@@ -427,19 +503,7 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
                 lambda x: tf.convert_to_tensor(x), inputs
             )
         with scope.TFDataScope():
-            inputs = self._ensure_inputs_are_compute_dtype(inputs)
-            inputs, metadata = self._format_inputs(inputs)
-            images = inputs[IMAGES]
-            if images.shape.rank == 3 or images.shape.rank == 4:
-                outputs = self._format_output(
-                    self._batch_augment(inputs), metadata
-                )
-            else:
-                raise ValueError(
-                    "Image augmentation layers are expecting inputs to be "
-                    "rank 3 (HWC) or 4D (NHWC) tensors. Got shape: "
-                    f"{images.shape}"
-                )
+            outputs = self._augment_inputs(inputs)
         # convert the outputs to backend native tensors if none of them
         # contain RaggedTensors. Note that if the user passed in Raggeds
         # but the outputs are dense, we still don't want to convert to
@@ -456,9 +520,65 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
                 )
         return outputs
 
+    def _augment_inputs(self, inputs):
+        inputs = self._ensure_inputs_are_compute_dtype(inputs)
+        inputs, metadata = self._format_inputs(inputs)
+        images = inputs[IMAGES]
+        if len(images.shape) not in (3, 4):
+            raise ValueError(
+                "Image augmentation layers are expecting inputs to be "
+                "rank 3 (HWC) or 4D (NHWC) tensors. Got shape: "
+                f"{images.shape}"
+            )
+        with stateless_random.sample_indices_scope(
+            self._random_generator, inputs
+        ):
+            if self.backend_native:
+                outputs = self._batch_augment(inputs)
+            else:
+                outputs = augmentation_profiler.profile_call(
+                    self, self._batch_augment, inputs
+                )
+        if self._image_dtype(images) == "uint8":
+            outputs[IMAGES] = self._round_to_uint8(outputs[IMAGES])
+        return self._format_output(outputs, metadata)
+
+    def _round_to_uint8(self, images):
+        if isinstance(images, tf.RaggedTensor):
+            return tf.ragged.map_flat_values(self._round_to_uint8, images)
+        if "uint8" in str(images.dtype):
+            return images
+        return ops.cast(ops.clip(ops.round(images), 0, 255), "uint8")
+
+    @contextlib.contextmanager
+    def _backend_native_factor_samplers(self):
+        """Draws the factors of the layer from its generator for the scope.
+
+        `FactorSampler`s draw with `tf.random`, so they are swapped for
+        `GeneratorFactorSampler`s backed by `self._random_generator`.
+        """
+        factor_samplers = {
+            name: value
+            for name, value in vars(self).items()
+            if isinstance(value, core.FactorSampler)
+        }
+        for name, value in factor_samplers.items():
+            setattr(
+                self,
+                name,
+                preprocessing.GeneratorFactorSampler(
+                    value, self._random_generator
+                ),
+            )
+        try:
+            yield
+        finally:
+            for name, value in factor_samplers.items():
+                setattr(self, name, value)
+
     def _format_inputs(self, inputs):
         metadata = {IS_DICT: True, USE_TARGETS: False}
-        if tf.is_tensor(inputs):
+        if not isinstance(inputs, dict):
             # single image input tensor
             metadata[IS_DICT] = False
             inputs = {IMAGES: inputs}
@@ -466,8 +586,8 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
             # Copy the input dict before we mutate it.
             inputs = dict(inputs)
 
-        metadata[BATCHED] = inputs["images"].shape.rank == 4
-        if inputs["images"].shape.rank == 3:
+        metadata[BATCHED] = len(inputs["images"].shape) == 4
+        if len(inputs["images"].shape) == 3:
             for key in list(inputs.keys()):
                 if key == BOUNDING_BOXES:
                     inputs[BOUNDING_BOXES]["boxes"] = tf.expand_dims(
@@ -477,7 +597,7 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
                         inputs[BOUNDING_BOXES]["classes"], axis=0
                     )
                 else:
-                    inputs[key] = tf.expand_dims(inputs[key], axis=0)
+                    inputs[key] = ops.expand_dims(inputs[key], axis=0)
 
         if not isinstance(inputs, dict):
             raise ValueError(
@@ -510,7 +630,7 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
                         output[BOUNDING_BOXES]["classes"], axis=0
                     )
                 else:
-                    output[key] = tf.squeeze(output[key], axis=0)
+                    output[key] = ops.squeeze(output[key], axis=0)
 
         if not metadata[IS_DICT]:
             return output[IMAGES]
@@ -520,43 +640,62 @@ class VectorizedBaseImageAugmentationLayer(keras.layers.Layer):
         return output
 
     def _ensure_inputs_are_compute_dtype(self, inputs):
+        if self.backend_native:
+            ensure_tensor = ops.cast
+        else:
+            ensure_tensor = preprocessing.ensure_tensor
         if not isinstance(inputs, dict):
-            return preprocessing.ensure_tensor(
+            return ensure_tensor(
                 inputs,
-                self.compute_dtype,
+                self._image_dtype(inputs),
             )
         # Copy the input dict before we mutate it.
         inputs = dict(inputs)
-        inputs[IMAGES] = preprocessing.ensure_tensor(
+        inputs[IMAGES] = ensure_tensor(
             inputs[IMAGES],
-            self.compute_dtype,
+            self._image_dtype(inputs[IMAGES]),
         )
         if LABELS in inputs:
-            inputs[LABELS] = preprocessing.ensure_tensor(
+            inputs[LABELS] = ensure_tensor(
                 inputs[LABELS],
                 self.compute_dtype,
             )
         if KEYPOINTS in inputs:
-            inputs[KEYPOINTS] = preprocessing.ensure_tensor(
+            inputs[KEYPOINTS] = ensure_tensor(
                 inputs[KEYPOINTS],
                 self.compute_dtype,
             )
         if SEGMENTATION_MASKS in inputs:
-            inputs[SEGMENTATION_MASKS] = preprocessing.ensure_tensor(
+            inputs[SEGMENTATION_MASKS] = ensure_tensor(
                 inputs[SEGMENTATION_MASKS],
                 self.compute_dtype,
             )
         if BOUNDING_BOXES in inputs:
-            inputs[BOUNDING_BOXES]["boxes"] = preprocessing.ensure_tensor(
+            inputs[BOUNDING_BOXES]["boxes"] = ensure_tensor(
                 inputs[BOUNDING_BOXES]["boxes"],
                 self.compute_dtype,
             )
-            inputs[BOUNDING_BOXES]["classes"] = preprocessing.ensure_tensor(
+            inputs[BOUNDING_BOXES]["classes"] = ensure_tensor(
                 inputs[BOUNDING_BOXES]["classes"],
                 self.compute_dtype,
             )
         return inputs
 
+    def _image_dtype(self, images):
+        if self.preserve_uint8 and "uint8" in str(
+            getattr(images, "dtype", None)
+        ):
+            return "uint8"
+        return self.compute_dtype
+
+    def get_config(self):
+        config = super().get_config()
+        if self.backend_native:
+            config["backend_native"] = True
+        if self.preserve_uint8:
+            config["preserve_uint8"] = True
+        return config
+
     def _format_bounding_boxes(self, bounding_boxes):
         # We can't catch the case where this is None, sometimes RaggedTensor
         # drops this dimension.
@@ -14,10 +14,14 @@
 import numpy as np
 import pytest
 import tensorflow as tf
+from absl.testing import parameterized
 
 from keras_cv.src import bounding_box
+from keras_cv.src import core
+from keras_cv.src.backend import config
 from keras_cv.src.backend import keras
 from keras_cv.src.backend import ops
+from keras_cv.src.layers import preprocessing
 from keras_cv.src.layers.preprocessing.vectorized_base_image_augmentation_layer import (  # noqa: E501
     VectorizedBaseImageAugmentationLayer,
 )
@@ -61,6 +65,24 @@ class VectorizedRandomAddLayer(VectorizedBaseImageAugmentationLayer):
         return segmentation_masks + transformations[:, None, None, None]
 
 
+class BackendNativeRandomAddLayer(VectorizedBaseImageAugmentationLayer):
+    _supports_backend_native = True
+
+    def get_random_transformation_batch(self, batch_size, **kwargs):
+        return self._random_generator.uniform((batch_size,))
+
+    def augment_images(self, images, transformations, **kwargs):
+        return images + transformations[:, None, None, None]
+
+    def augment_labels(self, labels, transformations, **kwargs):
+        return labels + transformations[:, None]
+
+    def augment_segmentation_masks(
+        self, segmentation_masks, transformations, **kwargs
+    ):
+        return segmentation_masks + transformations[:, None, None, None]
+
+
 TF_ALL_TENSOR_TYPES = (tf.Tensor, tf.RaggedTensor, tf.SparseTensor)
 
 
@@ -561,3 +583,220 @@ class VectorizedBaseImageAugmentationLayerTest(TestCase):
             pass
         self.assertTrue(isinstance(output["images"], tf.Tensor))
         self.assertAllClose(output["images"], images + 2.0)
+
+
+@pytest.mark.skipif(not config.keras_3(), reason="Requires Keras 3")
+class BackendNativeTest(TestCase):
+    def test_augments_dict_inputs(self):
+        layer = BackendNativeRandomAddLayer(backend_native=True)
+        images = np.zeros((4, 8, 8, 3), "float32")
+        labels = np.zeros((4, 2), "float32")
+
+        outputs = layer(
+            {"images": images, "labels": labels, "segmentation_masks": images}
+        )
+
+        additions = ops.convert_to_numpy(outputs["images"])[:, 0, 0, 0]
+        self.assertAllClose(outputs["labels"], np.stack([additions] * 2, 1))
+        self.assertAllClose(outputs["segmentation_masks"], outputs["images"])
+        self.assertNotAllClose(additions, additions[0] * np.ones(4))
+
+    def test_augments_unbatched_images(self):
+        layer = BackendNativeRandomAddLayer(backend_native=True)
+
+        outputs = layer(np.zeros((8, 8, 3), "float32"))
+
+        self.assertEqual(outputs.shape, (8, 8, 3))
+
+    def test_stateless_call(self):
+        layer = BackendNativeRandomAddLayer(seed=1, backend_native=True)
+        images = np.zeros((2, 8, 8, 3), "float32")
+        layer(images)
+        non_trainable_variables = [
+            ops.convert_to_numpy(v) for v in layer.non_trainable_variables
+        ]
+
+        outputs, new_non_trainable_variables = layer.stateless_call(
+            [], non_trainable_variables, images
+        )
+        other_outputs, _ = layer.stateless_call(
+            [], non_trainable_variables, images
+        )
+
+        self.assertAllClose(outputs, other_outputs)
+        self.assertNotAllClose(
+            new_non_trainable_variables[0], non_trainable_variables[0]
+        )
+
+    @parameterized.named_parameters(
+        (
+            "random_flip",
+            lambda **kwargs: preprocessing.RandomFlip(
+                "horizontal_and_vertical", rate=1.0, **kwargs
+            ),
+        ),
+        (
+            "random_brightness",
+            lambda **kwargs: preprocessing.RandomBrightness(
+                (0.2, 0.2), **kwargs
+            ),
+        ),
+        (
+            "random_contrast",
+            lambda **kwargs: preprocessing.RandomContrast(
+                (0, 255), (0.5, -0.5), **kwargs
+            ),
+        ),
+        (
+            "grayscale",
+            lambda **kwargs: preprocessing.Grayscale(3, **kwargs),
+        ),
+        (
+            "solarization",
+            lambda **kwargs: preprocessing.Solarization(
+                (0, 255), (10, 10), (100, 100), **kwargs
+            ),
+        ),
+        (
+            "random_color_degeneration",
+            lambda **kwargs: preprocessing.RandomColorDegeneration(
+                (0.5, 0.5), **kwargs
+            ),
+        ),
+    )
+    def test_matches_tf_data_path(self, layer_fn):
+        images = np.random.uniform(0, 255, (2, 8, 8, 3)).astype("float32")
+
+        outputs = layer_fn(backend_native=True)(images)
+
+        self.assertAllClose(outputs, layer_fn()(images), atol=1e-3)
+
+    def test_restores_factor_samplers(self):
+        layer = preprocessing.RandomChannelShift(
+            (0, 255), 0.5, seed=1, backend_native=True
+        )
+        images = np.random.uniform(0, 255, (2, 8, 8, 3)).astype("float32")
+
+        outputs = layer(images)
+
+        self.assertIsInstance(layer.factor, core.UniformFactorSampler)
+        self.assertNotAllClose(outputs, images)
+
+    def test_raises_on_unsupported_layer(self):
+        with self.assertRaisesRegex(ValueError, "does not support"):
+            VectorizedRandomAddLayer(backend_native=True)
+
+    def test_raises_on_bounding_boxes(self):
+        layer = BackendNativeRandomAddLayer(backend_native=True)
+        inputs = {
+            "images": np.zeros((1, 8, 8, 3), "float32"),
+            "bounding_boxes": {
+                "boxes": np.zeros((1, 1, 4), "float32"),
+                "classes": np.zeros((1, 1), "float32"),
+            },
+        }
+
+        with self.assertRaisesRegex(ValueError, "bounding boxes"):
+            layer(inputs)
+
+    def test_config(self):
+        layer = preprocessing.RandomFlip(backend_native=True)
+
+        config = layer.get_config()
+        self.assertTrue(config["backend_native"])
+        self.assertTrue(
+            preprocessing.RandomFlip.from_config(config).backend_native
+        )
+        self.assertNotIn(
+            "backend_native", preprocessing.RandomFlip().get_config()
+        )
+
+
+class PreserveUint8Test(TestCase):
+    @parameterized.named_parameters(
+        (
+            "random_flip",
+            lambda **kwargs: preprocessing.RandomFlip(
+                "horizontal_and_vertical", rate=1.0, **kwargs
+            ),
+        ),
+        (
+            "channel_shuffle",
+            lambda **kwargs: preprocessing.ChannelShuffle(seed=1, **kwargs),
+        ),
+        (
+            "solarization",
+            lambda **kwargs: preprocessing.Solarization(
+                (0, 255), (10, 10), (100, 100), **kwargs
+            ),
+        ),
+        (
+            "posterization",
+            lambda **kwargs: preprocessing.Posterization((0, 255), 3, **kwargs),
+        ),
+        (
+            "equalization",
+            lambda **kwargs: preprocessing.Equalization((0, 255), **kwargs),
+        ),
+        (
+            "random_cutout",
+            lambda **kwargs: preprocessing.RandomCutout(
+                (0.5, 0.5), (0.5, 0.5), fill_value=7, seed=1, **kwargs
+            ),
+        ),
+    )
+    def test_matches_float_path(self, layer_fn):
+        images = np.random.randint(0, 256, (2, 8, 8, 3)).astype("uint8")
+
+        outputs = layer_fn(preserve_uint8=True)(images)
+
+        self.assertEqual(outputs.dtype, tf.uint8)
+        self.assertAllEqual(outputs, layer_fn()(images))
+
+    def test_rounds_float_results(self):
+        layer = preprocessing.Grayscale(3, preserve_uint8=True)
+        images = np.random.randint(0, 256, (2, 8, 8, 3)).astype("uint8")
+
+        outputs = layer(images)
+
+        self.assertEqual(outputs.dtype, tf.uint8)
+        self.assertAllClose(
+            outputs, preprocessing.Grayscale(3)(images), atol=1.0
+        )
+
+    def test_casts_other_inputs(self):
+        layer = preprocessing.RandomFlip(preserve_uint8=True)
+        images = np.zeros((2, 8, 8, 3), "uint8")
+
+        outputs = layer({"images": images, "labels": np.zeros((2, 2), "int32")})
+
+        self.assertEqual(outputs["images"].dtype, tf.uint8)
+        self.assertEqual(outputs["labels"].dtype, tf.float32)
+        self.assertEqual(layer(images.astype("float32")).dtype, tf.float32)
+
+    def test_ragged_images(self):
+        layer = preprocessing.RandomFlip(preserve_uint8=True)
+        images = tf.ragged.stack(
+            [tf.zeros((8, 8, 3), tf.uint8), tf.zeros((4, 8, 3), tf.uint8)]
+        )
+
+        outputs = layer(images)
+
+        self.assertIsInstance(outputs, tf.RaggedTensor)
+        self.assertEqual(outputs.dtype, tf.uint8)
+
+    def test_raises_on_unsupported_layer(self):
+        with self.assertRaisesRegex(ValueError, "does not support"):
+            VectorizedRandomAddLayer(preserve_uint8=True)
+
+    def test_config(self):
+        layer = preprocessing.RandomFlip(preserve_uint8=True)
+
+        config = layer.get_config()
+        self.assertTrue(config["preserve_uint8"])
+        self.assertTrue(
+            preprocessing.RandomFlip.from_config(config).preserve_uint8
+        )
+        self.assertNotIn(
+            "preserve_uint8", preprocessing.RandomFlip().get_config()
+        )
@@ -13,3 +13,4 @@
 # limitations under the License.
 from keras_cv.src.metrics.coco.pycoco_wrapper import PyCOCOWrapper
 from keras_cv.src.metrics.coco.pycoco_wrapper import compute_pycoco_metrics
+from keras_cv.src.metrics.coco.streaming_evaluator import StreamingCOCOEvaluator
@@ -0,0 +1,318 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming COCO evaluation shared by the mask and keypoint metrics.
+
+`compute_pycoco_metrics()` keeps every ground truth and prediction around
+until the very end and runs `COCOeval` once over the full dataset. For masks
+this means holding every dense mask in memory. `StreamingCOCOEvaluator`
+instead runs the per-image matching step of `COCOeval` as soon as a batch of
+images is added, keeps only the (small) per-image matching results and
+discards the masks and keypoints. The final accumulation over all images is
+identical to running `COCOeval` on the full dataset in one shot.
+"""
+
+import contextlib
+import io
+
+import numpy as np
+
+try:
+    from pycocotools import mask as mask_util
+    from pycocotools.coco import COCO
+    from pycocotools.cocoeval import COCOeval
+except ImportError:
+    mask_util = None
+    COCO = None
+    COCOeval = object
+
+from keras_cv.src.utils.conditional_imports import assert_pycocotools_installed
+
+MASK_METRIC_NAMES = [
+    "AP",
+    "AP50",
+    "AP75",
+    "APs",
+    "APm",
+    "APl",
+    "ARmax1",
+    "ARmax10",
+    "ARmax100",
+    "ARs",
+    "ARm",
+    "ARl",
+]
+
+KEYPOINT_METRIC_NAMES = [
+    "AP",
+    "AP50",
+    "AP75",
+    "APm",
+    "APl",
+    "AR",
+    "AR50",
+    "AR75",
+    "ARm",
+    "ARl",
+]
+
+IOU_TYPES = {
+    "segm": MASK_METRIC_NAMES,
+    "keypoints": KEYPOINT_METRIC_NAMES,
+}
+
+
+def encode_masks(masks):
+    """Run-length encodes a stack of binary masks.
+
+    Args:
+        masks: a numpy array of shape `[num_masks, height, width]`. Non-zero
+            values are considered to be part of the mask.
+
+    Returns:
+        A list of `num_masks` COCO RLE dictionaries.
+    """
+    assert_pycocotools_installed("encode_masks")
+    if masks.shape[0] == 0:
+        return []
+    # pycocotools encodes a full `[height, width, num_masks]` stack in a
+    # single call, as long as the array is Fortran ordered.
+    masks = np.asfortranarray(np.transpose(masks != 0, (1, 2, 0)), np.uint8)
+    return mask_util.encode(masks)
+
+
+def keypoints_to_boxes(keypoints, visibility):
+    """Computes `xywh` boxes tightly enclosing the visible keypoints.
+
+    Args:
+        keypoints: a numpy array of shape `[num_instances, num_keypoints, 2]`
+            in the `"xy"` format.
+        visibility: a boolean numpy array of shape
+            `[num_instances, num_keypoints]`.
+
+    Returns:
+        A numpy array of shape `[num_instances, 4]` in the `"xywh"` format.
+        Instances with no visible keypoints get an empty box.
+    """
+    any_visible = np.any(visibility, axis=-1, keepdims=True)
+    masked = np.where(visibility[..., None], keypoints, np.nan)
+    with np.errstate(invalid="ignore"):
+        top_left = np.where(any_visible, np.nanmin(masked, axis=1), 0.0)
+        bottom_right = np.where(any_visible, np.nanmax(masked, axis=1), 0.0)
+    return np.concatenate([top_left, bottom_right - top_left], axis=-1)
+
+
+class _COCOeval(COCOeval):
+    """`COCOeval` with a vectorized object keypoint similarity."""
+
+    def computeOks(self, imgId, catId):
+        p = self.params
+        gts = self._gts[imgId, catId]
+        dts = self._dts[imgId, catId]
+        inds = np.argsort([-d["score"] for d in dts], kind="mergesort")
+        dts = [dts[i] for i in inds][: p.maxDets[-1]]
+        if len(gts) == 0 or len(dts) == 0:
+            return []
+
+        sigmas = np.asarray(p.kpt_oks_sigmas)
+        variances = (sigmas * 2) ** 2
+        g = np.array([gt["keypoints"] for gt in gts]).reshape(len(gts), -1, 3)
+        d = np.array([dt["keypoints"] for dt in dts]).reshape(len(dts), -1, 3)
+        visible = g[..., 2] > 0
+        any_visible = np.any(visible, axis=-1)
+        bboxes = np.array([gt["bbox"] for gt in gts])
+        areas = np.array([gt["area"] for gt in gts])
+
+        # [num_dts, num_gts, num_keypoints] distances to the ground truth
+        # keypoints, or to the doubled ground truth box when no keypoint is
+        # visible.
+        xd, yd = d[:, None, :, 0], d[:, None, :, 1]
+        x0 = (bboxes[:, 0] - bboxes[:, 2])[None, :, None]
+        x1 = (bboxes[:, 0] + bboxes[:, 2] * 2)[None, :, None]
+        y0 = (bboxes[:, 1] - bboxes[:, 3])[None, :, None]
+        y1 = (bboxes[:, 1] + bboxes[:, 3] * 2)[None, :, None]
+        dx_outside = np.maximum(0, x0 - xd) + np.maximum(0, xd - x1)
+        dy_outside = np.maximum(0, y0 - yd) + np.maximum(0, yd - y1)
+        use_keypoints = any_visible[None, :, None]
+        dx = np.where(use_keypoints, xd - g[None, :, :, 0], dx_outside)
+        dy = np.where(use_keypoints, yd - g[None, :, :, 1], dy_outside)
+
+        e = (
+            (dx**2 + dy**2)
+            / variances
+            / (areas[None, :, None] + np.spacing(1))
+            / 2
+        )
+        weights = np.where(any_visible[:, None], visible, True)
+        return np.sum(np.exp(-e) * weights[None], axis=-1) / np.sum(
+            weights, axis=-1
+        )
+
+
+class StreamingCOCOEvaluator:
+    """Incrementally evaluates COCO mask or keypoint predictions.
+
+    Ground truths and predictions are added one batch of images at a time
+    with `add_images()`. Each batch is matched immediately and only the
+    per-image matching results are kept, so memory usage grows with the
+    number of detections rather than with the number of pixels.
+
+    Args:
+        iou_type: one of `"segm"` or `"keypoints"`.
+        kpt_oks_sigmas: (Optional) per-keypoint OKS falloff constants, only
+            used when `iou_type="keypoints"`. Defaults to the 17 COCO person
+            keypoint sigmas.
+    """
+
+    def __init__(self, iou_type, kpt_oks_sigmas=None):
+        assert_pycocotools_installed("StreamingCOCOEvaluator")
+        if iou_type not in IOU_TYPES:
+            raise ValueError(
+                "StreamingCOCOEvaluator() expects `iou_type` to be one of "
+                f"{list(IOU_TYPES.keys())}. Got iou_type={iou_type}"
+            )
+        self.iou_type = iou_type
+        self.metric_names = IOU_TYPES[iou_type]
+        self.kpt_oks_sigmas = kpt_oks_sigmas
+        self.reset()
+
+    def reset(self):
+        self._eval_imgs = {}
+        self._image_ids = []
+        self._category_ids = set()
+        self._next_annotation_id = 1
+
+    def _evaluator(self, image_ids, category_ids):
+        evaluator = _COCOeval(iouType=self.iou_type)
+        evaluator.params.imgIds = image_ids
+        evaluator.params.catIds = category_ids
+        if self.kpt_oks_sigmas is not None:
+            evaluator.params.kpt_oks_sigmas = np.asarray(
+                self.kpt_oks_sigmas, dtype=np.float64
+            )
+        return evaluator
+
+    def _to_coco(self, image_ids, category_ids, annotations):
+        images = {image_id: {"id": image_id} for image_id in image_ids}
+        for annotation in annotations:
+            if "segmentation" in annotation:
+                # `COCO.annToRLE()` looks up the image size, even for
+                # annotations that are already run-length encoded.
+                height, width = annotation["segmentation"]["size"]
+                images[annotation["image_id"]].update(
+                    height=height, width=width
+                )
+        coco = COCO()
+        coco.dataset = {
+            "images": list(images.values()),
+            "categories": [{"id": c} for c in category_ids],
+            "annotations": annotations,
+        }
+        coco.createIndex()
+        return coco
+
+    def _annotate(self, image_id, annotations):
+        for annotation in annotations:
+            annotation = dict(annotation, image_id=image_id, iscrowd=0)
+            annotation["id"] = self._next_annotation_id
+            self._next_annotation_id += 1
+            yield annotation
+
+    def add_images(self, groundtruths, detections):
+        """Matches a batch of images and stores the matching results.
+
+        Args:
+            groundtruths: a list with one entry per image, each a list of
+                COCO annotation dictionaries. Every annotation needs
+                `"category_id"`, `"area"` and `"bbox"` keys, plus
+                `"segmentation"` for masks or `"keypoints"` and
+                `"num_keypoints"` for keypoints.
+            detections: a list with one entry per image, each a list of
+                annotation dictionaries with the same keys as
+                `groundtruths` and an additional `"score"`.
+        """
+        if len(groundtruths) != len(detections):
+            raise ValueError(
+                "add_images() expects `groundtruths` and `detections` to "
+                "have one entry per image. Got "
+                f"len(groundtruths)={len(groundtruths)}, "
+                f"len(detections)={len(detections)}"
+            )
+        first_image_id = len(self._image_ids) + 1
+        image_ids = list(
+            range(first_image_id, first_image_id + len(groundtruths))
+        )
+        self._image_ids.extend(image_ids)
+
+        gt_annotations = []
+        dt_annotations = []
+        for image_id, gts, dts in zip(image_ids, groundtruths, detections):
+            gt_annotations.extend(self._annotate(image_id, gts))
+            dt_annotations.extend(self._annotate(image_id, dts))
+
+        gt_category_ids = {ann["category_id"] for ann in gt_annotations}
+        self._category_ids.update(gt_category_ids)
+        category_ids = sorted(
+            gt_category_ids | {ann["category_id"] for ann in dt_annotations}
+        )
+        if not category_ids:
+            return
+
+        evaluator = self._evaluator(image_ids, category_ids)
+        with contextlib.redirect_stdout(io.StringIO()):
+            evaluator.cocoGt = self._to_coco(
+                image_ids, category_ids, gt_annotations
+            )
+            evaluator.cocoDt = self._to_coco(
+                image_ids, category_ids, dt_annotations
+            )
+            evaluator.evaluate()
+
+        area_ranges = evaluator.params.areaRng
+        for eval_img in evaluator.evalImgs:
+            if eval_img is None:
+                continue
+            key = (
+                eval_img["category_id"],
+                area_ranges.index(eval_img["aRng"]),
+                eval_img["image_id"],
+            )
+            self._eval_imgs[key] = eval_img
+
+    def summarize(self):
+        """Accumulates all matching results into the COCO summary metrics.
+
+        Returns:
+            A dictionary mapping each of `self.metric_names` to its value.
+        """
+        if not self._category_ids:
+            return {name: 0.0 for name in self.metric_names}
+
+        category_ids = sorted(self._category_ids)
+        evaluator = self._evaluator(self._image_ids, category_ids)
+        num_areas = len(evaluator.params.areaRng)
+        evaluator.evalImgs = [
+            self._eval_imgs.get((category_id, area_index, image_id))
+            for category_id in category_ids
+            for area_index in range(num_areas)
+            for image_id in self._image_ids
+        ]
+        evaluator._paramsEval = evaluator.params
+        with contextlib.redirect_stdout(io.StringIO()):
+            evaluator.accumulate()
+            evaluator.summarize()
+
+        return {
+            name: evaluator.stats[i].astype(np.float32)
+            for i, name in enumerate(self.metric_names)
+        }
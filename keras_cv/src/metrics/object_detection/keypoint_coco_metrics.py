@@ -0,0 +1,218 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import tensorflow as tf
+
+from keras_cv.src import bounding_box
+from keras_cv.src import keypoint
+from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.backend import ops
+from keras_cv.src.metrics.coco.streaming_evaluator import keypoints_to_boxes
+from keras_cv.src.metrics.object_detection.streaming_coco_metrics import (
+    StreamingCOCOMetrics,
+)
+
+METRIC_MAPPING = {
+    "AP": "MaP",
+    "AP50": "MaP@[OKS=50]",
+    "AP75": "MaP@[OKS=75]",
+    "APm": "MaP@[area=medium]",
+    "APl": "MaP@[area=large]",
+    "AR": "Recall@[max_detections=20]",
+    "AR50": "Recall@[OKS=50]",
+    "AR75": "Recall@[OKS=75]",
+    "ARm": "Recall@[area=medium]",
+    "ARl": "Recall@[area=large]",
+}
+
+
+@keras_cv_export("keras_cv.metrics.KeypointCOCOMetrics")
+class KeypointCOCOMetrics(StreamingCOCOMetrics):
+    """KeypointCOCOMetrics computes standard COCO keypoint (OKS) metrics.
+
+    Predicted keypoint groups are matched to the ground truth using the object
+    keypoint similarity (OKS), computed for all prediction and ground truth
+    pairs of an image at once. Like `MaskCOCOMetrics`, matching happens in
+    `update_state()` and only the matching results are kept across batches.
+
+    Args:
+        keypoint_format: the keypoint format of the inputs, for example
+            `"xy"`. Refer to `keras_cv.keypoint.convert_format()` for the
+            supported formats.
+        evaluate_freq: the number of steps to run before each evaluation.
+            Due to the high computational cost of metric evaluation the final
+            results are only updated once every `evaluate_freq` steps. Higher
+            values will allow for faster training times, while lower numbers
+            allow for higher numerical precision in metric reporting.
+        kpt_oks_sigmas: (Optional) list of per-keypoint OKS falloff constants,
+            one per keypoint. Defaults to the 17 COCO person keypoint sigmas.
+        bounding_box_format: (Optional) the format of the `"boxes"` entry of
+            `y_true`. Only required when `y_true` contains boxes.
+        image_shape: (Optional) `(height, width)` of the evaluated images.
+            Required when `keypoint_format` or `bounding_box_format` is a
+            relative format.
+
+    Example:
+    Inputs to `y_true` must be dictionaries of the form
+    `{"keypoints": keypoints, "classes": classes}`, where `keypoints` has
+    shape `[batch_size, num_instances, num_keypoints, 2]` and `classes` has
+    shape `[batch_size, num_instances]`. Instances with a class of `-1` are
+    treated as padding. `y_true` may also contain a boolean `"visibility"`
+    entry of shape `[batch_size, num_instances, num_keypoints]`, and a
+    `"boxes"` entry used to compute the instance scale. When `"boxes"` is
+    omitted, the box enclosing the visible keypoints is used instead. `y_pred`
+    must contain `"keypoints"`, `"classes"` and a `"confidence"` entry of
+    shape `[batch_size, num_instances]`.
+
+    ```python
+    keypoints = np.random.uniform(0, 256, size=(4, 3, 17, 2))
+    y_true = {"keypoints": keypoints, "classes": np.ones((4, 3))}
+    y_pred = {
+        "keypoints": keypoints + np.random.normal(size=keypoints.shape),
+        "classes": np.ones((4, 3)),
+        "confidence": np.random.uniform(size=(4, 3)),
+    }
+
+    metric = keras_cv.metrics.KeypointCOCOMetrics("xy", evaluate_freq=1)
+    metric.update_state(y_true, y_pred)
+    metric.result()
+    ```
+    """
+
+    default_name = "keypoint_coco_metrics"
+    iou_type = "keypoints"
+    metric_mapping = METRIC_MAPPING
+
+    def __init__(
+        self,
+        keypoint_format,
+        evaluate_freq,
+        kpt_oks_sigmas=None,
+        bounding_box_format=None,
+        image_shape=None,
+        name=None,
+        **kwargs,
+    ):
+        super().__init__(
+            evaluate_freq, kpt_oks_sigmas=kpt_oks_sigmas, name=name, **kwargs
+        )
+        self.keypoint_format = keypoint_format
+        self.kpt_oks_sigmas = kpt_oks_sigmas
+        self.bounding_box_format = bounding_box_format
+        self.image_shape = image_shape
+
+    def _images(self):
+        if self.image_shape is None:
+            return None
+        # Converters only read the spatial dimensions of `images`, so an
+        # empty channel axis avoids allocating an actual image.
+        height, width = self.image_shape[:2]
+        return tf.zeros((1, height, width, 0))
+
+    def _to_xy(self, keypoints):
+        keypoints = keypoint.convert_format(
+            keypoints,
+            source=self.keypoint_format,
+            target="xy",
+            images=self._images(),
+        )
+        keypoints = ops.convert_to_numpy(keypoints).astype(np.float64)
+        return keypoints[..., [keypoint.XY.X, keypoint.XY.Y]]
+
+    def _groups_to_annotations(
+        self, keypoints, classes, visibility, boxes=None, confidence=None
+    ):
+        valid = classes >= 0
+        keypoints = keypoints[valid]
+        visibility = visibility[valid]
+        if boxes is None:
+            boxes = keypoints_to_boxes(keypoints, visibility)
+        else:
+            boxes = boxes[valid]
+        areas = boxes[:, 2] * boxes[:, 3]
+        if confidence is not None:
+            confidence = confidence[valid]
+
+        # COCO stores keypoints as flat [x1, y1, v1, x2, y2, v2, ...] lists,
+        # with v=2 for labeled and visible keypoints.
+        flat_keypoints = np.concatenate(
+            [keypoints, 2.0 * visibility[..., None]], axis=-1
+        ).reshape(len(keypoints), -1)
+        annotations = []
+        for i, category_id in enumerate(classes[valid]):
+            annotation = {
+                "category_id": int(category_id),
+                "keypoints": flat_keypoints[i].tolist(),
+                "num_keypoints": int(np.sum(visibility[i])),
+                "area": float(areas[i]),
+                "bbox": boxes[i].tolist(),
+            }
+            if confidence is not None:
+                annotation["score"] = float(confidence[i])
+            annotations.append(annotation)
+        return annotations
+
+    def _to_annotations(self, y_true, y_pred):
+        gt_keypoints = self._to_xy(y_true["keypoints"])
+        gt_classes = ops.convert_to_numpy(y_true["classes"])
+        if "visibility" in y_true:
+            gt_visibility = ops.convert_to_numpy(y_true["visibility"]) > 0
+        else:
+            gt_visibility = np.ones(gt_keypoints.shape[:-1], dtype=bool)
+        gt_boxes = [None] * len(gt_keypoints)
+        if "boxes" in y_true:
+            if self.bounding_box_format is None:
+                raise ValueError(
+                    "KeypointCOCOMetrics() requires a `bounding_box_format` "
+                    "when `y_true` contains `boxes`."
+                )
+            gt_boxes = bounding_box.convert_format(
+                y_true["boxes"],
+                source=self.bounding_box_format,
+                target="xywh",
+                images=self._images(),
+            )
+            gt_boxes = ops.convert_to_numpy(gt_boxes).astype(np.float64)
+
+        pred_keypoints = self._to_xy(y_pred["keypoints"])
+        pred_classes = ops.convert_to_numpy(y_pred["classes"])
+        pred_confidence = ops.convert_to_numpy(y_pred["confidence"])
+        pred_visibility = np.ones(pred_keypoints.shape[:-1], dtype=bool)
+
+        groundtruths = [
+            self._groups_to_annotations(*inputs)
+            for inputs in zip(gt_keypoints, gt_classes, gt_visibility, gt_boxes)
+        ]
+        detections = [
+            self._groups_to_annotations(
+                keypoints, classes, visibility, confidence=confidence
+            )
+            for keypoints, classes, visibility, confidence in zip(
+                pred_keypoints, pred_classes, pred_visibility, pred_confidence
+            )
+        ]
+        return groundtruths, detections
+
+    def get_config(self):
+        config = super().get_config()
+        config.update(
+            {
+                "keypoint_format": self.keypoint_format,
+                "evaluate_freq": self.evaluate_freq,
+                "kpt_oks_sigmas": self.kpt_oks_sigmas,
+                "bounding_box_format": self.bounding_box_format,
+                "image_shape": self.image_shape,
+            }
+        )
+        return config
@@ -0,0 +1,144 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import io
+
+import numpy as np
+from pycocotools.coco import COCO
+from pycocotools.cocoeval import COCOeval
+
+from keras_cv.src.metrics import KeypointCOCOMetrics
+from keras_cv.src.tests.test_case import TestCase
+
+
+def random_keypoints(rng, batch_size, num_instances, num_keypoints=17):
+    centers = rng.uniform(100, 400, size=(batch_size, num_instances, 1, 2))
+    scales = rng.uniform(10, 100, size=(batch_size, num_instances, 1, 1))
+    offsets = rng.uniform(-1, 1, size=(batch_size, num_instances, 17, 2))
+    keypoints = centers + scales * offsets[:, :, :num_keypoints]
+    classes = np.ones((batch_size, num_instances), "float32")
+    classes[::2, -1] = -1
+    return keypoints.astype("float32"), classes
+
+
+def reference_metrics(groundtruths, detections):
+    """Runs stock `COCOeval`, including its loop-based OKS, in one pass."""
+    images, gt_annotations, dt_annotations = [], [], []
+    for image_id, (gts, dts) in enumerate(zip(groundtruths, detections)):
+        images.append({"id": image_id})
+        for ann in gts:
+            gt_annotations.append(dict(ann, image_id=image_id, iscrowd=0))
+        for ann in dts:
+            dt_annotations.append(dict(ann, image_id=image_id, iscrowd=0))
+    for i, ann in enumerate(gt_annotations + dt_annotations):
+        ann["id"] = i + 1
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        coco_gt, coco_dt = COCO(), COCO()
+        for coco, annotations in [
+            (coco_gt, gt_annotations),
+            (coco_dt, dt_annotations),
+        ]:
+            coco.dataset = {
+                "images": images,
+                "categories": [{"id": 1}],
+                "annotations": annotations,
+            }
+            coco.createIndex()
+        coco_eval = COCOeval(coco_gt, coco_dt, iouType="keypoints")
+        coco_eval.evaluate()
+        coco_eval.accumulate()
+        coco_eval.summarize()
+    return np.maximum(coco_eval.stats, 0.0)
+
+
+class KeypointCOCOMetricsTest(TestCase):
+    def test_perfect_predictions(self):
+        suite = KeypointCOCOMetrics("xy", evaluate_freq=1)
+        keypoints, classes = random_keypoints(np.random.default_rng(0), 2, 3)
+        y_true = {"keypoints": keypoints, "classes": classes}
+        y_pred = dict(y_true, confidence=np.ones_like(classes))
+
+        suite.update_state(y_true, y_pred)
+        metrics = suite.result()
+
+        self.assertEqual(metrics["MaP"], 1.0)
+        self.assertEqual(metrics["Recall@[max_detections=20]"], 1.0)
+
+    def test_streaming_matches_single_pass_evaluation(self):
+        suite = KeypointCOCOMetrics(
+            "xy", evaluate_freq=3, bounding_box_format="xyxy"
+        )
+        rng = np.random.default_rng(seed=1)
+        groundtruths, detections = [], []
+        for _ in range(3):
+            keypoints, classes = random_keypoints(rng, 4, 4)
+            visibility = rng.uniform(size=keypoints.shape[:-1]) > 0.3
+            # One instance without any labeled keypoint, which is matched
+            # against its box instead.
+            visibility[0, 0] = False
+            boxes = np.concatenate(
+                [keypoints.min(axis=2), keypoints.max(axis=2)], axis=-1
+            )
+            noise = rng.normal(scale=5.0, size=keypoints.shape)
+            y_true = {
+                "keypoints": keypoints,
+                "classes": classes,
+                "visibility": visibility,
+                "boxes": boxes,
+            }
+            y_pred = {
+                "keypoints": keypoints + noise,
+                "classes": np.ones_like(classes),
+                "confidence": rng.uniform(size=classes.shape),
+            }
+            suite.update_state(y_true, y_pred)
+            gts, dts = suite._to_annotations(y_true, y_pred)
+            groundtruths.extend(gts)
+            detections.extend(dts)
+
+        metrics = suite.result()
+        expected = reference_metrics(groundtruths, detections)
+        self.assertAllClose(list(metrics.values()), expected)
+
+    def test_relative_keypoint_format(self):
+        suite = KeypointCOCOMetrics(
+            "rel_xy",
+            evaluate_freq=1,
+            kpt_oks_sigmas=[0.1] * 5,
+            image_shape=(512, 512),
+        )
+        keypoints, classes = random_keypoints(
+            np.random.default_rng(2), 2, 3, num_keypoints=5
+        )
+        y_true = {"keypoints": keypoints / 512.0, "classes": classes}
+        y_pred = dict(y_true, confidence=np.ones_like(classes))
+
+        suite.update_state(y_true, y_pred)
+        metrics = suite.result()
+
+        self.assertEqual(metrics["MaP"], 1.0)
+
+    def test_boxes_require_bounding_box_format(self):
+        suite = KeypointCOCOMetrics("xy", evaluate_freq=1)
+        keypoints, classes = random_keypoints(np.random.default_rng(3), 1, 1)
+        y_true = {
+            "keypoints": keypoints,
+            "classes": classes,
+            "boxes": np.zeros((1, 1, 4)),
+        }
+        y_pred = dict(keypoints=keypoints, classes=classes, confidence=classes)
+
+        with self.assertRaisesRegex(ValueError, "bounding_box_format"):
+            suite._to_annotations(y_true, y_pred)
@@ -0,0 +1,146 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+try:
+    from pycocotools import mask as mask_util
+except ImportError:
+    mask_util = None
+
+from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.backend import ops
+from keras_cv.src.metrics.coco.streaming_evaluator import encode_masks
+from keras_cv.src.metrics.object_detection.streaming_coco_metrics import (
+    StreamingCOCOMetrics,
+)
+
+METRIC_MAPPING = {
+    "AP": "MaP",
+    "AP50": "MaP@[IoU=50]",
+    "AP75": "MaP@[IoU=75]",
+    "APs": "MaP@[area=small]",
+    "APm": "MaP@[area=medium]",
+    "APl": "MaP@[area=large]",
+    "ARmax1": "Recall@[max_detections=1]",
+    "ARmax10": "Recall@[max_detections=10]",
+    "ARmax100": "Recall@[max_detections=100]",
+    "ARs": "Recall@[area=small]",
+    "ARm": "Recall@[area=medium]",
+    "ARl": "Recall@[area=large]",
+}
+
+
+@keras_cv_export("keras_cv.metrics.MaskCOCOMetrics")
+class MaskCOCOMetrics(StreamingCOCOMetrics):
+    """MaskCOCOMetrics computes standard instance segmentation metrics.
+
+    Masks are run-length encoded as soon as they are passed to
+    `update_state()` and matched against the ground truth of the same batch
+    using the RLE IoU of `pycocotools`. Only the matching results are kept
+    across batches, so memory usage does not grow with the resolution or the
+    number of evaluated masks.
+
+    Args:
+        evaluate_freq: the number of steps to run before each evaluation.
+            Due to the high computational cost of metric evaluation the final
+            results are only updated once every `evaluate_freq` steps. Higher
+            values will allow for faster training times, while lower numbers
+            allow for higher numerical precision in metric reporting.
+        mask_threshold: float, predicted mask values above this threshold are
+            considered to be part of the mask. Defaults to `0.5`, which
+            supports both binary masks and per-pixel probabilities.
+
+    Example:
+    Inputs to `y_true` must be dictionaries of the form
+    `{"masks": masks, "classes": classes}`, where `masks` has shape
+    `[batch_size, num_instances, height, width]` and `classes` has shape
+    `[batch_size, num_instances]`. Instances with a class of `-1` are
+    treated as padding. `y_pred` must follow the same format with an
+    additional `confidence` key of shape `[batch_size, num_instances]`.
+
+    ```python
+    masks = np.zeros((1, 2, 64, 64))
+    masks[0, 0, 8:24, 8:24] = 1
+    masks[0, 1, 32:60, 16:48] = 1
+    y_true = {"masks": masks, "classes": np.array([[1, -1]])}
+    y_pred = {
+        "masks": masks,
+        "classes": np.array([[1, 2]]),
+        "confidence": np.array([[0.9, 0.3]]),
+    }
+
+    metric = keras_cv.metrics.MaskCOCOMetrics(evaluate_freq=1)
+    metric.update_state(y_true, y_pred)
+    metric.result()
+    ```
+    """
+
+    default_name = "mask_coco_metrics"
+    iou_type = "segm"
+    metric_mapping = METRIC_MAPPING
+
+    def __init__(self, evaluate_freq, mask_threshold=0.5, name=None, **kwargs):
+        super().__init__(evaluate_freq, name=name, **kwargs)
+        self.mask_threshold = mask_threshold
+
+    def _masks_to_annotations(self, masks, classes, confidence=None):
+        valid = classes >= 0
+        rles = encode_masks(masks[valid])
+        if not rles:
+            return []
+        areas = mask_util.area(rles)
+        boxes = mask_util.toBbox(rles)
+        if confidence is not None:
+            confidence = confidence[valid]
+        annotations = []
+        for i, (rle, category_id) in enumerate(zip(rles, classes[valid])):
+            annotation = {
+                "category_id": int(category_id),
+                "segmentation": rle,
+                "area": float(areas[i]),
+                "bbox": boxes[i].tolist(),
+            }
+            if confidence is not None:
+                annotation["score"] = float(confidence[i])
+            annotations.append(annotation)
+        return annotations
+
+    def _to_annotations(self, y_true, y_pred):
+        gt_masks = ops.convert_to_numpy(y_true["masks"])
+        gt_classes = ops.convert_to_numpy(y_true["classes"])
+        pred_masks = ops.convert_to_numpy(y_pred["masks"])
+        pred_classes = ops.convert_to_numpy(y_pred["classes"])
+        pred_confidence = ops.convert_to_numpy(y_pred["confidence"])
+
+        groundtruths = [
+            self._masks_to_annotations(masks, classes)
+            for masks, classes in zip(gt_masks, gt_classes)
+        ]
+        detections = [
+            self._masks_to_annotations(
+                masks > self.mask_threshold, classes, confidence
+            )
+            for masks, classes, confidence in zip(
+                pred_masks, pred_classes, pred_confidence
+            )
+        ]
+        return groundtruths, detections
+
+    def get_config(self):
+        config = super().get_config()
+        config.update(
+            {
+                "evaluate_freq": self.evaluate_freq,
+                "mask_threshold": self.mask_threshold,
+            }
+        )
+        return config
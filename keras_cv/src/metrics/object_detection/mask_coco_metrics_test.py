@@ -0,0 +1,161 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import io
+
+import numpy as np
+import tensorflow as tf
+from pycocotools.coco import COCO
+from pycocotools.cocoeval import COCOeval
+
+from keras_cv.src.metrics import MaskCOCOMetrics
+from keras_cv.src.tests.test_case import TestCase
+
+
+def random_masks(rng, batch_size, num_instances, size=96):
+    masks = np.zeros((batch_size, num_instances, size, size), "float32")
+    for b in range(batch_size):
+        for n in range(num_instances):
+            y, x = rng.integers(0, size - 8, size=2)
+            h, w = rng.integers(4, size, size=2)
+            masks[b, n, y : y + h, x : x + w] = 1
+    classes = rng.integers(0, 3, size=(batch_size, num_instances))
+    # Pad out the last instance of every other image.
+    classes[::2, -1] = -1
+    return masks, classes.astype("float32")
+
+
+def reference_metrics(groundtruths, detections):
+    """Runs stock `COCOeval` over all images at once."""
+    images, gt_annotations, dt_annotations = [], [], []
+    for image_id, (gts, dts) in enumerate(zip(groundtruths, detections)):
+        images.append({"id": image_id, "height": 96, "width": 96})
+        for ann in gts:
+            gt_annotations.append(dict(ann, image_id=image_id, iscrowd=0))
+        for ann in dts:
+            dt_annotations.append(dict(ann, image_id=image_id, iscrowd=0))
+    for i, ann in enumerate(gt_annotations + dt_annotations):
+        ann["id"] = i + 1
+    categories = sorted({ann["category_id"] for ann in gt_annotations})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        coco_gt, coco_dt = COCO(), COCO()
+        for coco, annotations in [
+            (coco_gt, gt_annotations),
+            (coco_dt, dt_annotations),
+        ]:
+            coco.dataset = {
+                "images": images,
+                "categories": [{"id": c} for c in categories],
+                "annotations": annotations,
+            }
+            coco.createIndex()
+        coco_eval = COCOeval(coco_gt, coco_dt, iouType="segm")
+        coco_eval.evaluate()
+        coco_eval.accumulate()
+        coco_eval.summarize()
+    return np.maximum(coco_eval.stats, 0.0)
+
+
+class MaskCOCOMetricsTest(TestCase):
+    def test_perfect_predictions(self):
+        suite = MaskCOCOMetrics(evaluate_freq=1)
+        masks = np.zeros((1, 3, 256, 256), "float32")
+        masks[0, 0, 0:16, 0:16] = 1  # small
+        masks[0, 1, 32:96, 32:96] = 1  # medium
+        masks[0, 2, 100:256, 100:256] = 1  # large
+        y_true = {"masks": masks, "classes": np.array([[0, 1, 2]])}
+        y_pred = {
+            "masks": masks * 0.9,
+            "classes": np.array([[0, 1, 2]]),
+            "confidence": np.array([[0.9, 0.8, 0.7]]),
+        }
+
+        suite.update_state(y_true, y_pred)
+        metrics = suite.result()
+
+        for metric in metrics:
+            self.assertEqual(metrics[metric], 1.0)
+
+    def test_streaming_matches_single_pass_evaluation(self):
+        suite = MaskCOCOMetrics(evaluate_freq=2)
+        rng = np.random.default_rng(seed=0)
+        groundtruths, detections = [], []
+        for _ in range(2):
+            gt_masks, gt_classes = random_masks(rng, 4, 5)
+            pred_masks, pred_classes = random_masks(rng, 4, 5)
+            y_true = {"masks": gt_masks, "classes": gt_classes}
+            y_pred = {
+                "masks": np.concatenate([gt_masks, pred_masks], axis=1),
+                "classes": np.concatenate([gt_classes, pred_classes], axis=1),
+                "confidence": rng.uniform(size=(4, 10)),
+            }
+            suite.update_state(y_true, y_pred)
+            gts, dts = suite._to_annotations(y_true, y_pred)
+            groundtruths.extend(gts)
+            detections.extend(dts)
+
+        metrics = suite.result()
+        expected = reference_metrics(groundtruths, detections)
+        self.assertAllClose(list(metrics.values()), expected)
+
+    def test_evaluate_freq(self):
+        suite = MaskCOCOMetrics(evaluate_freq=2)
+        masks, classes = random_masks(np.random.default_rng(seed=1), 2, 3)
+        y_true = {"masks": masks, "classes": classes}
+        y_pred = dict(y_true, confidence=np.ones_like(classes))
+
+        suite.update_state(y_true, y_pred)
+        metrics = suite.result()
+        for metric in metrics:
+            self.assertEqual(metrics[metric], 0.0)
+
+        metrics = suite.result(force=True)
+        self.assertEqual(metrics["MaP"], 1.0)
+
+    def test_graph_mode(self):
+        suite = MaskCOCOMetrics(evaluate_freq=1)
+        masks, classes = random_masks(np.random.default_rng(seed=2), 2, 3)
+        y_true = {"masks": masks, "classes": classes}
+        y_pred = dict(y_true, confidence=np.ones_like(classes))
+
+        @tf.function()
+        def update_state(y_true, y_pred):
+            suite.update_state(y_true, y_pred)
+
+        update_state(y_true, y_pred)
+        metrics = suite.result()
+        self.assertEqual(metrics["MaP"], 1.0)
+
+    def test_name_parameter(self):
+        suite = MaskCOCOMetrics(evaluate_freq=1, name="masks")
+        masks, classes = random_masks(np.random.default_rng(seed=3), 2, 3)
+        y_true = {"masks": masks, "classes": classes}
+        y_pred = dict(y_true, confidence=np.ones_like(classes))
+
+        suite.update_state(y_true, y_pred)
+        metrics = suite.result()
+        self.assertEqual(metrics["masks_MaP"], 1.0)
+
+    def test_reset_state(self):
+        suite = MaskCOCOMetrics(evaluate_freq=1)
+        masks, classes = random_masks(np.random.default_rng(seed=4), 2, 3)
+        y_true = {"masks": masks, "classes": classes}
+        y_pred = dict(y_true, confidence=np.ones_like(classes))
+
+        suite.update_state(y_true, y_pred)
+        suite.reset_state()
+        metrics = suite.result(force=True)
+        for metric in metrics:
+            self.assertEqual(metrics[metric], 0.0)
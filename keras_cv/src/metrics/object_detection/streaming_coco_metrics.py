@@ -0,0 +1,141 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import types
+
+import tensorflow as tf
+import tensorflow.keras as keras
+
+from keras_cv.src.metrics.coco.streaming_evaluator import StreamingCOCOEvaluator
+
+
+class StreamingCOCOMetrics(keras.metrics.Metric):
+    """Base class for COCO metrics backed by a `StreamingCOCOEvaluator`.
+
+    Like `BoxCOCOMetrics`, `update_state()` and `result()` are run eagerly on
+    the host CPU through `tf.py_function`, so subclasses can be used from
+    inside `fit()` and `evaluate()`. Unlike `BoxCOCOMetrics`, every call to
+    `update_state()` matches its batch right away, and only the matching
+    results are kept between steps.
+
+    Subclasses set `default_name`, `iou_type` and `metric_mapping`, and
+    implement `_to_annotations()` to turn one eager batch of `y_true` and
+    `y_pred` into per-image COCO annotations.
+    """
+
+    default_name = None
+    iou_type = None
+    metric_mapping = None
+
+    def __init__(self, evaluate_freq, kpt_oks_sigmas=None, name=None, **kwargs):
+        if "dtype" not in kwargs:
+            kwargs["dtype"] = "float32"
+        super().__init__(name=name, **kwargs)
+        self.evaluate_freq = evaluate_freq
+        self.evaluator = StreamingCOCOEvaluator(
+            self.iou_type, kpt_oks_sigmas=kpt_oks_sigmas
+        )
+        self._eval_step_count = 0
+        self._cached_result = [0] * len(self.metric_mapping)
+
+    def __new__(cls, *args, **kwargs):
+        obj = super(keras.metrics.Metric, cls).__new__(cls)
+
+        # Wrap the update_state function in a py_function and scope it to
+        # /cpu:0. The nested `y_true` and `y_pred` structures are flattened to
+        # a list of tensors to cross the `py_function` boundary.
+        obj_update_state = obj.update_state
+
+        def update_state_fn(self, y_true, y_pred, sample_weight=None):
+            structure = (y_true, y_pred)
+
+            def update_state_on_cpu(*flat_inputs):
+                y_true, y_pred = tf.nest.pack_sequence_as(
+                    structure, flat_inputs
+                )
+                with tf.device("/cpu:0"):
+                    return obj_update_state(y_true, y_pred, sample_weight)
+
+            return tf.py_function(
+                func=update_state_on_cpu,
+                inp=tf.nest.flatten(structure),
+                Tout=[],
+            )
+
+        obj.update_state = types.MethodType(update_state_fn, obj)
+
+        # Wrap the result function in a py_function and scope it to /cpu:0
+        obj_result = obj.result
+
+        def result_on_host_cpu(force):
+            with tf.device("/cpu:0"):
+                # Without the call to `constant` `tf.py_function` selects the
+                # first index automatically and just returns obj_result()[0]
+                return tf.constant(obj_result(force), obj.dtype)
+
+        obj.result_on_host_cpu = result_on_host_cpu
+
+        def result_fn(self, force=False):
+            py_func_result = tf.py_function(
+                self.result_on_host_cpu, inp=[force], Tout=obj.dtype
+            )
+            result = {}
+            for i, key in enumerate(self.metric_mapping):
+                result[self.name_prefix() + self.metric_mapping[key]] = (
+                    py_func_result[i]
+                )
+            return result
+
+        obj.result = types.MethodType(result_fn, obj)
+
+        return obj
+
+    def name_prefix(self):
+        if self.name.startswith(self.default_name):
+            return ""
+        return self.name + "_"
+
+    def _to_annotations(self, y_true, y_pred):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement `_to_annotations()`."
+        )
+
+    def update_state(self, y_true, y_pred, sample_weight=None):
+        self._eval_step_count += 1
+
+        groundtruths, detections = self._to_annotations(y_true, y_pred)
+        self.evaluator.add_images(groundtruths, detections)
+
+        # Compute on first step, so we don't have an inconsistent list of
+        # metrics in our train_step() results. This will just populate the
+        # metrics with `0.0` until we get to `evaluate_freq`.
+        if self._eval_step_count % self.evaluate_freq == 0:
+            self._cached_result = self._compute_result()
+
+    def reset_state(self):
+        self.evaluator.reset()
+        self._eval_step_count = 0
+        self._cached_result = [0] * len(self.metric_mapping)
+
+    def result(self, force=False):
+        if force:
+            self._cached_result = self._compute_result()
+        return self._cached_result
+
+    def _compute_result(self):
+        metrics = self.evaluator.summarize()
+        results = []
+        for key in self.metric_mapping:
+            # Workaround for the state where there are 0 boxes in a category.
+            results.append(max(metrics[key], 0.0))
+        return results
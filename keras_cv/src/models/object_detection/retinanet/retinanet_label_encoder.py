@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
 
 import tensorflow as tf
 
 from keras_cv.src import bounding_box
 from keras_cv.src.api_export import keras_cv_export
+from keras_cv.src.backend import config
 from keras_cv.src.backend import keras
 from keras_cv.src.backend import ops
 from keras_cv.src.layers.object_detection import box_matcher
@@ -49,6 +51,13 @@ class RetinaNetLabelEncoder(keras.layers.Layer):
             defaults to -1.
         ignore_class: (Optional) The class ID used for the ignore class,
             defaults to -2.
+        anchor_tile_size: (Optional) int, the number of anchors matched
+            against the ground truth boxes at a time. The IoU matrix of a
+            batch has `batch_size * num_anchors * max_boxes` entries, which
+            becomes very large for high resolution inputs. Setting this bounds
+            it to `batch_size * anchor_tile_size * max_boxes` entries without
+            changing the encoded targets. Defaults to `None`, which matches all
+            anchors at once.
     """  # noqa: E501
 
     def __init__(
@@ -60,6 +69,7 @@ class RetinaNetLabelEncoder(keras.layers.Layer):
         box_variance=(0.1, 0.1, 0.2, 0.2),
         background_class=-1.0,
         ignore_class=-2.0,
+        anchor_tile_size=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -79,13 +89,86 @@ class RetinaNetLabelEncoder(keras.layers.Layer):
             force_match_for_each_col=False,
         )
         self.box_variance_tuple = box_variance
+        self.anchor_tile_size = anchor_tile_size
+        # Anchors only depend on the image shape, so they are generated once
+        # per static image shape and reused as constants afterwards.
+        self._anchor_boxes_cache = {}
         self.built = True
 
+    def _generate_anchor_boxes(self, image_shape):
+        anchor_boxes = self.anchor_generator(image_shape=image_shape)
+        anchor_boxes = ops.concatenate(list(anchor_boxes.values()), axis=0)
+        return bounding_box.convert_format(
+            anchor_boxes,
+            source=self.anchor_generator.bounding_box_format,
+            target=self.bounding_box_format,
+            image_shape=image_shape,
+        )
+
+    def _anchor_boxes(self, image_shape):
+        if not all(isinstance(dim, int) for dim in image_shape):
+            return self._generate_anchor_boxes(image_shape)
+
+        if image_shape not in self._anchor_boxes_cache:
+            # Generate anchors outside of any graph being traced, so they can
+            # be cached as a numpy array.
+            if not tf.executing_eagerly():
+                eager_scope = tf.init_scope()
+            elif config.backend() == "jax":
+                import jax
+
+                eager_scope = jax.ensure_compile_time_eval()
+            else:
+                eager_scope = contextlib.nullcontext()
+            with eager_scope:
+                anchor_boxes = self._generate_anchor_boxes(image_shape)
+                self._anchor_boxes_cache[image_shape] = ops.convert_to_numpy(
+                    anchor_boxes
+                )
+        return ops.convert_to_tensor(self._anchor_boxes_cache[image_shape])
+
+    def _match_anchors(self, anchor_boxes, gt_boxes, gt_valid, image_shape):
+        """Matches anchors to the ground truth, `anchor_tile_size` at a time.
+
+        Matching of an anchor only depends on its own row of the IoU matrix,
+        so the results of the anchor tiles are simply concatenated. Padded
+        ground truth boxes get an IoU of -1 and are never matched.
+        """
+        num_anchors = anchor_boxes.shape[0]
+        tile_size = self.anchor_tile_size
+        if tile_size is None or num_anchors is None:
+            tile_size = num_anchors or ops.shape(anchor_boxes)[0]
+            tile_starts = [0]
+        else:
+            tile_starts = range(0, num_anchors, tile_size)
+
+        gt_valid = ops.expand_dims(gt_valid, axis=1)
+        matched_gt_idx = []
+        matched_vals = []
+        for start in tile_starts:
+            iou_matrix = bounding_box.compute_iou(
+                anchor_boxes[start : start + tile_size],
+                gt_boxes,
+                bounding_box_format=self.bounding_box_format,
+                image_shape=image_shape,
+            )
+            iou_matrix = ops.where(gt_valid, iou_matrix, -1.0)
+            tile_gt_idx, tile_vals = self.box_matcher(iou_matrix)
+            matched_gt_idx.append(tile_gt_idx)
+            matched_vals.append(tile_vals)
+        if len(tile_starts) == 1:
+            return matched_gt_idx[0], matched_vals[0]
+        return (
+            ops.concatenate(matched_gt_idx, axis=1),
+            ops.concatenate(matched_vals, axis=1),
+        )
+
     def _encode_sample(self, box_labels, anchor_boxes, image_shape):
         """Creates box and classification targets for a batched sample
         Matches ground truth boxes to anchor boxes based on IOU.
         1. Calculates the pairwise IOU for the M `anchor_boxes` and N `gt_boxes`
-          to get a `(M, N)` shaped matrix.
+          to get a `(M, N)` shaped matrix. Padded `gt_boxes`, with a class of
+          -1, get an IOU of -1.
         2. The ground truth box with the maximum IOU in each row is assigned to
           the anchor box provided the IOU is greater than `match_iou`.
         3. If the maximum IOU in a row is less than `ignore_iou`, the anchor
@@ -110,13 +193,10 @@ class RetinaNetLabelEncoder(keras.layers.Layer):
         """
         gt_boxes = box_labels["boxes"]
         gt_classes = box_labels["classes"]
-        iou_matrix = bounding_box.compute_iou(
-            anchor_boxes,
-            gt_boxes,
-            bounding_box_format=self.bounding_box_format,
-            image_shape=image_shape,
+        gt_valid = ops.not_equal(gt_classes[..., 0], -1)
+        matched_gt_idx, matched_vals = self._match_anchors(
+            anchor_boxes, gt_boxes, gt_valid, image_shape
         )
-        matched_gt_idx, matched_vals = self.box_matcher(iou_matrix)
         matched_vals = ops.expand_dims(matched_vals, axis=-1)
         positive_mask = ops.cast(ops.equal(matched_vals, 1), self.dtype)
         ignore_mask = ops.cast(ops.equal(matched_vals, -2), self.dtype)
@@ -204,14 +284,7 @@ class RetinaNetLabelEncoder(keras.layers.Layer):
             box_labels["classes"] = ops.expand_dims(
                 box_labels["classes"], axis=-1
             )
-        anchor_boxes = self.anchor_generator(image_shape=image_shape)
-        anchor_boxes = ops.concatenate(list(anchor_boxes.values()), axis=0)
-        anchor_boxes = bounding_box.convert_format(
-            anchor_boxes,
-            source=self.anchor_generator.bounding_box_format,
-            target=self.bounding_box_format,
-            image_shape=image_shape,
-        )
+        anchor_boxes = self._anchor_boxes(image_shape)
 
         result = self._encode_sample(box_labels, anchor_boxes, image_shape)
         encoded_box_targets = result["boxes"]
@@ -230,6 +303,7 @@ class RetinaNetLabelEncoder(keras.layers.Layer):
             "box_variance": self.box_variance_tuple,
             "background_class": self.background_class,
             "ignore_class": self.ignore_class,
+            "anchor_tile_size": self.anchor_tile_size,
         }
         base_config = super().get_config()
         return dict(list(base_config.items()) + list(config.items()))
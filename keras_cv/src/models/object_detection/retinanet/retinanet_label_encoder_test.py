@@ -129,3 +129,48 @@ class RetinaNetLabelEncoderTest(TestCase):
         # 49104 is the anchor generator shape
         self.assertEqual(box_targets.shape, (2, 49104, 4))
         self.assertEqual(class_targets.shape, (2, 49104))
+
+    def test_anchor_tiling_matches_untiled_encoding(self):
+        images = np.zeros((2, 256, 256, 3), "float32")
+        top_left = np.random.uniform(0, 200, size=(2, 6, 2))
+        extent = np.random.uniform(5, 100, size=(2, 6, 2))
+        boxes = np.concatenate([top_left, top_left + extent], axis=-1)
+        classes = np.random.randint(0, 5, size=(2, 6)).astype("float32")
+        # Padded boxes overlapping the image must never be matched.
+        boxes[:, 4:] = [[0, 0, 256, 256], [10, 10, 50, 50]]
+        classes[:, 4:] = -1
+        bounding_boxes = {"boxes": boxes, "classes": classes}
+
+        def anchor_generator():
+            return cv_layers.AnchorGenerator(
+                bounding_box_format="yxyx",
+                sizes=[32.0, 64.0, 128.0, 256.0, 512.0],
+                aspect_ratios=[0.5, 1.0, 2.0],
+                scales=[2**x for x in [0, 1 / 3, 2 / 3]],
+                strides=[2**i for i in range(3, 8)],
+            )
+
+        encoder = RetinaNetLabelEncoder(
+            anchor_generator=anchor_generator(),
+            bounding_box_format="xyxy",
+        )
+        tiled_encoder = RetinaNetLabelEncoder(
+            anchor_generator=anchor_generator(),
+            bounding_box_format="xyxy",
+            anchor_tile_size=1000,
+        )
+        box_targets, class_targets = encoder(images, bounding_boxes)
+        tiled_box_targets, tiled_class_targets = tiled_encoder(
+            images, bounding_boxes
+        )
+
+        self.assertAllClose(box_targets, tiled_box_targets)
+        self.assertAllClose(class_targets, tiled_class_targets)
+        # Anchors are only ever assigned the classes of non-padded boxes.
+        matched_classes = ops.convert_to_numpy(class_targets)
+        matched_classes = matched_classes[matched_classes >= 0]
+        self.assertNotEmpty(matched_classes)
+        self.assertContainsSubset(
+            set(matched_classes.tolist()), set(classes[:, :4].ravel().tolist())
+        )
+        self.assertIn((256, 256, 3), tiled_encoder._anchor_boxes_cache)
@@ -58,6 +58,14 @@ class YOLOV8LabelEncoder(keras.layers.Layer):
         epsilon: float, a small number used for numerical stability in division
             (to avoid diving by zero), and used as a threshold to eliminate very
             small matches based on alignment scores of approximately zero.
+        gt_chunk_size: optional integer, the number of ground truth boxes
+            matched against all anchors at a time. Assignment builds several
+            (batch_size, num_gt_boxes, num_anchors) tensors, which become very
+            large for crowded images and high resolution inputs. Setting this
+            bounds them to (batch_size, gt_chunk_size, num_anchors) without
+            changing the assigned targets. Only applies when the number of
+            ground truth boxes is statically known. Defaults to `None`, which
+            matches all ground truth boxes at once.
     """
 
     def __init__(
@@ -67,6 +75,7 @@ class YOLOV8LabelEncoder(keras.layers.Layer):
         alpha=0.5,
         beta=6.0,
         epsilon=1e-9,
+        gt_chunk_size=None,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -75,14 +84,16 @@ class YOLOV8LabelEncoder(keras.layers.Layer):
         self.alpha = alpha
         self.beta = beta
         self.epsilon = epsilon
+        self.gt_chunk_size = gt_chunk_size
 
-    def assign(
+    def _match_gt_chunk(
         self, scores, decode_bboxes, anchors, gt_labels, gt_bboxes, gt_mask
     ):
-        """Assigns ground-truth boxes to anchors.
+        """Matches anchors against a chunk of the ground-truth boxes.
 
-        Uses the task-aligned assignment strategy for matching ground truth
-        and anchor boxes based on prediction scores and IoU.
+        Returns the highest overlap of each anchor with a matched box of the
+        chunk, the index of that box within the chunk, and the normalized
+        alignment metric of each anchor, each with shape (B, num_anchors).
         """
         num_anchors = anchors.shape[0]
 
@@ -143,15 +154,95 @@ class YOLOV8LabelEncoder(keras.layers.Layer):
         overlaps *= anchors_matched_gt_box
         # In cases where one anchor matches to 2 GT boxes, we pick the GT box
         # with the highest overlap as a max.
-        gt_box_matches_per_anchor = ops.argmax(overlaps, axis=1)
-        gt_box_matches_per_anchor_mask = ops.max(overlaps, axis=1) > 0
+        max_overlap_per_anchor = ops.max(overlaps, axis=1)
+        gt_box_matches_per_anchor = ops.cast(
+            ops.argmax(overlaps, axis=1), "int32"
+        )
+
+        # We normalize an anchor's alignment metric based on the relative
+        # strength of the anchors match with the corresponding GT box.
+        alignment_metrics *= anchors_matched_gt_box
+        max_alignment_per_gt_box = ops.max(
+            alignment_metrics, axis=-1, keepdims=True
+        )
+        max_overlap_per_gt_box = ops.max(overlaps, axis=-1, keepdims=True)
+
+        normalized_alignment_metrics = ops.max(
+            alignment_metrics
+            * max_overlap_per_gt_box
+            / (max_alignment_per_gt_box + self.epsilon),
+            axis=-2,
+        )
+        return (
+            max_overlap_per_anchor,
+            gt_box_matches_per_anchor,
+            normalized_alignment_metrics,
+        )
+
+    def assign(
+        self, scores, decode_bboxes, anchors, gt_labels, gt_bboxes, gt_mask
+    ):
+        """Assigns ground-truth boxes to anchors.
+
+        Uses the task-aligned assignment strategy for matching ground truth
+        and anchor boxes based on prediction scores and IoU.
+
+        When `gt_chunk_size` is set, ground-truth boxes are matched
+        `gt_chunk_size` at a time. Candidate anchors are selected per
+        ground-truth box, so only the per-anchor reductions over boxes have to
+        be carried across chunks, which keeps the outputs identical.
+        """
+        num_anchors = anchors.shape[0]
+        num_gt_boxes = gt_bboxes.shape[1]
+
+        chunk_size = self.gt_chunk_size
+        if chunk_size is None or num_gt_boxes is None:
+            chunk_starts = [0]
+            chunk_size = num_gt_boxes or ops.shape(gt_bboxes)[1]
+        else:
+            chunk_starts = range(0, num_gt_boxes, chunk_size)
+
+        max_overlap_per_anchor = None
+        for start in chunk_starts:
+            end = start + chunk_size
+            (
+                chunk_max_overlap,
+                chunk_matches,
+                chunk_alignment_metrics,
+            ) = self._match_gt_chunk(
+                scores,
+                decode_bboxes,
+                anchors,
+                gt_labels[:, start:end],
+                gt_bboxes[:, start:end],
+                gt_mask[:, start:end],
+            )
+            if max_overlap_per_anchor is None:
+                max_overlap_per_anchor = chunk_max_overlap
+                gt_box_matches_per_anchor = chunk_matches
+                normalized_alignment_metrics = chunk_alignment_metrics
+                continue
+            # Like `argmax`, ties are resolved in favor of the first GT box.
+            is_better_match = chunk_max_overlap > max_overlap_per_anchor
+            gt_box_matches_per_anchor = ops.where(
+                is_better_match,
+                chunk_matches + start,
+                gt_box_matches_per_anchor,
+            )
+            max_overlap_per_anchor = ops.maximum(
+                max_overlap_per_anchor, chunk_max_overlap
+            )
+            normalized_alignment_metrics = ops.maximum(
+                normalized_alignment_metrics, chunk_alignment_metrics
+            )
+
+        gt_box_matches_per_anchor_mask = max_overlap_per_anchor > 0
         # TODO(ianstenbit): Once ops.take_along_axis supports -1 in Torch,
         # replace gt_box_matches_per_anchor with
         # ops.where(
         #     ops.max(overlaps, axis=1) > 0, ops.argmax(overlaps, axis=1), -1
         # )
         # and get rid of the manual masking
-        gt_box_matches_per_anchor = ops.cast(gt_box_matches_per_anchor, "int32")
 
         # We select the GT boxes and labels that correspond to anchor matches.
         bbox_labels = ops.take_along_axis(
@@ -170,21 +261,6 @@ class YOLOV8LabelEncoder(keras.layers.Layer):
         class_labels = ops.one_hot(
             ops.cast(class_labels, "int32"), self.num_classes
         )
-
-        # Finally, we normalize an anchor's class labels based on the relative
-        # strength of the anchors match with the corresponding GT box.
-        alignment_metrics *= anchors_matched_gt_box
-        max_alignment_per_gt_box = ops.max(
-            alignment_metrics, axis=-1, keepdims=True
-        )
-        max_overlap_per_gt_box = ops.max(overlaps, axis=-1, keepdims=True)
-
-        normalized_alignment_metrics = ops.max(
-            alignment_metrics
-            * max_overlap_per_gt_box
-            / (max_alignment_per_gt_box + self.epsilon),
-            axis=-2,
-        )
         class_labels *= normalized_alignment_metrics[:, :, None]
 
         # On TF backend, the final "4" becomes a dynamic shape so we include
@@ -269,6 +345,7 @@ class YOLOV8LabelEncoder(keras.layers.Layer):
             "alpha": self.alpha,
             "beta": self.beta,
             "epsilon": self.epsilon,
+            "gt_chunk_size": self.gt_chunk_size,
         }
         base_config = super().get_config()
         return dict(list(base_config.items()) + list(config.items()))
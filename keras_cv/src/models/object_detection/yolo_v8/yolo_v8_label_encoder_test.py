@@ -0,0 +1,84 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from absl.testing import parameterized
+
+from keras_cv.src.backend import ops
+from keras_cv.src.models.object_detection.yolo_v8.yolo_v8_detector import (
+    get_anchors,
+)
+from keras_cv.src.models.object_detection.yolo_v8.yolo_v8_label_encoder import (  # noqa: E501
+    YOLOV8LabelEncoder,
+)
+from keras_cv.src.tests.test_case import TestCase
+
+
+def random_assignment_inputs(batch_size=2, num_gt_boxes=23, num_classes=5):
+    rng = np.random.default_rng(seed=0)
+    anchor_points, strides = get_anchors(image_shape=(128, 128, 3))
+    anchors = ops.convert_to_numpy(anchor_points * strides[:, None])
+    num_anchors = anchors.shape[0]
+
+    top_left = rng.uniform(0, 100, size=(batch_size, num_gt_boxes, 2))
+    extent = rng.uniform(8, 60, size=(batch_size, num_gt_boxes, 2))
+    gt_bboxes = np.concatenate([top_left, top_left + extent], axis=-1)
+    # A duplicated box checks that ties resolve to the first GT box.
+    gt_bboxes[:, -5] = gt_bboxes[:, 1]
+    gt_labels = rng.integers(0, num_classes, size=(batch_size, num_gt_boxes))
+    gt_mask = np.ones((batch_size, num_gt_boxes, 1), dtype=bool)
+    gt_mask[:, -3:] = False
+
+    offsets = rng.uniform(2, 30, size=(2, batch_size, num_anchors, 2))
+    decode_bboxes = np.concatenate(
+        [anchors - offsets[0], anchors + offsets[1]], axis=-1
+    )
+    scores = rng.uniform(size=(batch_size, num_anchors, num_classes))
+    return (
+        scores.astype("float32"),
+        decode_bboxes.astype("float32"),
+        anchors,
+        gt_labels.astype("float32"),
+        gt_bboxes.astype("float32"),
+        gt_mask,
+    )
+
+
+class YOLOV8LabelEncoderTest(TestCase):
+    @parameterized.named_parameters(
+        ("single_box", 1),
+        ("uneven_chunks", 7),
+        ("larger_than_num_boxes", 64),
+    )
+    def test_gt_chunking_matches_unchunked_assignment(self, gt_chunk_size):
+        inputs = random_assignment_inputs()
+        encoder = YOLOV8LabelEncoder(num_classes=5)
+        chunked_encoder = YOLOV8LabelEncoder(
+            num_classes=5, gt_chunk_size=gt_chunk_size
+        )
+
+        bbox_labels, class_labels, fg_mask = encoder(*inputs)
+        chunked_outputs = chunked_encoder(*inputs)
+
+        self.assertGreater(ops.sum(ops.cast(class_labels > 0, "int32")), 0)
+        self.assertAllClose(bbox_labels, chunked_outputs[0])
+        self.assertAllClose(class_labels, chunked_outputs[1])
+        self.assertAllClose(fg_mask, chunked_outputs[2])
+
+    def test_get_config(self):
+        encoder = YOLOV8LabelEncoder(num_classes=5, gt_chunk_size=8)
+        config = encoder.get_config()
+        self.assertEqual(config["gt_chunk_size"], 8)
+        restored = YOLOV8LabelEncoder.from_config(config)
+        self.assertEqual(restored.gt_chunk_size, 8)
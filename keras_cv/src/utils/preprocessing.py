@@ -18,6 +18,7 @@ from tensorflow.keras import backend
 
 from keras_cv.src import core
 from keras_cv.src.backend import ops
+from keras_cv.src.backend import random
 
 _TF_INTERPOLATION_METHODS = {
     "bilinear": tf.image.ResizeMethod.BILINEAR,
@@ -91,7 +92,7 @@ def transform_value_range(
     ):
         return images
 
-    images = tf.cast(images, dtype=dtype)
+    images = ops.cast(images, dtype=dtype)
     original_min_value, original_max_value = _unwrap_value_range(
         original_range, dtype=dtype
     )
@@ -110,8 +111,8 @@ def transform_value_range(
 
 def _unwrap_value_range(value_range, dtype=tf.float32):
     min_value, max_value = value_range
-    min_value = tf.cast(min_value, dtype=dtype)
-    max_value = tf.cast(max_value, dtype=dtype)
+    min_value = ops.cast(min_value, dtype=dtype)
+    max_value = ops.cast(max_value, dtype=dtype)
     return min_value, max_value
 
 
@@ -134,7 +135,7 @@ def blend(image1: tf.Tensor, image2: tf.Tensor, factor: float) -> tf.Tensor:
     difference = image2 - image1
     scaled = factor * difference
     temp = image1 + scaled
-    return tf.clip_by_value(temp, 0.0, 255.0)
+    return ops.clip(temp, 0.0, 255.0)
 
 
 def parse_factor(
@@ -196,6 +197,129 @@ def batch_random_inversion(random_generator, batch_size):
     return negate
 
 
+class BackendRandomGenerator:
+    """Draws random numbers with `keras.random` and a `SeedGenerator`.
+
+    Provides the `uniform()` and `normal()` methods of `tf.random.Generator`
+    used by the augmentation layers, so that they can draw random numbers
+    with any Keras backend.
+
+    Args:
+        seed_generator: the `keras.random.SeedGenerator` of the draws.
+    """
+
+    def __init__(self, seed_generator):
+        self.seed_generator = seed_generator
+
+    def uniform(self, shape, minval=0, maxval=None, dtype="float32"):
+        if "int" in str(dtype):
+            return random.randint(
+                shape, minval, maxval, dtype=dtype, seed=self.seed_generator
+            )
+        return random.uniform(
+            shape,
+            minval=minval,
+            maxval=1.0 if maxval is None else maxval,
+            dtype=dtype,
+            seed=self.seed_generator,
+        )
+
+    def normal(self, shape, mean=0.0, stddev=1.0, dtype="float32"):
+        return random.normal(
+            shape,
+            mean=mean,
+            stddev=stddev,
+            dtype=dtype,
+            seed=self.seed_generator,
+        )
+
+
+class GeneratorFactorSampler:
+    """Draws the factors of a `FactorSampler` from a random generator.
+
+    Args:
+        factor_sampler: the `UniformFactorSampler`, `NormalFactorSampler` or
+            `ConstantFactorSampler` to draw the factors of.
+        random_generator: the generator to draw the factors from, with the
+            `uniform()` and `normal()` methods of `tf.random.Generator`.
+    """
+
+    def __init__(self, factor_sampler, random_generator):
+        self.factor_sampler = factor_sampler
+        self.random_generator = random_generator
+
+    def __call__(self, shape=(), dtype="float32"):
+        factor_sampler = self.factor_sampler
+        if isinstance(factor_sampler, core.ConstantFactorSampler):
+            return ops.full(shape, factor_sampler.value, dtype=dtype)
+        if isinstance(factor_sampler, core.UniformFactorSampler):
+            return self.random_generator.uniform(
+                shape,
+                minval=factor_sampler.lower,
+                maxval=factor_sampler.upper,
+                dtype=dtype,
+            )
+        return ops.clip(
+            self.random_generator.normal(
+                shape,
+                mean=factor_sampler.mean,
+                stddev=factor_sampler.stddev,
+                dtype=dtype,
+            ),
+            factor_sampler.min_value,
+            factor_sampler.max_value,
+        )
+
+
+def augment_by_group(inputs, layers, groups):
+    """Augments every sample of a batch with the layer of its group.
+
+    Samples sharing a group are gathered into a sub-batch, which is passed to
+    the group's layer in a single call, and the outputs are put back at the
+    position of each sample in the batch. Layers are not called when no
+    sample falls in their group.
+
+    Args:
+        inputs: a dictionary of batched inputs, as passed to an augmentation
+            layer. Every entry must be a `tf.Tensor` or `tf.RaggedTensor`, or
+            a nested structure of those, of the same type across layers.
+        layers: a list of callables, one per group. `None` leaves the samples
+            of its group unchanged.
+        groups: an int `[batch_size]` tensor, the index in `layers` of the
+            group of each sample.
+
+    Returns:
+        The augmented inputs, in the order of the batch.
+    """
+    indices, outputs = [], []
+    for i, layer in enumerate(layers):
+        group_indices = tf.where(groups == i)[:, 0]
+        group = tf.nest.map_structure(
+            lambda x: tf.gather(x, group_indices), inputs
+        )
+        if layer is not None:
+            group = tf.cond(
+                tf.size(group_indices) > 0,
+                _curry_call_layer(group, layer),
+                lambda: group,
+            )
+        indices.append(group_indices)
+        outputs.append(group)
+
+    order = tf.math.invert_permutation(tf.concat(indices, axis=0))
+    return tf.nest.map_structure(
+        lambda *groups: tf.gather(tf.concat(groups, axis=0), order),
+        *outputs,
+    )
+
+
+def _curry_call_layer(inputs, layer):
+    def call_layer():
+        return layer(inputs)
+
+    return call_layer
+
+
 def get_rotation_matrix(angles, image_height, image_width, name=None):
     """Returns projective transform(s) for the given angle(s).
     Args:
@@ -0,0 +1,238 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Counter-based random draws keyed by `(seed, epoch, sample index)`."""
+
+import contextlib
+
+import numpy as np
+import tensorflow as tf
+
+from keras_cv.src.core.factor_sampler.normal_factor_sampler import (
+    NormalFactorSampler,
+)
+from keras_cv.src.core.factor_sampler.uniform_factor_sampler import (
+    UniformFactorSampler,
+)
+
+SAMPLE_INDICES = "sample_indices"
+
+
+class StatelessRandomState:
+    """The seed, epoch and sample indices shared by a tree of generators.
+
+    Args:
+        seed: integer, the global seed of the draws.
+        epoch: integer scalar, the epoch of the draws.
+        sample_indices: integer scalar or `[batch_size]` tensor, the indices of
+            the samples being augmented.
+    """
+
+    def __init__(self, seed, epoch, sample_indices):
+        self.seed = seed
+        self.epoch = tf.cast(epoch, tf.int64)
+        # The keys are hashed once here rather than on every draw.
+        self.key = _fold_in(_uint64(_mix(np.uint64(seed % 2**64))), self.epoch)
+        self._scopes = [(sample_indices, _sample_keys(sample_indices))]
+
+    @property
+    def sample_keys(self):
+        """The `uint64` keys of the samples of the current scope."""
+        return self._scopes[-1][1]
+
+    @contextlib.contextmanager
+    def sample_indices_scope(self, sample_indices):
+        """Keys the draws of the scope by `sample_indices`."""
+        outer_indices, sample_keys = self._scopes[-1]
+        # Nested layers re-enter the scope with the indices of their parent.
+        if sample_indices is not outer_indices:
+            sample_keys = _sample_keys(sample_indices)
+        self._scopes.append((sample_indices, sample_keys))
+        try:
+            yield
+        finally:
+            self._scopes.pop()
+
+
+# The SplitMix64 increment, an odd approximation of `2**64 / phi`.
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+# The number of random bits of the uniform floats of each dtype.
+_MANTISSA_BITS = {
+    tf.float16: 11,
+    tf.bfloat16: 8,
+    tf.float32: 24,
+    tf.float64: 53,
+}
+
+
+def _uint64(value):
+    return tf.constant(value, tf.uint64)
+
+
+def _mix(x):
+    """The SplitMix64 finalizer, a bijective hash of `uint64` values.
+
+    Works on both `uint64` tensors and NumPy values, which lets the keys known
+    at trace time be hashed in NumPy.
+    """
+    if isinstance(x, tf.Tensor):
+        right_shift = tf.bitwise.right_shift
+    else:
+        right_shift = np.right_shift
+    with np.errstate(over="ignore"):
+        x = x ^ right_shift(x, np.uint64(30))
+        x = x * np.uint64(0xBF58476D1CE4E5B9)
+        x = x ^ right_shift(x, np.uint64(27))
+        x = x * np.uint64(0x94D049BB133111EB)
+        return x ^ right_shift(x, np.uint64(31))
+
+
+def _fold_in(key, data):
+    """Derives a new key from `key` and the integers of `data`."""
+    data = _mix(tf.cast(data, tf.uint64) * _uint64(_GOLDEN_GAMMA))
+    return _mix(key ^ data)
+
+
+def _sample_keys(sample_indices):
+    """Hashes the indices of the samples into their `uint64` keys."""
+    sample_indices = tf.cast(tf.cast(sample_indices, tf.int64), tf.uint64)
+    return _mix(sample_indices * _uint64(_GOLDEN_GAMMA))
+
+
+def _uniform_bits(bits, dtype):
+    """Maps random `uint64` bits to uniform floats in `[0, 1)`."""
+    num_bits = _MANTISSA_BITS[dtype]
+    float_dtype = tf.float64 if num_bits > 24 else tf.float32
+    samples = tf.cast(
+        tf.bitwise.right_shift(bits, _uint64(64 - num_bits)), float_dtype
+    )
+    return tf.cast(samples * 2.0**-num_bits, dtype)
+
+
+class StatelessRandomGenerator:
+    """A stateless stand-in for `tf.random.Generator`.
+
+    The `n`-th draw of the generator for the sample with index `i` is keyed by
+    `(seed, salt, epoch, n, i)`, so it does not depend on the order in which
+    samples are augmented, on how they are batched or on draws made by other
+    generators. Draws whose shape has a leading dimension are drawn per
+    sample along that dimension, draws of scalars are drawn once for the
+    batch and keyed by the index of its first sample.
+
+    The draws use the counter-based SplitMix64 generator: the `j`-th value
+    drawn for a sample is a hash of its key and of `j`. Unlike the
+    `tf.random.stateless_*` ops, which take a single seed, this draws the
+    values of all the samples of a batch at once.
+
+    Args:
+        state: the `StatelessRandomState` shared with the other generators.
+        salt: integer, distinguishes the generator from the other generators
+            sharing `state`.
+    """
+
+    def __init__(self, state, salt):
+        self.state = state
+        self.salt = salt
+        self._num_draws = 0
+
+    def uniform(self, shape, minval=0, maxval=None, dtype=tf.float32):
+        dtype = tf.as_dtype(dtype)
+        if dtype.is_integer:
+            samples = _uniform_bits(self._draw(shape), tf.float64)
+            minval = tf.cast(minval, tf.float64)
+            maxval = tf.cast(maxval, tf.float64)
+            return tf.cast(
+                tf.floor(samples * (maxval - minval) + minval), dtype
+            )
+        samples = _uniform_bits(self._draw(shape), dtype)
+        maxval = 1 if maxval is None else maxval
+        minval, maxval = tf.cast(minval, dtype), tf.cast(maxval, dtype)
+        return samples * (maxval - minval) + minval
+
+    def normal(self, shape, mean=0.0, stddev=1.0, dtype=tf.float32):
+        dtype = tf.as_dtype(dtype)
+        float_dtype = tf.float64 if dtype == tf.float64 else tf.float32
+        # Box-Muller transform of two uniform samples per value.
+        samples = _uniform_bits(self._draw(shape, (2,)), float_dtype)
+        radius = tf.sqrt(-2.0 * tf.math.log(1.0 - samples[..., 0]))
+        samples = radius * tf.cos(2.0 * np.pi * samples[..., 1])
+        return tf.cast(samples, dtype) * tf.cast(stddev, dtype) + tf.cast(
+            mean, dtype
+        )
+
+    def make_seeds(self, count=1):
+        """Returns `[2, count]` seeds for the `tf.random.stateless_*` ops."""
+        return tf.bitcast(self._draw((), (2, count)), tf.int64)
+
+    def _draw(self, shape, sample_shape=()):
+        """Draws random `uint64` bits of shape `shape + sample_shape`."""
+        with np.errstate(over="ignore"):
+            draw_key = _mix(
+                np.uint64(self.salt << 32 | self._num_draws)
+                * np.uint64(_GOLDEN_GAMMA)
+            )
+        self._num_draws += 1
+        key = _mix(self.state.key ^ _uint64(draw_key))
+
+        if isinstance(shape, tf.Tensor):
+            shape = tf.unstack(shape, num=shape.shape[0])
+        shape = list(shape)
+        sample_keys = self.state.sample_keys
+        if sample_keys.shape.rank == 0:
+            keys = _mix(key ^ sample_keys)
+        elif not shape:
+            keys = _mix(key ^ sample_keys[0])
+        else:
+            # One key per sample along the leading dimension of `shape`.
+            keys = _mix(key ^ sample_keys)
+            rank = len(shape) + len(sample_shape)
+            keys = tf.reshape(keys, [-1] + [1] * (rank - 1))
+            shape = shape[1:]
+        shape = shape + list(sample_shape)
+        return _mix(keys + _counters(shape))
+
+
+def _counters(shape):
+    """The SplitMix64 counters of the values of a sample of shape `shape`."""
+    if all(isinstance(dim, (int, np.integer)) for dim in shape):
+        # Static shapes, the common case, need no ops to build the counters.
+        counters = np.arange(1, np.prod(shape, dtype=np.int64) + 1)
+        with np.errstate(over="ignore"):
+            counters = counters.astype(np.uint64) * np.uint64(_GOLDEN_GAMMA)
+        return _uint64(counters.reshape(shape))
+    shape = tf.stack([tf.cast(dim, tf.int64) for dim in shape])
+    counters = tf.reshape(
+        tf.range(1, tf.reduce_prod(shape) + 1, dtype=tf.int64), shape
+    )
+    return tf.cast(counters, tf.uint64) * _uint64(_GOLDEN_GAMMA)
+
+
+def is_random_factor_sampler(value):
+    return isinstance(value, (UniformFactorSampler, NormalFactorSampler))
+
+
+def sample_indices_scope(random_generator, inputs):
+    """Keys the draws of `random_generator` by the samples of `inputs`.
+
+    Does nothing unless `random_generator` is a `StatelessRandomGenerator` and
+    `inputs` holds sample indices.
+    """
+    if (
+        isinstance(random_generator, StatelessRandomGenerator)
+        and isinstance(inputs, dict)
+        and SAMPLE_INDICES in inputs
+    ):
+        return random_generator.state.sample_indices_scope(
+            inputs[SAMPLE_INDICES]
+        )
+    return contextlib.nullcontext()
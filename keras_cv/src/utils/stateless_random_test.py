@@ -0,0 +1,85 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tensorflow as tf
+
+from keras_cv.src.tests.test_case import TestCase
+from keras_cv.src.utils import stateless_random
+
+
+def make_generator(sample_indices, seed=1, epoch=0, salt=0):
+    state = stateless_random.StatelessRandomState(seed, epoch, sample_indices)
+    return stateless_random.StatelessRandomGenerator(state, salt)
+
+
+class StatelessRandomGeneratorTest(TestCase):
+    def test_draws_per_sample(self):
+        batch = make_generator(tf.constant([3, 7, 5])).uniform((3, 2))
+        samples = [make_generator(index).uniform((2,)) for index in [3, 7, 5]]
+
+        self.assertAllClose(batch, tf.stack(samples))
+
+    def test_draws_are_keyed_by_draw_index(self):
+        generator = make_generator(tf.constant([0, 1]))
+
+        first = generator.uniform((2,))
+        second = generator.uniform((2,))
+
+        self.assertNotAllClose(first, second)
+        self.assertAllClose(
+            make_generator(tf.constant([0, 1])).uniform((2,)), first
+        )
+
+    def test_draws_are_keyed_by_seed_epoch_and_salt(self):
+        draw = make_generator(0).normal((4,))
+
+        self.assertNotAllClose(draw, make_generator(0, seed=2).normal((4,)))
+        self.assertNotAllClose(draw, make_generator(0, epoch=1).normal((4,)))
+        self.assertNotAllClose(draw, make_generator(0, salt=1).normal((4,)))
+
+    def test_uniform_bounds(self):
+        generator = make_generator(tf.range(100))
+
+        floats = generator.uniform(
+            (100,), minval=tf.range(100, dtype=tf.float32), maxval=200.0
+        )
+        ints = generator.uniform((100, 3), minval=2, maxval=5, dtype=tf.int32)
+
+        self.assertAllGreaterEqual(floats - tf.range(100, dtype=tf.float32), 0)
+        self.assertAllLessEqual(floats, 200)
+        self.assertAllInSet(ints, [2, 3, 4])
+
+    def test_scalar_draws_are_keyed_by_first_sample(self):
+        batch = make_generator(tf.constant([4, 2])).uniform(())
+
+        self.assertAllClose(batch, make_generator(4).uniform(()))
+
+    def test_sample_indices_scope(self):
+        generator = make_generator(tf.constant([0, 1]))
+        inputs = {stateless_random.SAMPLE_INDICES: tf.constant(5)}
+
+        with stateless_random.sample_indices_scope(generator, inputs):
+            draw = generator.uniform(())
+
+        self.assertAllClose(draw, make_generator(5).uniform(()))
+        self.assertAllEqual(
+            generator.state.sample_keys,
+            make_generator(tf.constant([0, 1])).state.sample_keys,
+        )
+
+    def test_make_seeds(self):
+        seeds = make_generator(tf.constant([0, 1])).make_seeds(3)
+
+        self.assertEqual(seeds.shape, (2, 3))
+        self.assertEqual(seeds.dtype, tf.int64)